@@ -4,9 +4,12 @@ from base64 import b64encode, b64decode
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import *
 from cryptography.fernet import Fernet
-from PyQt6.QtGui import QIcon , QCursor 
+from PyQt6.QtGui import QIcon , QCursor , QShortcut , QKeySequence
 from PyQt6.QtCore import Qt , QTimer , QThread, pyqtSignal , QSize
-import winreg as reg
+try:
+    import winreg as reg
+except ImportError:     # hors Windows (harness de charge Linux) : pas de registre
+    reg = None
 from PyQt6 import  uic ,  QtWidgets, QtGui, QtCore
 import shutil
 import signal
@@ -27,9 +30,12 @@ import PyQt6
 from typing import Optional, Dict
 import configparser
 from platformdirs import user_downloads_dir
-import win32gui       
-import win32process
-import win32con
+try:
+    import win32gui       
+    import win32process
+    import win32con
+except ImportError:     # hors Windows : la fermeture des fenêtres Firefox n'est pas disponible
+    win32gui = win32process = win32con = None
 from datetime import  timedelta
 from PyQt6.QtGui import QColor, QPixmap
 from PyQt6 import uic
@@ -47,12 +53,47 @@ from selenium.webdriver.chrome.options import Options
 import tempfile
 import stat
 import base64
+import threading
+import logging
 from collections import defaultdict
+from logRetention import LogRetentionManager, Compress_From_Env as Log_Compression_Enabled
+from logSink import CompressedLogSink, Make_Log_Record
+from runHistory import RunHistoryStore
+from jobTracing import JobTracer
+from cpuProfiler import CpuProfiler
+from stallWatchdog import StallWatchdog, HEARTBEAT_INTERVAL_MS
+from memoryTracker import MemoryTracker, Enabled_From_Env as Memory_Tracking_Enabled
+from deltaUpdate import Delta_Update, DeltaUpdateError
+from versionService import VersionService, VersionCheckError, Read_Version_File, Read_Manifest_Version
+from profileSnapshot import ProfileSnapshotCache, ProfileSnapshotError, Browser_Version, Benchmark, Format_Benchmark
+from profileStore import ProfileStore
+from jobRegistry import JobRegistry, STATE_INTERRUPTED
+from eventRecorder import EventRecorder
+from extensionBuild import ExtensionBuild, ExtensionBuildError
+from uiCache import UiCache
+from resourceCache import ResourceCache, ResourceCacheError, RESOURCE_BUNDLE_NAME
+from runContext import RunContext
+from appLogging import Get_Logger, Setup_Logging, Lazy
+from orchestrationEngine import (
+    OrchestrationEngine, EngineHooks, AsyncApiClient, OrchestrationAbort,
+    Enabled_From_Env as Orchestration_Engine_Enabled,
+)
 
 warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
 urllib3.disable_warnings()
 
 
+# =========================================
+# 📝 Loggers (niveaux : AUTOMAIL_LOG_LEVELS="INFO,api=DEBUG", fichier APPDATA_DIR/logs/automail.log)
+# =========================================
+LOG          = Get_Logger("app")
+API_LOG      = Get_Logger("api")          # Save_Process / Save_Email / Send_Status
+SESSION_LOG  = Get_Logger("session")      # session.txt, login, déconnexion
+PROFILE_LOG  = Get_Logger("profile")      # profils, Secure Preferences, extensions
+JOBS_LOG     = Get_Logger("jobs")         # lancement / fermeture des navigateurs par email
+UI_LOG       = Get_Logger("ui")           # fenêtres, scénarios, onglets de résultats
+
+
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 PARENT_DIR = os.path.dirname(SCRIPT_DIR)
@@ -98,12 +139,25 @@ KEY_LEN = 32
 FIREFOX_LAUNCH = []
 LOGS= []
 PROCESS_PIDS = []
-NOTIFICATION_BADGES = {}
+RESULT_REFRESH_INTERVAL_MS = 400     # rafraîchissements groupés de l'onglet Result pendant le run
+NOTIFICATION_BADGE_STYLE = """
+    background-color: #d90429;
+    color: white;
+    font-size: 14px;
+    padding: 3px;
+    border-radius: 10px;
+    min-width: 15px;
+    text-align: center;
+"""
 EXTRACTION_THREAD = None 
 CLOSE_BROWSER_THREAD = None 
 NEW_VERSION = None
 LOGS_RUNNING = True  
 SELECTED_BROWSER_GLOBAL=None
+LOG_RETENTION_MANAGER = None
+RUN_HISTORY = None
+JOB_REGISTRY = None
+JOB_TRACER = JobTracer()
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 BASE_DIRECTORY = os.path.join(SCRIPT_DIR, '..', 'tools', 'ExtensionEmail')
@@ -114,7 +168,37 @@ TEMPLATE_DIRECTORY_FAMILY_CHROME = os.path.join(SCRIPT_DIR, '..', 'tools', 'Exte
 # 
 # =========================================
 LOGS_DIRECTORY = os.path.join(SCRIPT_DIR, '..', 'Tools', 'logs')
+EXTRACTION_LOOP_INTERVAL_MS = 1000      # pause entre deux tours de la boucle ExtractionThread
+CLOSE_MONITOR_START_DELAY_SEC = 10      # attente avant la première surveillance des téléchargements
+CLOSE_MONITOR_POLL_INTERVAL_SEC = 1     # scan du dossier Téléchargements (CloseBrowserThread et moteur asyncio)
 RESULT_FILE_PATH = os.path.join(os.path.dirname(__file__), "..", "tools", "result.txt")
+PROFILING_DIRECTORY = os.path.join(SCRIPT_DIR, '..', 'Tools', 'profiling')
+SCENARIOS_DIRECTORY = os.path.join(SCRIPT_DIR, '..', 'Tools', 'scenarios')   # scénarios lancés (batchRunner --scenario <nom>)
+PROFILER_SHORTCUT = "Ctrl+Shift+F12"
+
+# Profilage CPU optionnel (variable AUTOMAIL_PROFILE ou raccourci caché PROFILER_SHORTCUT)
+CPU_PROFILER = CpuProfiler(PROFILING_DIRECTORY)
+
+# Watchdog des blocages du thread GUI (seuil : AUTOMAIL_STALL_MS, 0 = désactivé)
+STALL_WATCHDOG = None
+STALL_HEARTBEAT_TIMER = None
+
+# Diagnostic mémoire longue durée (AUTOMAIL_MEMTRACK=1) : rapports dans Tools/profiling/memory
+MEMORY_TRACKER = MemoryTracker(os.path.join(PROFILING_DIRECTORY, 'memory'))
+
+# Enregistrement du flux d'événements d'un run (AUTOMAIL_RECORD=1) pour le rejouer avec loadHarness.py
+EVENT_RECORDER = EventRecorder(os.path.join(SCRIPT_DIR, '..', 'Tools', 'recordings'))
+JOB_TRACER.Add_Listener(EVENT_RECORDER.Listener)
+
+# Moteur asyncio (AUTOMAIL_ASYNC_ENGINE=1) : remplace Extraction/CloseBrowser/LogsDisplay pendant un run
+ORCHESTRATION_ENGINE = None
+
+# Profils "golden" par navigateur/version, clonés pour chaque email (même volume que Tools/Profiles)
+PROFILE_SNAPSHOTS_DIRECTORY = os.path.join(SCRIPT_DIR, '..', 'Tools', 'ProfileSnapshots')
+PROFILE_SNAPSHOTS = ProfileSnapshotCache(PROFILE_SNAPSHOTS_DIRECTORY)
+
+# Dernière utilisation, purge des caches et quota disque des profils (AUTOMAIL_PROFILE_QUOTA_GB, 0 = illimité)
+PROFILE_STORE = ProfileStore(os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles'))
 
 
 # =========================================
@@ -127,11 +211,20 @@ ARROW_UP_PATH        = os.path.join(ICONS_DIR_INTERFACE, "arrow_up.png").replace
 ARROW_DOWN_W_PATH    = os.path.join(ICONS_DIR_INTERFACE, "arrow_Down_w.png")
 ARROW_UP_W_PATH      = os.path.join(ICONS_DIR_INTERFACE, "arrow_up_w.png")
 
+# Les flèches sont référencées par chemin disque dans les feuilles de style (url(...)) : on teste donc
+# le disque, pas RESOURCE_CACHE.Resolve (qui peut renvoyer une ressource du bundle absente du disque)
 DOWN_EXISTS    = os.path.exists(ARROW_DOWN_PATH)
 UP_EXISTS      = os.path.exists(ARROW_UP_PATH)
 DOWN_EXISTS_W  = os.path.exists(ARROW_DOWN_W_PATH)
 UP_EXISTS_W    = os.path.exists(ARROW_UP_W_PATH)
 
+# 🖼️ Icônes / pixmaps / objets de dessin partagés (bundle interface/resources.rcc s'il existe)
+try:
+    RESOURCE_CACHE = ResourceCache(PARENT_DIR, os.path.join(PARENT_DIR, "interface", RESOURCE_BUNDLE_NAME))
+except ResourceCacheError as e:
+    LOG.warning("⚠️ [RESOURCES] %s", e)
+    RESOURCE_CACHE = ResourceCache(PARENT_DIR)
+
 
 
 
@@ -148,6 +241,8 @@ _MAIN_API                   =  "https://apps1.nrb-apps.com/pub/chk_usr1.php"
 # 🌐 URL UPDATE PROGRAMM
 # =========================================
 _DOWNLOAD_EXTRACTT_API      =  "https://github.com/Azedize/Programme/archive/refs/heads/main.zip"
+_DELTA_MANIFEST_API         =  "https://raw.githubusercontent.com/Azedize/Programme/main/manifest.json"
+_DELTA_BASE_API             =  "https://raw.githubusercontent.com/Azedize/Programme/main"
 _CHECK_VERSION_API          =  "https://www.dropbox.com/scl/fi/78a38bc4papwzlw80hxti/version.json?rlkey=n7dx5mb8tcctvprn0wq4ojw7m&st=z6vzw0ox&dl=1"
 
 
@@ -163,7 +258,7 @@ _ON_SCENARIO_CHANGED_API    =  "http://localhost/auth-api/get_scenario_by_name.p
 # =========================================
 # GLOBAL
 # =========================================
-APPDATA       = os.getenv("APPDATA")
+APPDATA       = os.getenv("APPDATA") or os.path.join(os.path.expanduser("~"), ".config")
 APP_NAME      = "SecureDesk"
 APPDATA_DIR   = os.path.join(APPDATA, APP_NAME)
 
@@ -192,6 +287,10 @@ COMBINED_KEYS = f"&{CLE1}&{CLE2}"
 
 INTERFACE_UI      = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "interface", "interface.ui"))
 AUTH_UI           = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "interface", "login_ui", "Auth.ui"))
+UI_VERSION_FILE   = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "interface", "version.txt"))
+
+# 🗂️ Modules générés depuis les .ui (clé : empreinte du .ui + interface/version.txt)
+UI_CACHE = UiCache(os.path.join(APPDATA_DIR, "ui_cache"), UI_VERSION_FILE)
 FILE_ACTIONS_JSON = os.path.join(SCRIPT_DIR, '..', "Tools", "action.json")
 
 
@@ -244,6 +343,21 @@ encrypted = encrypt_message(json.dumps(DATA), KEY)
 CHECK_URL_EX3 = f"http://reporting.nrb-apps.com/APP_R/redirect.php?nv=1&rv4=1&event=check&type=V4&ext=Ext3&k={encrypted}"
 SERVEUR_ZIP_URL_EX3 = f"http://reporting.nrb-apps.com/APP_R/redirect.php?nv=1&rv4=1&event=download&type=V4&ext=Ext3&k={encrypted}"
 
+# Vérifications de version : requêtes conditionnelles + cache local (TTL) partagé par tous les composants
+VERSION_SERVICE = VersionService(os.path.join(APPDATA_DIR, "version_cache.json"), headers=HEADERS, verify=False)
+VERSION_SOURCES = {
+    "programme": _CHECK_VERSION_API,
+    "ext3": CHECK_URL_EX3,
+}
+
+# Résultat du preflight de Process_Browser (clés du template, extension installée et à jour).
+# Invalidé par TTL ou par modification des fichiers surveillés, recalculé en arrière-plan.
+PREFLIGHT_TTL_SEC = 600
+PREFLIGHT_CACHE   = None
+PREFLIGHT_LOCK    = threading.Lock()    # protège seulement la lecture / le remplacement du cache
+PREFLIGHT_GENERATION = 0                # incrémenté par Invalidate_Preflight
+PREFLIGHT_WATCHED = [SECURE_PREFERENCES_TEMPLATE, EXTENTION_EX3, MANIFEST_PATH_EX3, VERSION_LOCAL_EX3]
+
 
 
 
@@ -348,7 +462,7 @@ def ensure_web_ext_installed():
         subprocess.run('npm install --global web-ext', check=True, shell=True)
         #print("✅ 'web-ext' a été installé avec succès.")
     except subprocess.CalledProcessError:
-        print("❌ Échec de l'installation de 'web-ext' via npm.")
+        PROFILE_LOG.error("❌ Échec de l'installation de 'web-ext' via npm.")
 
 
 
@@ -378,7 +492,33 @@ def parse_firefox_profiles_ini() -> Dict[str, str]:
 
 
 
-# 🛠️ Crée un profil Firefox avec un nom donné s'il n'existe pas déjà, et affiche les profils avant/après la création
+# 🛠️ Crée un profil Firefox via "firefox --CreateProfile" dans un dossier donné
+def Create_Firefox_Profile_At(profile_name: str, custom_dir: str, path_firefox: str) -> bool:
+    cmd = f"{profile_name} {custom_dir}"
+    result = subprocess.run(
+        [path_firefox, '--CreateProfile', cmd],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    # Afficher résultats
+    #print("🪵 stdout :", result.stdout.strip() or "<vide>")
+    #print("🪵 stderr :", result.stderr.strip() or "<vide>", "\n")
+
+    if result.returncode != 0:
+        #print(f"❌ Échec de la création (code {result.returncode})")
+        return False
+    return os.path.isdir(custom_dir)
+
+
+
+
+
+
+# 🛠️ Crée un profil Firefox avec un nom donné s'il n'existe pas déjà.
+# Le profil est cloné depuis le golden de la version installée ; --CreateProfile n'est lancé
+# qu'une fois par version (construction du golden) ou en secours si le clonage échoue.
 def create_firefox_profile(profile_name: str) -> Optional[str]:
     # Vérifier la présence de firefox.exe
     path_firefox = Get_Browser_Path("firefox.exe")
@@ -387,13 +527,6 @@ def create_firefox_profile(profile_name: str) -> Optional[str]:
         return None
     #print(f"🧭 Firefox détecté : {path_firefox}\n")
 
-    # Afficher les profils existants avant la création
-    #print("=== Profils existants AVANT la création ===")
-    existing_profiles = parse_firefox_profiles_ini()
-    # for name, path in existing_profiles.items():
-        #print(f" - {name}: {path}")
-    #print()
-
     # Définir le chemin de base pour les profils: SCRIPT_DIR/firefox
     path_profile = os.path.join(SCRIPT_DIR,'..','Tools', 'Profiles', 'firefox')
     #print(f"📁 Répertoire de base des profils : {path_profile}")
@@ -410,38 +543,26 @@ def create_firefox_profile(profile_name: str) -> Optional[str]:
         #print(f"✅ Profil '{profile_name}' déjà existant : {custom_dir}")
         return custom_dir
 
+    # Cloner le golden de cette version de Firefox
+    version = Browser_Version(path_firefox)
+    if version:
+        try:
+            PROFILE_SNAPSHOTS.Clone(
+                "firefox", version, custom_dir,
+                lambda golden_dir, golden_name: Create_Firefox_Profile_At(golden_name, golden_dir, path_firefox)
+            )
+            PROFILE_LOG.info("✅ Profil cloné avec succès : %s", custom_dir)
+            return custom_dir
+        except (ProfileSnapshotError, OSError) as e:
+            PROFILE_LOG.warning("⚠️ Clonage du profil impossible, création classique : %s", e)
+
     # Créer le profil via subprocess
     #print(f"🔧 Création du profil '{profile_name}' dans {custom_dir}\n")
-    cmd = f"{profile_name} {custom_dir}"
-    result = subprocess.run(
-        [path_firefox, '--CreateProfile', cmd],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    # Afficher résultats
-    #print("🪵 stdout :", result.stdout.strip() or "<vide>")
-    #print("🪵 stderr :", result.stderr.strip() or "<vide>", "\n")
-
-    if result.returncode != 0:
-        #print(f"❌ Échec de la création (code {result.returncode})")
-        return None
-
-    # Vérifier l'existence après création
-    if os.path.isdir(custom_dir):
-        print(f"✅ Profil créé avec succès : {custom_dir}")
-    else:
+    if not Create_Firefox_Profile_At(profile_name, custom_dir, path_firefox):
         #print("❌ Le dossier du profil n'a pas été trouvé après création.")
         return None
 
-    # Afficher les profils existants après la création
-    #print("=== Profils existants APRÈS la création ===")
-    updated_profiles = parse_firefox_profiles_ini()
-    # for name, path in updated_profiles.items():
-        #print(f" - {name}: {path}")
-    #print()
-
+    PROFILE_LOG.info("✅ Profil créé avec succès : %s", custom_dir)
     return custom_dir
 
 
@@ -489,15 +610,15 @@ def launch_new_window():
         stdout, stderr = process.communicate()  
         if process.returncode != 0:
             try:
-                print(f"   📝 [ERROR] Standard Error: {stderr.decode(encoding='utf-8', errors='replace')}") 
+                JOBS_LOG.error("   📝 [ERROR] Standard Error: %s", stderr.decode(encoding='utf-8', errors='replace')) 
             except Exception as decode_err:
-                print(f"   ⚠️ [ERROR] Failed to decode stderr: {decode_err}")
-                print(f"   📝 [ERROR] Raw stderr: {stderr}") 
+                JOBS_LOG.warning("   ⚠️ [ERROR] Failed to decode stderr: %s", decode_err)
+                JOBS_LOG.error("   📝 [ERROR] Raw stderr: %s", stderr) 
             try:
-                print(f"   📤 [INFO] Standard Output: {stdout.decode(encoding='utf-8', errors='replace')}") 
+                JOBS_LOG.debug("   📤 [INFO] Standard Output: %s", Lazy(stdout.decode, encoding='utf-8', errors='replace')) 
             except Exception as decode_err:
-                print(f"   ⚠️ [ERROR] Failed to decode stdout: {decode_err}")
-                print(f"   📤 [INFO] Raw stdout: {stdout}") 
+                JOBS_LOG.warning("   ⚠️ [ERROR] Failed to decode stdout: %s", decode_err)
+                JOBS_LOG.debug("   📤 [INFO] Raw stdout: %s", stdout) 
             return None
 
         time.sleep(1)
@@ -517,6 +638,10 @@ def launch_new_window():
 # 📝 Ajoute un message au journal global 'LOGS'
 def log_message(text):
     global LOGS
+    EVENT_RECORDER.Log(text)
+    if ORCHESTRATION_ENGINE is not None and ORCHESTRATION_ENGINE.Is_Running():
+        ORCHESTRATION_ENGINE.Log(text)
+        return
     LOGS.append(text)
 
 
@@ -541,6 +666,15 @@ def Download_Extract(new_versions):
             #print("✅ [INFO] No extension updates required.")
             return 0
 
+        # Mise à jour différentielle : seuls les fichiers modifiés sont téléchargés.
+        # En cas d'échec (manifest absent, hash invalide...) on repasse par le ZIP complet.
+        try:
+            Delta_Update(_DELTA_MANIFEST_API, _DELTA_BASE_API, {"tools": os.path.join(PARENT_DIR, "tools")},
+                         headers=HEADERS, verify=False)
+            return 0
+        except DeltaUpdateError as delta_err:
+            LOG.warning("⚠️ [UPDATE] Delta update unavailable, full download: %s", delta_err)
+
         with tempfile.TemporaryDirectory() as tmpdir:
             local_zip = os.path.join(tmpdir, "Programme-main.zip")
 
@@ -631,12 +765,12 @@ def Check_Version():
     """
     try:
         #print("🌐 Checking latest versions from server...")
-        response = requests.get(_CHECK_VERSION_API, timeout=15)
-        if response.status_code != 200:
-            #print(f"❌ [ERROR] Failed to fetch versions: HTTP {response.status_code}")
+        try:
+            data = VERSION_SERVICE.Fetch(_CHECK_VERSION_API, key="programme")
+        except VersionCheckError:
+            #print(f"❌ [ERROR] Failed to fetch versions")
             return "_1"
 
-        data = response.json()
         version_updates = {}
 
         # server versions
@@ -655,16 +789,10 @@ def Check_Version():
             "version_extensions": os.path.join(PARENT_DIR, "tools", "version.txt")
         }
 
-        client_versions = {}
-        for key, path in client_files.items():
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    client_versions[key] = f.read().strip()
-                #print(f"📄 {key}: Local = {client_versions[key]}")
-            else:
-                client_versions[key] = None
-                #print(f"⚠️ {key}: Local version file not found.")
-                return "_1"
+        client_versions = {key: Read_Version_File(path) for key, path in client_files.items()}
+        if None in client_versions.values():
+            #print(f"⚠️ Local version file not found.")
+            return "_1"
 
         # compare
         if server_version_python != client_versions["version_python"]:
@@ -698,8 +826,11 @@ def Check_Version():
 
 # -----------------------------
 # Personnalisation d'un onglet pour afficher le nombre d'emails complétés et non complétés
+# Le QLabel d'en-tête est créé une seule fois par fenêtre (refs["header"]), ensuite seul son texte change
 # -----------------------------
-def Set_Custom_Colored_Tab(tab_widget, index, completed_count, not_completed_count):
+def Set_Custom_Colored_Tab(refs, completed_count, not_completed_count):
+    tab_widget = refs["interface"]
+    index = refs["result_index"]
     html_text = (
         f'<div style="text-align:center;margin:0;padding:0;">'
         f'<span style="font-family:\'Segoe UI\', sans-serif; font-size:14px;">Result ('
@@ -708,29 +839,105 @@ def Set_Custom_Colored_Tab(tab_widget, index, completed_count, not_completed_cou
         f'</div>'
     )
 
-    # إزالة النص الافتراضي
-    tab_widget.setTabText(index, "")
+    label = refs["header"]
+    if label is None:
+        # إزالة النص الافتراضي
+        tab_widget.setTabText(index, "")
+
+        # إنشاء QLabel
+        label = QLabel()
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        # لف QLabel داخل QWidget لتوسيطه
+        wrapper = QWidget()
+        layout = QHBoxLayout(wrapper)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(label)
+
+        # إزالة أي أزرار جانبية موجودة
+        tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.LeftSide, None)
+        tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+
+        # إضافة الـ wrapper كزر التبويب (محاذاة مركزية)
+        tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.LeftSide, wrapper)
+        refs["header"] = label
+
+    if label.text() != html_text:
+        label.setText(html_text)
+
+
+
+
+
+
+
+
+
+# -----------------------------
+# Références des onglets de résultats, recherchées une seule fois (MainWindow.__init__)
+# L'en-tête et les badges vivent ici : chaque MainWindow (nouvelle après un re-login) a les siens
+# -----------------------------
+def Build_Result_Tab_Refs(window):
+    refs = {"interface": None, "result_index": -1, "header": None, "results": None, "status": {}, "lists": []}
+
+    interface_tab_widget = window.findChild(QTabWidget, "interface_2")
+    if interface_tab_widget:
+        for i in range(interface_tab_widget.count()):
+            if interface_tab_widget.tabText(i).startswith("Result"):
+                refs["interface"] = interface_tab_widget
+                refs["result_index"] = i
+                break
+
+    result_tab_widget = window.findChild(QTabWidget, "tabWidgetResult")
+    if not result_tab_widget:
+        return refs
+    refs["results"] = result_tab_widget
+
+    for i in range(result_tab_widget.count()):
+        tab = result_tab_widget.widget(i)
+        if tab:
+            refs["lists"].extend(tab.findChildren(QListWidget))
+
+    for status in STATUS_LIST:
+        tab_widget = result_tab_widget.findChild(QWidget, status)
+        if not tab_widget:
+            continue
+        list_widgets = tab_widget.findChildren(QListWidget)
+        if not list_widgets:
+            continue
+        refs["status"][status] = {
+            "index": result_tab_widget.indexOf(tab_widget),
+            "list": list_widgets[0],
+            "no_data": tab_widget.findChild(QLabel, "no_data_message"),
+            "emails": None,     # dernière liste affichée : évite de reconstruire une liste inchangée
+            "badge": None,      # QLabel du compteur, créé au premier résultat
+        }
+    return refs
+
+
+def Result_Tab_Refs(window):
+    refs = getattr(window, "result_tab_refs", None)
+    if refs is None:
+        refs = Build_Result_Tab_Refs(window)
+        window.result_tab_refs = refs
+    return refs
+
+
 
-    # إنشاء QLabel
-    label = QLabel()
-    label.setTextFormat(Qt.TextFormat.RichText)
-    label.setText(html_text)
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-    # لف QLabel داخل QWidget لتوسيطه
-    wrapper = QWidget()
-    layout = QHBoxLayout(wrapper)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(0)
-    layout.addWidget(label)
 
-    # إزالة أي أزرار جانبية موجودة
-    tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.LeftSide, None)
-    tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
 
-    # إضافة الـ wrapper كزر التبويب (محاذاة مركزية)
-    tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.LeftSide, wrapper)
+# 🧹 Vide les listes de résultats et masque les badges (nouveau Submit)
+def Clear_Result_Tabs(window):
+    refs = Result_Tab_Refs(window)
+    for list_widget in refs["lists"]:
+        list_widget.clear()
+    for ref in refs["status"].values():
+        ref["emails"] = None
+        Remove_Notification(ref)
 
 
 
@@ -742,16 +949,18 @@ def Set_Custom_Colored_Tab(tab_widget, index, completed_count, not_completed_cou
 
 # -----------------------------
 # Read email results and update the UI
+# `notify=False` pour les rafraîchissements pendant le run : pas de message si rien n'est encore écrit
 # -----------------------------
-def Read_Result_Update_List(window):
+def Read_Result_Update_List(window, notify=True):
     # Vérifier si le fichier existe
     if not os.path.exists(RESULT_FILE_PATH):
-        Show_Critical_Message(
-            window,
-            "Information",
-            "No emails have been processed yet.\nPlease check the filters or new data.",
-            message_type="info"
-        )
+        if notify:
+            Show_Critical_Message(
+                window,
+                "Information",
+                "No emails have been processed yet.\nPlease check the filters or new data.",
+                message_type="info"
+            )
         return
 
     errors_dict = defaultdict(list)
@@ -764,7 +973,8 @@ def Read_Result_Update_List(window):
 
         # Vérification si le fichier est vide
         if not lines:
-            Show_Critical_Message(window, "Warning", "No results available.", message_type="warning")
+            if notify:
+                Show_Critical_Message(window, "Warning", "No results available.", message_type="warning")
             return
 
         completed_count = 0
@@ -784,42 +994,35 @@ def Read_Result_Update_List(window):
                 no_completed_count += 1
 
         errors_dict["all"] = all_emails
+        refs = Result_Tab_Refs(window)
 
         # Mise à jour du tab principal
-        interface_tab_widget = window.findChild(QTabWidget, "interface_2")
-        if interface_tab_widget:
-            for i in range(interface_tab_widget.count()):
-                if interface_tab_widget.tabText(i).startswith("Result"):
-                    Set_Custom_Colored_Tab(interface_tab_widget, i, completed_count, no_completed_count)
-                    break
+        if refs["interface"]:
+            Set_Custom_Colored_Tab(refs, completed_count, no_completed_count)
 
         # Mise à jour des tabs secondaires
-        result_tab_widget = window.findChild(QTabWidget, "tabWidgetResult")
+        result_tab_widget = refs["results"]
         if not result_tab_widget:
             return
 
-        for status in STATUS_LIST:
-            tab_widget = result_tab_widget.findChild(QWidget, status)
-            if not tab_widget:
-                continue
-
-            list_widgets = tab_widget.findChildren(QListWidget)
-            if not list_widgets:
+        for status, ref in refs["status"].items():
+            emails = errors_dict.get(status, [])
+            if emails == ref["emails"]:
                 continue
+            ref["emails"] = emails
 
-            list_widget = list_widgets[0]
+            list_widget = ref["list"]
             list_widget.clear()
-            emails = errors_dict.get(status, [])
             if emails:
                 list_widget.addItems(emails)
                 list_widget.scrollToBottom()
-                # Ajouter un badge de notification
-                Add_Notification_Badge(result_tab_widget, result_tab_widget.indexOf(tab_widget), len(emails))
-                # Supprimer le message "no data" si présent
-                message_label = tab_widget.findChild(QLabel, "no_data_message")
-                if message_label:
-                    message_label.deleteLater()
+                # Mettre à jour le badge de notification
+                Add_Notification_Badge(result_tab_widget, ref, len(emails))
+                # Masquer le message "no data" si présent
+                if ref["no_data"]:
+                    ref["no_data"].hide()
             else:
+                Remove_Notification(ref)
                 list_widget.addItem("⚠ No email data available for this category currently.")
                 list_widget.show()
 
@@ -834,49 +1037,41 @@ def Read_Result_Update_List(window):
 
 # -----------------------------
 # Gestion des badges de notification sur les onglets
+# Un QLabel par onglet (ref["badge"], voir Build_Result_Tab_Refs), créé (et stylé) une seule fois ;
+# ensuite texte, position et visibilité
 # -----------------------------
 
 
-def Remove_Notification(index):
-    badge = NOTIFICATION_BADGES.pop(index, None)
+def Remove_Notification(ref):
+    badge = ref["badge"]
     if badge:
-        badge.deleteLater()
+        badge.hide()
 
 
 
 
 
 
-def Add_Notification_Badge(tab_widget, tab_index, count):
-    old_badge = NOTIFICATION_BADGES.get(tab_index)
-    if old_badge:
-        old_badge.deleteLater()
-
+def Add_Notification_Badge(tab_widget, ref, count):
     tab_bar = tab_widget.tabBar()
-    tab_rect = tab_bar.tabRect(tab_index)
+    tab_rect = tab_bar.tabRect(ref["index"])
 
     badge_x = tab_rect.right() - 14
     badge_y = tab_rect.top() + 2
 
-    badge_label = QLabel(f"{count}", tab_widget)
-    badge_label.setStyleSheet("""
-        background-color: #d90429;
-        color: white;
-        font-size: 14px;
-        padding: 3px;
-        border-radius: 10px;
-        min-width: 15px;
-        text-align: center;
-    """)
-    badge_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
     try:
-        badge_label.setParent(tab_widget)
+        badge_label = ref["badge"]
+        if badge_label is None:
+            badge_label = QLabel(tab_widget)
+            badge_label.setStyleSheet(NOTIFICATION_BADGE_STYLE)
+            badge_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            ref["badge"] = badge_label
+
+        badge_label.setText(f"{count}")
+        badge_label.adjustSize()
         badge_label.move(badge_x, badge_y)
         badge_label.show()
-        NOTIFICATION_BADGES[tab_index] = badge_label
-        tab_widget.update()
-        tab_bar.update()
+        badge_label.raise_()
     except Exception as e:
         Show_Critical_Message(tab_widget, "Error", f"Error adding notification badge: {e}")
 
@@ -885,6 +1080,18 @@ def Add_Notification_Badge(tab_widget, tab_index, count):
 
 
 
+# 📣 Signal émis à chaque résultat écrit dans result.txt (threads de traitement ➜ interface)
+class ResultSignals(QtCore.QObject):
+    updated = pyqtSignal()
+
+
+RESULT_SIGNALS = ResultSignals()
+
+
+
+
+
+
 # 🆔 Génère un ID de session aléatoire basé sur UUID (tronqué à la longueur désirée)
 def Generate_Session_Id(length=5):
     if length <= 0:
@@ -1038,6 +1245,8 @@ def Generate_Gmail_Password(length=12):
 # 🔍 Récupère le chemin absolu d'un exécutable de navigateur en consultant le registre Windows.
 
 def Get_Browser_Path(exe_name: str) -> Optional[str]:
+    if reg is None:
+        return None
     key_app_paths = rf"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\{exe_name}"
     hives = [
         (reg.HKEY_LOCAL_MACHINE, reg.KEY_READ | reg.KEY_WOW64_32KEY),
@@ -1155,65 +1364,74 @@ def Modifier_Extension_Par_Traitement(email_folder):
 # -----------------------------
 # Génération complète de l'extension Chrome/Firefox
 # -----------------------------
-# Crée une extension personnalisée pour l'utilisateur
-# Copie template, remplace placeholders JS et applique JSON modifié
-def Create_Extension_For_Email(email, password, host, port, user, passwordP, recovry, new_password, new_recovry, IDL, selected_Browser):
-    template_directory = TEMPLATE_DIRECTORY_FIREFOX if selected_Browser.lower() == "firefox" else TEMPLATE_DIRECTORY_FAMILY_CHROME
+# Build partagé par template : copié et traité (traitement.json) une seule fois par run
+EXTENSION_BUILDS = {}
 
-    if not os.path.exists(BASE_DIRECTORY):
-        os.makedirs(BASE_DIRECTORY)
-        
-    email_folder = os.path.join(BASE_DIRECTORY, email)
-    if os.path.exists(email_folder):
-        shutil.rmtree(email_folder)
-    os.makedirs(email_folder)
+def Extension_Template_Directory(selected_Browser):
+    return TEMPLATE_DIRECTORY_FIREFOX if selected_Browser.lower() == "firefox" else TEMPLATE_DIRECTORY_FAMILY_CHROME
 
-    # Lecture session si existante
-    session = ""
-    if os.path.exists(SESSION_PATH):
-        with open(SESSION_PATH, "r", encoding="utf-8") as f:
-            session = f.read().strip()
 
-    # Copier les fichiers du template
-    for item in os.listdir(template_directory):
-        src = os.path.join(template_directory, item)
-        dst = os.path.join(email_folder, item)
-        if os.path.isdir(src):
-            shutil.copytree(src, dst, dirs_exist_ok=True)
-        else:
-            shutil.copy2(src, dst)
-
-    # Modification des fichiers JS principaux
-    js_files = {
-        "actions.js": {
-            "__IDL__": IDL, "__email__": email, "___session_user__": session
-        },
-        "background.js": {
-            "__host__": host, "__port__": port, "__user__": user,
-            "__pass__": passwordP, "__IDL__": IDL, "__email__": email
-        },
-        "gmail_process.js": {
-            "__email__": email, "__password__": password,
-            "__recovry__": recovry, "__newPassword__": new_password,
-            "__newRecovry__": new_recovry
-        },
-        "ReportingActions.js": {
-            "__IDL__": IDL, "__email__": email
+def Get_Extension_Build(template_directory):
+    if template_directory not in EXTENSION_BUILDS:
+        EXTENSION_BUILDS[template_directory] = ExtensionBuild(
+            template_directory, BASE_DIRECTORY, prepare=Modifier_Extension_Par_Traitement
+        )
+    return EXTENSION_BUILDS[template_directory]
+
+
+
+# Crée une extension personnalisée pour l'utilisateur
+# Liens vers le build partagé (`build_dir`, préparé par Build_Run_Context) + job.json avec les valeurs du compte
+def Create_Extension_For_Email(email, password, host, port, user, passwordP, recovry, new_password, new_recovry, IDL, selected_Browser,
+                               session=None, build_dir=None):
+    with JOB_TRACER.Span(email, "extension_rendered", browser=selected_Browser):
+        template_directory = Extension_Template_Directory(selected_Browser)
+
+        if not os.path.exists(BASE_DIRECTORY):
+            os.makedirs(BASE_DIRECTORY)
+        
+        email_folder = os.path.join(BASE_DIRECTORY, email)
+
+        # Lecture session si existante (déjà lue une fois par run quand `session` est fourni)
+        if session is None:
+            session = ""
+            if os.path.exists(SESSION_PATH):
+                with open(SESSION_PATH, "r", encoding="utf-8") as f:
+                    session = f.read().strip()
+
+        build = Get_Extension_Build(template_directory)
+        if build_dir is None:
+            build_dir = build.Ensure()
+
+        # Valeurs du compte, lues par les JS de l'extension (runtime.getURL("job.json"))
+        config = {
+            "email": email, "password": password, "recovry": recovry,
+            "newPassword": new_password, "newRecovry": new_recovry,
+            "host": host, "port": port, "user": user, "pass": passwordP,
+            "IDL": IDL, "session_user": session
         }
-    }
 
-    for js_file, replacements in js_files.items():
-        path = os.path.join(email_folder, js_file)
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            for placeholder, value in replacements.items():
-                content = content.replace(placeholder, str(value))
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        # Templates antérieurs (valeurs écrites dans le code JS) : rendus pour le job
+        js_files = {
+            "actions.js": {
+                "__IDL__": json.dumps(IDL), "__email__": email, "___session_user__": session
+            },
+            "background.js": {
+                "__host__": json.dumps(host), "__port__": json.dumps(port), "__user__": json.dumps(user),
+                "__pass__": json.dumps(passwordP), "__IDL__": json.dumps(IDL), "__email__": email
+            },
+            "gmail_process.js": {
+                "__email__": email, "__password__": password,
+                "__recovry__": recovry, "__newPassword__": new_password,
+                "__newRecovry__": new_recovry
+            },
+            "ReportingActions.js": {
+                "__IDL__": json.dumps(IDL), "__email__": email
+            }
+        }
 
-    # Appliquer le traitement avancé sur gmail_process.js
-    Modifier_Extension_Par_Traitement(email_folder)
+        report = build.Render_Job(email_folder, config, js_files, build_dir=build_dir)
+        PROFILE_LOG.debug("🧩 Extension %s : %s", email, report)
 
 
 
@@ -1222,25 +1440,38 @@ def Create_Extension_For_Email(email, password, host, port, user, passwordP, rec
 
 
 
-# 📝 Enregistre de façon unique le PID, l'email et l'ID de session dans un fichier texte lié à l'email.
+# 📝 Enregistre le PID du job dans le registre et écrit data.txt pour l'extension
+# (le background.js lit pid:email:session_id via runtime.getURL("data.txt")).
 def Add_Pid_To_Text_File(pid, email , inserted_id):
     #print(f"🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴🔴 Function add_pid_to_text_file called with PID: {pid}, Email: {email}")
-    text_file_path = os.path.join(BASE_DIRECTORY, email , "data.txt")
+    registry = Get_Job_Registry()
+    if registry:
+        registry.Set_Pid(JobRegistry.Job_Id(SESSION_ID, email), pid)
 
+    text_file_path = os.path.join(BASE_DIRECTORY, email , "data.txt")
     os.makedirs(os.path.dirname(text_file_path), exist_ok=True)
 
-    if os.path.exists(text_file_path):
-        with open(text_file_path, 'r', encoding='utf-8') as file:
-            existing_entries = set(file.read().splitlines())
-    else:
-        existing_entries = set()
-
     #print(f"PID: {pid}, Email: {email}")
     entry = f"{pid}:{email}:{SESSION_ID}:{inserted_id}" 
+    with open(text_file_path, 'w', encoding='utf-8') as file:
+        file.write(f"{entry}\n")
+
+
 
-    if entry not in existing_entries:
-        with open(text_file_path, 'w', encoding='utf-8') as file:
-            file.write(f"{entry}\n")
+# 🔎 inserted_id d'un email : registre en mémoire, sinon data.txt (jobs lancés avant la mise à jour)
+def Get_Inserted_Id(email):
+    registry = Get_Job_Registry()
+    job = registry.Find_By_Email(email) if registry else None
+    if job and job.get("inserted_id") not in (None, "None"):
+        return job["inserted_id"]
+
+    text_file_path = os.path.join(BASE_DIRECTORY, email , "data.txt")
+    with open(text_file_path, 'r', encoding='utf-8') as file:
+        first_line = file.readline().strip()  # lire juste la première ligne
+    parts = first_line.split(":")
+    if len(parts) >= 4:
+        return parts[3]
+    raise ValueError(f"Format de ligne invalide dans le fichier : {first_line}")
 
 
 
@@ -1341,7 +1572,7 @@ def Close_Windows_By_Profiles(profiles_list):
             win32gui.PostMessage(window["hwnd"], win32con.WM_CLOSE, 0, 0)
             #print(f"✅ Fermeture : {window['profile']} - {window['title']}")
         except Exception as e:
-            print(f"❌ Erreur avec {window['profile']} : {str(e)}")
+            JOBS_LOG.error("❌ Erreur avec %s : %s", window['profile'], str(e))
 
 
 
@@ -1387,27 +1618,125 @@ def Stop_All_Processes(window):
                 process.wait(timeout=5)
                 #print(f"Process {pid} terminated successfully.")
             except psutil.NoSuchProcess:
-                print(f"The process with PID {pid} no longer exists.")
+                JOBS_LOG.warning("The process with PID %s no longer exists.", pid)
             except psutil.AccessDenied:
-                print(f"Permission denied to terminate the process with PID {pid}.")
+                JOBS_LOG.warning("Permission denied to terminate the process with PID %s.", pid)
             except Exception as e:
-                print(f"An error occurred while terminating PID {pid}: {e}")
+                JOBS_LOG.error("An error occurred while terminating PID %s: %s", pid, e)
             finally:
                 if pid in PROCESS_PIDS:
                     PROCESS_PIDS.remove(pid)
-                    print(f"PID {pid} removed from process list.")
+                    JOBS_LOG.debug("PID %s removed from process list.", pid)
     else:
             try:
                 Close_Windows_By_Profiles(FIREFOX_LAUNCH)
             except Exception as e:
-                print(f"⚠️ Erreur lors de la fermeture des profils Firefox: {e}")
+                JOBS_LOG.error("⚠️ Erreur lors de la fermeture des profils Firefox: %s", e)
  
             finally:
                 for pid in PROCESS_PIDS[:]:
                     PROCESS_PIDS.remove(pid)
-                    print(f"PID {pid} removed from process list.")
+                    JOBS_LOG.debug("PID %s removed from process list.", pid)
+
+
+
+
+
+
+
+
+# 💾 Fin de run : purge des caches des profils utilisés, quota LRU et rapport d'occupation
+def Cleanup_Profiles():
+    try:
+        result = PROFILE_STORE.Cleanup()
+        if result["freed"] or result["evicted"]:
+            PROFILE_LOG.info("🧹 [PROFILES] %s Mo de caches libérés, %s profil(s) supprimé(s) : %s", result['freed'] // (1024 * 1024), len(result['evicted']), result['evicted'])
+        PROFILE_LOG.info("%s", PROFILE_STORE.Format_Footprint())
+    except Exception as e:
+        PROFILE_LOG.warning("⚠️ [PROFILES] Nettoyage des profils impossible : %s", e)
+
+
+
+
+
+
+# ⏱️ Écrit la trace des jobs (format Chrome trace) et le résumé p50/p95 dans le dossier de session
+def Write_Job_Trace():
+    try:
+        trace_path = os.path.join(LOGS_DIRECTORY, f"{CURRENT_DATE}_{CURRENT_HOUR}", f"trace_{SESSION_ID}.json")
+        if JOB_TRACER.Write(trace_path):
+            JOBS_LOG.info("⏱️ [TRACE] Trace écrite : %s", trace_path)
+            JOBS_LOG.info("%s", JOB_TRACER.Format_Summary())
+    except Exception as e:
+        JOBS_LOG.warning("⚠️ [TRACE] Impossible d'écrire la trace : %s", e)
+
+
+
+
+
+
+# 📋 Retourne le registre des jobs (créé au premier appel)
+def Get_Job_Registry():
+    global JOB_REGISTRY
+    if JOB_REGISTRY is None:
+        try:
+            JOB_REGISTRY = JobRegistry()
+        except Exception as e:
+            JOBS_LOG.warning("⚠️ [JOBS] Registre des jobs indisponible : %s", e)
+            JOB_REGISTRY = None
+    return JOB_REGISTRY
+
+
+
+# ♻️ Au démarrage : recharge les jobs non terminés ; ceux dont le processus a disparu sont marqués interrompus
+def Recover_Jobs():
+    registry = Get_Job_Registry()
+    if not registry:
+        return []
+    recovered = registry.Recover()
+    for job in recovered:
+        if not (job.get("pid") and psutil.pid_exists(job["pid"])):
+            registry.Update(job["job_id"], state=STATE_INTERRUPTED)
+    if recovered:
+        JOBS_LOG.info("♻️ [JOBS] %s job(s) non terminé(s) retrouvé(s) dans le journal.", len(recovered))
+    registry.Forget_Finished()
+    return recovered
+
+
+
+
 
 
+# 🗄️ Retourne le store d'historique (créé au premier appel, avec import unique de result.txt)
+def Get_Run_History():
+    global RUN_HISTORY
+    if RUN_HISTORY is None:
+        try:
+            RUN_HISTORY = RunHistoryStore()
+            RUN_HISTORY.Import_Result_File(RESULT_FILE_PATH)
+        except Exception as e:
+            JOBS_LOG.warning("⚠️ [HISTORY] Historique indisponible : %s", e)
+            RUN_HISTORY = None
+    return RUN_HISTORY
+
+
+
+
+
+
+# 🔎 Exécutable du navigateur choisi (web-ext installé au besoin pour Firefox)
+def Resolve_Browser_Path(selected_Browser):
+    browser_path = (
+        Get_Browser_Path("chrome.exe") if selected_Browser == "chrome"
+        else Get_Browser_Path("firefox.exe") if selected_Browser == "firefox"
+        else Get_Browser_Path("msedge.exe") if selected_Browser == "edge"
+        else Get_Browser_Path("dragon.exe")  
+    )
+
+    if selected_Browser == "firefox":
+        ensure_web_ext_installed()
+    return browser_path
+
 
 
 
@@ -1415,10 +1744,10 @@ def Stop_All_Processes(window):
 
 
 # 🚀 Lance un thread pour fermer automatiquement les processus Chrome actifs.
-def Launch_Close_Chrome(selected_Browser , username):
+def Launch_Close_Chrome(selected_Browser , username , Isp=None):
     global CLOSE_BROWSER_THREAD
-    CLOSE_BROWSER_THREAD = CloseBrowserThread( selected_Browser ,username)
-    CLOSE_BROWSER_THREAD.progress.connect(lambda msg: print(msg))
+    CLOSE_BROWSER_THREAD = CloseBrowserThread( selected_Browser ,username , Isp)
+    CLOSE_BROWSER_THREAD.progress.connect(lambda msg: JOBS_LOG.debug("%s", msg))
     CLOSE_BROWSER_THREAD.start()
 
 
@@ -1459,60 +1788,7 @@ def Generate_User_Input_Data(window):
     entered_number = int(entered_number)
 
     try:
-        # Séparer le texte en lignes et supprimer les espaces superflus
-        lines = [line.strip() for line in input_data.split("\n") if line.strip()]
-        if not lines:
-            Show_Critical_Message(window, "Error", "Input is empty after stripping spaces.", message_type="critical")
-            return
-
-        # Extraire les clés depuis la première ligne
-        keys = [key.strip() for key in lines[0].split(";")]
-
-        # Définir les clés obligatoires et optionnelles
-        mandatory_patterns = [
-            ["email", "passwordEmail", "ipAddress", "port"],
-            ["Email", "password_email", "ip_address", "port"]
-        ]
-        optional_patterns = [
-            ["login", "password", "recoveryEmail", "newrecoveryEmail"],
-            ["login", "password", "recovery_email", "New_recovery_email"]
-        ]
-
-        # Créer un set de toutes les clés valides
-        all_valid_keys = set()
-        for pat in mandatory_patterns + optional_patterns:
-            all_valid_keys.update(pat)
-
-        # Vérifier que toutes les clés obligatoires sont présentes
-        if not any(set(pat).issubset(keys) for pat in mandatory_patterns):
-            missing_keys = [k for pat in mandatory_patterns for k in pat if k not in keys]
-            pattern_message = (
-                "<b>The required keys are missing in your input.</b><br><br>"
-                "Please include the required keys in one of the following formats:<br>"
-                "1. <i>email; passwordEmail; ipAddress; port</i><br>"
-                "2. <i>Email; password_email; ip_address; port</i><br><br>"
-                f"<b>Missing keys detected:</b> {', '.join(missing_keys)}"
-            )
-            Show_Critical_Message(window, "Error - Required Keys Missing", pattern_message, message_type="critical")
-            return
-
-        # Vérifier qu'il n'y a pas de clés invalides
-        invalid_keys = [k for k in keys if k not in all_valid_keys]
-        if invalid_keys:
-            pattern_message = f"<b>Invalid keys detected:</b> {', '.join(invalid_keys)}"
-            Show_Critical_Message(window, "Error - Invalid Keys", pattern_message, message_type="critical")
-            return
-
-        # Transformer les lignes suivantes en liste de dictionnaires
-        data_list = []
-        for line in lines[1:]:
-            values = [v.strip() for v in line.split(";")]
-            if len(values) != len(keys):
-                Show_Critical_Message(window, "Error - Key/Value Mismatch", 
-                                      "The number of keys and values does not match for a line.", 
-                                      message_type="critical")
-                return
-            data_list.append(dict(zip(keys, values)))
+        data_list = Parse_Input_Data(input_data)
 
         # Vérifier que le nombre saisi ne dépasse pas le nombre d'entrées disponibles
         if entered_number > len(data_list):
@@ -1527,6 +1803,10 @@ def Generate_User_Input_Data(window):
 
         return data_list, entered_number
 
+    except InputDataError as e:
+        Show_Critical_Message(window, e.title, str(e), message_type="critical")
+        return
+
     except Exception as e:
         Show_Critical_Message(
             window,
@@ -1539,6 +1819,69 @@ def Generate_User_Input_Data(window):
 
 
 
+class InputDataError(ValueError):
+    """Raised when the pasted account list is malformed; `title` is the dialog title shown to the user."""
+
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+
+
+# 📋 Convertit le texte saisi (en-tête "clé;clé;..." puis une ligne par compte) en liste de dictionnaires.
+# Utilisé par l'interface (textEdit_3) et par le runner en ligne de commande (batchRunner.py).
+def Parse_Input_Data(input_data):
+    # Séparer le texte en lignes et supprimer les espaces superflus
+    lines = [line.strip() for line in input_data.split("\n") if line.strip()]
+    if not lines:
+        raise InputDataError("Error", "Input is empty after stripping spaces.")
+
+    # Extraire les clés depuis la première ligne
+    keys = [key.strip() for key in lines[0].split(";")]
+
+    # Définir les clés obligatoires et optionnelles
+    mandatory_patterns = [
+        ["email", "passwordEmail", "ipAddress", "port"],
+        ["Email", "password_email", "ip_address", "port"]
+    ]
+    optional_patterns = [
+        ["login", "password", "recoveryEmail", "newrecoveryEmail"],
+        ["login", "password", "recovery_email", "New_recovery_email"]
+    ]
+
+    # Créer un set de toutes les clés valides
+    all_valid_keys = set()
+    for pat in mandatory_patterns + optional_patterns:
+        all_valid_keys.update(pat)
+
+    # Vérifier que toutes les clés obligatoires sont présentes
+    if not any(set(pat).issubset(keys) for pat in mandatory_patterns):
+        missing_keys = [k for pat in mandatory_patterns for k in pat if k not in keys]
+        pattern_message = (
+            "<b>The required keys are missing in your input.</b><br><br>"
+            "Please include the required keys in one of the following formats:<br>"
+            "1. <i>email; passwordEmail; ipAddress; port</i><br>"
+            "2. <i>Email; password_email; ip_address; port</i><br><br>"
+            f"<b>Missing keys detected:</b> {', '.join(missing_keys)}"
+        )
+        raise InputDataError("Error - Required Keys Missing", pattern_message)
+
+    # Vérifier qu'il n'y a pas de clés invalides
+    invalid_keys = [k for k in keys if k not in all_valid_keys]
+    if invalid_keys:
+        raise InputDataError("Error - Invalid Keys", f"<b>Invalid keys detected:</b> {', '.join(invalid_keys)}")
+
+    # Transformer les lignes suivantes en liste de dictionnaires
+    data_list = []
+    for line in lines[1:]:
+        values = [v.strip() for v in line.split(";")]
+        if len(values) != len(keys):
+            raise InputDataError("Error - Key/Value Mismatch", "The number of keys and values does not match for a line.")
+        data_list.append(dict(zip(keys, values)))
+    return data_list
+
+
+
 
 
 
@@ -1568,13 +1911,38 @@ def Get_Key_Value( email_data, possible_keys):
 
 
 
+# 🧹 Lance (une seule fois) le nettoyage des anciens dossiers de logs, puis le laisse tourner en arrière-plan.
+# La session en cours est protégée pour ne jamais être supprimée pendant l'extraction.
+def Start_Log_Retention():
+    global LOG_RETENTION_MANAGER
+
+    session_directory = os.path.join(LOGS_DIRECTORY, f"{CURRENT_DATE}_{CURRENT_HOUR}")
+    os.makedirs(session_directory, exist_ok=True)
+
+    # AUTOMAIL_LOG_COMPRESS=1 : les sessions expirées sont archivées en .zip au lieu d'être supprimées
+    if LOG_RETENTION_MANAGER is None:
+        LOG_RETENTION_MANAGER = LogRetentionManager(LOGS_DIRECTORY, compress=Log_Compression_Enabled())
+    LOG_RETENTION_MANAGER.Protect(session_directory)
+    LOG_RETENTION_MANAGER.Start()
+
+
+
+
+
+
+
+
 # 🛠️ Démarre le processus d'extraction en lançant le thread principal avec les paramètres utilisateur, après validation des entrées et préparation de l'environnement.
-def Start_Extraction(window, data_list, entered_number , selected_Browser , Isp , unique_id , output_json_final , username):
+def Start_Extraction(window, data_list, entered_number , selected_Browser , Isp , unique_id , output_json_final , username, log_receiver=None):
     global EXTRACTION_THREAD 
 
     
     if not os.path.exists(LOGS_DIRECTORY):
         os.makedirs(LOGS_DIRECTORY)
+
+    Start_Log_Retention()
+    JOB_TRACER.Reset()
+    MEMORY_TRACKER.Mark_Session(f"session {SESSION_ID}")
     
     try:
         entered_number = int(entered_number)
@@ -1611,26 +1979,29 @@ def Start_Extraction(window, data_list, entered_number , selected_Browser , Isp
     #         }
     #     """)
 
-    print(" ttttttttttttttttt")
-    Launch_Close_Chrome(selected_Browser , username)
+    use_engine = Orchestration_Engine_Enabled()
+    JOBS_LOG.debug("🚀 Start_Extraction : %s email(s), moteur asyncio=%s", len(data_list), use_engine)
+    if not use_engine:
+        Launch_Close_Chrome(selected_Browser , username , Isp)
     # find_chrome_for_testing() 
-    browser_path = (
-        Get_Browser_Path("chrome.exe") if selected_Browser == "chrome"
-        else Get_Browser_Path("firefox.exe") if selected_Browser == "firefox"
-        else Get_Browser_Path("msedge.exe") if selected_Browser == "edge"
-        else Get_Browser_Path("dragon.exe")  
-    )
-
-    if selected_Browser == "firefox":
-        ensure_web_ext_installed()
+    browser_path = Resolve_Browser_Path(selected_Browser)
 
     #print("browser path   :",   browser_path    or "Non trouvé")
 
     # return browser_path;
+    if use_engine:
+        EXTRACTION_THREAD = Start_Orchestration_Engine(
+            data_list, entered_number, browser_path, window, selected_Browser, Isp, unique_id, output_json_final,
+            username, log_receiver
+        )
+        EXTRACTION_THREAD.finished.connect(lambda: QMessageBox.information(window, "Terminé", "L'extraction est terminée."))
+        EXTRACTION_THREAD.stopped.connect(lambda msg: QMessageBox.warning(window, "Arrêté", msg))
+        return
+
     EXTRACTION_THREAD = ExtractionThread(
         data_list, SESSION_ID, entered_number, browser_path, BASE_DIRECTORY, window ,selected_Browser , Isp , unique_id , output_json_final
     )
-    EXTRACTION_THREAD.progress.connect(lambda msg: print(msg))
+    EXTRACTION_THREAD.progress.connect(lambda msg: JOBS_LOG.debug("%s", msg))
     EXTRACTION_THREAD.finished.connect(lambda: QMessageBox.information(window, "Terminé", "L'extraction est terminée."))
     EXTRACTION_THREAD.stopped.connect(lambda msg: QMessageBox.warning(window, "Arrêté", msg))
     EXTRACTION_THREAD.start()
@@ -1700,19 +2071,106 @@ def Parse_Random_Range(text):
 
 
 
+# 🗂️ Enregistre le process (run) côté API ; retourne l'inserted_id ou -1
+def Save_Process(parameters):
+    try:
+        response = requests.post(_SAVE_PROCESS_API, data=parameters, headers=HEADERS)
+        if API_LOG.isEnabledFor(logging.DEBUG):
+            API_LOG.debug("🌐 [POST] URL: %s", _SAVE_PROCESS_API)
+            API_LOG.debug("📤 [POST] Paramètres envoyés: %s", parameters)
+            API_LOG.debug("📥 [HTTP] Code de réponse: %s", response.status_code)
+            API_LOG.debug("📄 [HTTP] Réponse brute:\n%s", response.text)
+
+        results = response.json()
+        status = results.get('status', False)
+
+        if status is True:
+            API_LOG.info("✅ [API] Insertion réussie ➜ ID inséré: %s", results.get('inserted_id'))
+            return results.get('inserted_id')
+        else:
+            API_LOG.error("❌ [API] Échec de l'insertion ➜ Détails: %s", results)
+            return -1
+
+    except ValueError as ve:
+        API_LOG.error("💥 [JSON ERROR] Impossible de parser la réponse JSON: %s", ve)
+        return -1
+    except Exception as e:
+        API_LOG.error("💥 [EXCEPTION] Erreur lors de l'appel POST: %s", e)
+        return -1
+
+
+
+
+
+
+
+
+# -----------------------------
+# Enregistre les données JSON dans traitement.json selon le navigateur
+# Retourne un statut de succès ou d'erreur
+# -----------------------------
+def Save_Traitement_Json(json_data, selected_browser):
+    if selected_browser.lower() == "firefox":
+        template_dir = TEMPLATE_DIRECTORY_FIREFOX
+    elif selected_browser.lower() == "chrome":
+        template_dir = EXTENTION_EX3
+    else:
+        template_dir = TEMPLATE_DIRECTORY_FAMILY_CHROME  
+
+    traitement_file = os.path.join(template_dir, 'traitement.json')
+
+    try:
+        os.makedirs(template_dir, exist_ok=True)
+        with open(traitement_file, 'w', encoding='utf-8') as f:
+            json.dump(json_data, f, ensure_ascii=False, indent=4)
+        return "SUCCESS" if template_dir != EXTENTION_EX3 else "SUCCESS_FAMILY"
+    except Exception as e:
+        #print(f"Error while creating the file {traitement_file}: {e}")
+        return "ERROR"
+
+
+
+
+
+
+
+
+# 💾 Copie locale du scénario lancé : Tools/scenarios/last.json et <nom>.json
+def Scenario_Path(name):
+    safe_name = re.sub(r"[^\w.-]+", "_", str(name)).strip("._") or "last"
+    return os.path.join(SCENARIOS_DIRECTORY, f"{safe_name}.json")
+
+
+def Save_Scenario_Snapshot(output_json_final, name=None):
+    try:
+        os.makedirs(SCENARIOS_DIRECTORY, exist_ok=True)
+        for path in {Scenario_Path("last"), Scenario_Path(name) if name else Scenario_Path("last")}:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(output_json_final, f, ensure_ascii=False, indent=4)
+    except OSError as e:
+        LOG.warning("⚠️ [SCENARIO] Copie locale impossible : %s", e)
+
+
+
+
+
+
+
+
 def Save_Email(params):
     
     response_text = ''
     
     while response_text == '':
         try:
-            print(f"🌐 [API] Envoi de la requête ➜ {_SAVE_EMAIL_API}")
-            print(f"📤 [DATA] Paramètres envoyés: {params}")
+            API_LOG.debug("🌐 [API] Envoi de la requête ➜ %s", _SAVE_EMAIL_API)
+            API_LOG.debug("📤 [DATA] Paramètres envoyés: %s", params)
 
             response = requests.post(_SAVE_EMAIL_API, headers=HEADERS, verify=False, data=params)
             
-            print(f"📥 [HTTP] Code de réponse: {response.status_code}")
-            print(f"📄 [HTTP] Réponse brute:\n{response.text}")
+            if API_LOG.isEnabledFor(logging.DEBUG):
+                API_LOG.debug("📥 [HTTP] Code de réponse: %s", response.status_code)
+                API_LOG.debug("📄 [HTTP] Réponse brute:\n%s", response.text)
 
             # Vérification d'erreur HTTP
             response.raise_for_status()
@@ -1721,12 +2179,12 @@ def Save_Email(params):
             break
 
         except requests.exceptions.RequestException as req_err:
-            print(f"💥 [ERREUR DE REQUÊTE] : {req_err}")
-            print("⏳ Nouvelle tentative dans 5 secondes...")
+            API_LOG.error("💥 [ERREUR DE REQUÊTE] : %s", req_err)
+            API_LOG.warning("⏳ Nouvelle tentative dans 5 secondes...")
             time.sleep(5)
         except Exception as e:
-            print(f"💥 [EXCEPTION] Erreur inconnue : {e}")
-            print("⏳ Nouvelle tentative dans 5 secondes...")
+            API_LOG.error("💥 [EXCEPTION] Erreur inconnue : %s", e)
+            API_LOG.warning("⏳ Nouvelle tentative dans 5 secondes...")
             time.sleep(5)
 
     return response_text
@@ -1739,7 +2197,7 @@ def Save_Email(params):
 
 
 
-def Send_Status(params):
+def Send_Status(params, job=None):
     #print( "\n📤 Préparation de l'envoi du statut à l'API...")
     #print("🧾 Paramètres envoyés :")
 
@@ -1748,26 +2206,27 @@ def Send_Status(params):
 
     #print("\n📤 Envoi du statut de l'email à l'API...")
 
-    while response == '':
-        try:
-            res = requests.post(_SEND_STATUS_API, headers=HEADERS, verify=False, data=params)
-            response = res.text
-
-            #print("✅ Statut envoyé avec succès !")
-            #print("🔽 Détails de la réponse de l'API :")
-            #print(response)
+    with JOB_TRACER.Span(job, "send_status", status=params.get('status')):
+        while response == '':
+            try:
+                res = requests.post(_SEND_STATUS_API, headers=HEADERS, verify=False, data=params)
+                response = res.text
 
-            break
-        except Exception as e:
-            #print(f"\n❌ Erreur [API:h CG] : Connexion refusée par le serveur... ({e})")
-            #print("🕒 Nouvelle tentative dans 5 secondes...")
+                #print("✅ Statut envoyé avec succès !")
+                #print("🔽 Détails de la réponse de l'API :")
+                #print(response)
 
-            cpt += 1
-            if cpt == 5:
-                #print("❌ Échec après 5 tentatives.")
                 break
-            time.sleep(5)
-            continue
+            except Exception as e:
+                #print(f"\n❌ Erreur [API:h CG] : Connexion refusée par le serveur... ({e})")
+                #print("🕒 Nouvelle tentative dans 5 secondes...")
+
+                cpt += 1
+                if cpt == 5:
+                    #print("❌ Échec après 5 tentatives.")
+                    break
+                time.sleep(5)
+                continue
 
     return response
 
@@ -1851,13 +2310,13 @@ def Updated_Secure_Preferences(profile_name, RESULTATS_EX):
         ))
 
         # 🖨️ Affichage du chemin complet
-        print("🔍 Étape 1 : Vérification du chemin du fichier Secure Preferences...")
-        print(f"📂 Chemin complet du fichier 'Secure Preferences' : {secure_preferences_path}")
+        PROFILE_LOG.debug("🔍 Étape 1 : Vérification du chemin du fichier Secure Preferences...")
+        PROFILE_LOG.debug("📂 Chemin complet du fichier 'Secure Preferences' : %s", secure_preferences_path)
 
         # Vérification existence fichier
         if not os.path.exists(secure_preferences_path):
-            print(f"❌ Le fichier 'Secure Preferences' est introuvable pour le profil '{profile_name}'.")
-            print("👉 Veuillez contacter le support technique pour assistance.")
+            PROFILE_LOG.error("❌ Le fichier 'Secure Preferences' est introuvable pour le profil '%s'.", profile_name)
+            PROFILE_LOG.error("👉 Veuillez contacter le support technique pour assistance.")
             return None
 
         #print("✅ Étape 2 : Fichier trouvé. Lecture du contenu JSON...")
@@ -1866,7 +2325,7 @@ def Updated_Secure_Preferences(profile_name, RESULTATS_EX):
 
         # Vérification structure
         if "extensions" not in data:
-            print("⚠️ Aucune clé 'extensions' trouvée. Initialisation forcée...")
+            PROFILE_LOG.warning("⚠️ Aucune clé 'extensions' trouvée. Initialisation forcée...")
             data["extensions"] = {}
 
         data["extensions"].setdefault("ui", {})
@@ -1877,41 +2336,41 @@ def Updated_Secure_Preferences(profile_name, RESULTATS_EX):
         #print("✅ Étape 3 : Structure JSON vérifiée et préparée.")
 
         # 🔄 Ajouter les résultats sans supprimer les anciennes valeurs
-        print("🔄 Étape 4 : Mise à jour des paramètres avec RESULTATS_EX...")
+        PROFILE_LOG.debug("🔄 Étape 4 : Mise à jour des paramètres avec RESULTATS_EX...")
         for idx, item in enumerate(RESULTATS_EX, start=1):
-            print(f"➡️ Traitement de l'élément {idx} : {item}")
+            PROFILE_LOG.debug("➡️ Traitement de l'élément %s : %s", idx, item)
 
             if not isinstance(item, dict):
-                print("⚠️ Ignoré (élément non dict).")
+                PROFILE_LOG.warning("⚠️ Ignoré (élément non dict).")
                 continue
 
             for k, v in item.items():
                 if isinstance(v, dict) and "account_extension_type" in v:
                     data["extensions"]["settings"][k] = v
-                    print(f"   📝 Ajout/maj dans extensions.settings[{k}] = {v}")
+                    PROFILE_LOG.debug("   📝 Ajout/maj dans extensions.settings[%s] = %s", k, v)
 
                 elif isinstance(v, str) and len(v) > 30 and k != "developer_mode":
                     data["protection"]["macs"]["extensions"]["settings"][k] = v
-                    print(f"   🔐 Ajout/maj MAC dans protection.macs.extensions.settings[{k}]")
+                    PROFILE_LOG.debug("   🔐 Ajout/maj MAC dans protection.macs.extensions.settings[%s]", k)
 
                 elif isinstance(v, bool) and k == "developer_mode":
                     data["extensions"]["ui"]["developer_mode"] = v
-                    print(f"   ⚙️ developer_mode activé/désactivé (extensions.ui) : {v}")
+                    PROFILE_LOG.debug("   ⚙️ developer_mode activé/désactivé (extensions.ui) : %s", v)
 
                 elif isinstance(v, str) and k == "developer_mode":
                     data["protection"]["macs"]["extensions"]["ui"]["developer_mode"] = v
-                    print(f"   🔐 MAC pour developer_mode ajouté dans protection.macs.extensions.ui")
+                    PROFILE_LOG.debug("   🔐 MAC pour developer_mode ajouté dans protection.macs.extensions.ui")
 
         # Sauvegarde
-        print("💾 Étape 5 : Écriture du fichier JSON mis à jour...")
+        PROFILE_LOG.debug("💾 Étape 5 : Écriture du fichier JSON mis à jour...")
         with open(secure_preferences_path, "w", encoding="utf-8") as f:
             json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
 
-        print("✅ Étape 6 : Mise à jour terminée avec succès !")
+        PROFILE_LOG.debug("✅ Étape 6 : Mise à jour terminée avec succès !")
         return data
 
     except Exception as e:
-        print(f"❌ Erreur lors de la mise à jour du fichier Secure Preferences : {e}")
+        PROFILE_LOG.error("❌ Erreur lors de la mise à jour du fichier Secure Preferences : %s", e)
         return None
 
 
@@ -1924,7 +2383,7 @@ def Search_Keys(data, CLES_RECHERCHE, RESULTATS):
     if isinstance(data, dict):
         for key, value in data.items():
             if key in CLES_RECHERCHE:
-                print(f"🔑 Clé trouvée : {key} ➜ Valeur : {value}") 
+                PROFILE_LOG.debug("🔑 Clé trouvée : %s ➜ Valeur : %s", key, value) 
                 RESULTATS.append({key: value})
             Search_Keys(value, CLES_RECHERCHE, RESULTATS)
     elif isinstance(data, list):
@@ -1940,54 +2399,54 @@ def Search_Keys(data, CLES_RECHERCHE, RESULTATS):
 
 
 def Upload_EXTENTION_PROXY(profile_name, CLES_RECHERCHE, RESULTATS):
-    print("====================================================")
-    print(f"📂 Début du traitement pour le profil : {profile_name}")
-    print("====================================================")
+    PROFILE_LOG.debug("====================================================")
+    PROFILE_LOG.debug("📂 Début du traitement pour le profil : %s", profile_name)
+    PROFILE_LOG.debug("====================================================")
 
     # Construction du chemin complet du fichier "Secure Preferences"
     profile_path_file_secure_preferences = os.path.join(
         CONFIG_PROFILE, profile_name, "Secure Preferences"
     )
-    print(f"🔍 Chemin du fichier Secure Preferences : {profile_path_file_secure_preferences}")
+    PROFILE_LOG.debug("🔍 Chemin du fichier Secure Preferences : %s", profile_path_file_secure_preferences)
 
     # Vérification si le fichier existe
     if not os.path.exists(profile_path_file_secure_preferences):
-        print("❌ Erreur : le fichier 'Secure Preferences' est introuvable !")
-        print("👉 Vérifiez que le profil Chrome existe correctement ou contactez le support.")
+        PROFILE_LOG.error("❌ Erreur : le fichier 'Secure Preferences' est introuvable !")
+        PROFILE_LOG.error("👉 Vérifiez que le profil Chrome existe correctement ou contactez le support.")
         return None
 
     try:
         # Lecture du fichier JSON
-        print("📖 Lecture du fichier JSON en cours ...")
+        PROFILE_LOG.debug("📖 Lecture du fichier JSON en cours ...")
         with open(profile_path_file_secure_preferences, "r", encoding="utf-8") as f:
             data = json.load(f)
         #print("✅ Lecture réussie du fichier Secure Preferences.")
 
         # Nettoyage de la liste des résultats
         RESULTATS.clear()
-        print("🧹 Initialisation de la liste des résultats (RESULTATS) ...")
+        PROFILE_LOG.debug("🧹 Initialisation de la liste des résultats (RESULTATS) ...")
 
         # Recherche des clés
-        print(f"🔎 Début de la recherche des clés : {CLES_RECHERCHE}")
+        PROFILE_LOG.debug("🔎 Début de la recherche des clés : %s", CLES_RECHERCHE)
         Search_Keys(data, CLES_RECHERCHE, RESULTATS)
 
         # Affichage des résultats trouvés
-        print("📌 Résultats trouvés :")
+        PROFILE_LOG.debug("📌 Résultats trouvés :")
         if RESULTATS:
             for idx, item in enumerate(RESULTATS, start=1):
-                print(f"   {idx}. {item}")
+                PROFILE_LOG.debug("   %s. %s", idx, item)
         else:
-            print("⚠️ Aucun résultat trouvé pour les clés spécifiées.")
+            PROFILE_LOG.warning("⚠️ Aucun résultat trouvé pour les clés spécifiées.")
 
-        print("====================================================")
-        print(f"✅ Fin du traitement pour le profil : {profile_name}")
-        print("====================================================")
+        PROFILE_LOG.debug("====================================================")
+        PROFILE_LOG.debug("✅ Fin du traitement pour le profil : %s", profile_name)
+        PROFILE_LOG.debug("====================================================")
 
         return RESULTATS
 
     except Exception as e:
-        print("❌ Une erreur inattendue est survenue lors du traitement du fichier Secure Preferences.")
-        print(f"➡️ Détail de l'erreur : {e}")
+        PROFILE_LOG.error("❌ Une erreur inattendue est survenue lors du traitement du fichier Secure Preferences.")
+        PROFILE_LOG.error("➡️ Détail de l'erreur : %s", e)
         return None
 
 
@@ -1996,13 +2455,13 @@ def Upload_EXTENTION_PROXY(profile_name, CLES_RECHERCHE, RESULTATS):
 
 
 
-def Run_Browser_Create_Profile(profile_name):
+def Run_Browser_Create_Profile(profile_name, profile_path=None):
     #print("=============================================")
     #print("🔧 Initialisation de la création du profil...")
     #print("=============================================")
 
     # 📂 Définir le chemin du profil (remontée de 2 niveaux pour Desktop\Tools)
-    profile_path = os.path.abspath(os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_name))
+    profile_path = os.path.abspath(profile_path or os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_name))
     #print(f"📂 Chemin complet du profil : {profile_path}")
 
     # Créer le dossier si non existant
@@ -2010,7 +2469,7 @@ def Run_Browser_Create_Profile(profile_name):
         os.makedirs(profile_path)
         #print(f"✅ Dossier de profil créé : {profile_path}")
     else:
-        print(f"✅ Profil déjà existant : {profile_path}")
+        PROFILE_LOG.info("✅ Profil déjà existant : %s", profile_path)
 
     # ⚙️ Configuration des options Chrome
     chrome_options = Options()
@@ -2035,11 +2494,11 @@ def Run_Browser_Create_Profile(profile_name):
         time.sleep(2)
 
     except Exception as e:
-        print(f"❌ Erreur lors du lancement du navigateur : {e}")
+        PROFILE_LOG.error("❌ Erreur lors du lancement du navigateur : %s", e)
 
     finally:
         if driver:
-            print("🛑 Fermeture du navigateur...")
+            PROFILE_LOG.info("🛑 Fermeture du navigateur...")
             driver.quit()
             #print("✅ Navigateur fermé proprement.")
 
@@ -2052,6 +2511,105 @@ def Run_Browser_Create_Profile(profile_name):
 
 
 
+# 🧬 Crée le profil Chrome d'un email en clonant le golden de la version installée.
+# Le lancement Selenium (et ses pauses) n'a lieu qu'une fois par version de Chrome.
+def Create_Chrome_Profile(profile_email):
+    profile_path = os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_email)
+    version = Browser_Version(Get_Browser_Path("chrome.exe"))
+    if version:
+        try:
+            stats = PROFILE_SNAPSHOTS.Clone("chrome", version, profile_path, Build_Chrome_Golden, profile_name=profile_email)
+            PROFILE_LOG.info("🧬 Profil cloné pour %s : %s", profile_email, stats)
+            return
+        except (ProfileSnapshotError, OSError) as e:
+            PROFILE_LOG.warning("⚠️ Clonage du profil impossible, création classique : %s", e)
+            shutil.rmtree(profile_path, ignore_errors=True)
+
+    Run_Browser_Create_Profile(profile_email)
+    time.sleep(3)
+
+
+
+def Build_Chrome_Golden(golden_dir, golden_name):
+    Run_Browser_Create_Profile(golden_name, golden_dir)
+    time.sleep(3)
+
+
+
+
+
+
+# ⏱️ Benchmark : création par lancement du navigateur vs clonage du golden
+def Benchmark_Profile_Creation(browser="chrome", runs=3):
+    work_dir = os.path.join(PROFILE_SNAPSHOTS_DIRECTORY, "_benchmark")
+    if browser == "chrome":
+        version = Browser_Version(Get_Browser_Path("chrome.exe"))
+        builder = Build_Chrome_Golden
+    else:
+        path_firefox = Get_Browser_Path("firefox.exe")
+        version = Browser_Version(path_firefox)
+        builder = lambda path, name: Create_Firefox_Profile_At(name, path, path_firefox)
+
+    if not version:
+        PROFILE_LOG.error("❌ %s introuvable, benchmark impossible.", browser)
+        return None
+    results = Benchmark(PROFILE_SNAPSHOTS, browser, version, builder, work_dir, runs)
+    PROFILE_LOG.info("⏱️ Création de profil %s %s (%s essais)\n%s", browser, version, runs, Format_Benchmark(results))
+    return results
+
+
+
+
+
+
+# 🧭 Invariants du run, calculés une seule fois au démarrage (et non pour chaque email)
+def Build_Run_Context(extraction, session_info) -> RunContext:
+    browser = extraction.selected_Browser
+
+    session_directory = os.path.join(LOGS_DIRECTORY, f"{CURRENT_DATE}_{CURRENT_HOUR}")
+    os.makedirs(session_directory, exist_ok=True)
+    os.makedirs(extraction.BASE_DIRECTORY, exist_ok=True)
+
+    chrome_profiles_dir = os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome')
+    if browser == "chrome":
+        os.makedirs(chrome_profiles_dir, exist_ok=True)
+
+    session_text = ""
+    if os.path.exists(SESSION_PATH):
+        with open(SESSION_PATH, "r", encoding="utf-8") as f:
+            session_text = f.read().strip()
+
+    # Build partagé de l'extension, une fois par run (firefox : une extension par email)
+    extension_build_dir = None
+    if browser == "firefox":
+        extension_build_dir = Get_Extension_Build(Extension_Template_Directory(browser)).Ensure()
+
+    return RunContext(
+        session_id=extraction.session_id,
+        process_id=extraction.unique_id,
+        username=session_info["username"],
+        entity=session_info["p_entity"],
+        encrypted_login=encrypt_message(session_info["username"], KEY),
+        isp=extraction.Isp,
+        action_json=json.dumps(extraction.output_json_final),
+        selected_browser=browser,
+        browser_path=extraction.Browser_path,
+        chrome_path=Get_Browser_Path("chrome.exe") if browser == "chrome" else None,
+        web_ext_path=get_web_ext_path() if browser == "firefox" else None,
+        base_directory=extraction.BASE_DIRECTORY,
+        chrome_profiles_dir=chrome_profiles_dir,
+        session_directory=session_directory,
+        session_text=session_text,
+        extension_build_dir=extension_build_dir,
+    )
+
+
+
+
+
+
+
+
 # Thread responsable du traitement de l'extraction des emails.
 # Gère l'exécution des navigateurs avec les extensions, l'enregistrement des LOGS,
 # et la gestion des processus.
@@ -2075,8 +2633,13 @@ class ExtractionThread(QThread):
         self.Isp=Isp
         self.unique_id=unique_id
         self.output_json_final = output_json_final
+        self.run_context = None
 
     def run(self):
+        with CPU_PROFILER.Profile_Thread("ExtractionThread"):
+            self.Process_Emails()
+
+    def Process_Emails(self):
         # Exécute la boucle principale de traitement des emails :
         # - Création des profils/extensions
         # - Lancement des navigateurs
@@ -2085,8 +2648,13 @@ class ExtractionThread(QThread):
         global PROCESS_PIDS, LOGS_RUNNING  ,SELECTED_BROWSER_GLOBAL  ,RESULTATS_EX 
         SELECTED_BROWSER_GLOBAL=self.selected_Browser
         remaining_emails = self.data_list[:]  
-        log_message("[INFO] Processing started")
         total_emails = len(self.data_list) 
+        EVENT_RECORDER.Start(
+            self.session_id, jobs=total_emails, parallel=self.entered_number,
+            browser=self.selected_Browser, loop_ms=EXTRACTION_LOOP_INTERVAL_MS,
+            start_delay_sec=CLOSE_MONITOR_START_DELAY_SEC, poll_sec=CLOSE_MONITOR_POLL_INTERVAL_SEC
+        )
+        log_message("[INFO] Processing started")
 
         # session = ""
         # if os.path.exists(SESSION_PATH):
@@ -2109,13 +2677,19 @@ class ExtractionThread(QThread):
         session_info = check_session(SESSION_PATH, KEY)
 
         for k, v in session_info.items():
-            print(f"{k}: {v}")
+            SESSION_LOG.debug("%s: %s", k, v)
 
         if not session_info["valid"]:
-            print("[SESSION] ❌ Session invalide. Impossible de continuer l’extraction.")
+            SESSION_LOG.error("[SESSION] ❌ Session invalide. Impossible de continuer l’extraction.")
             self.stopped.emit("Session invalide. Veuillez vous reconnecter.")
             return
         
+        try:
+            self.run_context = Build_Run_Context(self, session_info)
+        except ExtensionBuildError as e:
+            PROFILE_LOG.error("❌ %s", e)
+            self.stopped.emit("We could not prepare the browser extension. Please contact Support.")
+            return
 
         if self.selected_Browser == "chrome":
             #print(f"✅ Navigateur sélectionné : {self.selected_Browser}")
@@ -2138,179 +2712,187 @@ class ExtractionThread(QThread):
             if len(PROCESS_PIDS) < self.entered_number and remaining_emails:
                 next_email = remaining_emails.pop(0)  
                 email_value = Get_Key_Value(next_email, ["email", "Email"])
+                JOB_TRACER.Mark(email_value, "dequeued")
                 log_message(f"[INFO] Processing the email:  {email_value}")
 
-        
+        
+
+                try:
+                    launch = self.Prepare_Job(next_email, self.run_context)
+                    with JOB_TRACER.Span(launch["email"], "browser_spawned"):
+                        process = subprocess.Popen(launch["command"]) 
+                    self.Register_Launch(launch, process.pid, process)
+                    self.emails_processed += 1  
+
+                except OrchestrationAbort as e:
+                    log_message(str(e))   
+                    self.stopped.emit(str(e))  
+                    self.stop_flag = True   
+                    return
+                except Exception as e:
+                    log_message(f"[INFO] Erreur : {e}")
+            self.msleep(EXTRACTION_LOOP_INTERVAL_MS) 
+
+        log_message("[INFO] Processing finished for all emails.") 
+        time.sleep(3)
+        LOGS_RUNNING=False
+        self.finished.emit()
+
 
-                try:
-                    profile_email = Get_Key_Value(next_email, ["email", "Email"])
-                    profile_password = Get_Key_Value(next_email, ["password_email", "passwordEmail"])
-                    ip_address =Get_Key_Value(next_email, ["ip_address", "ipAddress"])
-                    port = Get_Key_Value(next_email, ["port"])
-                    login = Get_Key_Value(next_email, ["login"])
-                    password = Get_Key_Value(next_email, ["password"])
-                    recovery_email = Get_Key_Value(next_email, ["recovery_email", "recoveryEmail"])
-                    new_recovery_email = Get_Key_Value(next_email, ["new_recovery_email", "neWrecoveryEmail"])
 
-                    params = {
-                        'l': encrypt_message(session_info["username"],KEY),
-                        'login': session_info["username"],
-                        'entity': session_info["p_entity"],
-                        'isp': self.Isp,
-                        'action': json.dumps(self.output_json_final),
-                        'email': email_value,
-                        'password': '',
-                        'proxy_ip': ip_address+":"+port,
-                        'proxy_login': f"{login};{password}" if login != session_info["username"] else "",
-                        'email_recovery': '',
-                        'line': '',
-                        'app': "V4",
-                        'e_pid':self.unique_id
-                    }
+    # Prépare un job avant le lancement du navigateur : enregistrement côté API, extension,
+    # profil et ligne de commande. Partagé par cette boucle et le moteur asyncio (orchestrationEngine).
+    # `context` (RunContext) porte tout ce qui ne dépend pas de l'email.
+    def Prepare_Job(self, next_email, context, save_email=Save_Email):
+        email_value = Get_Key_Value(next_email, ["email", "Email"])
+        profile_email = Get_Key_Value(next_email, ["email", "Email"])
+        profile_password = Get_Key_Value(next_email, ["password_email", "passwordEmail"])
+        ip_address =Get_Key_Value(next_email, ["ip_address", "ipAddress"])
+        port = Get_Key_Value(next_email, ["port"])
+        login = Get_Key_Value(next_email, ["login"])
+        password = Get_Key_Value(next_email, ["password"])
+        recovery_email = Get_Key_Value(next_email, ["recovery_email", "recoveryEmail"])
+        new_recovery_email = Get_Key_Value(next_email, ["new_recovery_email", "neWrecoveryEmail"])
+
+        params = {
+            'l': context.encrypted_login,
+            'login': context.username,
+            'entity': context.entity,
+            'isp': context.isp,
+            'action': context.action_json,
+            'email': email_value,
+            'password': '',
+            'proxy_ip': ip_address+":"+port,
+            'proxy_login': f"{login};{password}" if login != context.username else "",
+            'email_recovery': '',
+            'line': '',
+            'app': "V4",
+            'e_pid': context.process_id
+        }
 
-                    inserted_id=Save_Email(params)
-                    print(" inserted_id ", inserted_id)
-                    new_password = Generate_Gmail_Password(16)
+        with JOB_TRACER.Span(email_value, "save_email"):
+            inserted_id=save_email(params)
+        JOBS_LOG.debug("🆔 %s ➜ inserted_id %s", email_value, inserted_id)
+        registry = Get_Job_Registry()
+        if registry:
+            registry.Register(email_value, context.session_id, inserted_id, context.selected_browser)
+        new_password = Generate_Gmail_Password(16)
 
-                    session_directory = os.path.join(LOGS_DIRECTORY, f"{CURRENT_DATE}_{CURRENT_HOUR}")
-                    os.makedirs(session_directory, exist_ok=True)
+      
+        if context.selected_browser == "firefox":
+            Create_Extension_For_Email(
+                profile_email, profile_password,
+                ip_address, port,
+                login, password, recovery_email,
+                new_password, new_recovery_email, context.session_id, context.selected_browser,
+                session=context.session_text, build_dir=context.extension_build_dir
+            )
+            with JOB_TRACER.Span(profile_email, "profile_prepared"):
+                create_firefox_profile(profile_email)
+            PROFILE_STORE.Touch("firefox", profile_email)
+            #print('➡️➡️➡️➡️➡️➡️ PROCESS_PIDS : ' ,PROCESS_PIDS)
+
+            command = [
+                context.web_ext_path,
+                "run",
+                "--source-dir", os.path.join(context.base_directory, profile_email),
+                "--firefox-profile", os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'firefox', profile_email),
+                "--keep-profile-changes",  
+                "--no-reload"
+            ]
+
+        elif context.selected_browser in ["edge", "icedragon", "Comodo"]:
+            #print(f"✅ Navigateur sélectionné : {self.selected_Browser}")
+            command = [
+                context.browser_path,
+                f"--user-data-dir={os.path.join(context.chrome_profiles_dir, profile_email)}",
+                f"--disable-extensions-except={os.path.join(context.base_directory, profile_email)}",
+                f"--load-extension={os.path.join(context.base_directory, profile_email)}",
+                "--no-first-run",
+                "--no-default-browser-check",
+                "--disable-sync"
+            ]
+        
+        else:
 
-                    logs_subdirs = [os.path.join(LOGS_DIRECTORY, d) for d in os.listdir(LOGS_DIRECTORY) if os.path.isdir(os.path.join(LOGS_DIRECTORY, d))]
-                    logs_subdirs.sort(key=os.path.getctime)
+            with JOB_TRACER.Span(profile_email, "profile_prepared"):
+                profile_path = os.path.join(context.chrome_profiles_dir, profile_email)
+                if not os.path.exists(profile_path):
+                    PROFILE_LOG.info("🆕 Création du profil pour %s", profile_email)
+                    Create_Chrome_Profile(profile_email)
+                else:
+                    PROFILE_LOG.debug("✅ Profil déjà existant pour %s", profile_email)   
+                PROFILE_STORE.Touch("chrome", profile_email)
 
-                    if len(logs_subdirs) > 4:
-                        to_delete = logs_subdirs[:4]
-                        for dir_to_delete in to_delete:
-                            try:
-                                shutil.rmtree(dir_to_delete)
-                            except Exception as e:
-                                log_message(f"[INFO]  Erreur lors de la suppression de {dir_to_delete} : {e}")
-
-                  
-                    if self.selected_Browser == "firefox":
-                        Create_Extension_For_Email(
-                            profile_email, profile_password,
-                            f'"{ip_address}"', f'"{port}"',
-                            f'"{login}"', f'"{password}"', f'{recovery_email}',
-                            new_password, new_recovery_email, f'"{self.session_id}"' , self.selected_Browser 
-                        )
-                        create_firefox_profile(profile_email)
-                        #print('➡️➡️➡️➡️➡️➡️ PROCESS_PIDS : ' ,PROCESS_PIDS)
-
-                        eb_ext_path = get_web_ext_path()
-                        #print("eb_ext_path : ", eb_ext_path)
-
-                        command = [
-                            eb_ext_path,
-                            "run",
-                            "--source-dir", os.path.join(self.BASE_DIRECTORY, profile_email),
-                            "--firefox-profile", os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'firefox', profile_email),
-                            "--keep-profile-changes",  
-                            "--no-reload"
-                        ]
-                        process = subprocess.Popen(command) 
-                        PROCESS_PIDS.append(process.pid) 
-                        
-                        ts   = time.time()
-                        FIREFOX_LAUNCH.append({
-                            'profile': profile_email,
-                            'create_time': ts,
-                            'proc': process,
-                            'hwnd': None
-                        })
-                        #print("Firefox launched with PID: ", process.pid)
-                        Add_Pid_To_Text_File(process.pid, profile_email , inserted_id)
-
-                    elif self.selected_Browser in ["edge", "icedragon", "Comodo"]:
-                        #print(f"✅ Navigateur sélectionné : {self.selected_Browser}")
-                        command = [
-                            self.Browser_path,
-                            f"--user-data-dir={os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_email)}",
-                            f"--disable-extensions-except={os.path.join(self.BASE_DIRECTORY, profile_email)}",
-                            f"--load-extension={os.path.join(self.BASE_DIRECTORY, profile_email)}",
-                            "--no-first-run",
-                            "--no-default-browser-check",
-                            "--disable-sync"
-                        ]
-                        process = subprocess.Popen(command) 
-                        PROCESS_PIDS.append(process.pid) 
-                        #print('➡️➡️➡️➡️➡️➡️ PROCESS_PIDS : ' ,PROCESS_PIDS)
-                        Add_Pid_To_Text_File(process.pid, profile_email , inserted_id)
-                    
-                    else:
 
-                        profiles_dir = os.path.join(SCRIPT_DIR,'..','Tools', 'Profiles','chrome')
-                        if not os.path.exists(profiles_dir):
-                            os.makedirs(profiles_dir)
+                if not  RESULTATS_EX:
+                    raise OrchestrationAbort(
+                        "❌ An issue occurred while copying the JSON file to the template profile.\n"
+                        "➡ Please contact support."
+                    )
+                else:
+                    PROFILE_LOG.debug("✅ Profil prêt pour %s avec les paramètres proxy.", profile_email)
+                    Updated_Secure_Preferences(profile_email, RESULTATS_EX)
+                    time.sleep(2)
 
-                        profile_path = os.path.join(profiles_dir,profile_email)
-                        if not os.path.exists(profile_path):
-                            print(f"🆕 Création du profil pour {profile_email}")
-                            Run_Browser_Create_Profile(profile_email)
-                            time.sleep(3)
-                        else:
-                            print(f"✅ Profil déjà existant pour {profile_email}")   
 
 
-                        if not  RESULTATS_EX:
-                            error_msg = (
-                                "❌ An issue occurred while copying the JSON file to the template profile.\n"
-                                "➡ Please contact support."
-                            )
-                            log_message(error_msg)   
-                            self.stopped.emit(error_msg)  
-                            self.stop_flag = True   
-                            return                   
-                        else:
-                            print(f"✅ Profil prêt pour {profile_email} avec les paramètres proxy.")
-                            Updated_Secure_Preferences(profile_email, RESULTATS_EX)
-                            time.sleep(2)
+            # cmd = [
+            #     self.Browser_path,
+            #     f"--user-data-dir={os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_email)}",
+            #     f'--profile-directory={profile_email}',
+            #     '--lang=En-US',
+            #     '--no-first-run',
+            # ]
 
+            # process = subprocess.Popen(cmd)
 
+            time.sleep(2)
+            
 
-                        # cmd = [
-                        #     self.Browser_path,
-                        #     f"--user-data-dir={os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_email)}",
-                        #     f'--profile-directory={profile_email}',
-                        #     '--lang=En-US',
-                        #     '--no-first-run',
-                        # ]
+            combined = f"{ip_address};{port};{login};{password};{profile_email};{profile_password};{recovery_email};{new_password};{new_recovery_email}"
 
-                        # process = subprocess.Popen(cmd)
+            b64 = Encrypt_Aes_Gcm("A9!fP3z$wQ8@rX7kM2#dN6^bH1&yL4t*", combined)
+            url =f"https://example.com/?rep={combined}"
 
-                        time.sleep(2)
-                        
+            command = [
+                context.chrome_path,
+                f"--user-data-dir={os.path.join(context.chrome_profiles_dir, profile_email)}",
+                f'--profile-directory={profile_email}',
+                f'{url}',
+                '--lang=En-US',
+                '--no-first-run',
+            ]
 
-                        combined = f"{ip_address};{port};{login};{password};{profile_email};{profile_password};{recovery_email};{new_password};{new_recovery_email}"
+        return {"email": profile_email, "command": command, "inserted_id": inserted_id}
 
-                        b64 = Encrypt_Aes_Gcm("A9!fP3z$wQ8@rX7kM2#dN6^bH1&yL4t*", combined)
-                        url =f"https://example.com/?rep={combined}"
 
-                        command = [
-                            Get_Browser_Path("chrome.exe"),
-                            f"--user-data-dir={os.path.join(SCRIPT_DIR, '..', 'Tools', 'Profiles', 'chrome', profile_email)}",
-                            f'--profile-directory={profile_email}',
-                            f'{url}',
-                            '--lang=En-US',
-                            '--no-first-run',
-                        ]
 
+    # Après le lancement : suivi du PID (PROCESS_PIDS, registre, data.txt pour l'extension)
+    def Register_Launch(self, launch, pid, process):
+        profile_email = launch["email"]
+        JOB_TRACER.Mark(profile_email, "browser_started", pid=pid)
+        PROCESS_PIDS.append(pid) 
 
-                        process1 = subprocess.Popen(command) 
-                        PROCESS_PIDS.append(process.pid) 
-                        print('➡️➡️➡️➡️➡️➡️ PROCESS_PIDS : ' ,PROCESS_PIDS)
-                        # add_pid_to_text_file(process.pid, profile_email , inserted_id)
-             
-                    self.emails_processed += 1  
+        if self.selected_Browser == "firefox":
+            FIREFOX_LAUNCH.append({
+                'profile': profile_email,
+                'create_time': time.time(),
+                'proc': process,
+                'hwnd': None
+            })
+            #print("Firefox launched with PID: ", pid)
+            Add_Pid_To_Text_File(pid, profile_email , launch["inserted_id"])
 
-                except Exception as e:
-                    log_message(f"[INFO] Erreur : {e}")
-            self.msleep(1000) 
+        elif self.selected_Browser in ["edge", "icedragon", "Comodo"]:
+            #print('➡️➡️➡️➡️➡️➡️ PROCESS_PIDS : ' ,PROCESS_PIDS)
+            Add_Pid_To_Text_File(pid, profile_email , launch["inserted_id"])
 
-        log_message("[INFO] Processing finished for all emails.") 
-        time.sleep(3)
-        LOGS_RUNNING=False
-        self.finished.emit()
+        else:
+            registry = Get_Job_Registry()
+            if registry:
+                registry.Set_Pid(JobRegistry.Job_Id(SESSION_ID, profile_email), pid)
+            JOBS_LOG.debug("➡️ PROCESS_PIDS : %s", PROCESS_PIDS)
 
 
 
@@ -2335,18 +2917,29 @@ class CloseBrowserThread(QThread):
 
 
 
-    def __init__(self , selected_Browser, username):
+    def __init__(self , selected_Browser, username , Isp=None):
         super().__init__()
         self.selected_Browser = selected_Browser
         self.username =username
+        self.Isp = Isp
+        self.run_history = Get_Run_History()
         self.session_id = SESSION_ID  
         self.stop_flag = False 
         self.downloads_folder = user_downloads_dir() 
+        self.log_sink = None
+        self.seen_downloads = set()
 
 
 
 
     def run(self):
+        with CPU_PROFILER.Profile_Thread("CloseBrowserThread"):
+            self.Monitor_Downloads()
+
+
+
+
+    def Monitor_Downloads(self):
         # Boucle de surveillance continue tant que tous les processus ne sont pas terminés.
         # Traite les fichiers de session et de log détectés.
 
@@ -2354,7 +2947,7 @@ class CloseBrowserThread(QThread):
         # #print("[DEBUG] Run CloseBrowserThread")
         # #print("[Thread] Dossier Téléchargements :", self.downloads_folder)
         # #print("[Thread] Démarrage du thread de fermeture des navigateurs...")
-        time.sleep(10)
+        time.sleep(CLOSE_MONITOR_START_DELAY_SEC)
         session = ""
         if os.path.exists(SESSION_PATH):
             with open(SESSION_PATH, "r", encoding="utf-8") as f:
@@ -2362,6 +2955,23 @@ class CloseBrowserThread(QThread):
         # else:
             #print("[❌] session.txt introuvable")
 
+        # Journal compressé unique pour toute la session (au lieu d'un fichier par email)
+        self.log_sink = CompressedLogSink(os.path.join(LOGS_DIRECTORY, f"{CURRENT_DATE}_{CURRENT_HOUR}"))
+
+        try:
+            self.Watch_Loop(session)
+        finally:
+            self.log_sink.Close()
+            Write_Job_Trace()
+            recording = EVENT_RECORDER.Stop()
+            if recording:
+                JOBS_LOG.info("🎥 [RECORD] Run enregistré : %s", recording)
+            Cleanup_Profiles()
+
+
+
+
+    def Watch_Loop(self, session):
         while not self.stop_flag:  
             # #print("🫀🫀🫀🫀🫀🫀🫀🫀🫀 PROCESS_PIDS : ", PROCESS_PIDS)
             # #print("[Thread] Vérification des processus restants...")
@@ -2404,7 +3014,9 @@ class CloseBrowserThread(QThread):
             for file_name in files:
                 file_path = os.path.join(self.downloads_folder, file_name)
                 if os.path.exists(file_path):
-                    print(f"[Thread] Fichier de session détecté: {file_name}")
+                    JOBS_LOG.debug("[Thread] Fichier de session détecté: %s", file_name)
+
+            self.Record_Downloads(files + log_files)
 
 
             with ThreadPoolExecutor() as executor:
@@ -2427,15 +3039,32 @@ class CloseBrowserThread(QThread):
 
                 # #print("[Thread][Session] Résultat:", result)
 
-            time.sleep(1)
+            self.log_sink.Flush()
+            time.sleep(CLOSE_MONITOR_POLL_INTERVAL_SEC)
 
 
     
 
+    def Record_Downloads(self, file_names):
+        # Enregistrement du run (AUTOMAIL_RECORD) : chaque fichier téléchargé une seule fois
+        if not EVENT_RECORDER.recording:
+            return
+        for file_name in file_names:
+            if file_name not in self.seen_downloads:
+                self.seen_downloads.add(file_name)
+                try:
+                    size = os.path.getsize(os.path.join(self.downloads_folder, file_name))
+                except OSError:
+                    size = None
+                EVENT_RECORDER.Download("log" if file_name.startswith("log_") else "session", size)
+
+
+
+
     def process_log_file(self, log_file, downloads_folder):
         #  Traite un fichier de log :
         # - Lit le contenu
-        # - Déplace les données vers le fichier de log global
+        # - Ajoute un enregistrement (email, session, horodatage) au journal compressé
         # - Supprime le fichier de log
         #print(f"[Traitement Log] Début du traitement de {log_file}")
 
@@ -2449,8 +3078,6 @@ class CloseBrowserThread(QThread):
                 return f"⚠️ Erreur dans le fichier {log_file}: Email non trouvé."
 
             session_folder = f"{CURRENT_DATE}_{CURRENT_HOUR}"
-            target_folder = os.path.join(LOGS_DIRECTORY, session_folder)
-            target_file_path = os.path.join(target_folder, f"{email}_{CURRENT_HOUR}.txt")
 
             try:
                 with open(log_file_path, 'r', encoding='utf-8') as log_file_reader:
@@ -2459,10 +3086,9 @@ class CloseBrowserThread(QThread):
                 return f"⚠️ Erreur lors de la lecture du fichier {log_file}: {e}"
 
             try:
-                with open(target_file_path, 'a', encoding='utf-8') as target_file_writer:
-                    target_file_writer.write(log_content + "\n")
+                self.log_sink.Append(Make_Log_Record(email, session_folder, self.session_id, log_file, log_content))
             except Exception as e:
-                return f"⚠️ Erreur lors de l'écriture dans {target_file_path}: {e}"
+                return f"⚠️ Erreur lors de l'écriture dans {self.log_sink.current_path}: {e}"
             #print(f"Fichier log supprimé et contenu déplacé: {log_file_path}")
 
             # Suppression du fichier log après traitement
@@ -2479,10 +3105,10 @@ class CloseBrowserThread(QThread):
 
 
 
-    def process_session_file(self, file_name, downloads_folder , selected_Browser, session):
+    def process_session_file(self, file_name, downloads_folder , selected_Browser, session, send_status=Send_Status):
         # Traite un fichier de session :
         # - Récupère les infos de session (pid, email, état)
-        # - Écrit dans le fichier result.txt
+        # - Écrit dans le fichier result.txt et dans l'historique SQLite
         # - Termine le processus si actif
         # - Supprime le fichier
         #print(f"[Traitement Session] Début du traitement de {file_name}")
@@ -2501,28 +3127,24 @@ class CloseBrowserThread(QThread):
                 return f"⚠️ Format incorrect dans {file_name}: {file_content}"
 
             session_id, pid, email, etat  = match.groups()
+            JOB_TRACER.Complete(email, "browser_run", since_mark="browser_started", status=etat)
+            JOB_TRACER.Mark(email, "session_observed", status=etat)
             #print(f"[Session Info] PID: {pid}, Email: {email}, État: {etat}")
 
             log_message(f"[INFO] Email {email} has completed  processing with status {etat}.")
 
-            # text_file_path = os.path.join(BASE_DIRECTORY, email , "data.txt")
-
-            text_file_path = os.path.join(BASE_DIRECTORY, email , "data.txt")
-
             try:
-                with open(text_file_path, 'r', encoding='utf-8') as file:
-                    first_line = file.readline().strip()  # lire juste la première ligne
-
-                    parts = first_line.split(":")
-                    if len(parts) >= 4:
-                        inserted_id = parts[3]
-                        #print(f"😶‍🌫️😶‍🌫️ ID extrait : {inserted_id}")
-                    else:
-                        return f"⚠️ Format de ligne invalide dans le fichier : {first_line}"
-
+                inserted_id = Get_Inserted_Id(email)
+                #print(f"😶‍🌫️😶‍🌫️ ID extrait : {inserted_id}")
+            except ValueError as e:
+                return f"⚠️ {e}"
             except Exception as e:
                 return f"⚠️ Erreur lors de la lecture du fichier {file_path}: {e}"
 
+            registry = Get_Job_Registry()
+            if registry:
+                registry.Finish(JobRegistry.Job_Id(session_id, email), etat)
+
             
             try:
                 with open(file_path, 'r', encoding='utf-8') as file:
@@ -2533,6 +3155,17 @@ class CloseBrowserThread(QThread):
             try:
                 with open(RESULT_FILE_PATH, 'a', encoding='utf-8') as result_file:
                     result_file.write(f"{session_id}:{pid}:{email}:{etat}\n")
+                    result_file.flush()
+                    RESULT_SIGNALS.updated.emit()
+
+                    if self.run_history:
+                        try:
+                            self.run_history.Record_Result(
+                                email, etat, session_id=session_id, pid=pid, isp=self.Isp,
+                                browser=selected_Browser, login=self.username
+                            )
+                        except Exception as e:
+                            JOBS_LOG.warning("⚠️ [HISTORY] Enregistrement impossible pour %s : %s", email, e)
                     params = {
                         'id': inserted_id,
                         'login': self.username,
@@ -2540,7 +3173,7 @@ class CloseBrowserThread(QThread):
                         'error':  '' if etat == "completed" else etat
                     }
 
-                    Send_Status(params)
+                    send_status(params, job=email)
 
             except Exception as e:
                 return f"⚠️ Erreur lors de l'écriture dans le fichier {file_name}: {e}"
@@ -2554,17 +3187,19 @@ class CloseBrowserThread(QThread):
                     try:
                         #print("browser : ", selected_Browser)
                         #print('✅✅✅✅✅✅✅✅PID : ', pid)
-                        self.find_firefox_window(email)
-                        self.wait_then_close(email)
+                        with JOB_TRACER.Span(email, "process_closed"):
+                            self.find_firefox_window(email)
+                            self.wait_then_close(email)
                         PROCESS_PIDS.remove(pid)   
                         #print(f"Processus {pid} ({email}) terminé.")
                     except Exception as e:
-                        print(f"⚠️ Erreur lors de la fermeture du processus {pid} ({email}): {e}")
+                        JOBS_LOG.error("⚠️ Erreur lors de la fermeture du processus %s (%s): %s", pid, email, e)
                     
                 else:
                     try:
                         #print('✅✅✅✅✅✅✅✅✅✅ PID : ', pid)
-                        os.kill(pid, signal.SIGTERM) 
+                        with JOB_TRACER.Span(email, "process_closed"):
+                            os.kill(pid, signal.SIGTERM) 
                         PROCESS_PIDS.remove(pid)   
                         #print(f"Processus {pid} ({email}) terminé.")
     
@@ -2628,12 +3263,12 @@ class CloseBrowserThread(QThread):
                         #print(f"  • Title : {window_title}")
                         return False
                 except Exception as e:
-                    print(f"⚠️ Erreur lors du traitement de la fenêtre HWND={hwnd} : {e}")
+                    JOBS_LOG.error("⚠️ Erreur lors du traitement de la fenêtre HWND=%s : %s", hwnd, e)
                 return True
             try:
                 win32gui.EnumWindows(window_processor, None)
             except Exception as e:
-                print(f"⚠️ Exception EnumWindows : {e}")
+                JOBS_LOG.warning("⚠️ Exception EnumWindows : %s", e)
             if entry['hwnd']:
                 #print(f"\n🎯 Fenêtre correspondante trouvée (HWND={entry['hwnd']})")
                 return entry['hwnd']
@@ -2716,6 +3351,233 @@ class CloseBrowserThread(QThread):
 
 
 
+
+# =========================================
+# ⚙️ Moteur asyncio (AUTOMAIL_ASYNC_ENGINE=1)
+# =========================================
+# Adaptateur Qt du moteur : mêmes signaux et mêmes attributs (stop_flag, wait, isRunning)
+# qu'ExtractionThread, pour que Stop_All_Processes et Submit_Button_Clicked restent inchangés.
+class EngineSignalAdapter(QtCore.QObject):
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal()
+    stopped = pyqtSignal(str)
+    log_signal = pyqtSignal(str)
+
+    def __init__(self, engine=None):
+        super().__init__()
+        self.engine = engine
+        # Créé depuis un thread de l'exécuteur : les slots connectés doivent s'exécuter dans le thread Qt
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            self.moveToThread(app.thread())
+
+
+    @property
+    def stop_flag(self):
+        return self.engine.stop_requested
+
+
+    @stop_flag.setter
+    def stop_flag(self, value):
+        if value:
+            self.engine.Stop()
+
+
+    def wait(self, timeout=None):
+        self.engine.Join(timeout)
+        return not self.engine.Is_Running()
+
+
+    def isRunning(self):
+        return self.engine.Is_Running()
+
+
+
+
+# Branche le moteur sur le code existant : ExtractionThread prépare les jobs, CloseBrowserThread
+# traite les fichiers téléchargés. Aucun des deux n'est démarré (pas de boucle de sondage).
+class AppEngineHooks(EngineHooks):
+
+    def __init__(self, extraction, processor, session, signals):
+        self.extraction = extraction
+        self.processor = processor
+        self.session = session
+        self.signals = signals
+        self.engine = None
+        self.session_info = None
+        self.run_context = None
+
+
+    def Save_Email(self, params):
+        API_LOG.debug("🌐 [API] Envoi de la requête ➜ %s", _SAVE_EMAIL_API)
+        return self.engine.Call(self.engine.api.Post(_SAVE_EMAIL_API, params, raise_for_status=True))
+
+
+    def Send_Status(self, params, job=None):
+        with JOB_TRACER.Span(job, "send_status", status=params.get('status')):
+            return self.engine.Call(self.engine.api.Post(_SEND_STATUS_API, params, attempts=5))
+
+
+    def begin(self):
+        global SELECTED_BROWSER_GLOBAL, RESULTATS_EX
+        SELECTED_BROWSER_GLOBAL = self.extraction.selected_Browser
+        EVENT_RECORDER.Start(
+            self.extraction.session_id, jobs=len(self.extraction.data_list), parallel=self.extraction.entered_number,
+            browser=self.extraction.selected_Browser, loop_ms=0, start_delay_sec=0, poll_sec=CLOSE_MONITOR_POLL_INTERVAL_SEC
+        )
+        log_message("[INFO] Processing started")
+
+        self.session_info = check_session(SESSION_PATH, KEY)
+        if not self.session_info["valid"]:
+            SESSION_LOG.error("[SESSION] ❌ Session invalide. Impossible de continuer l’extraction.")
+            self.stopped("Session invalide. Veuillez vous reconnecter.")
+            return False
+
+        try:
+            self.run_context = Build_Run_Context(self.extraction, self.session_info)
+        except ExtensionBuildError as e:
+            PROFILE_LOG.error("❌ %s", e)
+            self.stopped("We could not prepare the browser extension. Please contact Support.")
+            return False
+
+        if self.extraction.selected_Browser == "chrome":
+            RESULTATS_EX = Upload_EXTENTION_PROXY("default", CLES_RECHERCHE, RESULTATS)
+
+        self.processor.log_sink = CompressedLogSink(self.run_context.session_directory)
+        return True
+
+
+    def prepare(self, job):
+        email_value = Get_Key_Value(job, ["email", "Email"])
+        JOB_TRACER.Mark(email_value, "dequeued")
+        log_message(f"[INFO] Processing the email:  {email_value}")
+        return self.extraction.Prepare_Job(job, self.run_context, save_email=self.Save_Email)
+
+
+    def spawned(self, launch, pid):
+        # psutil.Process offre pid/terminate/wait comme Popen (utilisé par close_window_by_hwnd)
+        try:
+            handle = psutil.Process(pid)
+        except psutil.Error:
+            handle = None
+        self.extraction.Register_Launch(launch, pid, handle)
+        self.extraction.emails_processed += 1
+
+
+    def scanned(self, session_files, log_files):
+        for file_name in session_files:
+            JOBS_LOG.debug("[Engine] Fichier de session détecté: %s", file_name)
+        self.processor.Record_Downloads(session_files + log_files)
+
+
+    def log_file(self, file_name):
+        return self.processor.process_log_file(file_name, self.processor.downloads_folder)
+
+
+    def session_file(self, file_name):
+        return self.processor.process_session_file(
+            file_name, self.processor.downloads_folder, self.processor.selected_Browser, self.session,
+            send_status=self.Send_Status
+        )
+
+
+    def scan_done(self):
+        if self.processor.log_sink:
+            self.processor.log_sink.Flush()
+
+
+    def lost(self, launch, returncode):
+        log_message(f"[INFO] Email {launch['email']} : browser exited (code {returncode}) without a session file.")
+        registry = Get_Job_Registry()
+        if registry:
+            registry.Update(JobRegistry.Job_Id(SESSION_ID, launch["email"]), state=STATE_INTERRUPTED)
+        job = registry.Find_By_Email(launch["email"]) if registry else None
+        if job and job.get("pid") in PROCESS_PIDS:
+            PROCESS_PIDS.remove(job["pid"])
+
+
+    def log(self, text):
+        if self.signals is not None:
+            self.signals.log_signal.emit(text)
+
+
+    def stopped(self, message):
+        log_message(message)
+        if self.signals is not None:
+            self.signals.stopped.emit(message)
+
+
+    def finished(self, summary):
+        global LOGS_RUNNING
+        log_message("[INFO] Processing finished for all emails.")
+        LOGS_RUNNING = False
+        if self.processor.log_sink:
+            self.processor.log_sink.Close()
+        Write_Job_Trace()
+        recording = EVENT_RECORDER.Stop()
+        if recording:
+            JOBS_LOG.info("🎥 [RECORD] Run enregistré : %s", recording)
+        Cleanup_Profiles()
+        JOBS_LOG.info("⚙️ [ENGINE] %s", summary)
+        if self.signals is not None:
+            self.signals.finished.emit()
+
+
+
+
+# 🧱 Construit le moteur et ses hooks (sans le démarrer). `signals` vaut None hors interface (batchRunner.py).
+def Build_Orchestration_Engine(data_list, entered_number, browser_path, window, selected_Browser, Isp, unique_id,
+                               output_json_final, username, signals=None, hooks_class=AppEngineHooks):
+    global ORCHESTRATION_ENGINE
+
+    session = ""
+    if os.path.exists(SESSION_PATH):
+        with open(SESSION_PATH, "r", encoding="utf-8") as f:
+            session = f.read().strip()
+
+    extraction = ExtractionThread(
+        data_list, SESSION_ID, entered_number, browser_path, BASE_DIRECTORY, window, selected_Browser, Isp, unique_id, output_json_final
+    )
+    processor = CloseBrowserThread(selected_Browser, username, Isp)
+
+    hooks = hooks_class(extraction, processor, session, signals)
+    engine = OrchestrationEngine(
+        hooks, entered_number, processor.downloads_folder, SESSION_ID,
+        api=AsyncApiClient(headers=HEADERS, verify=False), scan_interval=CLOSE_MONITOR_POLL_INTERVAL_SEC,
+    )
+    hooks.engine = engine
+    ORCHESTRATION_ENGINE = engine
+    return engine
+
+
+
+
+# 🚀 Démarre un run sur le moteur asyncio ; retourne l'adaptateur Qt (utilisé comme EXTRACTION_THREAD)
+def Start_Orchestration_Engine(data_list, entered_number, browser_path, window, selected_Browser, Isp, unique_id,
+                               output_json_final, username, log_receiver=None):
+    signals = EngineSignalAdapter()
+    signals.progress.connect(lambda msg: JOBS_LOG.debug("%s", msg))
+    if log_receiver is not None:
+        signals.log_signal.connect(log_receiver)
+
+    engine = Build_Orchestration_Engine(
+        data_list, entered_number, browser_path, window, selected_Browser, Isp, unique_id, output_json_final,
+        username, signals=signals
+    )
+    signals.engine = engine
+    engine.Start(data_list)
+    return signals
+
+
+
+
+
+
+
+
+
+
 # QTabBar personnalisé pour un affichage vertical avec des styles adaptés.
 # Affiche les onglets avec icônes, couleurs personnalisées et texte formaté.
 class VerticalTabBar(QtWidgets.QTabBar):
@@ -2757,29 +3619,24 @@ class VerticalTabBar(QtWidgets.QTabBar):
 
             painter.save()
             if self.currentIndex() == i:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor("#669bbc")))
+                painter.setBrush(RESOURCE_CACHE.Brush("#669bbc"))
             else:
-                painter.setBrush(QtGui.QBrush(QtGui.QColor("#F5F5F5")))
+                painter.setBrush(RESOURCE_CACHE.Brush("#F5F5F5"))
             painter.setPen(QtCore.Qt.PenStyle.NoPen)
             painter.drawRect(rect)  
-            border_pen = QtGui.QPen(QtGui.QColor("#669bbc"))
-            border_pen.setWidth(1)
-            painter.setPen(border_pen)
+            painter.setPen(RESOURCE_CACHE.Pen("#669bbc", 1))
             painter.drawLine(rect.bottomLeft(), rect.bottomRight())
             painter.drawLine(rect.topRight(), rect.bottomRight())
             painter.restore()
             painter.save()
 
             if not icon.isNull():
-                pixmap = icon.pixmap(24, 24)
+                pixmap = RESOURCE_CACHE.Icon_Pixmap(icon, 24)
                 icon_pos = QtCore.QPoint(rect.left() + 8, rect.top() + 15)
                 painter.drawPixmap(icon_pos, pixmap)
 
-            painter.setPen(QtGui.QPen(QtGui.QColor("#333")))
-            font = painter.font()
-            font.setPointSize(10)
-            font.setFamily("Times New Roman")
-            painter.setFont(font)
+            painter.setPen(RESOURCE_CACHE.Pen("#333"))
+            painter.setFont(RESOURCE_CACHE.Font(painter.font(), "Times New Roman", 10))
 
             text_rect = QtCore.QRect(
                 rect.left() + 44,
@@ -2898,22 +3755,22 @@ def Update_From_Serveur(remote_version=None):
 
 
 
-def Check_Version_Extention(window):
+def Check_Version_Extention(window, notify=None):
     """
     Checks and updates the Chrome extension if necessary.
+    notify(window, title, message, message_type) replaces Show_Critical_Message (headless runs).
     Returns:
         str  -> returns the remote version if an update is required
         True -> extension exists and is up to date
         False -> failure (download issue, fetch remote error, manifest mismatch, or missing local extension files)
     """
+    notify = notify or Show_Critical_Message
     try:
         #print("\n🔎 Checking local and remote extension versions...")
 
         # Fetch remote version
         try:
-            response = requests.get(CHECK_URL_EX3, verify=False, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = VERSION_SERVICE.Fetch(CHECK_URL_EX3, key="ext3")
             remote_version = data.get("version_Extention")
             remote_manifest_version = data.get("manifest_version")
 
@@ -2925,7 +3782,7 @@ def Check_Version_Extention(window):
 
         except Exception as e:
             #print(f"❌ Unable to fetch remote version: {e}")
-            Show_Critical_Message(
+            notify(
                 window,
                 "Network / Remote Version Error",
                 f"Unable to fetch the remote version. Check your connection or contact support.\n\nTechnical details: {str(e).capitalize()}",
@@ -2936,7 +3793,7 @@ def Check_Version_Extention(window):
         # Check local files
         if not os.path.exists(MANIFEST_PATH_EX3) or not os.path.exists(VERSION_LOCAL_EX3):
             #print("⚠️ Local files missing for version check.")
-            Show_Critical_Message(
+            notify(
                 window,
                 "Missing Local Files",
                 "The local extension files could not be found. Please reinstall the extension.",
@@ -2944,21 +3801,16 @@ def Check_Version_Extention(window):
             )
             return False
 
-        # Read local manifest
-        with open(MANIFEST_PATH_EX3, "r", encoding="utf-8") as f:
-            manifest_data = json.load(f)
-        local_manifest_version = manifest_data.get("version", None)
-
-        # Read local version
-        with open(VERSION_LOCAL_EX3, "r", encoding="utf-8") as f:
-            local_version = f.read().strip()
+        # Read local manifest and version
+        local_manifest_version = Read_Manifest_Version(MANIFEST_PATH_EX3)
+        local_version = Read_Version_File(VERSION_LOCAL_EX3)
 
         #print(f"📄 Local version : {local_version}, Local manifest : {local_manifest_version}")
         #print(f"🌍 Remote version : {remote_version}, Remote manifest : {remote_manifest_version}")
 
         # Check manifest compatibility
         if str(local_manifest_version) != str(remote_manifest_version):
-            Show_Critical_Message(
+            notify(
                 window,
                 "Manifest Incompatibility",
                 "The local manifest version does not match the remote one.\nPlease contact support.",
@@ -2977,7 +3829,7 @@ def Check_Version_Extention(window):
 
     except Exception as e:
         #print(f"❌ Unexpected error in Check_Version_Extention: {e}")
-        Show_Critical_Message(
+        notify(
             window,
             "Internal Error",
             "An unexpected error occurred during extension verification. Please contact support.",
@@ -2996,89 +3848,195 @@ def Check_Version_Extention(window):
 
 
 
-def Process_Browser(window, selected_Browser):
-    if selected_Browser != "chrome":
-        #print(f"⚠️ Navigateur non pris en charge : {selected_Browser}")
-        return False  
+# 🕒 Dates de modification des fichiers dont dépend le preflight (None si absent)
+def Preflight_Mtimes():
+    mtimes = {}
+    for path in PREFLIGHT_WATCHED:
+        try:
+            mtimes[path] = os.path.getmtime(path)
+        except OSError:
+            mtimes[path] = None
+    return mtimes
 
-    #print(f"\n🌐 Navigateur sélectionné : {selected_Browser}")
+
+
+
+# 🔎 Compare la version locale de l'extension à la version distante (sans interface).
+# Retourne True si à jour, la version distante (str) si une mise à jour est nécessaire, None si indéterminé.
+def Check_Extension_Status():
+    try:
+        data = VERSION_SERVICE.Fetch(CHECK_URL_EX3, key="ext3")
+    except VersionCheckError:
+        return None
+
+    local_manifest_version = Read_Manifest_Version(MANIFEST_PATH_EX3)
+    local_version = Read_Version_File(VERSION_LOCAL_EX3)
+    if local_manifest_version is None or local_version is None:
+        return None
+    if str(local_manifest_version) != str(data.get("manifest_version")):
+        return None
+
+    remote_version = data.get("version_Extention")
+    return True if local_version == remote_version else remote_version
+
+
+
+
+# 🧪 Calcule le preflight complet (lecture + parcours de Secure Preferences, état de l'extension)
+def Compute_Preflight():
+    result = {
+        "error": None,
+        "missing_keys": [],
+        "extension_installed": os.path.exists(EXTENTION_EX3),
+        "extension_status": None,
+        "mtimes": Preflight_Mtimes(),
+        "checked_at": time.time(),
+    }
 
     # Étape 1 : Vérification du dossier de configuration
-    #print("\n🔍 Étape 1 : Vérification du dossier de configuration ...")
     if not os.path.exists(CONFIG_PROFILE):
-        print(f"❌ Le dossier requis '{CONFIG_PROFILE}' est introuvable.")
-        return False  
-    #print(f"📂 Dossier de configuration trouvé : {CONFIG_PROFILE}")
+        result["error"] = f"❌ Le dossier requis '{CONFIG_PROFILE}' est introuvable."
+        return result
 
     # Étape 2 : Vérification du fichier secure_preferences
-    #print("\n🔍 Étape 2 : Vérification du fichier secure_preferences ...")
     if not os.path.exists(SECURE_PREFERENCES_TEMPLATE):
-        #print(f"❌ Le fichier '{SECURE_PREFERENCES_TEMPLATE}' est introuvable.")
-        return False  
+        result["error"] = f"❌ Le fichier '{SECURE_PREFERENCES_TEMPLATE}' est introuvable."
+        return result
 
     try:
         with open(SECURE_PREFERENCES_TEMPLATE, "r", encoding="utf-8") as f:
             data = json.load(f)
-        #print("✅ Lecture réussie du fichier Secure Preferences.")
     except Exception as e:
-        #print(f"❌ Erreur lors de la lecture du fichier secure_preferences : {e}")
-        return False  
-
-    results_keys=[]
-    missing_keys = []  # Liste des clés manquantes
+        result["error"] = f"❌ Erreur lors de la lecture du fichier secure_preferences : {e}"
+        return result
 
     # Étape 3 : Vérification des clés attendues
+    results_keys = []
     Search_Keys(data, CLES_RECHERCHE , results_keys)
+    found_keys = {list(d.keys())[0] for d in results_keys}
+    result["missing_keys"] = [key for key in CLES_RECHERCHE if key not in found_keys]
 
+    # Étape 4 : État de l'extension locale
+    if result["extension_installed"]:
+        result["extension_status"] = Check_Extension_Status()
 
+    return result
 
-    found_keys = [list(d.keys())[0] for d in results_keys]  
-    for key in CLES_RECHERCHE:
-        if key in found_keys:
-            # print(f"✅ Clé trouvée : {key}")
-            continue
-        else:
-            # print(f"❌ Clé manquante : {key}")
-            missing_keys.append(key)
-
-    if missing_keys:
-        #print("\n⚠️ Vérification échouée : certaines clés sont manquantes.")
-        #print("Clés manquantes :")
-        for idx, k in enumerate(missing_keys, start=1):
-            print(f"   {idx}. {k}")
+
+
+
+# 📦 Retourne le preflight en cache s'il est encore valide (TTL + fichiers inchangés), sinon le recalcule
+def Get_Preflight(force=False):
+    global PREFLIGHT_CACHE
+    with PREFLIGHT_LOCK:
+        cached = PREFLIGHT_CACHE
+        generation = PREFLIGHT_GENERATION
+    if (
+        not force and cached is not None
+        and time.time() - cached["checked_at"] < PREFLIGHT_TTL_SEC
+        and cached["mtimes"] == Preflight_Mtimes()
+    ):
+        return cached
+
+    # Calcul hors verrou (Secure Preferences + requête de version) : un Submit pendant un
+    # rafraîchissement en arrière-plan n'attend jamais le réseau sur PREFLIGHT_LOCK
+    result = Compute_Preflight()
+    with PREFLIGHT_LOCK:
+        # Pas de remplacement par un résultat plus ancien, ni après une invalidation pendant le calcul
+        if generation == PREFLIGHT_GENERATION and (
+            PREFLIGHT_CACHE is None or PREFLIGHT_CACHE["checked_at"] <= result["checked_at"]
+        ):
+            PREFLIGHT_CACHE = result
+    return result
+
+
+
+
+def Invalidate_Preflight():
+    global PREFLIGHT_CACHE, PREFLIGHT_GENERATION
+    with PREFLIGHT_LOCK:
+        PREFLIGHT_CACHE = None
+        PREFLIGHT_GENERATION += 1
+
+
+
+
+# 🔁 Rafraîchit le preflight en arrière-plan (au lancement et après chaque Submit)
+def Refresh_Preflight_Async():
+    def worker():
+        try:
+            Get_Preflight(force=True)
+        except Exception as e:
+            PROFILE_LOG.warning("⚠️ [PREFLIGHT] Rafraîchissement impossible : %s", e)
+    threading.Thread(target=worker, name="PreflightRefresh", daemon=True).start()
+
+
+
+
+
+
+# `notify` (même signature que Show_Critical_Message) remplace les QMessageBox hors interface (batchRunner.py)
+def Process_Browser(window, selected_Browser, notify=None):
+    if selected_Browser != "chrome":
+        #print(f"⚠️ Navigateur non pris en charge : {selected_Browser}")
+        return False  
+
+    #print(f"\n🌐 Navigateur sélectionné : {selected_Browser}")
+
+    # Étapes 1 à 3 : dossier de configuration, Secure Preferences et clés attendues (en cache)
+    preflight = Get_Preflight()
+
+    if preflight["error"]:
+        PROFILE_LOG.error("%s", preflight["error"])
+        if notify:
+            notify(window, "Browser Preflight Error", preflight["error"], message_type="critical")
+        return False
+
+    if preflight["missing_keys"]:
+        PROFILE_LOG.warning("⚠️ Vérification échouée, clés manquantes : %s", ", ".join(map(str, preflight["missing_keys"])))
+        if notify:
+            notify(window, "Missing Extension Keys", ", ".join(map(str, preflight["missing_keys"])), message_type="critical")
         return False  
-    # else:
-        # print("\n✅ Toutes les clés requises ont été trouvées avec succès.")
 
     # Étape 4 : Vérification et mise à jour de l'extension locale
     #print("\n🔍 Étape 4 : Vérification de l'extension locale ...")
     if not os.path.exists(EXTENTION_EX3):
         # print(f"📂 Le dossier '{EXTENTION_EX3}' a été créé car il n'existait pas.")
         #print("📥 Téléchargement de la dernière version de l'extension...")
+        Invalidate_Preflight()
         if Update_From_Serveur():
-            print("✅ Extension installée avec succès.")
+            PROFILE_LOG.info("✅ Extension installée avec succès.")
         else:
             #print("We could not install the extension. Please contact Support.")
+            if notify:
+                notify(window, "Extension Install Failed", "We could not install the extension.", message_type="critical")
             return False  
     else:
         #print(f"📂 Extension trouvée : {EXTENTION_EX3}")
-        remote_version = Check_Version_Extention(window)
+        remote_version = preflight["extension_status"]
+        if remote_version is None:
+            # État indéterminé : vérification complète avec messages d'erreur à l'utilisateur
+            remote_version = Check_Version_Extention(window, notify=notify)
 
         if isinstance(remote_version, str):  # Mise à jour nécessaire
             #print(f"🔄 Mise à jour nécessaire vers {remote_version}")
+            Invalidate_Preflight()
             if Update_From_Serveur(remote_version):
-                print("✅ Mise à jour réussie : l'extension a été mise à jour avec succès !")
+                PROFILE_LOG.info("✅ Mise à jour réussie : l'extension a été mise à jour avec succès !")
             else:
                 #print("We could not update the extension from GitHub. Please contact Support.")
+                if notify:
+                    notify(window, "Extension Update Failed", f"We could not update the extension to {remote_version}.", message_type="critical")
                 return False  
         elif remote_version is True:
-            print("✅ L'extension locale est déjà à jour.")
+            PROFILE_LOG.info("✅ L'extension locale est déjà à jour.")
         else:
             #print("Unable to verify extension version. Please contact Support.")
             return False  
 
-    # Si toutes les étapes ont réussi
+    # Si toutes les étapes ont réussi : le prochain Submit trouvera un preflight frais
     #print("\n🎉 Traitement terminé avec succès pour le navigateur Chrome.")
+    Refresh_Preflight_Async()
     return True
 
 
@@ -3095,62 +4053,62 @@ def check_session(SESSION_PATH, KEY):
         "error": None
     }
 
-    print(f"[INFO] Chemin du fichier session : {SESSION_PATH}")
+    SESSION_LOG.debug("[INFO] Chemin du fichier session : %s", SESSION_PATH)
 
     if not os.path.exists(SESSION_PATH):
-        print("[AVERTISSEMENT SESSION] ❌ Le fichier session.txt n'existe pas")
+        SESSION_LOG.warning("[AVERTISSEMENT SESSION] ❌ Le fichier session.txt n'existe pas")
         session_info["error"] = "FileNotFound"
         return session_info
 
-    print("[INFO] Le fichier session.txt existe ✅")
+    SESSION_LOG.debug("[INFO] Le fichier session.txt existe ✅")
 
     try:
         with open(SESSION_PATH, "r", encoding="utf-8") as f:
             encrypted = f.read().strip()
 
-        print(f"[INFO] Contenu chiffré lu :\n'{encrypted}'")
-        print(f"[INFO] Longueur du contenu chiffré : {len(encrypted)} caractères")
+        SESSION_LOG.debug("[INFO] Contenu chiffré lu :\n'%s'", encrypted)
+        SESSION_LOG.debug("[INFO] Longueur du contenu chiffré : %s caractères", Lazy(len, encrypted))
 
         if not encrypted:
-            print("[AVERTISSEMENT SESSION] Le fichier session.txt est vide ❌")
+            SESSION_LOG.warning("[AVERTISSEMENT SESSION] Le fichier session.txt est vide ❌")
             session_info["error"] = "EmptyFile"
             return session_info
 
         # Tentative de déchiffrement
         try:
             decrypted = decrypt_message(encrypted, KEY)
-            print(f"[INFO] Contenu déchiffré complet :\n'{decrypted}'")
-            print(f"[INFO] Longueur du contenu déchiffré : {len(decrypted)} caractères")
+            SESSION_LOG.debug("[INFO] Contenu déchiffré complet :\n'%s'", decrypted)
+            SESSION_LOG.debug("[INFO] Longueur du contenu déchiffré : %s caractères", Lazy(len, decrypted))
         except Exception as e:
-            print(f"[ERREUR DECHIFFREMENT] Erreur lors du déchiffrement : {e}")
+            SESSION_LOG.error("[ERREUR DECHIFFREMENT] Erreur lors du déchiffrement : %s", e)
             session_info["error"] = f"DecryptError: {e}"
             return session_info
 
         # Analyse du contenu déchiffré
         parts = decrypted.split("::", 2)
-        print(f"[INFO] Contenu découpé en {len(parts)} parties : {parts}")
+        SESSION_LOG.debug("[INFO] Contenu découpé en %s parties : %s", Lazy(len, parts), parts)
 
         if len(parts) != 3:
-            print("[ERREUR FORMAT SESSION] ❌ Format invalide (attendu : username::date::p_entity)")
-            print(f"[DEBUG] Contenu déchiffré complet : '{decrypted}'")
+            SESSION_LOG.error("[ERREUR FORMAT SESSION] ❌ Format invalide (attendu : username::date::p_entity)")
+            SESSION_LOG.debug("[DEBUG] Contenu déchiffré complet : '%s'", decrypted)
             session_info["error"] = "InvalidFormat"
             return session_info
 
         username, date_str, p_entity = [p.strip() for p in parts]
 
-        print(f"[INFO] Nom d'utilisateur : '{username}'")
-        print(f"[INFO] Date de session (date_str) : '{date_str}'")
-        print(f"[INFO] p_entity : '{p_entity}'")
+        SESSION_LOG.debug("[INFO] Nom d'utilisateur : '%s'", username)
+        SESSION_LOG.debug("[INFO] Date de session (date_str) : '%s'", date_str)
+        SESSION_LOG.debug("[INFO] p_entity : '%s'", p_entity)
 
         try:
             tz = pytz.timezone("Africa/Casablanca")
-            print(f"[DEBUG] Conversion de la date '{date_str}' en datetime...")
+            SESSION_LOG.debug("[DEBUG] Conversion de la date '%s' en datetime...", date_str)
             last_session = datetime.datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
             last_session = tz.localize(last_session)
 
             now = datetime.datetime.now(tz)
-            print(f"[INFO] Date de la session : {last_session}")
-            print(f"[INFO] Date actuelle : {now}")
+            SESSION_LOG.debug("[INFO] Date de la session : %s", last_session)
+            SESSION_LOG.debug("[INFO] Date actuelle : %s", now)
 
             if (now - last_session) < timedelta(days=2):
                 session_info.update({
@@ -3159,17 +4117,17 @@ def check_session(SESSION_PATH, KEY):
                     "date": last_session,
                     "p_entity": p_entity
                 })
-                print(f"[SESSION] ✅ Session valide pour l'utilisateur '{username}' (p_entity = {p_entity})")
+                SESSION_LOG.info("[SESSION] ✅ Session valide pour l'utilisateur '%s' (p_entity = %s)", username, p_entity)
             else:
-                print("[SESSION EXPIRÉE] ⌛ La session a expiré depuis plus de 2 jours")
+                SESSION_LOG.warning("[SESSION EXPIRÉE] ⌛ La session a expiré depuis plus de 2 jours")
                 session_info["error"] = "Expired"
         except ValueError as e:
-            print(f"[ERREUR FORMAT DATE] ❌ Format de date invalide : {e}")
-            print(f"[DEBUG] Contenu complet de date_str : '{date_str}'")
+            SESSION_LOG.error("[ERREUR FORMAT DATE] ❌ Format de date invalide : %s", e)
+            SESSION_LOG.debug("[DEBUG] Contenu complet de date_str : '%s'", date_str)
             session_info["error"] = f"InvalidDateFormat: {e}"
 
     except Exception as e:
-        print(f"[ERREUR LECTURE SESSION] ❌ Exception lors de la lecture du fichier : {e}")
+        SESSION_LOG.error("[ERREUR LECTURE SESSION] ❌ Exception lors de la lecture du fichier : %s", e)
         session_info["error"] = f"FileReadError: {e}"
 
     return session_info
@@ -3192,8 +4150,12 @@ class MainWindow(QMainWindow):
 
         super(MainWindow, self).__init__()
 
-        # Charger l'interface utilisateur depuis le fichier .ui
-        uic.loadUi(INTERFACE_UI , self)
+        # Charger l'interface utilisateur : module compilé en cache, sinon uic.loadUi
+        UI_CACHE.Setup(INTERFACE_UI, self)
+
+        # Raccourci caché : active / arrête le profilage CPU
+        self.profiler_shortcut = QShortcut(QKeySequence(PROFILER_SHORTCUT), self)
+        self.profiler_shortcut.activated.connect(self.Toggle_Profiling)
         
         # Initialiser les données et layouts principaux
         self.states = json_data
@@ -3246,8 +4208,8 @@ class MainWindow(QMainWindow):
 
         if self.ClearButton:
             clear_path = os.path.join(ICONS_DIR_INTERFACE, "clear.png").replace("\\", "/")
-            if os.path.exists(clear_path):
-                icon = QIcon(clear_path)
+            icon = RESOURCE_CACHE.Icon(clear_path)
+            if not icon.isNull():
                 self.ClearButton.setIcon(icon)
                 self.ClearButton.setIconSize(QSize(32, 32))
 
@@ -3274,8 +4236,8 @@ class MainWindow(QMainWindow):
 
         if self.CopyButton:
             clear_path = os.path.join(ICONS_DIR_INTERFACE, "copyLog.png").replace("\\", "/")
-            if os.path.exists(clear_path):
-                icon = QIcon(clear_path)
+            icon = RESOURCE_CACHE.Icon(clear_path)
+            if not icon.isNull():
                 self.CopyButton.setIcon(icon)
                 self.CopyButton.setIconSize(QSize(26, 26))
 
@@ -3305,8 +4267,8 @@ class MainWindow(QMainWindow):
 
         if self.SaveButton:
             icon_path_save = os.path.join(ICONS_DIR_INTERFACE, "save.png").replace("\\", "/")
-            if os.path.exists(icon_path_save):
-                icon = QIcon(icon_path_save)
+            icon = RESOURCE_CACHE.Icon(icon_path_save)
+            if not icon.isNull():
                 self.SaveButton.setIcon(icon)
                 self.SaveButton.setIconSize(QSize(16, 16))
                 self.SaveButton.clicked.connect(self.Handle_Save)
@@ -3329,10 +4291,8 @@ class MainWindow(QMainWindow):
                     tab_text = self.tabWidgetResult.tabText(i)
                     icon_name = tab_text.lower().replace(" ", "_") + ".png"
                     icon_path = os.path.join(DEFAULT_ICON_PATH, icon_name)
-                    if os.path.exists(icon_path):
-                        icon = QIcon(icon_path)
-                        icon_pixmap = icon.pixmap(icon_size[0], icon_size[1])
-                        icon = QIcon(icon_pixmap)
+                    icon = RESOURCE_CACHE.Icon(icon_path, icon_size[0])
+                    if not icon.isNull():
                         self.tabWidgetResult.setTabIcon(i, icon)
 
 
@@ -3443,10 +4403,10 @@ class MainWindow(QMainWindow):
                 self.browser.setStyleSheet(old_style + new_style)
 
 
-            self.browser.addItem(QIcon(os.path.join(ICONS_DIR_INTERFACE, "chrome.png")), "Chrome")
-            self.browser.addItem(QIcon(os.path.join(ICONS_DIR_INTERFACE, "firefox.png")), "Firefox")
-            self.browser.addItem(QIcon(os.path.join(ICONS_DIR_INTERFACE, "edge.png")), "Edge")
-            self.browser.addItem(QIcon(os.path.join(ICONS_DIR_INTERFACE, "comodo.png")), "Comodo")
+            self.browser.addItem(RESOURCE_CACHE.Icon(os.path.join(ICONS_DIR_INTERFACE, "chrome.png")), "Chrome")
+            self.browser.addItem(RESOURCE_CACHE.Icon(os.path.join(ICONS_DIR_INTERFACE, "firefox.png")), "Firefox")
+            self.browser.addItem(RESOURCE_CACHE.Icon(os.path.join(ICONS_DIR_INTERFACE, "edge.png")), "Edge")
+            self.browser.addItem(RESOURCE_CACHE.Icon(os.path.join(ICONS_DIR_INTERFACE, "comodo.png")), "Comodo")
     
 
 
@@ -3466,7 +4426,7 @@ class MainWindow(QMainWindow):
                 old_style = self.Isp.styleSheet()
                 self.Isp.setStyleSheet(old_style + new_style)
             else:
-                print(f"❌ Fichier flèche manquant : {ARROW_DOWN_PATH}")
+                UI_LOG.error("❌ Fichier flèche manquant : %s", ARROW_DOWN_PATH)
 
             # 📁 Icônes
             #print(f"📁 Dossier d'icônes : {ICONS_DIR_INTERFACE}")
@@ -3480,8 +4440,9 @@ class MainWindow(QMainWindow):
 
             for name, icon_file in services.items():
                 icon_path = os.path.join(ICONS_DIR_INTERFACE, icon_file)
-                if os.path.exists(icon_path):
-                    self.Isp.addItem(QIcon(icon_path), name)
+                icon = RESOURCE_CACHE.Icon(icon_path)
+                if not icon.isNull():
+                    self.Isp.addItem(icon, name)
                     #print(f"✅ Ajout de l'élément '{name}' avec icône : {icon_path}")
                 else:
                     self.Isp.addItem(name)
@@ -3501,9 +4462,9 @@ class MainWindow(QMainWindow):
                     elif "yahoo" in line:
                         selected_isp = "Yahoo"
                     else:
-                        print("⚠️ Aucune correspondance trouvée dans le fichier.")
+                        UI_LOG.warning("⚠️ Aucune correspondance trouvée dans le fichier.")
             else:
-                print(f"❌ Fichier Isp.txt non trouvé : {FILE_ISP}")
+                UI_LOG.error("❌ Fichier Isp.txt non trouvé : %s", FILE_ISP)
 
 
 
@@ -3514,9 +4475,9 @@ class MainWindow(QMainWindow):
                     self.Isp.setCurrentIndex(index)
                     #print(f"✅ Élément '{selected_isp}' sélectionné dans la QComboBox.")
                 else:
-                    print(f"❌ Élément '{selected_isp}' introuvable dans la QComboBox.")
+                    UI_LOG.error("❌ Élément '%s' introuvable dans la QComboBox.", selected_isp)
         else:
-            print("❌ QComboBox 'Isps' introuvable.")
+            UI_LOG.error("❌ QComboBox 'Isps' introuvable.")
 
 
 
@@ -3547,8 +4508,9 @@ class MainWindow(QMainWindow):
             self.log_out_Button.setLayoutDirection(Qt.LayoutDirection.RightToLeft)  
             self.log_out_Button.clicked.connect(self.logOut)
 
-            if os.path.exists(self.image_path):
-                self.log_out_Button.setIcon(QIcon(self.image_path))
+            icon = RESOURCE_CACHE.Icon(self.image_path)
+            if not icon.isNull():
+                self.log_out_Button.setIcon(icon)
                 self.log_out_Button.setIconSize(QSize(18, 18))
 
 
@@ -3563,6 +4525,14 @@ class MainWindow(QMainWindow):
 
         self.result_tab_widget = self.findChild(QTabWidget, "tabWidgetResult")
 
+        # Onglets de résultats : références gardées une fois, rafraîchissements groupés pendant le run
+        self.result_tab_refs = Build_Result_Tab_Refs(self)
+        self.result_refresh_timer = QTimer(self)
+        self.result_refresh_timer.setSingleShot(True)
+        self.result_refresh_timer.setInterval(RESULT_REFRESH_INTERVAL_MS)
+        self.result_refresh_timer.timeout.connect(lambda: Read_Result_Update_List(self, notify=False))
+        RESULT_SIGNALS.updated.connect(self.Schedule_Result_Refresh)
+
         # if self.result_tab_widget:
         #     print("[DEBUG] ✅ tabWidgetResult trouvé dans l'interface.")
         # else:
@@ -3578,29 +4548,8 @@ class MainWindow(QMainWindow):
 
 
     def Save_Process(self, parameters):
-        try:
-            response = requests.post(_SAVE_PROCESS_API, data=parameters, headers=HEADERS)
-            print(f"🌐 [POST] URL: {_SAVE_PROCESS_API}")
-            print(f"📤 [POST] Paramètres envoyés: {parameters}")
-            print(f"📥 [HTTP] Code de réponse: {response.status_code}")
-            print(f"📄 [HTTP] Réponse brute:\n{response.text}")
-
-            results = response.json()
-            status = results.get('status', False)
-
-            if status is True:
-                print(f"✅ [API] Insertion réussie ➜ ID inséré: {results.get('inserted_id')}")
-                return results.get('inserted_id')
-            else:
-                print(f"❌ [API] Échec de l'insertion ➜ Détails: {results}")
-                return -1
+        return Save_Process(parameters)
 
-        except ValueError as ve:
-            print(f"💥 [JSON ERROR] Impossible de parser la réponse JSON: {ve}")
-            return -1
-        except Exception as e:
-            print(f"💥 [EXCEPTION] Erreur lors de l'appel POST: {e}")
-            return -1
 
         
 
@@ -3755,11 +4704,11 @@ class MainWindow(QMainWindow):
 
                     #print("")
             else:
-                print(f"[❌] Erreur HTTP {response.status_code}")
+                API_LOG.error("[❌] Erreur HTTP %s", response.status_code)
                 #print(f"[❗] Contenu de la réponse: {response.text}")
 
         except Exception as e:
-            print(f"[❌] Erreur lors de la récupération des scénarios: {e}")
+            API_LOG.error("[❌] Erreur lors de la récupération des scénarios: %s", e)
 
 
 
@@ -3782,7 +4731,7 @@ class MainWindow(QMainWindow):
 
                 if object_name.startswith("copy"):
                     icon_path = os.path.join(ICONS_DIR_INTERFACE, "copy.png")
-                    button.setIcon(QIcon(icon_path))
+                    button.setIcon(RESOURCE_CACHE.Icon(icon_path))
                     button.setIconSize(QtCore.QSize(20, 20))
                     # #print(f"[DEBUG] 🎯 Icône ajoutée au bouton '{object_name}' dans l'onglet {i}")
 
@@ -3794,7 +4743,7 @@ class MainWindow(QMainWindow):
 
                     button.clicked.connect(lambda _, idx=i: self.Copy_Result_From_Tab(idx))
                 else:
-                    print(f"[DEBUG] ⏭️ Bouton ignoré: '{object_name}'")
+                    UI_LOG.debug("[DEBUG] ⏭️ Bouton ignoré: '%s'", object_name)
 
 
 
@@ -3812,7 +4761,7 @@ class MainWindow(QMainWindow):
             clipboard.setText(text_to_copy)
             #print(f"[DEBUG] 📋 {len(items)} éléments copiés dans le presse-papiers.")
         else:
-            print("[DEBUG] ⚠️ Aucun QListWidget trouvé dans cet onglet.")
+            UI_LOG.debug("[DEBUG] ⚠️ Aucun QListWidget trouvé dans cet onglet.")
 
             
 
@@ -3865,11 +4814,21 @@ class MainWindow(QMainWindow):
             self.close()
 
         except Exception as e:
-            print(f"[LOGOUT ERROR] {e}")
+            UI_LOG.error("[LOGOUT ERROR] %s", e)
 
 
 
 
+    # 🔬 Active le profilage CPU, ou l'arrête et écrit les profils dans Tools/profiling
+    def Toggle_Profiling(self):
+        output_dir = CPU_PROFILER.Toggle()
+        if CPU_PROFILER.enabled:
+            UI_LOG.info("🔬 [PROFILE] Profilage CPU activé (threads en cours : échantillonneur seul, cProfile pour les suivants)")
+        elif output_dir:
+            UI_LOG.info("🔬 [PROFILE] Profils écrits dans : %s", output_dir)
+
+
+
     #Ajoute une nouvelle ligne de log dans la zone de log (interface utilisateur).
     #Chaque log est stylisé pour rester lisible avec fond transparent.
     def Update_Logs_Display(self, log_entry):
@@ -3901,23 +4860,7 @@ class MainWindow(QMainWindow):
     # -----------------------------
 
     def Save_Json_To_File(self, json_data, selected_browser):
-        if selected_browser.lower() == "firefox":
-            template_dir = TEMPLATE_DIRECTORY_FIREFOX
-        elif selected_browser.lower() == "chrome":
-            template_dir = EXTENTION_EX3
-        else:
-            template_dir = TEMPLATE_DIRECTORY_FAMILY_CHROME  
-
-        traitement_file = os.path.join(template_dir, 'traitement.json')
-
-        try:
-            os.makedirs(template_dir, exist_ok=True)
-            with open(traitement_file, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=4)
-            return "SUCCESS" if template_dir != EXTENTION_EX3 else "SUCCESS_FAMILY"
-        except Exception as e:
-            #print(f"Error while creating the file {traitement_file}: {e}")
-            return "ERROR"
+        return Save_Traitement_Json(json_data, selected_browser)
 
 
 
@@ -4094,10 +5037,21 @@ class MainWindow(QMainWindow):
         return output_json
 
 
+    # Regroupe les demandes de rafraîchissement des résultats : au plus un
+    # Read_Result_Update_List par RESULT_REFRESH_INTERVAL_MS pendant que les résultats arrivent.
+    def Schedule_Result_Refresh(self):
+        if not self.result_refresh_timer.isActive():
+            self.result_refresh_timer.start()
+
+
+
+
+
     # Appelée une fois l'extraction des données terminée.
     # - Arrête proprement le thread de LOGS.
     # - Lance la mise à jour de la liste des résultats après un court délai.
     def Extraction_Finished(self, window):
+        self.result_refresh_timer.stop()
         self.LOGS_THREAD.stop()  
         self.LOGS_THREAD.wait()  
         QTimer.singleShot(100, lambda: Read_Result_Update_List(window))
@@ -4111,7 +5065,7 @@ class MainWindow(QMainWindow):
     #     la vérification des champs, et le lancement de l'extraction dans un thread.
     
     def Submit_Button_Clicked(self, window):
-        global CURRENT_HOUR, CURRENT_DATE, LOGS_RUNNING , NOTIFICATION_BADGES
+        global CURRENT_HOUR, CURRENT_DATE, LOGS_RUNNING
 
 
         session_valid = False
@@ -4147,29 +5101,19 @@ class MainWindow(QMainWindow):
                     f.write("")
                 # #print("[SESSION] 🧼 Fichier session.txt nettoyé.")
             except Exception as e:
-                print(f"[ERREUR NETTOYAGE SESSION] ❌ {e}")
+                UI_LOG.error("[ERREUR NETTOYAGE SESSION] ❌ %s", e)
 
             return
 
 
 
 
-        # 🧹 Supprimer tous les badges de notification dans les onglets de résultats
+        # 🧹 Masquer les badges de notification et vider les listes des onglets de résultats
         try:
             if self.result_tab_widget:
-                for tab_index, badge in NOTIFICATION_BADGES.items():
-                    if badge:
-                        badge.deleteLater()
-                NOTIFICATION_BADGES.clear()
-
-                for i in range(self.result_tab_widget.count()):
-                    tab = self.result_tab_widget.widget(i)
-                    if tab:
-                        list_widgets = tab.findChildren(QListWidget)
-                        for lw in list_widgets:
-                            lw.clear()  
+                Clear_Result_Tabs(self)
         except Exception as e:
-            print(f"[BADGES ERROR] Erreur lors de la suppression des badges : {e}")
+            UI_LOG.error("[BADGES ERROR] Erreur lors de la suppression des badges : %s", e)
 
 
 
@@ -4281,8 +5225,8 @@ class MainWindow(QMainWindow):
                 full_state = widget.property("full_state")
                 hidden_id = full_state.get("id") if full_state else None
                 
-                print(f"📋 full_state: {full_state}")  # Afficher le contenu de full_state
-                print(f"📋 hidden_id: {hidden_id}")    # Afficher la valeur de hidden_id
+                UI_LOG.debug("📋 full_state: %s", full_state)  # Afficher le contenu de full_state
+                UI_LOG.debug("📋 hidden_id: %s", hidden_id)    # Afficher la valeur de hidden_id
 
                 checkbox = next((child for child in widget.children() if isinstance(child, QCheckBox)), None)
 
@@ -4476,7 +5420,7 @@ class MainWindow(QMainWindow):
                         #print(f"✏️ Nombre total de champs QLineEdit trouvés : {len(qlineedits)}")
 
                         for idx, line_edit in enumerate(qlineedits, start=1):
-                            print(f"   ➤ Champ QLineEdit {idx} : \"{line_edit.text()}\"")
+                            UI_LOG.debug('   ➤ Champ QLineEdit %s : "%s"', idx, Lazy(line_edit.text))
 
                         if len(qlineedits) > 1:
                             search_value = qlineedits[1].text()
@@ -4525,12 +5469,14 @@ class MainWindow(QMainWindow):
         CURRENT_DATE = current_time.strftime("%Y-%m-%d")
         CURRENT_HOUR = current_time.strftime("%H-%M-%S") 
         modified_json = self.Process_Split_Json(output_json)
-        print(f"📦 JSON Modifié après Process_Split_Json:{json.dumps(modified_json, indent=4, ensure_ascii=False)}")
+        UI_LOG.debug("📦 JSON Modifié après Process_Split_Json:%s", Lazy(json.dumps, modified_json, indent=4, ensure_ascii=False))
         output_json = self.Process_Handle_Last_Element(modified_json)
-        print(f"📦 JSON Modifié après Process_Handle_Last_Element:{json.dumps(output_json, indent=4, ensure_ascii=False)}")
+        UI_LOG.debug("📦 JSON Modifié après Process_Handle_Last_Element:%s", Lazy(json.dumps, output_json, indent=4, ensure_ascii=False))
         output_json_final=self.Process_Modify_Json(output_json)
-        print(f"📦 JSON Final après Process_Modify_Json:{json.dumps(output_json_final, indent=4, ensure_ascii=False)}")
+        UI_LOG.debug("📦 JSON Final après Process_Modify_Json:%s", Lazy(json.dumps, output_json_final, indent=4, ensure_ascii=False))
         result_json = self.Save_Json_To_File(output_json_final, selected_Browser)
+        if self.saveSanario is not None:
+            Save_Scenario_Snapshot(output_json_final, self.saveSanario.currentText())
 
         if result_json == "ERROR":
             Show_Critical_Message(
@@ -4550,12 +5496,12 @@ class MainWindow(QMainWindow):
                 f.write(self.Isp.currentText().strip())
             #print(f"📄 Fichier Isp.txt mis à jour avec : '{self.Isp.currentText().strip()}'")
         except Exception as e:
-            print(f"❌ Erreur lors de l'écriture dans Isp.txt : {e}")
+            UI_LOG.error("❌ Erreur lors de l'écriture dans Isp.txt : %s", e)
 
 
 
         json_string = json.dumps(output_json_final)
-        print("✈️​✈️​✈️​✈️​✈️​✈️​ : ",json_string)
+        UI_LOG.debug("✈️ Scénario sérialisé : %s", json_string)
 
         parameters = { 
             'p_owner':session_info["username"],
@@ -4570,15 +5516,20 @@ class MainWindow(QMainWindow):
         unique_id=self.Save_Process(parameters)
 
         if unique_id==-1:
-            print("Error getting process ID ")
+            UI_LOG.error("Error getting process ID ")
             os.system("pause")
             exit()
             return
 
 
+        use_engine = Orchestration_Engine_Enabled()
         with ThreadPoolExecutor(max_workers=2) as executor:
-            executor.submit(Start_Extraction, window, data_list , entered_number, selected_Browser, self.Isp.currentText() , unique_id , output_json_final, session_info["username"])
-            executor.submit(self.LOGS_THREAD.start)
+            executor.submit(
+                Start_Extraction, window, data_list , entered_number, selected_Browser, self.Isp.currentText() , unique_id , output_json_final, session_info["username"],
+                self.Update_Logs_Display if use_engine else None
+            )
+            if not use_engine:
+                executor.submit(self.LOGS_THREAD.start)
         EXTRACTION_THREAD.finished.connect(lambda: self.Extraction_Finished(window))
 
 
@@ -4660,11 +5611,12 @@ class MainWindow(QMainWindow):
         # Relier le bouton à l’état
         button.clicked.connect(lambda _, s=state: self.Load_State(s))
 
-        # Définir l’icône si elle existe
-        if os.path.exists(icon_path):
-            button.setIcon(QIcon(icon_path))
+        # Définir l’icône si elle existe (cache partagé : pas d'accès disque à chaque reconstruction)
+        icon = RESOURCE_CACHE.Icon(icon_path)
+        if not icon.isNull():
+            button.setIcon(icon)
         else:
-            print(f"[Warning] Icon not found at: {icon_path}")
+            UI_LOG.warning("[Warning] Icon not found at: %s", icon_path)
 
         # Ajouter le bouton à l’interface
         self.reset_options_layout.addWidget(button)
@@ -4687,7 +5639,7 @@ class MainWindow(QMainWindow):
 
         #print("\n📦 Pile des états (🧱 du plus ancien au plus récent) :\n")
         # for i, state in enumerate(self.STATE_STACK):
-            print(f"🧱 État {i+1:02d} :")
+            UI_LOG.debug("🧱 État %02d :", i+1)
             #print(json.dumps(state, indent=4, ensure_ascii=False))  # JSON واضح ومنسق
             #print("-" * 50)
 
@@ -5233,11 +6185,11 @@ class MainWindow(QMainWindow):
                                     te.setPlainText(new_text)
                                     #print(f"[✅] Nouveau texte saisi pour QTextEdit {index} :\n{new_text}")
                                 else:
-                                    print(f"[⚠️] Modification annulée (QTextEdit {index})")
+                                    UI_LOG.warning("[⚠️] Modification annulée (QTextEdit %s)", index)
                                 # ✅ دايمًا ننحي الفوكس سواء سجل أو لغى
                                 te.clearFocus()
                             except Exception as e:
-                                print(f"[❌] Erreur lors de l’ouverture de la boîte de dialogue : {e}")
+                                UI_LOG.error("[❌] Erreur lors de l’ouverture de la boîte de dialogue : %s", e)
                         return handler
 
                     qtextedit.mousePressEvent = create_handler(qtextedit, idx)
@@ -5476,7 +6428,7 @@ class MainWindow(QMainWindow):
                 #print(f"🔘 {label}")
                 self.Create_Option_Button(state)
             else:
-                print(f"⚠️ Aucune définition trouvée pour l'action : '{action_key}'.")
+                UI_LOG.warning("⚠️ Aucune définition trouvée pour l'action : '%s'.", action_key)
 
         #print("===== Mise à jour terminée =====\n")
 
@@ -5659,7 +6611,7 @@ class MainWindow(QMainWindow):
 
 
     def Scenario_Changed(self, name_selected):
-        print("Scenario_Changed called with name_selected=%r", name_selected)
+        UI_LOG.debug("Scenario_Changed called with name_selected=%r", name_selected)
 
         # 1) تحقق من ملف الجلسة
         if not os.path.exists(SESSION_PATH):
@@ -5694,9 +6646,9 @@ class MainWindow(QMainWindow):
         # تسجيل نص الاستجابة كاملة لو احتجنا لفحصها عند الأخطاء
         if response.status_code != 200:
             try:
-                print("HTTP %s: %s", response.status_code, response.text[:1000])
+                UI_LOG.error("HTTP %s: %s", response.status_code, response.text[:1000])
             except Exception:
-                print("HTTP %s and failed to read response.text", response.status_code)
+                UI_LOG.error("HTTP %s and failed to read response.text", response.status_code)
             return
 
         # محاولة تحويل الاستجابة إلى JSON مع حماية
@@ -5726,7 +6678,7 @@ class MainWindow(QMainWindow):
                     self.login_window.show()
                     self.close()
                 except Exception:
-                    print("Erreur pendant l'affichage de la fenêtre de login")
+                    UI_LOG.error("Erreur pendant l'affichage de la fenêtre de login")
                 return
         except Exception:
             #print("Erreur en vérifiant la clé 'session' du résultat")
@@ -5755,7 +6707,7 @@ class MainWindow(QMainWindow):
                 # التأكد من وجود state_stack
                 state_stack = scenario.get("state_stack")
                 if not isinstance(state_stack, list):
-                    print("state_stack n'est pas une liste (type=%s). Tentative de conversion...", type(state_stack))
+                    UI_LOG.warning("state_stack n'est pas une liste (type=%s). Tentative de conversion...", type(state_stack))
                     # محاولة تصحيح إذا كانت سلسلة JSON
                     if isinstance(state_stack, str):
                         try:
@@ -5781,7 +6733,7 @@ class MainWindow(QMainWindow):
                         pretty = json.dumps(state, indent=2, ensure_ascii=False, default=str)
                         #print("State #%d preview: %s", index, pretty[:2000])  # لا تطبع كل شيء لو كبير
                     except Exception:
-                        print("Cannot JSON-dump state #%d; fallback to repr", index)
+                        UI_LOG.warning("Cannot JSON-dump state #%d; fallback to repr", index)
                         #print("State #%d repr: %s", index, repr(state)[:1000])
 
                     # استدعاء Load_State مع قياس الوقت
@@ -5794,9 +6746,9 @@ class MainWindow(QMainWindow):
                         try:
                             self.Update_Actions_Color_Handle_Last_Button()
                         except Exception:
-                            print("Update_Actions_Color_Handle_Last_Button failed after state #%d", index)
+                            UI_LOG.error("Update_Actions_Color_Handle_Last_Button failed after state #%d", index)
                     except Exception as e:
-                        print("Erreur pendant Load_State() pour l'état #%d: %s", index, e)
+                        UI_LOG.error("Erreur pendant Load_State() pour l'état #%d: %s", index, e)
                         # لا نكسر الحلقة — نستمر في محاولة تحميل باقي الحالات
                         continue
 
@@ -5818,11 +6770,11 @@ class MainWindow(QMainWindow):
                     self.STATE_STACK = unique_states
                     #print("self.STATE_STACK dédupliqué, nouveau length=%d", len(self.STATE_STACK))
                 except Exception:
-                    print("Échec de suppression des doublons")
+                    UI_LOG.error("Échec de suppression des doublons")
             # else:
                 # print("API returned success=false; error: %s", result.get("error"))
         except Exception:
-            print("Erreur pendant le traitement du résultat JSON")
+            UI_LOG.error("Erreur pendant le traitement du résultat JSON")
 
 
 
@@ -5946,7 +6898,7 @@ class LoginWindow(QMainWindow):
 
         # Charger le bon fichier .ui
         self.ui_path = self.Select_Ui_File()
-        uic.loadUi(self.ui_path, self)
+        UI_CACHE.Setup(self.ui_path, self)
 
         # Initialiser les widgets si Auth.ui
         if "Auth.ui" in self.ui_path:
@@ -5972,7 +6924,7 @@ class LoginWindow(QMainWindow):
 
                 return INTERFACE_UI
         except Exception as e:
-            print(f"[SESSION ERROR] {e}")
+            SESSION_LOG.error("[SESSION ERROR] %s", e)
 
         # Par défaut → retour sur Auth.ui
         return AUTH_UI
@@ -6027,7 +6979,7 @@ class LoginWindow(QMainWindow):
                 self.logo_label = QLabel(self.logoFrame)
                 self.logo_label.setScaledContents(True)
                 logo_path = os.path.join(SCRIPT_DIR, "icons", "logo.jpg")
-                pixmap = QPixmap(logo_path)
+                pixmap = RESOURCE_CACHE.Pixmap(logo_path, self.logoFrame.width(), self.logoFrame.height(), keep_aspect=False)
                 if not pixmap.isNull():
                     self.logo_label.setPixmap(pixmap)
                     self.logo_label.setGeometry(0, 0, self.logoFrame.width(), self.logoFrame.height())
@@ -6038,7 +6990,7 @@ class LoginWindow(QMainWindow):
                 self.user_label = QLabel(self.UseFrame)
                 self.user_label.setScaledContents(True)
                 user_path = os.path.join(SCRIPT_DIR, "icons", "user.png")
-                user_pixmap = QPixmap(user_path)
+                user_pixmap = RESOURCE_CACHE.Pixmap(user_path, self.UseFrame.width(), self.UseFrame.height(), keep_aspect=False)
                 if not user_pixmap.isNull():
                     self.user_label.setPixmap(user_pixmap)
                     self.user_label.setGeometry(0, 0, self.UseFrame.width(), self.UseFrame.height())
@@ -6047,10 +6999,12 @@ class LoginWindow(QMainWindow):
 
 
     def Update_Background_Image(self):
+        # Pixmap déjà à la taille du cadre, gardée en cache : pas de relecture ni de remise à l'échelle du JPEG
         if hasattr(self, "background_frame") and hasattr(self, "background_label"):
-            pixmap = QPixmap(self.background_image_path)
+            size = self.background_frame.size()
+            pixmap = RESOURCE_CACHE.Pixmap(self.background_image_path, size.width(), size.height(), keep_aspect=False)
             if not pixmap.isNull():
-                self.background_label.resize(self.background_frame.size())
+                self.background_label.resize(size)
                 self.background_label.setPixmap(pixmap)
 
 
@@ -6202,6 +7156,25 @@ class LoginWindow(QMainWindow):
 
 
 
+# 🐶 Démarre le watchdog : un QTimer bat le cœur de la boucle Qt, un thread surveille les blocages
+def Start_Stall_Watchdog(app):
+    global STALL_WATCHDOG, STALL_HEARTBEAT_TIMER
+
+    STALL_WATCHDOG = StallWatchdog(LOGS_DIRECTORY, app_root=SCRIPT_DIR)
+    if not STALL_WATCHDOG.enabled:
+        return
+
+    STALL_HEARTBEAT_TIMER = QTimer(app)
+    STALL_HEARTBEAT_TIMER.timeout.connect(STALL_WATCHDOG.Beat)
+    STALL_HEARTBEAT_TIMER.start(HEARTBEAT_INTERVAL_MS)
+    STALL_WATCHDOG.Start()
+
+
+
+
+
+
+
 def main():
 
     if len(sys.argv) < 3:
@@ -6212,6 +7185,9 @@ def main():
     if not verify_key(encrypted_key, secret_key):
         sys.exit(1)
 
+    log_path = Setup_Logging(os.path.join(APPDATA_DIR, "logs"))
+    LOG.info("🚀 AutoMail démarré (PID %s, log : %s)", os.getpid(), log_path)
+
 
 
 
@@ -6294,11 +7270,20 @@ def main():
     session_valid = session_info["valid"]
 
     app = QApplication(sys.argv)
+    Start_Stall_Watchdog(app)
+
+    # Toutes les vérifications de version partent en parallèle dès le lancement
+    VERSION_SERVICE.Prefetch(VERSION_SOURCES)
+    Refresh_Preflight_Async()
+    Recover_Jobs()
+
+    if Memory_Tracking_Enabled():
+        MEMORY_TRACKER.Start()
 
 
-    icon_path = os.path.join(SCRIPT_DIR, "icons", "logo.jpg")
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    icon = RESOURCE_CACHE.Icon(os.path.join(SCRIPT_DIR, "icons", "logo.jpg"))
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     if session_valid:
         try:
@@ -6338,7 +7323,21 @@ def main():
         window.move(x, y)
         window.show()
 
-    sys.exit(app.exec())
+    if CPU_PROFILER.enabled:
+        CPU_PROFILER.Start()
+
+    with CPU_PROFILER.Profile_Thread("GUI"):
+        exit_code = app.exec()
+
+    output_dir = CPU_PROFILER.Stop()
+    if output_dir:
+        LOG.info("🔬 [PROFILE] Profils écrits dans : %s", output_dir)
+
+    report_path = MEMORY_TRACKER.Stop()
+    if report_path:
+        LOG.info("🧠 [MEMORY] Rapport mémoire : %s", report_path)
+
+    sys.exit(exit_code)
 
 
 
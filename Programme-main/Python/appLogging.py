@@ -0,0 +1,165 @@
+import os
+import sys
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from typing import Dict, Optional, Tuple
+
+
+
+
+# =========================================
+# 📝 Journalisation par niveaux (fichiers tournants, écriture asynchrone)
+# =========================================
+# Les modules écrivent via Get_Logger("<nom>") ➜ logger "automail.<nom>". Le thread appelant ne fait
+# que poser l'enregistrement dans une file (QueueHandler) ; un QueueListener l'écrit dans
+# automail.log (RotatingFileHandler) et, si demandé, sur stderr. Un message sous le niveau configuré
+# n'est ni formaté ni mis en file : utiliser LOG.debug("... %s", valeur) et non une f-string, et
+# Lazy(fonction, ...) pour les dumps coûteux (json.dumps...).
+#
+# Niveaux : AUTOMAIL_LOG_LEVELS="INFO"  ou  "WARNING,api=DEBUG,session=INFO" (défaut puis par module)
+# Console : AUTOMAIL_LOG_CONSOLE=1 / 0 (défaut : seulement si stderr est un terminal)
+ROOT_LOGGER            = "automail"
+LOG_LEVELS_ENV         = "AUTOMAIL_LOG_LEVELS"
+LOG_CONSOLE_ENV        = "AUTOMAIL_LOG_CONSOLE"
+DEFAULT_LEVEL          = "INFO"
+LOG_FILE_NAME          = "automail.log"
+LOG_MAX_BYTES          = 5 * 1024 * 1024
+LOG_BACKUP_COUNT       = 5
+LOG_FORMAT             = "%(asctime)s %(levelname)-7s %(name)s [%(threadName)s] %(message)s"
+
+_LISTENER = None
+_LOCK = threading.Lock()
+
+
+
+
+
+
+class LoggingConfigError(ValueError):
+    """Raised when AUTOMAIL_LOG_LEVELS contains an unknown level name."""
+
+
+
+
+
+
+# Valeur calculée seulement si le message est réellement écrit
+class Lazy:
+
+    def __init__(self, function, *args, **kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+
+    def __str__(self):
+        return str(self.function(*self.args, **self.kwargs))
+
+
+
+
+
+
+def Get_Logger(name) -> logging.Logger:
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}" if name else ROOT_LOGGER)
+
+
+def _Level(value) -> int:
+    level = logging.getLevelName(value.strip().upper())
+    if not isinstance(level, int):
+        raise LoggingConfigError(f"Unknown log level: {value}")
+    return level
+
+
+# 🎚️ "WARNING,api=DEBUG,session=INFO" ➜ (niveau par défaut, {module: niveau})
+def Parse_Levels(spec) -> Tuple[int, Dict[str, int]]:
+    default = _Level(DEFAULT_LEVEL)
+    modules = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" in part:
+            name, value = part.split("=", 1)
+            modules[name.strip()] = _Level(value)
+        else:
+            default = _Level(part)
+    return default, modules
+
+
+def Apply_Levels(spec):
+    default, modules = Parse_Levels(spec)
+    Get_Logger(None).setLevel(default)
+    for name, level in modules.items():
+        Get_Logger(name).setLevel(level)
+
+
+
+
+
+
+# 🚀 Installe la file + le thread d'écriture. Idempotent ; renvoie le chemin du fichier de log.
+def Setup_Logging(log_directory, levels=None, console=None) -> Optional[str]:
+    global _LISTENER
+    with _LOCK:
+        root = Get_Logger(None)
+        try:
+            Apply_Levels(os.environ.get(LOG_LEVELS_ENV, "") if levels is None else levels)
+        except LoggingConfigError as e:
+            Apply_Levels("")
+            sys.stderr.write(f"⚠️ [LOG] {e}\n")
+
+        if _LISTENER is not None:
+            return getattr(_LISTENER, "log_path", None)
+
+        handlers = []
+        formatter = logging.Formatter(LOG_FORMAT)
+        log_path = None
+        try:
+            os.makedirs(log_directory, exist_ok=True)
+            log_path = os.path.join(log_directory, LOG_FILE_NAME)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            sys.stderr.write(f"⚠️ [LOG] Fichier de log indisponible ({e}), sortie console uniquement\n")
+            log_path = None
+
+        if console is None:
+            env = os.environ.get(LOG_CONSOLE_ENV)
+            console = env not in ("0", "false", "no", "off") if env is not None else bool(sys.stderr and sys.stderr.isatty())
+        if console or not handlers:
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(formatter)
+            handlers.append(stream_handler)
+
+        log_queue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.propagate = False
+
+        _LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _LISTENER.log_path = log_path
+        _LISTENER.start()
+        atexit.register(Stop_Logging)
+        return log_path
+
+
+# 🛑 Vide la file et ferme les fichiers (appelé aussi à la sortie du programme)
+def Stop_Logging():
+    global _LISTENER
+    with _LOCK:
+        listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    root = Get_Logger(None)
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
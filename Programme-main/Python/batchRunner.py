@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import threading
+
+_STARTED = time.perf_counter()
+
+
+
+
+# =========================================
+# 🖥️ Runner en ligne de commande (sans fenêtre)
+# =========================================
+# Lance le même pipeline que le bouton Submit (moteur asyncio d'orchestrationEngine), sans
+# LoginWindow / MainWindow ni chargement des .ui. La progression est écrite sur stdout, une
+# ligne JSON par événement ; le journal d'AppV2 (appLogging) part sur stderr.
+#
+#   python batchRunner.py --input comptes.txt --scenario last --parallel 5 --browser edge
+#
+# Événements : ready, log, stage (étapes du JobTracer), error, finished.
+# Code de sortie : 0 si tous les jobs sont "completed", 1 sinon (échec, job perdu, arrêt), 2 si entrée invalide.
+BROWSERS               = ("chrome", "firefox", "edge", "icedragon", "Comodo")
+EXIT_OK                = 0
+EXIT_FAILED            = 1
+EXIT_USAGE             = 2
+
+JSON_OUT = sys.stdout
+JSON_LOCK = threading.Lock()
+
+
+
+
+
+
+def Emit(event, **fields):
+    fields["event"] = event
+    fields["t"] = round(time.perf_counter() - _STARTED, 3)
+    with JSON_LOCK:
+        JSON_OUT.write(json.dumps(fields, ensure_ascii=False, default=str) + "\n")
+        JSON_OUT.flush()
+
+
+# 📜 Scénario : fichier JSON, JSON en ligne, ou nom d'un scénario lancé depuis l'interface
+def Load_Scenario(value, scenario_path):
+    if os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if value.lstrip().startswith("["):
+        return json.loads(value)
+    path = scenario_path(value)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Scenario '{value}' not found (looked for {path})")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def Parse_Args(argv=None):
+    parser = argparse.ArgumentParser(description="Run an account batch without the GUI (JSON-lines progress on stdout)")
+    parser.add_argument("--input", required=True, help="account file: header line 'email;passwordEmail;ipAddress;port;...' then one line per account ('-' = stdin)")
+    parser.add_argument("--scenario", required=True, help="scenario JSON file, inline JSON list, or name saved under Tools/scenarios")
+    parser.add_argument("--parallel", type=int, default=1, help="number of browsers running at the same time")
+    parser.add_argument("--browser", default="edge", choices=BROWSERS)
+    parser.add_argument("--session", help="session.txt to use (default: the GUI session in APPDATA)")
+    parser.add_argument("--isp", help="ISP name (default: content of Isp.txt)")
+    return parser.parse_args(argv)
+
+
+
+
+
+
+def main(argv=None):
+    global JSON_OUT
+    args = Parse_Args(argv)
+
+    # stdout est réservé aux événements JSON : journal d'AppV2 (et print() éventuels) sur stderr
+    JSON_OUT = sys.stdout
+    sys.stdout = sys.stderr
+
+    import AppV2
+    AppV2.Setup_Logging(os.path.join(AppV2.APPDATA_DIR, "logs"), console=True)
+
+    if args.session:
+        AppV2.SESSION_PATH = os.path.abspath(args.session)
+    session_info = AppV2.check_session(AppV2.SESSION_PATH, AppV2.KEY)
+    if not session_info["valid"]:
+        Emit("error", stage="session", message=session_info.get("error") or "invalid session")
+        return EXIT_USAGE
+
+    try:
+        if args.input == "-":
+            input_data = sys.stdin.read()
+        else:
+            with open(args.input, "r", encoding="utf-8") as f:
+                input_data = f.read()
+        data_list = AppV2.Parse_Input_Data(input_data.strip())
+        scenario = Load_Scenario(args.scenario, AppV2.Scenario_Path)
+    except (OSError, ValueError) as e:
+        Emit("error", stage="input", message=str(e))
+        return EXIT_USAGE
+    if not data_list:
+        Emit("error", stage="input", message="no account lines")
+        return EXIT_USAGE
+    parallel = max(1, min(args.parallel, len(data_list)))
+
+    isp = args.isp
+    if isp is None and os.path.exists(AppV2.FILE_ISP):
+        with open(AppV2.FILE_ISP, "r", encoding="utf-8") as f:
+            isp = f.read().strip()
+    isp = isp or ""
+
+    # Mêmes étapes que Submit_Button_Clicked, sans widgets : les messages d'erreur sont collectés au lieu des QMessageBox
+    browser_errors = []
+
+    def Collect_Browser_Error(window, title, message, message_type="critical"):
+        browser_errors.append(f"{title}: {message}")
+
+    if args.browser == "chrome" and not AppV2.Process_Browser(None, "chrome", notify=Collect_Browser_Error):
+        Emit("error", stage="browser", message="; ".join(browser_errors) or "chrome extension preflight failed")
+        return EXIT_FAILED
+    if AppV2.Save_Traitement_Json(scenario, args.browser) == "ERROR":
+        Emit("error", stage="scenario", message="cannot write traitement.json")
+        return EXIT_FAILED
+
+    now = datetime.datetime.now()
+    AppV2.CURRENT_DATE = now.strftime("%Y-%m-%d")
+    AppV2.CURRENT_HOUR = now.strftime("%H-%M-%S")
+    AppV2.LOGS_RUNNING = True
+
+    unique_id = AppV2.Save_Process({
+        'p_owner': session_info["username"],
+        'p_entity': session_info["p_entity"],
+        'p_isp': isp,
+        'p_action_name': json.dumps(scenario),
+        'p_app': 'V4',
+        'p_python_version': f"{sys.version_info.major}.{sys.version_info.minor}",
+        'p_browser': args.browser,
+    })
+    if unique_id == -1:
+        Emit("error", stage="save_process", message="process registration failed")
+        return EXIT_FAILED
+
+    os.makedirs(AppV2.LOGS_DIRECTORY, exist_ok=True)
+    AppV2.Start_Log_Retention()
+    AppV2.JOB_TRACER.Reset()
+    AppV2.JOB_TRACER.Add_Listener(
+        lambda kind, job, stage, duration_ms, extra: Emit(
+            "stage", kind=kind, job=job, stage=stage,
+            ms=None if duration_ms is None else round(duration_ms, 1), **{k: v for k, v in extra.items() if k not in ("event", "t")}
+        )
+    )
+    browser_path = AppV2.Resolve_Browser_Path(args.browser)
+
+    done = {}
+
+    class CliHooks(AppV2.AppEngineHooks):
+
+        def log(self, text):
+            Emit("log", text=text)
+
+        def stopped(self, message):
+            AppV2.log_message(message)
+            Emit("error", stage="run", message=message)
+
+        def finished(self, summary):
+            super().finished(summary)
+            done["summary"] = summary
+
+    engine = AppV2.Build_Orchestration_Engine(
+        data_list, parallel, browser_path, None, args.browser, isp, unique_id, scenario,
+        session_info["username"], hooks_class=CliHooks
+    )
+    Emit("ready", jobs=len(data_list), parallel=parallel, browser=args.browser, process_id=unique_id,
+         startup_ms=round((time.perf_counter() - _STARTED) * 1000, 1))
+
+    engine.Start(data_list)
+    try:
+        while engine.Is_Running():
+            engine.Join(0.5)
+    except KeyboardInterrupt:
+        Emit("log", text="[INFO] Processing interrupted by user.")
+        engine.Stop()
+        engine.Join()
+
+    summary = done.get("summary", {})
+    Emit("finished", **summary)
+    # Succès uniquement si chaque job est "completed" (les jobs lost/failed comptent comme échecs)
+    if summary and not summary.get("stopped") and summary.get("completed") == len(data_list):
+        return EXIT_OK
+    return EXIT_FAILED
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import os
+import io
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import contextlib
+import datetime
+from collections import Counter
+from typing import Dict, Optional
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("profiler")
+
+
+
+
+# =========================================
+# 🔬 Profilage CPU à la demande
+# =========================================
+# AUTOMAIL_PROFILE = 1 | both     → cProfile par thread + échantillonneur
+#                    cprofile     → cProfile uniquement
+#                    sample       → échantillonneur uniquement
+PROFILE_ENV            = "AUTOMAIL_PROFILE"
+PROFILE_INTERVAL_ENV   = "AUTOMAIL_PROFILE_INTERVAL_MS"
+PROFILE_DIR_ENV        = "AUTOMAIL_PROFILE_DIR"
+DEFAULT_INTERVAL_MS    = 5
+TOP_FUNCTIONS          = 40
+MAX_STACK_DEPTH        = 128
+
+
+
+
+
+
+# 🧩 Lit le mode demandé dans l'environnement ("" = désactivé)
+def Mode_From_Env() -> str:
+    value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return ""
+    if value in ("cprofile", "sample"):
+        return value
+    return "both"
+
+
+
+
+
+
+# 🔥 Construit une pile "repliée" (format flamegraph.pl / speedscope) à partir d'une frame
+def Collapse_Stack(thread_name, frame) -> str:
+    parts = []
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        code = frame.f_code
+        parts.append(f"{code.co_name}@{os.path.basename(code.co_filename)}:{code.co_firstlineno}")
+        frame = frame.f_back
+        depth += 1
+    parts.append(thread_name.replace(" ", "_"))
+    return ";".join(reversed(parts))
+
+
+
+
+
+
+# Profileur CPU optionnel.
+# - cProfile : un profil par thread enveloppé (ExtractionThread, CloseBrowserThread, boucle GUI).
+#   Depuis Python 3.12 un seul cProfile peut être actif à la fois : les threads suivants
+#   sont alors couverts uniquement par l'échantillonneur.
+# - Échantillonneur : lit sys._current_frames() à intervalle fixe et agrège des piles repliées,
+#   prêtes pour un flamegraph. Couvre tous les threads, même ceux démarrés avant l'activation.
+# Activé en cours de route (Ctrl+Shift+F12), cProfile ne couvre que les threads démarrés après
+# Start() : les threads déjà lancés et la boucle GUI ne sont vus que par l'échantillonneur.
+# Un thread encore profilé au moment de Stop() ajoute son profil au dossier déjà écrit quand il se
+# termine (dernier thread profilé sorti).
+class CpuProfiler:
+
+    def __init__(self, output_dir, mode=None, interval_ms=None):
+        self.output_dir = os.environ.get(PROFILE_DIR_ENV) or output_dir
+        self.mode = Mode_From_Env() if mode is None else mode
+        self.interval = (interval_ms or int(os.environ.get(PROFILE_INTERVAL_ENV, DEFAULT_INTERVAL_MS))) / 1000.0
+
+        self.lock = threading.Lock()
+        self.profiles: Dict[str, pstats.Stats] = {}
+        self.stacks = Counter()
+        self.samples = 0
+        self.sampler = None
+        self.stop_event = threading.Event()
+        self.started_at = None
+        self.active = 0                    # threads actuellement dans Profile_Thread avec cProfile
+        self.dump_lock = threading.Lock()  # un seul Dump à la fois (arrêt / profils tardifs)
+        self.last_dump_dir = None
+
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.mode)
+
+
+    def Start(self, mode="both"):
+        # Active le profilage (appel depuis l'environnement ou le raccourci caché)
+        self.mode = self.mode or mode
+        self.started_at = time.time()
+        if self.mode in ("both", "sample") and not (self.sampler and self.sampler.is_alive()):
+            self.stop_event.clear()
+            self.sampler = threading.Thread(target=self._Sample_Loop, name="CpuSampler", daemon=True)
+            self.sampler.start()
+
+
+    def Stop(self) -> Optional[str]:
+        # Désactive le profilage et écrit les résultats ; retourne le dossier de sortie
+        if not self.enabled:
+            return None
+        self.stop_event.set()
+        if self.sampler:
+            self.sampler.join(timeout=2)
+            self.sampler = None
+        with self.dump_lock:
+            self.mode = ""
+            path = self.Dump()
+            self.last_dump_dir = path
+        return path
+
+
+    def Toggle(self) -> Optional[str]:
+        if self.enabled:
+            return self.Stop()
+        self.Start()
+        return None
+
+
+    @contextlib.contextmanager
+    def Profile_Thread(self, name):
+        # Enveloppe le corps d'un thread : with CPU_PROFILER.Profile_Thread("ExtractionThread"): ...
+        profiler = None
+        if self.mode in ("both", "cprofile"):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                profiler = None
+        if profiler is not None:
+            with self.lock:
+                self.active += 1
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._Add_Profile(name, profiler)
+
+
+    def _Add_Profile(self, name, profiler):
+        with self.lock:
+            if name in self.profiles:
+                self.profiles[name].add(profiler)
+            else:
+                self.profiles[name] = pstats.Stats(profiler)
+            self.active -= 1
+        self._Write_Late_Profiles()
+
+
+    def _Write_Late_Profiles(self):
+        # Profils arrivés après Stop() : fusionnés dans le dernier dossier écrit (ou un nouveau)
+        with self.dump_lock:
+            with self.lock:
+                late = not self.mode and self.active == 0 and bool(self.profiles)
+            if late:
+                self.last_dump_dir = self.Dump(self.last_dump_dir)
+                LOG.info("🔬 [PROFILE] Profils des threads terminés après l'arrêt écrits dans : %s", self.last_dump_dir)
+
+
+    def _Sample_Loop(self):
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            frames = sys._current_frames()
+            collapsed = [
+                Collapse_Stack(names.get(tid, f"thread-{tid}"), frame)
+                for tid, frame in frames.items() if tid != own_id
+            ]
+            with self.lock:
+                self.stacks.update(collapsed)
+                self.samples += 1
+
+
+    def Dump(self, out_dir=None) -> Optional[str]:
+        # Écrit : <thread>.prof (pstats), <thread>.txt (top cumulatif) et collapsed_stacks.txt.
+        # `out_dir` existant : les .prof déjà présents sont fusionnés avec les nouveaux profils.
+        with self.lock:
+            profiles = dict(self.profiles)
+            stacks = Counter(self.stacks)
+            samples = self.samples
+            self.profiles = {}
+            self.stacks = Counter()
+            self.samples = 0
+
+        if not profiles and not stacks:
+            return None
+
+        if out_dir is None:
+            stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            out_dir = os.path.join(self.output_dir, stamp)
+        os.makedirs(out_dir, exist_ok=True)
+
+        for name, stats in profiles.items():
+            safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+            if os.path.exists(os.path.join(out_dir, f"{safe}.prof")):
+                stats.add(os.path.join(out_dir, f"{safe}.prof"))
+            stats.dump_stats(os.path.join(out_dir, f"{safe}.prof"))
+            buffer = io.StringIO()
+            pstats.Stats(os.path.join(out_dir, f"{safe}.prof"), stream=buffer).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            with open(os.path.join(out_dir, f"{safe}.txt"), "w", encoding="utf-8") as f:
+                f.write(buffer.getvalue())
+
+        if stacks:
+            with open(os.path.join(out_dir, "collapsed_stacks.txt"), "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(os.path.join(out_dir, "sampler.txt"), "w", encoding="utf-8") as f:
+                f.write(f"samples: {samples}\ninterval_ms: {self.interval * 1000:.1f}\n")
+
+        return out_dir
@@ -0,0 +1,407 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+
+
+
+# =========================================
+# 🔄 Mises à jour différentielles (manifest SHA-256)
+# =========================================
+# Le manifest décrit la release complète (racine du dépôt = Programme-main) :
+# {
+#     "version": "...",
+#     "algorithm": "sha256",
+#     "files": { "tools/Extention_Family_Chrome/actions.js": {"sha256": "...", "size": 1234}, ... }
+# }
+# Chaque fichier est téléchargé depuis <base_url>/<chemin relatif>.
+MANIFEST_NAME        = "manifest.json"
+LOCAL_MANIFEST_NAME  = ".manifest.json"
+STAGING_SUFFIX       = ".staging"
+BACKUP_SUFFIX        = ".backup"
+DOWNLOAD_SUFFIX      = ".download"
+PART_SUFFIX          = ".part"
+CHUNK_SIZE           = 64 * 1024
+DOWNLOAD_RETRIES     = 3
+DEFAULT_EXCLUDES     = ("__pycache__", ".git", LOCAL_MANIFEST_NAME)
+
+
+
+
+
+
+class DeltaUpdateError(Exception):
+    """Raised when a delta update cannot be completed; callers fall back to the full ZIP."""
+
+
+
+
+
+
+# 🔑 SHA-256 d'un fichier
+def Hash_File(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+
+
+
+
+# 🧾 Construit le manifest d'un dossier (à publier avec chaque release)
+def Build_Manifest(root, version=None, excludes=DEFAULT_EXCLUDES) -> Dict:
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in excludes)
+        for name in sorted(filenames):
+            if name in excludes or name.endswith((".pyc", PART_SUFFIX)):
+                continue
+            # Seul le manifest de la release (racine) est exclu : les manifest.json des extensions sont suivis
+            if name == MANIFEST_NAME and dirpath == root:
+                continue
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            files[rel] = {"sha256": Hash_File(path), "size": os.path.getsize(path)}
+    return {
+        "version": version or datetime.datetime.now().strftime("%Y%m%d%H%M%S"),
+        "algorithm": "sha256",
+        "files": files,
+    }
+
+
+
+
+
+
+# 🔒 Refuse les chemins absolus ou sortant du dossier cible
+def Safe_Relpath(rel) -> str:
+    norm = os.path.normpath(rel.replace("/", os.sep))
+    if os.path.isabs(norm) or norm.startswith("..") or ":" in norm:
+        raise DeltaUpdateError(f"⚠️ [SECURITY] Unsafe path in manifest: {rel}")
+    return norm
+
+
+
+
+
+
+# ✂️ Extrait la partie du manifest située sous un préfixe ("tools/") avec des chemins relatifs au préfixe
+def Subset_Manifest(manifest: Dict, prefix: str) -> Dict:
+    prefix = prefix.strip("/") + "/" if prefix else ""
+    return {
+        rel[len(prefix):]: entry
+        for rel, entry in manifest.get("files", {}).items()
+        if rel.startswith(prefix)
+    }
+
+
+
+
+
+
+# 📋 Plan différentiel : fichiers à télécharger, à réutiliser et à supprimer
+def Plan_Delta(target_dir, remote_files: Dict, previous_files: Optional[Dict] = None) -> Dict[str, List[str]]:
+    plan = {"download": [], "reuse": [], "delete": []}
+
+    for rel, entry in sorted(remote_files.items()):
+        local_path = os.path.join(target_dir, Safe_Relpath(rel))
+        if os.path.isfile(local_path) and os.path.getsize(local_path) == entry.get("size", -1) \
+                and Hash_File(local_path) == entry["sha256"]:
+            plan["reuse"].append(rel)
+        else:
+            plan["download"].append(rel)
+
+    # Seuls les fichiers suivis par la release précédente peuvent être supprimés :
+    # les données locales (logs, profils, result.txt...) ne sont jamais touchées.
+    for rel in sorted(previous_files or {}):
+        if rel not in remote_files and os.path.isfile(os.path.join(target_dir, Safe_Relpath(rel))):
+            plan["delete"].append(rel)
+
+    return plan
+
+
+
+
+
+
+# ⬇️ Téléchargement reprenable (HTTP Range) vers <dest>.part puis vérification du hash
+def Download_File(session, url, dest, sha256, size=None, headers=None, verify=True, timeout=60) -> int:
+    part_path = dest + PART_SUFFIX
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+    if os.path.isfile(dest) and Hash_File(dest) == sha256:
+        return 0
+
+    last_error = None
+    for _ in range(DOWNLOAD_RETRIES):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if size is not None and offset > size:
+            os.remove(part_path)
+            offset = 0
+
+        request_headers = dict(headers or {})
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+
+        try:
+            received = 0
+            with session.get(url, headers=request_headers, stream=True, verify=verify, timeout=timeout) as resp:
+                if resp.status_code == 416:
+                    # Plage invalide : le .part est complet ou corrompu, le hash tranchera
+                    pass
+                elif resp.status_code == 206 and offset:
+                    mode = "ab"
+                elif resp.status_code == 200:
+                    mode = "wb"
+                else:
+                    raise DeltaUpdateError(f"HTTP {resp.status_code} for {url}")
+
+                if resp.status_code != 416:
+                    with open(part_path, mode) as f:
+                        for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                            if chunk:
+                                f.write(chunk)
+                                received += len(chunk)
+
+            if Hash_File(part_path) == sha256:
+                os.replace(part_path, dest)
+                return received
+
+            # Hash invalide : on repart de zéro
+            os.remove(part_path)
+            last_error = DeltaUpdateError(f"SHA-256 mismatch for {url}")
+
+        except (requests.RequestException, OSError) as e:
+            # Le .part est conservé : la tentative suivante reprendra à l'octet atteint
+            last_error = e
+
+    raise DeltaUpdateError(f"Download failed for {url}: {last_error}")
+
+
+
+
+
+
+# 🔁 Place un fichier dans le dossier de staging : lien physique si possible, sinon copie
+def Link_Or_Copy(src, dst):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+
+
+
+
+def Read_Local_Manifest(target_dir) -> Optional[Dict]:
+    path = os.path.join(target_dir, LOCAL_MANIFEST_NAME)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+
+
+
+
+# 🏗️ Construit <target>.staging : fichiers réutilisés en liens physiques, fichiers téléchargés,
+# fichiers non suivis des dossiers suivis et manifest local. Retourne les entrées de premier niveau suivies.
+def Build_Staging(target_dir, staging_dir, download_dir, remote_files: Dict, plan: Dict, previous: Optional[Dict],
+                  version=None) -> set:
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+    os.makedirs(staging_dir)
+
+    for rel in plan["reuse"]:
+        Link_Or_Copy(os.path.join(target_dir, Safe_Relpath(rel)), os.path.join(staging_dir, Safe_Relpath(rel)))
+    for rel in plan["download"]:
+        dst = os.path.join(staging_dir, Safe_Relpath(rel))
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        os.replace(os.path.join(download_dir, Safe_Relpath(rel)), dst)
+
+    tracked_top = {rel.split("/")[0] for rel in remote_files} | {rel.split("/")[0] for rel in (previous or {}).get("files", {})}
+    deleted = set(plan["delete"])
+
+    if os.path.isdir(target_dir):
+        # Fichiers non suivis à l'intérieur des dossiers suivis : conservés (liens physiques)
+        for top in tracked_top:
+            top_path = os.path.join(target_dir, top)
+            if not os.path.isdir(top_path):
+                continue
+            for dirpath, _, filenames in os.walk(top_path):
+                for name in filenames:
+                    src = os.path.join(dirpath, name)
+                    rel = os.path.relpath(src, target_dir).replace(os.sep, "/")
+                    if rel in remote_files or rel in deleted or name.endswith(".pyc"):
+                        continue
+                    Link_Or_Copy(src, os.path.join(staging_dir, Safe_Relpath(rel)))
+
+    with open(os.path.join(staging_dir, LOCAL_MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump({"version": version, "files": remote_files}, f)
+    return tracked_top
+
+
+
+
+
+
+# Applique une release différentielle sur `target_dir` :
+# 1. télécharge uniquement les fichiers modifiés (reprenables, vérifiés) dans <target>.download
+# 2. construit <target>.staging : fichiers réutilisés en liens physiques + fichiers téléchargés
+# 3. les entrées de premier niveau non suivies (logs, Profiles...) sont déplacées telles quelles
+# 4. bascule atomique : target → target.backup, staging → target ; restauration en cas d'échec
+# Toute erreur disque est convertie en DeltaUpdateError (l'appelant repasse alors par le ZIP complet).
+def Apply_Delta(target_dir, remote_files: Dict, base_url, version=None, headers=None, verify=True,
+                session=None) -> Dict:
+    target_dir = os.path.abspath(target_dir)
+    staging_dir = target_dir + STAGING_SUFFIX
+    backup_dir = target_dir + BACKUP_SUFFIX
+    download_dir = target_dir + DOWNLOAD_SUFFIX
+    session = session or requests.Session()
+
+    # 1. Plan + téléchargements (en cas d'échec <target>.download est gardé pour reprendre)
+    try:
+        previous = Read_Local_Manifest(target_dir)
+        plan = Plan_Delta(target_dir, remote_files, previous.get("files") if previous else None)
+        stats = {"downloaded": len(plan["download"]), "reused": len(plan["reuse"]),
+                 "deleted": len(plan["delete"]), "bytes": 0}
+
+        if not plan["download"] and not plan["delete"]:
+            return stats
+
+        for rel in plan["download"]:
+            entry = remote_files[rel]
+            stats["bytes"] += Download_File(
+                session, base_url.rstrip("/") + "/" + rel, os.path.join(download_dir, Safe_Relpath(rel)),
+                entry["sha256"], entry.get("size"), headers=headers, verify=verify,
+            )
+    except OSError as e:
+        raise DeltaUpdateError(f"Download failed for {target_dir}: {e}") from e
+
+    # 2. Staging
+    try:
+        tracked_top = Build_Staging(target_dir, staging_dir, download_dir, remote_files, plan, previous, version)
+    except OSError as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        shutil.rmtree(download_dir, ignore_errors=True)
+        raise DeltaUpdateError(f"Staging failed for {target_dir}: {e}") from e
+
+    # 3 + 4. Bascule
+    moved_untracked = []
+    try:
+        if os.path.isdir(target_dir):
+            for name in os.listdir(target_dir):
+                if name in tracked_top or name == LOCAL_MANIFEST_NAME:
+                    continue
+                os.rename(os.path.join(target_dir, name), os.path.join(staging_dir, name))
+                moved_untracked.append(name)
+
+            if os.path.exists(backup_dir):
+                shutil.rmtree(backup_dir)
+            os.rename(target_dir, backup_dir)
+
+        try:
+            os.rename(staging_dir, target_dir)
+        except OSError:
+            if os.path.isdir(backup_dir):
+                os.rename(backup_dir, target_dir)
+            raise
+
+    except OSError as e:
+        # Restauration des données locales déplacées
+        restored = True
+        for name in moved_untracked:
+            src = os.path.join(staging_dir, name)
+            try:
+                if os.path.exists(src):
+                    os.rename(src, os.path.join(target_dir, name))
+            except OSError:
+                restored = False
+        # Le staging n'est supprimé que si la cible d'origine et ses données locales sont bien en place
+        if restored and os.path.isdir(target_dir):
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.rmtree(download_dir, ignore_errors=True)
+        raise DeltaUpdateError(f"Directory swap failed for {target_dir}: {e}") from e
+
+    shutil.rmtree(backup_dir, ignore_errors=True)
+    shutil.rmtree(download_dir, ignore_errors=True)
+    return stats
+
+
+
+
+
+
+# 🌐 Récupère le manifest distant
+def Fetch_Manifest(manifest_url, headers=None, verify=True, timeout=15, session=None) -> Dict:
+    session = session or requests.Session()
+    try:
+        resp = session.get(manifest_url, headers=headers, verify=verify, timeout=timeout)
+    except requests.RequestException as e:
+        raise DeltaUpdateError(f"Manifest unreachable: {e}")
+    if resp.status_code != 200:
+        raise DeltaUpdateError(f"Manifest unavailable: HTTP {resp.status_code}")
+    try:
+        manifest = resp.json()
+    except ValueError:
+        raise DeltaUpdateError("Manifest is not valid JSON")
+    if manifest.get("algorithm", "sha256") != "sha256" or not isinstance(manifest.get("files"), dict):
+        raise DeltaUpdateError("Unsupported manifest format")
+    return manifest
+
+
+
+
+
+
+# 🚀 Point d'entrée : met à jour chaque couple (préfixe dans la release → dossier local)
+def Delta_Update(manifest_url, base_url, targets: Dict[str, str], headers=None, verify=True) -> Dict[str, Dict]:
+    session = requests.Session()
+    manifest = Fetch_Manifest(manifest_url, headers=headers, verify=verify, session=session)
+    results = {}
+    for prefix, target_dir in targets.items():
+        files = Subset_Manifest(manifest, prefix)
+        if not files:
+            raise DeltaUpdateError(f"No files under '{prefix}' in manifest")
+        prefix_url = base_url.rstrip("/") + ("/" + prefix.strip("/") if prefix else "")
+        results[prefix] = Apply_Delta(target_dir, files, prefix_url, version=manifest.get("version"),
+                                      headers=headers, verify=verify, session=session)
+    return results
+
+
+
+
+
+
+if __name__ == "__main__":
+    # python deltaUpdate.py build <dossier_release> [--version X] [--out manifest.json]
+    parser = argparse.ArgumentParser(description="Manifest SHA-256 pour les mises à jour différentielles")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Générer le manifest d'une release")
+    p_build.add_argument("root")
+    p_build.add_argument("--version")
+    p_build.add_argument("--out")
+    args = parser.parse_args()
+
+    manifest = Build_Manifest(args.root, args.version)
+    out = args.out or os.path.join(args.root, MANIFEST_NAME)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"✅ Manifest: {len(manifest['files'])} fichiers → {out}")
+    sys.exit(0)
@@ -0,0 +1,240 @@
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import threading
+import datetime
+from collections import defaultdict
+from typing import Optional, Dict, List
+
+
+
+
+# =========================================
+# 🎥 Enregistrement / rejeu du flux d'événements d'un run
+# =========================================
+# AUTOMAIL_RECORD=1 : chaque run écrit Tools/recordings/run_<date>_<session>.jsonl.gz
+# Une ligne JSON par événement : {"t": secondes depuis le début, "e": type, ...}
+#   run_start  jobs, parallel, browser, loop_ms, start_delay_sec, poll_sec   (attentes fixes du pipeline)
+#   dequeued   job                       (job = empreinte courte de l'email)
+#   spawn      job, pid
+#   api        job, api (save_email|send_status), ms
+#   browser    job, ms                   (durée navigateur : lancement → fichier de session)
+#   exit       job, status, ms           (fermeture du processus)
+#   download   kind (session|log), size
+#   log        text                      (adresses email remplacées par leur empreinte <job:…>)
+RECORD_ENV             = "AUTOMAIL_RECORD"
+RECORDING_SUFFIX       = ".jsonl.gz"
+FLUSH_EVERY            = 50
+API_STAGES             = ("save_email", "send_status")
+EMAIL_PATTERN          = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+
+
+
+
+
+# 🧩 Enregistrement activé par la variable d'environnement
+def Enabled_From_Env() -> bool:
+    return os.environ.get(RECORD_ENV, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+# 🔒 Les emails ne sont jamais écrits tels quels : empreinte courte stable
+def Job_Key(email) -> str:
+    return hashlib.sha1(str(email).encode("utf-8")).hexdigest()[:12]
+
+
+# Lignes de log : chaque adresse email devient <job:empreinte>, la même clé que les événements du job
+def Redact_Emails(text) -> str:
+    return EMAIL_PATTERN.sub(lambda m: f"<job:{Job_Key(m.group(0))}>", str(text))
+
+
+
+
+
+
+# Enregistreur thread-safe. Les événements du pipeline arrivent par le JobTracer (Listener),
+# les fichiers de téléchargement par CloseBrowserThread et les lignes de log par log_message.
+class EventRecorder:
+
+    def __init__(self, output_dir, enabled=None):
+        self.output_dir = output_dir
+        self.enabled = Enabled_From_Env() if enabled is None else enabled
+        self.lock = threading.Lock()
+        self.file = None
+        self.path = None
+        self.origin = None
+        self.pending = 0
+
+
+    @property
+    def recording(self) -> bool:
+        return self.file is not None
+
+
+    def Start(self, session_id, **run_info) -> Optional[str]:
+        if not self.enabled:
+            return None
+        self.Stop()
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        with self.lock:
+            self.path = os.path.join(self.output_dir, f"run_{stamp}_{session_id}{RECORDING_SUFFIX}")
+            self.file = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+            self.origin = time.perf_counter()
+            self.pending = 0
+        self.Record("run_start", epoch=round(time.time(), 3), **run_info)
+        return self.path
+
+
+    def Record(self, event, **fields):
+        if self.file is None:
+            return
+        with self.lock:
+            if self.file is None:
+                return
+            fields["t"] = round(time.perf_counter() - self.origin, 4)
+            fields["e"] = event
+            self.file.write(json.dumps(fields, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self.pending += 1
+            if self.pending >= FLUSH_EVERY:
+                self.file.flush()
+                self.pending = 0
+
+
+    def Stop(self) -> Optional[str]:
+        with self.lock:
+            if self.file is None:
+                return None
+            self.file.close()
+            self.file = None
+            return self.path
+
+
+    def Listener(self, kind, job, stage, duration_ms, args):
+        # Branché sur JobTracer.Add_Listener : traduit les étapes du pipeline en événements
+        if self.file is None:
+            return
+        key = Job_Key(job)
+        if kind == "mark" and stage == "dequeued":
+            self.Record("dequeued", job=key)
+        elif kind == "mark" and stage == "browser_started":
+            self.Record("spawn", job=key, pid=args.get("pid"))
+        elif kind == "span" and stage in API_STAGES:
+            self.Record("api", job=key, api=stage, ms=round(duration_ms, 1), error=args.get("error"))
+        elif kind == "span" and stage == "browser_run":
+            self.Record("browser", job=key, ms=round(duration_ms, 1), status=args.get("status"))
+        elif kind == "span" and stage == "process_closed":
+            self.Record("exit", job=key, ms=round(duration_ms, 1))
+
+
+    def Download(self, kind, size=None):
+        self.Record("download", kind=kind, size=size)
+
+
+    def Log(self, text):
+        if self.file is None:
+            return
+        self.Record("log", text=Redact_Emails(text))
+
+
+
+
+
+
+# 📂 Lecture d'un enregistrement
+def Load_Recording(path) -> List[Dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+
+
+
+
+# 🎬 Plan de rejeu : ce qui vient de l'extérieur du pipeline (durées des navigateurs, statuts,
+# latences des API, parallélisme) ; tout le reste est recalculé par l'orchestration rejouée.
+# `speed` compresse le temps (speed=10 : dix fois plus vite), y compris les attentes fixes du pipeline
+# (loop_ms, start_delay_sec, poll_sec ; None si absentes de l'enregistrement).
+def Build_Replay_Plan(events: List[Dict], speed=1.0) -> Dict:
+    speed = max(float(speed), 0.001)
+    run = next((e for e in events if e["e"] == "run_start"), {})
+    order = []
+    browsers = {}
+    api_latency = defaultdict(list)
+
+    for event in events:
+        kind = event["e"]
+        if kind == "dequeued" and event["job"] not in order:
+            order.append(event["job"])
+        elif kind == "browser":
+            browsers[event["job"]] = {"delay": event["ms"] / 1000.0 / speed, "status": event.get("status") or "completed"}
+        elif kind == "api":
+            api_latency[event["api"]].append(round(event["ms"] / speed, 1))
+
+    jobs = []
+    for index, key in enumerate(order):
+        browser = browsers.get(key, {"delay": 0.0, "status": "completed"})
+        jobs.append({"email": f"replay{index:05d}@example.com", "job": key,
+                     "delay": round(browser["delay"], 3), "status": browser["status"]})
+
+    loop_ms = run.get("loop_ms")
+    start_delay_sec = run.get("start_delay_sec")
+    poll_sec = run.get("poll_sec")
+    return {
+        "speed": speed,
+        "parallel": run.get("parallel") or 1,
+        "browser": run.get("browser"),
+        "loop_ms": int(loop_ms / speed) if loop_ms else None,
+        "start_delay_sec": round(start_delay_sec / speed, 3) if start_delay_sec is not None else None,
+        "poll_sec": round(poll_sec / speed, 3) if poll_sec else None,
+        "jobs": jobs,
+        "api_latency_ms": dict(api_latency),
+    }
+
+
+def Summarize(events: List[Dict]) -> str:
+    counts = defaultdict(int)
+    for event in events:
+        counts[event["e"]] += 1
+    duration = events[-1]["t"] if events else 0
+    run = next((e for e in events if e["e"] == "run_start"), {})
+    out = [f"🎥 {len(events)} événements sur {duration:.1f} s  "
+           f"(jobs={run.get('jobs')}, parallèle={run.get('parallel')}, navigateur={run.get('browser')})"]
+    for kind in sorted(counts):
+        out.append(f"   {kind:<10}{counts[kind]:>8}")
+    return "\n".join(out)
+
+
+
+
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect a recorded run or turn it into a replay plan")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_summary = sub.add_parser("summary")
+    p_summary.add_argument("recording")
+    p_plan = sub.add_parser("plan")
+    p_plan.add_argument("recording")
+    p_plan.add_argument("--speed", type=float, default=1.0)
+    p_plan.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+
+    events = Load_Recording(args.recording)
+    if args.command == "summary":
+        print(Summarize(events))
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(Build_Replay_Plan(events, args.speed), f, indent=1)
+        print(f"✅ Plan de rejeu écrit : {args.out}")
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+
+
+# =========================================
+# 🧩 Build partagé de l'extension (une fois par run)
+# =========================================
+# Le template est copié une seule fois dans tools/ExtensionEmail/.shared/<template>_<empreinte>
+# (traitement.json déjà appliqué). Chaque job ne reçoit ensuite qu'un dossier de liens physiques
+# vers ce build, plus ses deux fichiers : job.json (valeurs du compte, lues par les JS via
+# runtime.getURL) et data.txt (pid, écrit au lancement) ; quelques centaines d'octets par job.
+# Compatibilité : un fichier qui contient encore des marqueurs (__email__...) sans mentionner job.json
+# (template antérieur, reçu par mise à jour) est rendu pour le job ; il est découpé une fois par
+# build en segments d'octets autour des marqueurs, le job n'assemble que ses valeurs.
+SHARED_DIR_NAME        = ".shared"
+JOB_CONFIG_NAME        = "job.json"         # valeurs du compte, écrit par Render_Job
+PER_JOB_FILES          = ("data.txt", JOB_CONFIG_NAME)   # propres au job : jamais liés au build partagé
+KEEP_BUILDS            = 2                  # builds conservés par template (run en cours + précédent)
+
+
+
+
+
+
+class ExtensionBuildError(Exception):
+    """Raised when the shared extension build cannot be created or a job directory cannot be rendered."""
+
+
+
+
+
+
+# 🔑 Empreinte du template : chemins, tailles et dates de modification + valeurs communes au run
+def Template_Fingerprint(template_dir, extra="") -> str:
+    digest = hashlib.sha1(extra.encode("utf-8"))
+    for root, dirs, files in os.walk(template_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            st = os.stat(path)
+            rel = os.path.relpath(path, template_dir).replace(os.sep, "/")
+            digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+# 🔗 Lien physique vers le build partagé, copie si le système de fichiers ne le permet pas
+def Link_Or_Copy(src, dst) -> bool:
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        shutil.copy2(src, dst)
+        return False
+
+
+
+
+
+
+# Build partagé d'un template. `prepare(build_dir)` est appliqué une seule fois au build
+# (Modifier_Extension_Par_Traitement) ; le build n'est plus modifié ensuite.
+class ExtensionBuild:
+
+    def __init__(self, template_dir, base_dir, prepare: Optional[Callable[[str], None]] = None):
+        self.template_dir = template_dir
+        self.shared_root = os.path.join(base_dir, SHARED_DIR_NAME)
+        self.prepare = prepare
+        self.lock = threading.Lock()
+        self.fingerprint = None
+        self.build_dir = None
+        self.templates: Dict[Tuple, Tuple[List[bytes], List[str]]] = {}   # (fichier, marqueurs) → segments
+        self.stats = {"builds": 0, "jobs": 0, "linked": 0, "copied": 0, "rendered_bytes": 0}
+
+
+    def Ensure(self, extra="") -> str:
+        # Reconstruit seulement si le template (ou traitement.json, ou la session) a changé
+        fingerprint = Template_Fingerprint(self.template_dir, extra)
+        with self.lock:
+            if fingerprint == self.fingerprint and self.build_dir and os.path.isdir(self.build_dir):
+                return self.build_dir
+
+            name = f"{os.path.basename(os.path.normpath(self.template_dir))}_{fingerprint}"
+            build_dir = os.path.join(self.shared_root, name)
+            if not os.path.isdir(build_dir):
+                building = f"{build_dir}.{os.getpid()}.building"
+                shutil.rmtree(building, ignore_errors=True)
+                try:
+                    shutil.copytree(self.template_dir, building)
+                    if self.prepare:
+                        self.prepare(building)
+                    os.replace(building, build_dir)
+                except OSError as e:
+                    shutil.rmtree(building, ignore_errors=True)
+                    if not os.path.isdir(build_dir):
+                        raise ExtensionBuildError(f"Cannot build shared extension {build_dir}: {e}") from e
+                self.stats["builds"] += 1
+
+            self.fingerprint = fingerprint
+            self.build_dir = build_dir
+            self.templates = {}
+            self._Drop_Old_Builds(name)
+            return build_dir
+
+
+    def _Drop_Old_Builds(self, current):
+        # Appelé sous self.lock. Les jobs déjà lancés gardent leurs liens : supprimer l'ancien
+        # build ne retire qu'un nom, les fichiers restent tant qu'un dossier de job les référence.
+        prefix = os.path.basename(os.path.normpath(self.template_dir)) + "_"
+        try:
+            builds = [
+                entry for entry in os.scandir(self.shared_root)
+                if entry.is_dir() and entry.name.startswith(prefix) and not entry.name.endswith(".building")
+            ]
+        except OSError:
+            return
+        builds.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        kept = 0
+        for entry in builds:
+            if entry.name == current:
+                continue
+            kept += 1
+            if kept >= KEEP_BUILDS:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+    def _Template(self, build_dir, rel, placeholders) -> Tuple[List[bytes], List[str]]:
+        # Appelé sous self.lock. Segments du fichier entre les marqueurs, et le marqueur de chaque trou.
+        # Un fichier qui mentionne job.json (il le lit, ou un autre JS remplace ses marqueurs avec) : aucun trou, il est lié.
+        key = (build_dir, rel, placeholders)
+        if key not in self.templates:
+            with open(os.path.join(build_dir, rel), "rb") as f:
+                data = f.read()
+            if JOB_CONFIG_NAME.encode("utf-8") in data:
+                self.templates[key] = ([data], [])
+                return self.templates[key]
+            pattern = re.compile(b"|".join(re.escape(name.encode("utf-8")) for name in sorted(placeholders, key=len, reverse=True)))
+            segments, slots, last = [], [], 0
+            for match in pattern.finditer(data):
+                segments.append(data[last:match.start()])
+                slots.append(match.group(0).decode("utf-8"))
+                last = match.end()
+            segments.append(data[last:])
+            self.templates[key] = (segments, slots)
+        return self.templates[key]
+
+
+    def Render_Job(self, dest, config: Dict[str, str], replacements: Optional[Dict[str, Dict[str, str]]] = None,
+                   build_dir=None) -> Dict:
+        # Dossier du job : job.json (`config`), data.txt vide (écrit au lancement) et des liens vers
+        # le build partagé (`build_dir`, par défaut le dernier Ensure()). Seuls les fichiers de
+        # `replacements` qui ont encore des marqueurs sans mentionner job.json sont rendus.
+        build_dir = build_dir or self.build_dir
+        if not build_dir:
+            raise ExtensionBuildError("Ensure() must be called before Render_Job()")
+        if os.path.exists(dest):
+            shutil.rmtree(dest)
+
+        with self.lock:
+            rendered = {}
+            for rel, values in (replacements or {}).items():
+                if not values or not os.path.exists(os.path.join(build_dir, rel)):
+                    continue
+                segments, slots = self._Template(build_dir, rel, tuple(sorted(values)))
+                if not slots:
+                    continue
+                encoded = {name: str(value).encode("utf-8") for name, value in values.items()}
+                parts = [segments[0]]
+                for slot, segment in zip(slots, segments[1:]):
+                    parts.append(encoded[slot])
+                    parts.append(segment)
+                rendered[rel] = b"".join(parts)
+
+        report = {"linked": 0, "copied": 0, "rendered": 0, "bytes_written": 0}
+        for root, dirs, files in os.walk(build_dir):
+            rel_root = os.path.relpath(root, build_dir)
+            target_root = dest if rel_root == "." else os.path.join(dest, rel_root)
+            os.makedirs(target_root, exist_ok=True)
+            for name in files:
+                rel = name if rel_root == "." else os.path.join(rel_root, name).replace(os.sep, "/")
+                target = os.path.join(target_root, name)
+                if rel in rendered:
+                    with open(target, "wb") as f:
+                        f.write(rendered[rel])
+                    report["rendered"] += 1
+                    report["bytes_written"] += len(rendered[rel])
+                elif rel in PER_JOB_FILES:
+                    open(target, "w", encoding="utf-8").close()
+                elif Link_Or_Copy(os.path.join(root, name), target):
+                    report["linked"] += 1
+                else:
+                    report["copied"] += 1
+                    report["bytes_written"] += os.path.getsize(target)
+
+        data = json.dumps(config, ensure_ascii=False).encode("utf-8")
+        with open(os.path.join(dest, JOB_CONFIG_NAME), "wb") as f:
+            f.write(data)
+        report["bytes_written"] += len(data)
+
+        with self.lock:
+            self.stats["jobs"] += 1
+            self.stats["linked"] += report["linked"]
+            self.stats["copied"] += report["copied"]
+            self.stats["rendered_bytes"] += report["bytes_written"]
+        return report
+
+
+
+
+
+
+# Mesure : python extensionBuild.py <template_dir> [jobs]
+# Compare la copie complète du template par job au build partagé + liens.
+if __name__ == "__main__":
+    import tempfile
+    if len(sys.argv) < 2:
+        print("usage: extensionBuild.py <template_dir> [jobs]")
+        sys.exit(2)
+    template, jobs = sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    config = {"email": "bench@example.com", "IDL": "0", "host": "127.0.0.1", "port": "3128"}
+    values = {"__email__": "bench@example.com", "__IDL__": '"0"', "__host__": '"127.0.0.1"', "__port__": '"3128"'}
+    files = {rel: values for rel in ("actions.js", "background.js", "gmail_process.js", "ReportingActions.js")}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for i in range(jobs):
+            shutil.copytree(template, os.path.join(tmp, "copy", str(i)))
+        copy_sec = time.perf_counter() - start
+
+        build = ExtensionBuild(template, os.path.join(tmp, "shared"))
+        start = time.perf_counter()
+        build.Ensure()
+        written = sum(build.Render_Job(os.path.join(tmp, "shared", str(i)), config, files)["bytes_written"] for i in range(jobs))
+        shared_sec = time.perf_counter() - start
+
+    print(f"📦 copie complète : {copy_sec * 1000 / jobs:.2f} ms/job")
+    print(f"🔗 build partagé  : {shared_sec * 1000 / jobs:.2f} ms/job  ({written // jobs} o écrits/job, {build.stats})")
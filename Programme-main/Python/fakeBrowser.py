@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import datetime
+
+
+
+
+# =========================================
+# 🤖 Faux navigateur pour le harness de charge
+# =========================================
+# Lancé par ExtractionThread à la place du navigateur (Browser_path). Reproduit le contrat de
+# l'extension : lit data.txt (pid:email:session_id) dans le dossier --load-extension, attend une
+# durée tirée d'une distribution (ou celle du script de rejeu pour cet email), dépose le fichier
+# de log puis le fichier de session dans le dossier de téléchargements, et reste vivant jusqu'au
+# SIGTERM envoyé par CloseBrowserThread.
+DATA_FILE_TIMEOUT_SEC  = 60
+MAX_LIFETIME_SEC       = 600
+
+
+
+
+
+
+# ⏳ Durée simulée : "fixed:2", "uniform:1:5", "lognormal:0.5:0.4", "exp:2"
+def Sample_Delay(spec) -> float:
+    kind, *values = spec.split(":")
+    values = [float(v) for v in values]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return random.uniform(values[0], values[1])
+    if kind == "lognormal":
+        return random.lognormvariate(values[0], values[1])
+    if kind == "exp":
+        return random.expovariate(1.0 / values[0])
+    raise ValueError(f"Unknown delay distribution: {spec}")
+
+
+def Extension_Dir(argv) -> str:
+    for arg in argv:
+        if arg.startswith("--load-extension="):
+            return arg.split("=", 1)[1]
+    raise ValueError("--load-extension=<dir> is required")
+
+
+def Read_Data_File(extension_dir):
+    # data.txt est écrit par Add_Pid_To_Text_File juste après le Popen : on l'attend
+    path = os.path.join(extension_dir, "data.txt")
+    deadline = time.time() + DATA_FILE_TIMEOUT_SEC
+    while time.time() < deadline:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                parts = f.readline().strip().split(":")
+            if len(parts) >= 3 and parts[0] == str(os.getpid()):
+                return parts[1], parts[2]
+        except OSError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"data.txt not written for pid {os.getpid()}")
+
+
+
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake browser worker for loadHarness")
+    parser.add_argument("--downloads", required=True)
+    parser.add_argument("--delay", default="uniform:1:3")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--fail-status", default="bad_proxy")
+    parser.add_argument("--script", help="replay script: {email: {delay, status}}")
+    args, browser_args = parser.parse_known_args()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    email, session_id = Read_Data_File(Extension_Dir(browser_args))
+    scripted = None
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            scripted = json.load(f).get(email)
+
+    if scripted:
+        time.sleep(scripted["delay"])
+        status = scripted["status"]
+    else:
+        time.sleep(Sample_Delay(args.delay))
+        status = args.fail_status if random.random() < args.fail_rate else "completed"
+    pid = os.getpid()
+
+    # Même nommage que l'extension : log_<ISO>_<email>.txt puis <session>_<email>_<status>_<pid>.txt
+    stamp = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S-%f")[:-3] + "Z"
+    log_path = os.path.join(args.downloads, f"log_{stamp}_{email}.txt")
+    with open(log_path + ".part", "w", encoding="utf-8") as f:
+        f.write(f"[fake] {email} {status}\n" * 20)
+    os.replace(log_path + ".part", log_path)
+
+    session_path = os.path.join(args.downloads, f"{session_id}_{email}_{status}_{pid}.txt")
+    with open(session_path + ".part", "w", encoding="utf-8") as f:
+        f.write(f"session_id:{session_id}_PID:{pid}_Email:{email}_Status:{status}")
+    os.replace(session_path + ".part", session_path)
+
+    time.sleep(MAX_LIFETIME_SEC)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional, Dict, List
+
+
+
+
+# =========================================
+# 📋 Registre des jobs (mémoire + journal SQLite WAL)
+# =========================================
+JOB_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "..", "tools", "jobs.db")
+
+STATE_SAVED       = "saved"         # email enregistré côté API (inserted_id connu)
+STATE_RUNNING     = "running"       # navigateur lancé (pid connu)
+STATE_FINISHED    = "finished"      # fichier de session reçu
+STATE_INTERRUPTED = "interrupted"   # retrouvé après un arrêt brutal, processus disparu
+TERMINAL_STATES   = (STATE_FINISHED, STATE_INTERRUPTED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id      TEXT PRIMARY KEY,
+    session_id  TEXT,
+    email       TEXT    NOT NULL,
+    pid         INTEGER,
+    inserted_id TEXT,
+    browser     TEXT,
+    state       TEXT    NOT NULL,
+    status      TEXT,
+    created_ts  REAL    NOT NULL,
+    updated_ts  REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state);
+CREATE INDEX IF NOT EXISTS idx_jobs_pid   ON jobs (pid);
+"""
+
+COLUMNS = ["job_id", "session_id", "email", "pid", "inserted_id", "browser", "state", "status", "created_ts", "updated_ts"]
+
+
+
+
+
+
+# Table des jobs en mémoire (recherche O(1) par job, email ou pid), recopiée à chaque changement
+# dans un journal SQLite en mode WAL. Recover() recharge les jobs non terminés après un crash.
+class JobRegistry:
+
+    def __init__(self, db_path=JOB_REGISTRY_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.jobs: Dict[str, Dict] = {}
+        self.by_email: Dict[str, str] = {}
+        self.by_pid: Dict[int, str] = {}
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.commit()
+
+
+    @staticmethod
+    def Job_Id(session_id, email) -> str:
+        return f"{session_id}:{email}"
+
+
+    def _Index(self, job):
+        # Appelé sous self.lock
+        self.jobs[job["job_id"]] = job
+        self.by_email[job["email"]] = job["job_id"]
+        if job.get("pid") is not None:
+            self.by_pid[job["pid"]] = job["job_id"]
+
+
+    def _Persist(self, job):
+        # Appelé sous self.lock
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO jobs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            [job.get(column) for column in COLUMNS],
+        )
+        self.conn.commit()
+
+
+    def Register(self, email, session_id, inserted_id=None, browser=None) -> str:
+        now = time.time()
+        job = {
+            "job_id": self.Job_Id(session_id, email), "session_id": session_id, "email": email,
+            "pid": None, "inserted_id": None if inserted_id is None else str(inserted_id), "browser": browser,
+            "state": STATE_SAVED, "status": None, "created_ts": now, "updated_ts": now,
+        }
+        with self.lock:
+            self._Index(job)
+            self._Persist(job)
+        return job["job_id"]
+
+
+    def Update(self, job_id, **fields) -> Optional[Dict]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if "pid" in fields and fields["pid"] is not None:
+                fields["pid"] = int(fields["pid"])
+            job.update(fields)
+            job["updated_ts"] = time.time()
+            self._Index(job)
+            self._Persist(job)
+            return dict(job)
+
+
+    def Set_Pid(self, job_id, pid) -> Optional[Dict]:
+        return self.Update(job_id, pid=pid, state=STATE_RUNNING)
+
+
+    def Finish(self, job_id, status) -> Optional[Dict]:
+        return self.Update(job_id, state=STATE_FINISHED, status=status)
+
+
+    def Get(self, job_id) -> Optional[Dict]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+
+    def Find_By_Email(self, email) -> Optional[Dict]:
+        # Job le plus récent de cet email
+        with self.lock:
+            job = self.jobs.get(self.by_email.get(email))
+            return dict(job) if job else None
+
+
+    def Find_By_Pid(self, pid) -> Optional[Dict]:
+        with self.lock:
+            job = self.jobs.get(self.by_pid.get(int(pid)))
+            return dict(job) if job else None
+
+
+    def Active(self) -> List[Dict]:
+        with self.lock:
+            return [dict(job) for job in self.jobs.values() if job["state"] not in TERMINAL_STATES]
+
+
+    def Recover(self) -> List[Dict]:
+        # Recharge en mémoire les jobs non terminés du journal (redémarrage après crash)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM jobs WHERE state NOT IN ({', '.join('?' * len(TERMINAL_STATES))}) ORDER BY created_ts",
+                TERMINAL_STATES,
+            ).fetchall()
+            recovered = [dict(row) for row in rows]
+            for job in recovered:
+                self._Index(job)
+        return [dict(job) for job in recovered]
+
+
+    def Forget_Finished(self):
+        # Libère la mémoire des jobs terminés (ils restent dans le journal)
+        with self.lock:
+            for job_id in [j for j, job in self.jobs.items() if job["state"] in TERMINAL_STATES]:
+                job = self.jobs.pop(job_id)
+                if self.by_email.get(job["email"]) == job_id:
+                    del self.by_email[job["email"]]
+                if job.get("pid") is not None and self.by_pid.get(job["pid"]) == job_id:
+                    del self.by_pid[job["pid"]]
+
+
+    def Close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,202 @@
+import os
+import json
+import time
+import threading
+import contextlib
+from typing import Optional, Dict, List
+
+
+
+
+# =========================================
+# ⏱️ Traçage du cycle de vie des jobs
+# =========================================
+# Étapes suivies pour chaque compte (ordre d'affichage du rapport)
+STAGES = [
+    "dequeued",
+    "save_email",
+    "extension_rendered",
+    "profile_prepared",
+    "browser_spawned",
+    "browser_run",
+    "session_observed",
+    "send_status",
+    "process_closed",
+]
+
+TRACE_FILE_PREFIX = "trace_"
+
+
+
+
+
+
+# 📊 Percentile (interpolation linéaire) d'une liste de valeurs
+def Percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+
+
+
+
+# Collecteur de spans par job (un job = un email).
+# Produit un fichier au format Chrome Trace Event (chrome://tracing, Perfetto) :
+# une ligne par job, un événement "X" par étape, un événement "i" par marqueur.
+class JobTracer:
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.epoch = time.time()
+        self.events = []
+        self.marks = {}
+        self.job_ids = {}
+        self.durations = {}
+        self.listeners = []
+
+
+    def Add_Listener(self, callback):
+        # callback(kind, job, stage, duration_ms, args) : kind = "mark" ou "span" (enregistreur d'événements)
+        self.listeners.append(callback)
+
+
+    def _Notify(self, kind, job, stage, duration_ms, args):
+        for callback in self.listeners:
+            try:
+                callback(kind, job, stage, duration_ms, args)
+            except Exception:
+                pass
+
+
+    def _Now_Us(self) -> float:
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+
+    def _Tid(self, job) -> int:
+        # Un identifiant de "thread" par job pour que chaque compte ait sa propre ligne
+        tid = self.job_ids.get(job)
+        if tid is None:
+            tid = len(self.job_ids) + 1
+            self.job_ids[job] = tid
+            self.events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                "args": {"name": str(job)},
+            })
+        return tid
+
+
+    def _Record(self, job, stage, start_us, end_us, args=None):
+        with self.lock:
+            self.events.append({
+                "name": stage, "cat": "job", "ph": "X", "pid": 1, "tid": self._Tid(job),
+                "ts": round(start_us, 1), "dur": round(end_us - start_us, 1),
+                "args": dict(args or {}, job=str(job), thread=threading.current_thread().name),
+            })
+            self.durations.setdefault(stage, []).append((end_us - start_us) / 1000.0)
+        self._Notify("span", job, stage, (end_us - start_us) / 1000.0, args or {})
+
+
+    def Mark(self, job, stage, **args):
+        # Marqueur instantané ; sert aussi de point de départ pour Complete()
+        if not self.enabled or job is None:
+            return
+        now = self._Now_Us()
+        with self.lock:
+            self.marks[(job, stage)] = now
+            self.events.append({
+                "name": stage, "cat": "job", "ph": "i", "s": "t", "pid": 1, "tid": self._Tid(job),
+                "ts": round(now, 1), "args": dict(args, job=str(job)),
+            })
+        self._Notify("mark", job, stage, None, args)
+
+
+    @contextlib.contextmanager
+    def Span(self, job, stage, **args):
+        # Mesure la durée d'un bloc : with JOB_TRACER.Span(email, "save_email"): ...
+        if not self.enabled or job is None:
+            yield
+            return
+        start = self._Now_Us()
+        try:
+            yield
+        except Exception as e:
+            args["error"] = str(e)
+            raise
+        finally:
+            self._Record(job, stage, start, self._Now_Us(), args)
+
+
+    def Complete(self, job, stage, since_mark, **args):
+        # Enregistre un span entre un marqueur précédent (autre thread possible) et maintenant
+        if not self.enabled or job is None:
+            return
+        with self.lock:
+            start = self.marks.get((job, since_mark))
+        if start is not None:
+            self._Record(job, stage, start, self._Now_Us(), args)
+
+
+    def Summary(self) -> Dict[str, Dict]:
+        # p50 / p95 / max (ms) par étape
+        with self.lock:
+            durations = {stage: list(values) for stage, values in self.durations.items()}
+
+        ordered = [s for s in STAGES if s in durations] + sorted(s for s in durations if s not in STAGES)
+        return {
+            stage: {
+                "count": len(durations[stage]),
+                "p50_ms": round(Percentile(durations[stage], 50), 1),
+                "p95_ms": round(Percentile(durations[stage], 95), 1),
+                "max_ms": round(max(durations[stage]), 1),
+            }
+            for stage in ordered
+        }
+
+
+    def Format_Summary(self) -> str:
+        lines = [f"{'stage':<20}{'count':>7}{'p50 (ms)':>12}{'p95 (ms)':>12}{'max (ms)':>12}"]
+        for stage, s in self.Summary().items():
+            lines.append(f"{stage:<20}{s['count']:>7}{s['p50_ms']:>12}{s['p95_ms']:>12}{s['max_ms']:>12}")
+        return "\n".join(lines)
+
+
+    def Write(self, trace_path) -> Optional[str]:
+        # Écrit la trace (JSON Chrome) et le résumé texte à côté ; retourne le chemin de la trace
+        if not self.enabled:
+            return None
+        with self.lock:
+            if not self.job_ids:
+                return None
+            payload = {
+                "traceEvents": list(self.events),
+                "displayTimeUnit": "ms",
+                "otherData": {"epoch": self.epoch},
+            }
+
+        os.makedirs(os.path.dirname(os.path.abspath(trace_path)), exist_ok=True)
+        tmp_path = trace_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, trace_path)
+
+        with open(os.path.splitext(trace_path)[0] + "_summary.txt", "w", encoding="utf-8") as f:
+            f.write(self.Format_Summary() + "\n")
+        return trace_path
+
+
+    def Reset(self):
+        with self.lock:
+            self.origin = time.perf_counter()
+            self.epoch = time.time()
+            self.events = []
+            self.marks = {}
+            self.job_ids = {}
+            self.durations = {}
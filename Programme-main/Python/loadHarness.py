@@ -0,0 +1,505 @@
+import os
+import sys
+import json
+import time
+import stat
+import signal
+import shutil
+import argparse
+import tempfile
+import threading
+import contextlib
+import subprocess
+import datetime
+import multiprocessing
+from collections import defaultdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+from typing import Dict, List
+
+import psutil
+
+from jobTracing import Percentile
+from eventRecorder import Load_Recording, Build_Replay_Plan
+
+
+
+
+# =========================================
+# 🏋️ Harness de charge hors ligne (Linux)
+# =========================================
+# Fait tourner le vrai pipeline (ExtractionThread → faux navigateurs → CloseBrowserThread →
+# Send_Status) contre un serveur de reporting local et mesure, pour N jobs synthétiques :
+# latence de bout en bout, CPU et mémoire du processus d'orchestration.
+#
+#   python loadHarness.py --jobs 10,100,1000 --parallel 20 --delay uniform:1:3 --out load.json
+#   python loadHarness.py --replay Tools/recordings/run_<...>.jsonl.gz --speed 10
+#   python loadHarness.py --jobs 100 --engine          (moteur asyncio au lieu des QThread)
+DEFAULT_JOBS           = "10"
+DEFAULT_PARALLEL       = 10
+DEFAULT_DELAY          = "uniform:1:3"
+DEFAULT_TIMEOUT_SEC    = 1800
+SAMPLE_INTERVAL_SEC    = 0.2
+FAKE_BROWSER_SCRIPT    = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fakeBrowser.py")
+
+STUB_ROUTES = {
+    "h_new.php": "save_email",
+    "email_status.php": "send_status",
+    "SaveProcess.php": "save_process",
+}
+
+
+
+
+
+
+# 🌐 Serveur de reporting factice (processus séparé : son CPU n'est pas compté dans l'orchestration)
+# En rejeu, `latency_script` donne la suite des latences enregistrées par route (rejouées dans l'ordre).
+def Run_Stub_Server(port_queue, events_path, latency_ms, latency_script=None):
+
+    counter = {"next_id": 1000}
+    script_position = defaultdict(int)
+    latency_script = latency_script or {}
+    lock = threading.Lock()
+    events = open(events_path, "a", encoding="utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+            route = next((name for key, name in STUB_ROUTES.items() if key in self.path), None)
+            if route is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            delay_ms = latency_ms
+            scripted = latency_script.get(route)
+            if scripted:
+                with lock:
+                    delay_ms = scripted[script_position[route] % len(scripted)]
+                    script_position[route] += 1
+            if delay_ms:
+                time.sleep(delay_ms / 1000.0)
+            with lock:
+                event = {"route": route, "ts": time.time()}
+                if route == "save_email":
+                    counter["next_id"] += 1
+                    body = str(counter["next_id"])
+                    event.update(email=form.get("email"), id=body)
+                else:
+                    body = "OK"
+                    event.update(id=form.get("id"), status=form.get("status"), error=form.get("error"))
+                events.write(json.dumps(event) + "\n")
+                events.flush()
+
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+
+
+
+
+# 🤖 Exécutable "navigateur" : script shell qui relance fakeBrowser.py avec la distribution voulue
+def Write_Fake_Browser(workspace, downloads, delay, fail_rate, script_path=None) -> str:
+    path = os.path.join(workspace, "fake-browser")
+    script_arg = f'--script "{script_path}" ' if script_path else ""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("#!/bin/sh\n")
+        f.write(f'exec "{sys.executable}" "{FAKE_BROWSER_SCRIPT}" --downloads "{downloads}" '
+                f'--delay "{delay}" --fail-rate {fail_rate} {script_arg}"$@"\n')
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def Synthetic_Jobs(count, emails=None) -> List[Dict]:
+    emails = emails or [f"load{i:05d}@example.com" for i in range(count)]
+    return [
+        {
+            "email": email, "password_email": "x", "ip_address": "127.0.0.1",
+            "port": "3128", "login": "proxy", "password": "proxy", "recovery_email": "r@example.com",
+            "new_recovery_email": "n@example.com",
+        }
+        for email in emails
+    ]
+
+
+# 🎬 Plan de rejeu depuis un enregistrement (.jsonl.gz) ou un plan déjà construit (.json)
+def Load_Replay_Plan(path, speed) -> Dict:
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return Build_Replay_Plan(Load_Recording(path), speed)
+
+
+
+
+
+
+# 📈 Échantillonne CPU et RSS du processus d'orchestration
+class ResourceSampler:
+
+    def __init__(self, interval=SAMPLE_INTERVAL_SEC):
+        self.process = psutil.Process()
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.rss_samples = []
+        self.thread = threading.Thread(target=self._Loop, name="ResourceSampler", daemon=True)
+
+    def Start(self):
+        times = self.process.cpu_times()
+        self.cpu_start = times.user + times.system
+        self.rss_start = self.process.memory_info().rss
+        self.thread.start()
+
+    def _Loop(self):
+        while not self.stop_event.wait(self.interval):
+            self.rss_samples.append(self.process.memory_info().rss)
+
+    def Stop(self) -> Dict:
+        self.stop_event.set()
+        self.thread.join(timeout=2)
+        times = self.process.cpu_times()
+        rss_end = self.process.memory_info().rss
+        mb = 1024 * 1024
+        return {
+            "cpu_sec": round(times.user + times.system - self.cpu_start, 3),
+            "rss_start_mb": round(self.rss_start / mb, 1),
+            "rss_peak_mb": round(max(self.rss_samples + [rss_end]) / mb, 1),
+            "rss_end_mb": round(rss_end / mb, 1),
+        }
+
+
+
+
+
+
+def Latency_Stats(values) -> Dict:
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "p50_sec": round(Percentile(values, 50), 3),
+        "p95_sec": round(Percentile(values, 95), 3),
+        "max_sec": round(max(values), 3),
+    }
+
+
+def Read_Events(events_path) -> List[Dict]:
+    if not os.path.exists(events_path):
+        return []
+    with open(events_path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+
+
+
+
+# 🧵 Pipeline historique : ExtractionThread + CloseBrowserThread, pilotés par un QTimer
+def Run_Threads(app, extraction, state, started, args):
+    import AppV2
+    from PyQt6.QtCore import QTimer
+
+    def New_Monitor():
+        monitor = AppV2.CloseBrowserThread("edge", "loadharness", "harness")
+        monitor.start()
+        state["monitor"] = monitor
+        state["monitor_restarts"] += 1
+
+    def Tick():
+        monitor = state["monitor"]
+        if time.time() - started > args.timeout:
+            state["timed_out"] = True
+            extraction.stop_flag = True
+            if monitor:
+                monitor.stop_flag = True
+            app.quit()
+            return
+        # CloseBrowserThread s'arrête dès que PROCESS_PIDS est vide : il est (re)lancé quand des
+        # navigateurs tournent. Chaque relance signale une fenêtre où la surveillance s'est arrêtée trop tôt.
+        if AppV2.PROCESS_PIDS and (monitor is None or monitor.isFinished()):
+            New_Monitor()
+        if extraction.isFinished() and (monitor is None or monitor.isFinished()) and not AppV2.PROCESS_PIDS:
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(Tick)
+    timer.start(100)
+    extraction.start()
+    app.exec()
+    timer.stop()
+
+
+
+
+
+
+# ⏩ Rejeu : les attentes fixes du pipeline (boucle d'extraction, délai de démarrage et scan des
+# téléchargements) sont compressées par `speed` comme le trafic enregistré. Valeurs de l'enregistrement
+# (run_start) si présentes, sinon valeurs par défaut d'AppV2 ; --loop-ms / --start-delay / --poll-sec priment.
+def Apply_Replay_Waits(args, plan, app):
+    speed = plan.get("speed") or 1.0
+    if args.loop_ms is None:
+        args.loop_ms = plan.get("loop_ms") or max(1, int(app.EXTRACTION_LOOP_INTERVAL_MS / speed))
+    if args.start_delay is None:
+        start_delay = plan.get("start_delay_sec")
+        args.start_delay = start_delay if start_delay is not None else app.CLOSE_MONITOR_START_DELAY_SEC / speed
+    if args.poll_sec is None:
+        args.poll_sec = plan.get("poll_sec") or app.CLOSE_MONITOR_POLL_INTERVAL_SEC / speed
+
+
+
+
+
+
+# 🏁 Un run complet pour N jobs, dans un processus neuf (l'état global d'AppV2 n'est pas réutilisable)
+def Run_Once(args) -> Dict:
+    workspace = tempfile.mkdtemp(prefix="automail_load_")
+    dirs = {name: os.path.join(workspace, name) for name in ("appdata", "downloads", "extensions", "logs", "tools")}
+    for path in dirs.values():
+        os.makedirs(path, exist_ok=True)
+
+    os.environ["APPDATA"] = dirs["appdata"]
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    plan = Load_Replay_Plan(args.replay, args.speed) if args.replay else None
+    script_path = None
+    if plan:
+        args.jobs = len(plan["jobs"])
+        args.parallel = args.parallel_override or plan["parallel"]
+        script_path = os.path.join(workspace, "replay_script.json")
+        with open(script_path, "w", encoding="utf-8") as f:
+            json.dump({job["email"]: job for job in plan["jobs"]}, f)
+
+    events_path = os.path.join(workspace, "stub_events.jsonl")
+    port_queue = multiprocessing.Queue()
+    stub = multiprocessing.Process(
+        target=Run_Stub_Server,
+        args=(port_queue, events_path, args.api_latency_ms, plan["api_latency_ms"] if plan else None),
+        daemon=True,
+    )
+    stub.start()
+    stub_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+
+    quiet = open(os.devnull, "w") if not args.verbose else None
+    redirect = contextlib.redirect_stdout(quiet) if quiet else contextlib.nullcontext()
+
+    with redirect:
+        import pytz
+        from PyQt6.QtCore import QCoreApplication, QTimer
+        import AppV2
+        from runHistory import RunHistoryStore
+        from jobRegistry import JobRegistry
+        from profileStore import ProfileStore
+
+        # Le pipeline réel, branché sur l'espace de travail temporaire et le serveur factice
+        AppV2._SAVE_EMAIL_API = f"{stub_url}/pub/h_new.php"
+        AppV2._SEND_STATUS_API = f"{stub_url}/rep/pub/email_status.php"
+        AppV2._SAVE_PROCESS_API = f"{stub_url}/pub/SaveProcess.php"
+        AppV2.BASE_DIRECTORY = dirs["extensions"]
+        AppV2.LOGS_DIRECTORY = dirs["logs"]
+        AppV2.RESULT_FILE_PATH = os.path.join(dirs["tools"], "result.txt")
+        AppV2.RUN_HISTORY = RunHistoryStore(os.path.join(dirs["tools"], "run_history.db"))
+        AppV2.JOB_REGISTRY = JobRegistry(os.path.join(dirs["tools"], "jobs.db"))
+        AppV2.PROFILE_STORE = ProfileStore(os.path.join(dirs["tools"], "Profiles"))
+        now = datetime.datetime.now()
+        AppV2.CURRENT_DATE = now.strftime("%Y-%m-%d")
+        AppV2.CURRENT_HOUR = now.strftime("%H-%M-%S")
+        if plan:
+            Apply_Replay_Waits(args, plan, AppV2)
+        if args.loop_ms is not None:
+            AppV2.EXTRACTION_LOOP_INTERVAL_MS = args.loop_ms
+        if args.start_delay is not None:
+            AppV2.CLOSE_MONITOR_START_DELAY_SEC = args.start_delay
+        if args.poll_sec is not None:
+            AppV2.CLOSE_MONITOR_POLL_INTERVAL_SEC = args.poll_sec
+        AppV2.JOB_TRACER.Reset()
+
+        session_date = datetime.datetime.now(pytz.timezone("Africa/Casablanca")).strftime("%Y-%m-%d %H:%M:%S")
+        with open(AppV2.SESSION_PATH, "w", encoding="utf-8") as f:
+            f.write(AppV2.encrypt_message(f"loadharness::{session_date}::harness", AppV2.KEY))
+
+        fake_browser = Write_Fake_Browser(workspace, dirs["downloads"], args.delay, args.fail_rate, script_path)
+        app = QCoreApplication.instance() or QCoreApplication([])
+
+        sampler = ResourceSampler()
+        sampler.Start()
+        started = time.time()
+
+        jobs = Synthetic_Jobs(args.jobs, [job["email"] for job in plan["jobs"]] if plan else None)
+        AppV2.user_downloads_dir = lambda: dirs["downloads"]
+        state = {"monitor": None, "monitor_restarts": -1, "timed_out": False}
+
+        if args.engine:
+            engine_signals = AppV2.Start_Orchestration_Engine(
+                jobs, args.parallel, fake_browser, None, "edge", "harness", "harness", [], "loadharness"
+            )
+
+            def Engine_Tick():
+                if time.time() - started > args.timeout:
+                    state["timed_out"] = True
+                    engine_signals.stop_flag = True
+                if not engine_signals.isRunning():
+                    app.quit()
+
+            timer = QTimer()
+            timer.timeout.connect(Engine_Tick)
+            timer.start(100)
+            app.exec()
+            timer.stop()
+            extraction = engine_signals
+
+        else:
+            extraction = AppV2.ExtractionThread(
+                jobs, AppV2.SESSION_ID, args.parallel, fake_browser, dirs["extensions"],
+                None, "edge", "harness", "harness", []
+            )
+            Run_Threads(app, extraction, state, started, args)
+
+        wall = time.time() - started
+        resources = sampler.Stop()
+        extraction.wait(5000)
+        if state["monitor"]:
+            state["monitor"].wait(5000)
+        trace_summary = AppV2.JOB_TRACER.Summary()
+
+
+    for pid in list(AppV2.PROCESS_PIDS):
+        with contextlib.suppress(OSError):
+            os.kill(pid, signal.SIGTERM)
+    stub.terminate()
+
+    events = Read_Events(events_path)
+    saved = {e["id"]: e for e in events if e["route"] == "save_email"}
+    statuses = [e for e in events if e["route"] == "send_status"]
+    end_to_end = [e["ts"] - started for e in statuses]
+    service = [e["ts"] - saved[e["id"]]["ts"] for e in statuses if e.get("id") in saved]
+
+    report = {
+        "engine": "asyncio" if args.engine else "qthread",
+        "replay": {"source": args.replay, "speed": args.speed, "loop_ms": args.loop_ms,
+                   "start_delay_sec": args.start_delay, "poll_sec": args.poll_sec} if plan else None,
+        "jobs": args.jobs,
+        "parallel": args.parallel,
+        "delay": args.delay,
+        "completed": len(statuses),
+        "failed_status": sum(1 for e in statuses if e.get("status") != "OK"),
+        "timed_out": state["timed_out"],
+        "monitor_restarts": max(state["monitor_restarts"], 0),
+        "wall_sec": round(wall, 2),
+        "throughput_jobs_per_min": round(len(statuses) / wall * 60, 2) if wall else 0.0,
+        "latency_end_to_end": Latency_Stats(end_to_end),
+        "latency_save_to_status": Latency_Stats(service),
+        "orchestration": resources,
+        "cpu_ms_per_job": round(resources["cpu_sec"] * 1000 / max(len(statuses), 1), 2),
+        "stages": trace_summary,
+    }
+
+    if args.keep:
+        report["workspace"] = workspace
+    else:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return report
+
+
+
+
+
+
+def Format_Report(report) -> str:
+    e2e, svc, res = report["latency_end_to_end"], report["latency_save_to_status"], report["orchestration"]
+    out = [
+        f"🏋️ N={report['jobs']}  parallèle={report['parallel']}  "
+        + (f"rejeu x{report['replay']['speed']:g}" if report.get("replay") else f"délai={report['delay']}"),
+        f"   terminés {report['completed']}/{report['jobs']}  échecs={report['failed_status']}  "
+        f"timeout={report['timed_out']}  relances surveillance={report['monitor_restarts']}",
+        f"   durée {report['wall_sec']} s  débit {report['throughput_jobs_per_min']} jobs/min",
+        f"   latence bout en bout  p50={e2e.get('p50_sec')} s  p95={e2e.get('p95_sec')} s  max={e2e.get('max_sec')} s",
+        f"   save → status         p50={svc.get('p50_sec')} s  p95={svc.get('p95_sec')} s  max={svc.get('max_sec')} s",
+        f"   CPU orchestration {res['cpu_sec']} s ({report['cpu_ms_per_job']} ms/job)  "
+        f"RSS {res['rss_start_mb']} → pic {res['rss_peak_mb']} → {res['rss_end_mb']} Mo",
+    ]
+    for stage, s in report["stages"].items():
+        out.append(f"      {stage:<20}{s['count']:>7}  p50={s['p50_ms']} ms  p95={s['p95_ms']} ms")
+    return "\n".join(out)
+
+
+
+
+
+
+def Parse_Args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline end-to-end load harness for the AppV2 pipeline")
+    parser.add_argument("--jobs", default=DEFAULT_JOBS, help="job counts, comma separated (e.g. 10,100,1000)")
+    parser.add_argument("--parallel", type=int, default=None, help=f"concurrent browsers (entered_number, default {DEFAULT_PARALLEL})")
+    parser.add_argument("--delay", default=DEFAULT_DELAY, help="fake browser duration: fixed:S, uniform:A:B, lognormal:MU:SIGMA, exp:MEAN")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--api-latency-ms", type=int, default=0)
+    parser.add_argument("--loop-ms", type=int, default=None, help="override EXTRACTION_LOOP_INTERVAL_MS")
+    parser.add_argument("--start-delay", type=float, default=None, help="override CLOSE_MONITOR_START_DELAY_SEC")
+    parser.add_argument("--poll-sec", type=float, default=None, help="override CLOSE_MONITOR_POLL_INTERVAL_SEC")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC)
+    parser.add_argument("--out", help="write the JSON report(s) to this file")
+    parser.add_argument("--keep", action="store_true", help="keep the temporary workspace")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline output")
+    parser.add_argument("--engine", action="store_true", help="run on the asyncio orchestration engine")
+    parser.add_argument("--replay", help="recording (.jsonl.gz) or replay plan (.json) to replay")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay time compression (10 = ten times faster), also applied to the pipeline's fixed waits")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    args.parallel_override = args.parallel
+    args.parallel = args.parallel or DEFAULT_PARALLEL
+    return args
+
+
+def main(argv=None):
+    args = Parse_Args(argv)
+
+    if args.single:
+        args.jobs = int(args.jobs)
+        print(json.dumps(Run_Once(args)))
+        return 0
+
+    reports = []
+    passthrough = [a for a in (argv if argv is not None else sys.argv[1:])]
+    counts = [0] if args.replay else [int(n) for n in str(args.jobs).split(",") if n.strip()]
+    for count in counts:
+        child_args = [a for i, a in enumerate(passthrough)
+                      if a != "--jobs" and not (i > 0 and passthrough[i - 1] == "--jobs") and not a.startswith("--jobs=")
+                      and a != "--out" and not (i > 0 and passthrough[i - 1] == "--out") and not a.startswith("--out=")]
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--single", "--jobs", str(count)] + child_args,
+            stdout=subprocess.PIPE, text=True,
+        )
+        lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+        if result.returncode != 0 or not lines:
+            print(f"❌ Run N={count} en échec (code {result.returncode})")
+            continue
+        report = json.loads(lines[-1])
+        reports.append(report)
+        print(Format_Report(report))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    return 0 if reports else 1
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
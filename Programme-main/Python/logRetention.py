@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import shutil
+import zipfile
+import threading
+import datetime
+from typing import Optional, List, Dict
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("retention")
+
+
+
+
+# =========================================
+# 🧹 Politique de rétention par défaut
+# =========================================
+RETENTION_MAX_SESSIONS   = 4            # nombre de dossiers de session conservés
+RETENTION_MAX_AGE_DAYS   = 7            # âge maximum d'une session (jours)
+RETENTION_MAX_TOTAL_MB   = 512          # taille totale maximum du dossier logs
+RETENTION_INTERVAL_SEC   = 600          # période du passage en arrière-plan
+RETENTION_REPORT_FILE    = "retention.jsonl"
+ARCHIVE_SUFFIX           = ".zip"
+RETENTION_COMPRESS_ENV   = "AUTOMAIL_LOG_COMPRESS"   # "1" : sessions expirées zippées au lieu d'être supprimées
+
+
+
+
+
+
+def Compress_From_Env() -> bool:
+    return os.environ.get(RETENTION_COMPRESS_ENV, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+# 📏 Calcule la taille totale (octets) d'un fichier ou d'un dossier
+def Get_Path_Size(path: str) -> int:
+    if os.path.isfile(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+
+
+
+
+# Gestionnaire de rétention du dossier LOGS_DIRECTORY.
+# Exécuté une fois au démarrage de la session puis périodiquement en arrière-plan,
+# au lieu de lister / trier / supprimer les dossiers pour chaque email traité.
+class LogRetentionManager:
+
+    def __init__(self, logs_directory, max_sessions=RETENTION_MAX_SESSIONS, max_age_days=RETENTION_MAX_AGE_DAYS,
+                 max_total_mb=RETENTION_MAX_TOTAL_MB, compress=None, interval=RETENTION_INTERVAL_SEC):
+        self.logs_directory = os.path.abspath(logs_directory)
+        self.max_sessions = max_sessions
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_mb * 1024 * 1024 if max_total_mb else None
+        self.compress = Compress_From_Env() if compress is None else compress
+        self.interval = interval
+        self.report_path = os.path.join(self.logs_directory, RETENTION_REPORT_FILE)
+
+        self.protected = set()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+
+    def Protect(self, path):
+        # Un dossier protégé (session en cours) n'est jamais supprimé ni compressé
+        with self.lock:
+            self.protected.add(os.path.abspath(path))
+
+
+    def List_Sessions(self) -> List[Dict]:
+        # Retourne les sessions (dossiers et archives) triées de la plus ancienne à la plus récente
+        if not os.path.isdir(self.logs_directory):
+            return []
+
+        sessions = []
+        for entry in os.scandir(self.logs_directory):
+            is_archive = entry.is_file() and entry.name.endswith(ARCHIVE_SUFFIX)
+            if not entry.is_dir() and not is_archive:
+                continue
+            try:
+                ctime = entry.stat().st_ctime
+            except OSError:
+                continue
+            sessions.append({
+                "path": os.path.abspath(entry.path),
+                "name": entry.name,
+                "ctime": ctime,
+                "archived": is_archive,
+            })
+
+        sessions.sort(key=lambda s: s["ctime"])
+        return sessions
+
+
+    def Select_Expired(self, sessions: List[Dict], now: float) -> List[Dict]:
+        # Applique les politiques âge / nombre / taille totale et retourne les sessions à traiter
+        with self.lock:
+            candidates = [s for s in sessions if s["path"] not in self.protected]
+
+        expired = {}
+
+        if self.max_age_days is not None:
+            limit = now - self.max_age_days * 86400
+            for s in candidates:
+                if s["ctime"] < limit:
+                    expired[s["path"]] = s
+
+        if self.max_sessions is not None:
+            live = [s for s in candidates if not s["archived"] and s["path"] not in expired]
+            # Les sessions protégées comptent dans le quota mais ne sont jamais retirées
+            overflow = len(live) + (len(sessions) - len(candidates)) - self.max_sessions
+            for s in live[:max(0, overflow)]:
+                expired[s["path"]] = s
+
+        if self.max_total_bytes is not None:
+            sizes = {s["path"]: Get_Path_Size(s["path"]) for s in sessions}
+            total = sum(size for path, size in sizes.items() if path not in expired)
+            for s in candidates:
+                if total <= self.max_total_bytes:
+                    break
+                if s["path"] in expired:
+                    continue
+                expired[s["path"]] = s
+                total -= sizes[s["path"]]
+
+        return [s for s in candidates if s["path"] in expired]
+
+
+    def Compress_Session(self, session: Dict) -> int:
+        # Compresse un dossier de session en archive ZIP puis supprime le dossier.
+        # Retourne le nombre d'octets récupérés.
+        source = session["path"]
+        archive_path = source + ARCHIVE_SUFFIX
+        before = Get_Path_Size(source)
+
+        tmp_path = archive_path + ".tmp"
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for root, _, files in os.walk(source):
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    zipf.write(file_path, os.path.relpath(file_path, os.path.dirname(source)))
+        os.replace(tmp_path, archive_path)
+        shutil.rmtree(source)
+
+        return max(0, before - Get_Path_Size(archive_path))
+
+
+    def Run_Once(self) -> Dict:
+        # Un passage complet de rétention : retourne (et enregistre) ce qui a été récupéré
+        now = time.time()
+        report = {
+            "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "deleted": [],
+            "compressed": [],
+            "errors": [],
+            "reclaimed_bytes": 0,
+        }
+
+        for session in self.Select_Expired(self.List_Sessions(), now):
+            try:
+                if self.compress and not session["archived"]:
+                    report["reclaimed_bytes"] += self.Compress_Session(session)
+                    report["compressed"].append(session["name"])
+                else:
+                    size = Get_Path_Size(session["path"])
+                    if session["archived"]:
+                        os.remove(session["path"])
+                    else:
+                        shutil.rmtree(session["path"])
+                    report["reclaimed_bytes"] += size
+                    report["deleted"].append(session["name"])
+            except Exception as e:
+                report["errors"].append(f"{session['name']}: {e}")
+
+        if report["deleted"] or report["compressed"] or report["errors"]:
+            self.Record_Report(report)
+        return report
+
+
+    def Record_Report(self, report: Dict):
+        try:
+            os.makedirs(self.logs_directory, exist_ok=True)
+            with open(self.report_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+        except Exception as e:
+            LOG.warning("⚠️ [RETENTION] Impossible d'écrire le rapport : %s", e)
+
+
+    def Start(self):
+        # Passage immédiat puis boucle en arrière-plan (thread démon)
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._Loop, name="LogRetention", daemon=True)
+        self.thread.start()
+
+
+    def Stop(self):
+        self.stop_event.set()
+
+
+    def _Loop(self):
+        while not self.stop_event.is_set():
+            try:
+                self.Run_Once()
+            except Exception as e:
+                LOG.warning("⚠️ [RETENTION] Erreur pendant le nettoyage des logs : %s", e)
+            self.stop_event.wait(self.interval)
@@ -0,0 +1,241 @@
+import os
+import io
+import re
+import json
+import gzip
+import threading
+import datetime
+from typing import Iterator, Optional, Dict
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+
+
+# =========================================
+# 📦 Paramètres du journal compressé
+# =========================================
+SINK_BASE_NAME        = "browser_logs"
+SINK_MAX_FILE_MB      = 64          # rotation quand le fichier courant dépasse cette taille
+SINK_BLOCK_RECORDS    = 128         # nombre d'enregistrements par bloc compressé
+SINK_BLOCK_BYTES      = 256 * 1024  # ou taille (non compressée) d'un bloc
+ZSTD_LEVEL            = 6
+
+CODEC_EXTENSIONS = {
+    "zstd": ".jsonl.zst",
+    "gzip": ".jsonl.gz",
+}
+
+
+
+
+
+
+# 🔧 Choisit le codec disponible : zstd si le module est installé, sinon gzip
+def Default_Codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+
+
+
+
+# 🗜️ Compresse un bloc complet en une trame indépendante (membre gzip / trame zstd).
+# Les trames concaténées restent lisibles d'un seul flux à la relecture.
+def Compress_Block(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+
+
+
+
+# Journal unique, en ajout seul et avec rotation, au format JSONL compressé par blocs.
+# Remplace les milliers de petits fichiers <email>_<heure>.txt : un seul descripteur ouvert,
+# une écriture par bloc au lieu d'un open/append/close par fichier de log.
+class CompressedLogSink:
+
+    def __init__(self, directory, base_name=SINK_BASE_NAME, codec=None, max_file_mb=SINK_MAX_FILE_MB,
+                 block_records=SINK_BLOCK_RECORDS, block_bytes=SINK_BLOCK_BYTES):
+        self.directory = directory
+        self.base_name = base_name
+        self.codec = codec or Default_Codec()
+        if self.codec == "zstd" and zstandard is None:
+            self.codec = "gzip"
+        self.extension = CODEC_EXTENSIONS[self.codec]
+        self.max_file_bytes = max_file_mb * 1024 * 1024
+        self.block_records = block_records
+        self.block_bytes = block_bytes
+
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.buffer_size = 0
+        self.handle = None
+        self.index = self._Last_Index()
+        self.records_written = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+
+    def _File_Path(self, index) -> str:
+        return os.path.join(self.directory, f"{self.base_name}-{index:04d}{self.extension}")
+
+
+    def _Last_Index(self) -> int:
+        if not os.path.isdir(self.directory):
+            return 1
+        pattern = re.compile(rf"^{re.escape(self.base_name)}-(\d{{4}}){re.escape(self.extension)}$")
+        indexes = [int(m.group(1)) for m in (pattern.match(f) for f in os.listdir(self.directory)) if m]
+        return max(indexes) if indexes else 1
+
+
+    @property
+    def current_path(self) -> str:
+        return self._File_Path(self.index)
+
+
+    def Append(self, record: Dict):
+        # Ajoute un enregistrement ; le bloc est compressé et écrit dès qu'il est plein
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self.lock:
+            self.buffer.append(line)
+            self.buffer_size += len(line)
+            if len(self.buffer) >= self.block_records or self.buffer_size >= self.block_bytes:
+                self._Flush_Locked()
+
+
+    def Flush(self):
+        with self.lock:
+            self._Flush_Locked()
+
+
+    def _Flush_Locked(self):
+        if not self.buffer:
+            return
+
+        block = Compress_Block(b"".join(self.buffer), self.codec)
+        count = len(self.buffer)
+        self.buffer = []
+        self.buffer_size = 0
+
+        if self.handle is None:
+            # Reprise (redémarrage après un arrêt brutal) : le dernier bloc du fichier existant peut
+            # être tronqué, on n'écrit donc jamais à sa suite ➜ nouveau fichier
+            if os.path.exists(self.current_path) and os.path.getsize(self.current_path) > 0:
+                self.index += 1
+            self.handle = open(self.current_path, "ab")
+        elif self.handle.tell() + len(block) > self.max_file_bytes and self.handle.tell() > 0:
+            # Rotation : on ferme le fichier courant et on passe à l'index suivant
+            self.handle.close()
+            self.index += 1
+            self.handle = open(self.current_path, "ab")
+
+        self.handle.write(block)
+        self.handle.flush()
+        self.records_written += count
+
+
+    def Close(self):
+        with self.lock:
+            self._Flush_Locked()
+            if self.handle is not None:
+                self.handle.close()
+                self.handle = None
+
+
+
+
+
+
+# 📖 Ouvre un fichier du journal en lecture texte, quelle que soit sa compression
+def Open_Sink_File(path) -> io.TextIOBase:
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("Le module 'zstandard' est requis pour relire les fichiers .zst")
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+
+
+
+
+# ⚠️ Fin de fichier illisible : bloc tronqué ou CRC invalide laissé par un arrêt brutal
+def _Is_Truncated_Block_Error(error) -> bool:
+    if isinstance(error, (EOFError, gzip.BadGzipFile)):
+        return True
+    if zstandard is not None and isinstance(error, zstandard.ZstdError):
+        return True
+    return isinstance(error, OSError) and ("truncated" in str(error).lower() or "Compressed file ended" in str(error))
+
+
+# 🔁 Relit de façon transparente tous les enregistrements d'un fichier ou d'un dossier de journal.
+# Filtre optionnel sur l'email ; un bloc final tronqué (arrêt brutal) est ignoré : la relecture du
+# fichier s'arrête là et passe au suivant (le sink ne réécrit jamais à la suite d'un tel bloc).
+def Read_Records(path, email: Optional[str] = None, base_name=SINK_BASE_NAME) -> Iterator[Dict]:
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(path, f) for f in os.listdir(path)
+            if f.startswith(base_name + "-") and any(f.endswith(ext) for ext in CODEC_EXTENSIONS.values())
+        )
+    else:
+        files = [path]
+
+    for file_path in files:
+        try:
+            with Open_Sink_File(file_path) as reader:
+                for line in reader:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if email is None or record.get("email") == email:
+                        yield record
+        except Exception as e:
+            if not _Is_Truncated_Block_Error(e):
+                raise
+
+
+
+
+
+
+# 🧾 Construit l'enregistrement d'un fichier log ingéré
+def Make_Log_Record(email, session, session_id, source, content) -> Dict:
+    return {
+        "email": email,
+        "session": session,
+        "session_id": session_id,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "source": source,
+        "content": content,
+    }
+
+
+
+
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Utilisation : python logSink.py <dossier_ou_fichier> [email]
+    if len(sys.argv) < 2:
+        print("Usage : python logSink.py <dossier_ou_fichier> [email]")
+        sys.exit(1)
+
+    for rec in Read_Records(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None):
+        print(f"===== {rec.get('timestamp')} | {rec.get('email')} | {rec.get('source')} =====")
+        print(rec.get("content", ""))
@@ -0,0 +1,222 @@
+import os
+import gc
+import json
+import threading
+import tracemalloc
+import datetime
+from collections import Counter
+from typing import Optional, Dict, List
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("memory")
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+
+
+# =========================================
+# 🧠 Suivi mémoire longue durée
+# =========================================
+MEMTRACK_ENV           = "AUTOMAIL_MEMTRACK"
+MEMTRACK_INTERVAL_ENV  = "AUTOMAIL_MEMTRACK_INTERVAL_SEC"
+DEFAULT_INTERVAL_SEC   = 300
+TRACEMALLOC_FRAMES     = 10
+TOP_GROWTH             = 25
+OBJECT_MODULE_PREFIX   = "PyQt6"
+MEMTRACK_SUMMARY_FILE  = "memory.jsonl"
+
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+
+
+
+
+# 🧩 Mode activé par la variable d'environnement
+def Enabled_From_Env() -> bool:
+    return os.environ.get(MEMTRACK_ENV, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+
+
+
+
+# 🔢 Compte les objets vivants par classe pour les types d'un module donné (PyQt6 par défaut).
+# Seuls les objets ayant un wrapper Python sont visibles : QLabel créés depuis Python, badges, etc.
+def Count_Objects(module_prefix=OBJECT_MODULE_PREFIX) -> Counter:
+    counts = Counter()
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if (cls.__module__ or "").startswith(module_prefix):
+            counts[cls.__name__] += 1
+    return counts
+
+
+
+
+
+
+# 📏 Mémoire résidente du processus (Mo)
+def Rss_Mb() -> Optional[float]:
+    if psutil is None:
+        return None
+    return round(psutil.Process().memory_info().rss / (1024 * 1024), 1)
+
+
+
+
+
+
+# Un point de mesure : snapshot tracemalloc + compteurs d'objets + RSS
+class MemoryPoint:
+
+    def __init__(self, label):
+        self.label = label
+        self.time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        self.objects = Count_Objects()
+        self.traced_mb = round(tracemalloc.get_traced_memory()[0] / (1024 * 1024), 1)
+        self.rss_mb = Rss_Mb()
+
+
+
+
+
+
+# Mode diagnostic mémoire : snapshots périodiques + marqueurs de session.
+# Chaque rapport compare au point précédent, au début de la session précédente et au démarrage,
+# et liste les plus fortes croissances (lignes de code et classes Qt).
+class MemoryTracker:
+
+    def __init__(self, report_dir, interval_sec=None, top_n=TOP_GROWTH):
+        self.report_dir = report_dir
+        self.interval = interval_sec or int(os.environ.get(MEMTRACK_INTERVAL_ENV, DEFAULT_INTERVAL_SEC))
+        self.top_n = top_n
+
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.baseline: Optional[MemoryPoint] = None
+        self.previous: Optional[MemoryPoint] = None
+        self.last_session: Optional[MemoryPoint] = None
+        self.sequence = 0
+
+
+    @property
+    def running(self) -> bool:
+        return self.baseline is not None
+
+
+    def Start(self):
+        if self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.baseline = self.previous = MemoryPoint("startup")
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._Loop, name="MemoryTracker", daemon=True)
+        self.thread.start()
+
+
+    def Stop(self) -> Optional[str]:
+        if not self.running:
+            return None
+        self.stop_event.set()
+        path = self.Take_Point("shutdown")
+        tracemalloc.stop()
+        self.baseline = self.previous = self.last_session = None
+        return path
+
+
+    def Mark_Session(self, label) -> Optional[str]:
+        # Marqueur de début de session : le rapport compare aussi à la session précédente
+        if not self.running:
+            return None
+        return self.Take_Point(label, session=True)
+
+
+    def _Loop(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.Take_Point("periodic")
+            except Exception as e:
+                LOG.warning("⚠️ [MEMORY] Erreur pendant la mesure mémoire : %s", e)
+
+
+    def Take_Point(self, label, session=False) -> str:
+        point = MemoryPoint(label)
+        with self.lock:
+            comparisons = [("previous", self.previous), ("baseline", self.baseline)]
+            if session and self.last_session is not None:
+                comparisons.insert(0, ("previous session", self.last_session))
+            path = self.Write_Report(point, [(name, ref) for name, ref in comparisons if ref is not None])
+            self.previous = point
+            if session:
+                self.last_session = point
+        return path
+
+
+    def Top_Growth(self, current: MemoryPoint, reference: MemoryPoint) -> Dict[str, List]:
+        lines = [
+            stat for stat in current.snapshot.compare_to(reference.snapshot, "lineno")
+            if stat.size_diff > 0
+        ][:self.top_n]
+        objects = Counter(current.objects)
+        objects.subtract(reference.objects)
+        return {
+            "lines": [
+                {
+                    "where": f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in lines
+            ],
+            "objects": [(name, diff) for name, diff in objects.most_common(self.top_n) if diff > 0],
+        }
+
+
+    def Write_Report(self, point: MemoryPoint, comparisons) -> str:
+        os.makedirs(self.report_dir, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.sequence += 1
+        path = os.path.join(self.report_dir, f"memory_{stamp}_{self.sequence:03d}.txt")
+
+        summary = {
+            "time": point.time, "label": point.label,
+            "traced_mb": point.traced_mb, "rss_mb": point.rss_mb,
+            "qt_objects": sum(point.objects.values()),
+        }
+
+        out = [f"🧠 {point.time} [{point.label}]  traced={point.traced_mb} Mo  rss={point.rss_mb} Mo  "
+               f"objets Qt={summary['qt_objects']}"]
+        for name, reference in comparisons:
+            growth = self.Top_Growth(point, reference)
+            out.append("")
+            out.append(f"===== Croissance depuis {name} ({reference.label} @ {reference.time}) =====")
+            out.append(f"traced: {point.traced_mb - reference.traced_mb:+.1f} Mo")
+            out.append("-- Lignes --")
+            for entry in growth["lines"]:
+                out.append(f"  {entry['size_diff_kb']:>10} Ko  {entry['count_diff']:>+8}  {entry['where']}")
+            out.append("-- Objets Qt --")
+            for cls_name, diff in growth["objects"]:
+                out.append(f"  {diff:>+8}  {cls_name}")
+            if name == "previous session":
+                summary["session_growth_objects"] = dict(growth["objects"][:10])
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(out) + "\n")
+        with open(os.path.join(self.report_dir, MEMTRACK_SUMMARY_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        return path
@@ -0,0 +1,420 @@
+import os
+import re
+import time
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("engine")
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+
+
+# =========================================
+# ⚙️ Moteur d'orchestration asyncio (une seule boucle d'événements)
+# =========================================
+# Remplace, quand AUTOMAIL_ASYNC_ENGINE=1, les trois QThread qui sondent chaque seconde
+# (ExtractionThread, CloseBrowserThread, LogsDisplayThread) :
+#   - ordonnancement des jobs : un sémaphore de N navigateurs, create_subprocess_exec + attente de fin
+#   - ingestion des fichiers du dossier Téléchargements : un seul scanner, actif seulement s'il y a des jobs
+#   - appels API : client HTTP asynchrone (aiohttp si installé, sinon requests dans l'exécuteur)
+#   - diffusion des logs : file asyncio, sans sondage
+# Le code métier (préparation d'un job, traitement d'un fichier de session) reste dans AppV2 et
+# est appelé via EngineHooks dans l'exécuteur ; Qt ne voit que des signaux (adaptateur dans AppV2).
+ENGINE_ENV             = "AUTOMAIL_ASYNC_ENGINE"
+SCAN_INTERVAL_SEC      = 1.0      # scan du dossier Téléchargements tant qu'un navigateur tourne
+EXIT_GRACE_SEC         = 60.0     # processus terminé sans fichier de session : attente avant abandon
+CLOSE_TIMEOUT_SEC      = 15.0     # fichier de session traité : attente de la fin du processus avant kill
+API_RETRY_DELAY_SEC    = 5.0
+EXTRA_WORKERS          = 4        # threads de l'exécuteur en plus d'un par navigateur
+
+# <session>_<email>_<status>_<pid>.txt (le domaine de l'email ne contient pas de "_")
+SESSION_FILE_PATTERN = r"^{session}_(?P<email>.+?@[A-Za-z0-9.-]+)_(?P<status>.+)_(?P<pid>\d+)\.txt$"
+
+
+
+
+
+
+class OrchestrationAbort(Exception):
+    """Raised by job preparation to stop the whole run (the message is shown to the user)."""
+
+
+
+
+
+
+# 🧩 Moteur activé par la variable d'environnement
+def Enabled_From_Env() -> bool:
+    return os.environ.get(ENGINE_ENV, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+
+
+
+
+# Points d'extension appelés par le moteur. Les méthodes synchrones tournent dans l'exécuteur
+# (elles peuvent bloquer) ; aucune n'est appelée depuis le thread Qt.
+class EngineHooks:
+
+    def begin(self) -> bool:
+        # Avant le premier job ; False annule le run
+        return True
+
+    def prepare(self, job) -> Optional[Dict]:
+        # → {"email", "command", ...} ou None pour ignorer le job ; OrchestrationAbort arrête le run
+        raise NotImplementedError
+
+    def spawned(self, launch, pid):
+        pass
+
+    def session_file(self, file_name):
+        pass
+
+    def log_file(self, file_name):
+        pass
+
+    def scanned(self, session_files, log_files):
+        pass
+
+    def scan_done(self):
+        pass
+
+    def lost(self, launch, returncode):
+        pass
+
+    def log(self, text):
+        pass
+
+    def stopped(self, message):
+        pass
+
+    def finished(self, summary):
+        pass
+
+
+
+
+
+
+# 🌐 Client HTTP asynchrone : aiohttp si disponible, sinon requests dans l'exécuteur du moteur
+class AsyncApiClient:
+
+    def __init__(self, headers=None, verify=True):
+        self.headers = headers or {}
+        self.verify = verify
+        self.session = None
+
+
+    async def _Post_Once(self, url, data, raise_for_status):
+        if aiohttp is not None:
+            if self.session is None:
+                self.session = aiohttp.ClientSession(headers=self.headers)
+            async with self.session.post(url, data=data, ssl=None if self.verify else False) as response:
+                if raise_for_status:
+                    response.raise_for_status()
+                return await response.text()
+
+        if requests is None:
+            raise RuntimeError("aiohttp or requests is required for API calls")
+        post = functools.partial(requests.post, url, headers=self.headers, verify=self.verify, data=data)
+        response = await asyncio.get_running_loop().run_in_executor(None, post)
+        if raise_for_status:
+            response.raise_for_status()
+        return response.text
+
+
+    async def Post(self, url, data, attempts=None, retry_delay=API_RETRY_DELAY_SEC, raise_for_status=False) -> str:
+        # attempts=None : réessaie indéfiniment (comportement de Save_Email)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._Post_Once(url, data, raise_for_status)
+            except Exception as e:
+                LOG.error("💥 [ENGINE][API] %s : %s", url, e)
+                if attempts is not None and attempt >= attempts:
+                    return ""
+                await asyncio.sleep(retry_delay)
+
+
+    async def Close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+
+
+
+
+# Moteur : une boucle asyncio dans un thread dédié. Start() rend la main immédiatement ;
+# Stop() / Log() / Call() sont utilisables depuis n'importe quel thread.
+class OrchestrationEngine:
+
+    def __init__(self, hooks: EngineHooks, parallel, downloads_folder, session_id,
+                 api: Optional[AsyncApiClient] = None, scan_interval=SCAN_INTERVAL_SEC):
+        self.hooks = hooks
+        self.parallel = max(1, int(parallel))
+        self.downloads_folder = downloads_folder
+        self.session_id = str(session_id)
+        self.api = api or AsyncApiClient()
+        self.scan_interval = scan_interval
+        self.session_pattern = re.compile(SESSION_FILE_PATTERN.format(session=re.escape(self.session_id)))
+
+        self.loop = None
+        self.thread = None
+        self.ready = threading.Event()
+        self.stop_requested = False
+        self.stats = {"jobs": 0, "spawned": 0, "completed": 0, "lost": 0, "failed": 0, "scans": 0}
+
+
+    # ---------- API publique (tous threads) ----------
+
+    def Start(self, jobs: List[Dict]):
+        self.thread = threading.Thread(target=self._Thread_Main, args=(list(jobs),), name="OrchestrationEngine", daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+
+    def Is_Running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+
+    def Join(self, timeout=None):
+        if self.thread is not None and threading.current_thread() is not self.thread:
+            self.thread.join(timeout)
+
+
+    def Stop(self):
+        self.stop_requested = True
+        if self.loop is not None and self.Is_Running():
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+
+
+    def Log(self, text):
+        if self.loop is not None and self.Is_Running():
+            try:
+                self.loop.call_soon_threadsafe(self.log_queue.put_nowait, text)
+                return
+            except RuntimeError:
+                pass    # boucle déjà fermée
+        self.hooks.log(text)
+
+
+    def Call(self, coroutine, timeout=None):
+        # Exécute une coroutine sur la boucle depuis un thread de l'exécuteur et attend son résultat
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("Call() would block the engine loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+
+    # ---------- Boucle ----------
+
+    def _Thread_Main(self, jobs):
+        try:
+            asyncio.run(self._Main(jobs))
+        finally:
+            self.ready.set()
+
+
+    async def _Main(self, jobs):
+        self.loop = asyncio.get_running_loop()
+        self.loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.parallel + EXTRA_WORKERS, thread_name_prefix="engine")
+        )
+        self.stop_event = asyncio.Event()
+        self.active_event = asyncio.Event()
+        self.log_queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(self.parallel)
+        self.prepare_lock = asyncio.Lock()
+        self.waiters: Dict[str, asyncio.Future] = {}
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        if self.stop_requested:
+            self.stop_event.set()
+        self.ready.set()
+
+        fan_out = asyncio.create_task(self._Fan_Out_Logs())
+        scanner = asyncio.create_task(self._Scan_Downloads())
+        started = time.perf_counter()
+        try:
+            if await self.loop.run_in_executor(None, self.hooks.begin):
+                await self._Schedule(jobs)
+        finally:
+            scanner.cancel()
+            await asyncio.gather(scanner, return_exceptions=True)
+            await self._Terminate_All()
+            await self.api.Close()
+            summary = dict(self.stats, wall_sec=round(time.perf_counter() - started, 3), stopped=self.stop_event.is_set())
+            await self.loop.run_in_executor(None, self.hooks.finished, summary)
+            await self._Drain_Logs()
+            fan_out.cancel()
+            await asyncio.gather(fan_out, return_exceptions=True)
+
+
+    async def _Schedule(self, jobs):
+        tasks = []
+        for job in jobs:
+            if not await self._Acquire_Slot():
+                break
+            self.stats["jobs"] += 1
+            tasks.append(asyncio.create_task(self._Run_Job(job)))
+
+        if tasks:
+            stop_waiter = asyncio.create_task(self.stop_event.wait())
+            await asyncio.wait([asyncio.gather(*tasks, return_exceptions=True), stop_waiter],
+                               return_when=asyncio.FIRST_COMPLETED)
+            stop_waiter.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+    async def _Acquire_Slot(self) -> bool:
+        # Attend un navigateur libre ou l'arrêt ; False si le run est arrêté
+        if self.stop_event.is_set():
+            return False
+        acquire = asyncio.create_task(self.slots.acquire())
+        stop_waiter = asyncio.create_task(self.stop_event.wait())
+        await asyncio.wait([acquire, stop_waiter], return_when=asyncio.FIRST_COMPLETED)
+        stop_waiter.cancel()
+        if acquire.done() and not acquire.cancelled():
+            if self.stop_event.is_set():
+                self.slots.release()
+                return False
+            return True
+        acquire.cancel()
+        return False
+
+
+    async def _Run_Job(self, job):
+        launch = None
+        try:
+            async with self.prepare_lock:
+                if self.stop_event.is_set():
+                    return
+                launch = await self.loop.run_in_executor(None, self.hooks.prepare, job)
+            if not launch:
+                return
+
+            email = launch["email"]
+            waiter = self.loop.create_future()
+            self.waiters[email] = waiter
+            process = await asyncio.create_subprocess_exec(*launch["command"])
+            self.processes[email] = process
+            self.stats["spawned"] += 1
+            await self.loop.run_in_executor(None, self.hooks.spawned, launch, process.pid)
+            self.active_event.set()
+
+            exit_task = asyncio.create_task(process.wait())
+            done, _ = await asyncio.wait([waiter, exit_task], return_when=asyncio.FIRST_COMPLETED)
+            if waiter not in done:
+                # Processus terminé avant son fichier de session : l'extension peut encore l'avoir écrit
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), EXIT_GRACE_SEC)
+                except asyncio.TimeoutError:
+                    self.stats["lost"] += 1
+                    await self.loop.run_in_executor(None, self.hooks.lost, launch, process.returncode)
+                    return
+
+            self.stats["completed"] += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(exit_task), CLOSE_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                process.kill()
+                await exit_task
+
+        except OrchestrationAbort as e:
+            self.stats["failed"] += 1
+            self.stop_event.set()
+            await self.loop.run_in_executor(None, self.hooks.stopped, str(e))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            self.Log(f"[INFO] Erreur : {e}")
+        finally:
+            if launch:
+                self.waiters.pop(launch["email"], None)
+                self.processes.pop(launch["email"], None)
+            if not self.processes:
+                self.active_event.clear()
+            self.slots.release()
+
+
+    async def _Terminate_All(self):
+        # Arrêt du run : les navigateurs encore ouverts sont fermés
+        for process in list(self.processes.values()):
+            if process.returncode is None:
+                try:
+                    process.terminate()
+                except ProcessLookupError:
+                    pass
+        for process in list(self.processes.values()):
+            try:
+                await asyncio.wait_for(process.wait(), CLOSE_TIMEOUT_SEC)
+            except asyncio.TimeoutError:
+                process.kill()
+        self.processes.clear()
+
+
+    # ---------- Ingestion des fichiers ----------
+
+    async def _Scan_Downloads(self):
+        while True:
+            # Aucun navigateur lancé : pas de réveil périodique
+            await self.active_event.wait()
+            await asyncio.sleep(self.scan_interval)
+            await self._Scan_Once()
+
+
+    async def _Scan_Once(self):
+        self.stats["scans"] += 1
+        try:
+            names = await self.loop.run_in_executor(None, os.listdir, self.downloads_folder)
+        except OSError:
+            return
+        session_files = [n for n in names if n.startswith(self.session_id) and n.endswith(".txt")]
+        log_files = [n for n in names if n.startswith("log_") and n.endswith(".txt")]
+        if not session_files and not log_files:
+            return
+        await self.loop.run_in_executor(None, self.hooks.scanned, session_files, log_files)
+
+        await asyncio.gather(*[self.loop.run_in_executor(None, self.hooks.log_file, n) for n in log_files])
+        results = await asyncio.gather(
+            *[self.loop.run_in_executor(None, self.hooks.session_file, n) for n in session_files],
+            return_exceptions=True,
+        )
+        for file_name, result in zip(session_files, results):
+            match = self.session_pattern.match(file_name)
+            waiter = self.waiters.get(match.group("email")) if match else None
+            if waiter is not None and not waiter.done():
+                waiter.set_result(result)
+        await self.loop.run_in_executor(None, self.hooks.scan_done)
+
+
+    # ---------- Logs ----------
+
+    async def _Fan_Out_Logs(self):
+        while True:
+            text = await self.log_queue.get()
+            self.hooks.log(text)
+
+
+    async def _Drain_Logs(self):
+        while not self.log_queue.empty():
+            self.hooks.log(self.log_queue.get_nowait())
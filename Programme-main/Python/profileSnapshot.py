@@ -0,0 +1,318 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import threading
+import datetime
+from typing import Optional, Dict, Callable, List
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+
+
+# =========================================
+# 🧬 Profils "golden" clonés par email
+# =========================================
+SNAPSHOT_MARKER        = "snapshot.json"
+GOLDEN_DIR_NAME        = "golden"
+GOLDEN_PROFILE_NAME    = "automail-golden"
+FICLONE                = 0x40049409          # ioctl Linux (btrfs, XFS reflink)
+VERSION_DIR_PATTERN    = re.compile(r"^\d+(\.\d+){2,3}$")
+
+# Fichiers que le navigateur ne réécrit jamais sur place (données de composants versionnées,
+# dictionnaires, extensions empaquetées) : partagés par lien physique au lieu d'être copiés.
+# Tout le reste (SQLite, Preferences, Local State...) est copié (reflink si possible).
+IMMUTABLE_PATTERNS = {
+    "chrome": [
+        "Dictionaries/*", "*.bdic", "hyphen-data/*", "ZxcvbnData/*", "Safe Browsing/*",
+        "CertificateRevocation/*", "FileTypePolicies/*", "OriginTrials/*", "MEIPreload/*",
+        "SSLErrorAssistant/*", "TLSDeprecationConfig/*", "Crowd Deny/*", "WidevineCdm/*",
+        "Subresource Filter/*", "FirstPartySetsPreloaded/*", "pnacl/*",
+    ],
+    "firefox": [
+        "*.xpi", "features/*",
+    ],
+}
+
+
+
+
+
+
+class ProfileSnapshotError(Exception):
+    """Raised when a golden profile cannot be built or cloned."""
+
+
+
+
+
+
+# 🔎 Version installée du navigateur, lue à côté de l'exécutable :
+# - Chrome/Edge : dossier "<version>" à côté de chrome.exe
+# - Firefox     : application.ini (Version=...)
+# À défaut : empreinte taille + date de l'exécutable (change à chaque mise à jour).
+def Browser_Version(exe_path) -> Optional[str]:
+    if not exe_path or not os.path.exists(exe_path):
+        return None
+    install_dir = os.path.dirname(exe_path)
+
+    try:
+        versions = [d for d in os.listdir(install_dir)
+                    if VERSION_DIR_PATTERN.match(d) and os.path.isdir(os.path.join(install_dir, d))]
+    except OSError:
+        versions = []
+    if versions:
+        return max(versions, key=lambda v: tuple(int(p) for p in v.split(".")))
+
+    ini_path = os.path.join(install_dir, "application.ini")
+    if os.path.exists(ini_path):
+        with open(ini_path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                if line.startswith("Version="):
+                    return line.split("=", 1)[1].strip()
+
+    st = os.stat(exe_path)
+    return f"exe-{st.st_size}-{int(st.st_mtime)}"
+
+
+
+
+
+
+# 📄 Copie rapide : reflink (copy-on-write) si le système de fichiers le permet, sinon copie classique
+def Reflink_Or_Copy(src, dst) -> str:
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+            shutil.copystat(src, dst)
+            return "reflink"
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def Link_Or_Copy(src, dst) -> str:
+    try:
+        os.link(src, dst)
+        return "link"
+    except OSError:
+        return Reflink_Or_Copy(src, dst)
+
+
+
+
+
+
+def Is_Immutable(relpath, browser) -> bool:
+    relpath = relpath.replace(os.sep, "/")
+    for pattern in IMMUTABLE_PATTERNS.get(browser, []):
+        if fnmatch.fnmatch(relpath, pattern) or fnmatch.fnmatch(relpath, "*/" + pattern):
+            return True
+    return False
+
+
+
+
+
+
+# 🧬 Clone un arbre : liens physiques pour les fichiers immuables, reflink/copie pour les autres.
+# `rename` remplace le premier composant du chemin (dossier de profil Chrome nommé d'après l'email).
+def Clone_Tree(src, dst, browser, rename: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+    stats = {"link": 0, "reflink": 0, "copy": 0}
+    rename = rename or {}
+    for root, dirs, files in os.walk(src):
+        rel_root = os.path.relpath(root, src)
+        parts = [] if rel_root == "." else rel_root.split(os.sep)
+        if parts and parts[0] in rename:
+            parts[0] = rename[parts[0]]
+        out_root = os.path.join(dst, *parts)
+        os.makedirs(out_root, exist_ok=True)
+
+        for name in files:
+            if not parts and name == SNAPSHOT_MARKER:
+                continue
+            rel_file = os.path.join(rel_root, name)
+            target = os.path.join(out_root, name)
+            if Is_Immutable(rel_file, browser):
+                stats[Link_Or_Copy(os.path.join(root, name), target)] += 1
+            else:
+                stats[Reflink_Or_Copy(os.path.join(root, name), target)] += 1
+    return stats
+
+
+
+
+
+
+# 🔧 Local State de Chrome : le cache des profils est indexé par nom de dossier
+def Rename_Chrome_Profile(user_data_dir, old_name, new_name):
+    path = os.path.join(user_data_dir, "Local State")
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    profile = state.get("profile", {})
+    info_cache = profile.get("info_cache", {})
+    if old_name in info_cache:
+        info_cache[new_name] = info_cache.pop(old_name)
+    if profile.get("last_used") == old_name:
+        profile["last_used"] = new_name
+    for key in ("last_active_profiles", "profiles_order"):
+        if isinstance(profile.get(key), list):
+            profile[key] = [new_name if p == old_name else p for p in profile[key]]
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+
+
+
+
+# Cache de profils "golden" : un profil initialisé par navigateur et par version, construit une fois
+# (lancement Selenium pour Chrome, --CreateProfile pour Firefox) puis cloné pour chaque email.
+# Une nouvelle version du navigateur invalide le golden précédent.
+class ProfileSnapshotCache:
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.lock = threading.Lock()
+
+
+    def Golden_Path(self, browser, version) -> str:
+        safe_version = "".join(c if c.isalnum() or c in ".-_" else "_" for c in version)
+        return os.path.join(self.root_dir, browser, safe_version, GOLDEN_DIR_NAME)
+
+
+    def Is_Ready(self, browser, version) -> bool:
+        return os.path.exists(os.path.join(self.Golden_Path(browser, version), SNAPSHOT_MARKER))
+
+
+    def Ensure_Golden(self, browser, version, builder: Callable[[str, str], None]) -> str:
+        # builder(dossier_golden, nom_du_profil) doit produire un profil initialisé dans le dossier
+        golden = self.Golden_Path(browser, version)
+        with self.lock:
+            if self.Is_Ready(browser, version):
+                return golden
+
+            # Golden incomplet (arrêt pendant la construction) : on repart de zéro
+            shutil.rmtree(golden, ignore_errors=True)
+            os.makedirs(golden, exist_ok=True)
+            started = time.perf_counter()
+            try:
+                builder(golden, GOLDEN_PROFILE_NAME)
+            except Exception:
+                shutil.rmtree(golden, ignore_errors=True)
+                raise
+            if not any(name != SNAPSHOT_MARKER for name in os.listdir(golden)):
+                shutil.rmtree(golden, ignore_errors=True)
+                raise ProfileSnapshotError(f"Golden {browser} profile build produced nothing")
+
+            with open(os.path.join(golden, SNAPSHOT_MARKER), "w", encoding="utf-8") as f:
+                json.dump({
+                    "browser": browser,
+                    "version": version,
+                    "profile_name": GOLDEN_PROFILE_NAME,
+                    "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "build_sec": round(time.perf_counter() - started, 2),
+                }, f)
+            self._Drop_Other_Versions(browser, version)
+            return golden
+
+
+    def _Drop_Other_Versions(self, browser, version):
+        browser_dir = os.path.join(self.root_dir, browser)
+        keep = os.path.basename(os.path.dirname(self.Golden_Path(browser, version)))
+        for entry in os.listdir(browser_dir):
+            if entry != keep:
+                shutil.rmtree(os.path.join(browser_dir, entry), ignore_errors=True)
+
+
+    def Clone(self, browser, version, dest, builder, profile_name=None) -> Dict[str, int]:
+        # Clone le golden vers `dest`. Pour Chrome, `profile_name` renomme le sous-dossier de profil.
+        if os.path.exists(dest):
+            raise ProfileSnapshotError(f"Destination already exists: {dest}")
+        golden = self.Ensure_Golden(browser, version, builder)
+
+        tmp_dest = dest + ".cloning"
+        shutil.rmtree(tmp_dest, ignore_errors=True)
+        rename = {GOLDEN_PROFILE_NAME: profile_name} if profile_name else None
+        try:
+            stats = Clone_Tree(golden, tmp_dest, browser, rename)
+            if browser == "chrome" and profile_name:
+                Rename_Chrome_Profile(tmp_dest, GOLDEN_PROFILE_NAME, profile_name)
+            os.replace(tmp_dest, dest)
+        except Exception:
+            shutil.rmtree(tmp_dest, ignore_errors=True)
+            raise
+        return stats
+
+
+
+
+
+
+# ⏱️ Compare la création par lancement du navigateur et le clonage du golden
+def Benchmark(cache: ProfileSnapshotCache, browser, version, builder, work_dir, runs=3) -> Dict[str, List[float]]:
+    os.makedirs(work_dir, exist_ok=True)
+    results = {"launch_ms": [], "clone_ms": []}
+    cache.Ensure_Golden(browser, version, builder)
+
+    for i in range(runs):
+        launch_dir = os.path.join(work_dir, f"launch_{i}")
+        shutil.rmtree(launch_dir, ignore_errors=True)
+        os.makedirs(launch_dir)
+        started = time.perf_counter()
+        builder(launch_dir, f"bench_{i}")
+        results["launch_ms"].append(round((time.perf_counter() - started) * 1000, 1))
+
+        clone_dir = os.path.join(work_dir, f"clone_{i}")
+        shutil.rmtree(clone_dir, ignore_errors=True)
+        started = time.perf_counter()
+        cache.Clone(browser, version, clone_dir, builder, profile_name=f"bench_{i}")
+        results["clone_ms"].append(round((time.perf_counter() - started) * 1000, 1))
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def Format_Benchmark(results) -> str:
+    def line(name, values):
+        if not values:
+            return f"{name:<8} -"
+        return f"{name:<8} min={min(values):.1f} ms  moy={sum(values) / len(values):.1f} ms  max={max(values):.1f} ms"
+    out = [line("launch", results["launch_ms"]), line("clone", results["clone_ms"])]
+    if results["launch_ms"] and results["clone_ms"]:
+        ratio = (sum(results["launch_ms"]) / max(sum(results["clone_ms"]), 0.001))
+        out.append(f"gain     x{ratio:.1f}")
+    return "\n".join(out)
+
+
+
+
+
+
+# Clonage manuel d'un golden existant : python profileSnapshot.py <root> <browser> <version> <dest> [nom]
+if __name__ == "__main__":
+    if len(sys.argv) < 5:
+        print("usage: profileSnapshot.py <root> <browser> <version> <dest> [profile_name]")
+        sys.exit(2)
+    root, browser_name, browser_version, destination = sys.argv[1:5]
+
+    def _No_Builder(path, name):
+        raise ProfileSnapshotError("No golden profile available for this browser version")
+
+    started_at = time.perf_counter()
+    clone_stats = ProfileSnapshotCache(root).Clone(browser_name, browser_version, destination, _No_Builder,
+                                                   sys.argv[5] if len(sys.argv) > 5 else None)
+    print(f"✅ Clone en {(time.perf_counter() - started_at) * 1000:.1f} ms : {clone_stats}")
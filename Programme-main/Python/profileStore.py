@@ -0,0 +1,275 @@
+import os
+import sys
+import json
+import time
+import shutil
+import fnmatch
+import threading
+from typing import Dict, List, Optional, Iterable
+
+
+
+
+# =========================================
+# 💾 Gestion de l'espace disque des profils
+# =========================================
+PROFILE_QUOTA_ENV      = "AUTOMAIL_PROFILE_QUOTA_GB"     # 0 = pas de quota
+DEFAULT_QUOTA_GB       = 20
+STORE_STATE_FILE       = ".profile_store.json"
+BROWSER_FAMILIES       = ("chrome", "firefox")
+
+# Dossiers régénérables : le navigateur les recrée au prochain lancement
+CACHE_DIR_PATTERNS = {
+    "chrome": [
+        "Cache", "Code Cache", "GPUCache", "DawnCache", "DawnGraphiteCache", "DawnWebGPUCache",
+        "GraphiteDawnCache", "GrShaderCache", "ShaderCache", "component_crx_cache",
+        "Service Worker/CacheStorage", "Service Worker/ScriptCache", "Crashpad/reports",
+    ],
+    "firefox": [
+        "cache2", "startupCache", "thumbnails", "shader-cache", "crashes", "minidumps",
+        "datareporting/archived", "saved-telemetry-pings",
+    ],
+}
+
+# Présents uniquement pendant que le navigateur utilise le profil
+LOCK_FILES = {
+    "chrome": ["lockfile", "SingletonLock"],
+    "firefox": ["parent.lock", ".parentlock", "lock"],
+}
+
+
+
+
+
+
+# 🧩 Quota (octets) lu dans l'environnement ; None = illimité
+def Quota_From_Env() -> Optional[int]:
+    try:
+        quota_gb = float(os.environ.get(PROFILE_QUOTA_ENV, DEFAULT_QUOTA_GB))
+    except ValueError:
+        quota_gb = DEFAULT_QUOTA_GB
+    return int(quota_gb * 1024 ** 3) if quota_gb > 0 else None
+
+
+def Dir_Size(path) -> int:
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def Format_Size(size) -> str:
+    for unit in ("o", "Ko", "Mo", "Go"):
+        if size < 1024 or unit == "Go":
+            return f"{size:.1f} {unit}" if unit != "o" else f"{size} o"
+        size /= 1024
+
+
+
+
+
+
+# Magasin de profils : Tools/Profiles/<chrome|firefox>/<email>.
+# - Touch() enregistre la dernière utilisation de chaque profil (.profile_store.json)
+# - Purge_Caches() supprime les caches régénérables après un run
+# - Enforce_Quota() supprime les profils les moins récemment utilisés au-delà du quota
+# - Footprint() mesure l'espace occupé (profils + part des caches)
+class ProfileStore:
+
+    def __init__(self, root_dir, quota_bytes=None):
+        self.root_dir = root_dir
+        self.quota = quota_bytes if quota_bytes is not None else Quota_From_Env()
+        self.state_path = os.path.join(root_dir, STORE_STATE_FILE)
+        self.lock = threading.Lock()
+        self.state = self._Load_State()
+        self.touched = set()      # profils utilisés depuis le dernier Cleanup()
+
+
+    def _Load_State(self) -> Dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+
+    def _Save_State(self):
+        # Appelé sous self.lock
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+
+    @staticmethod
+    def _Key(browser, name) -> str:
+        return f"{browser}/{name}"
+
+
+    def Profile_Path(self, browser, name) -> str:
+        return os.path.join(self.root_dir, browser, name)
+
+
+    def Profiles(self) -> List[tuple]:
+        # (navigateur, nom) de tous les profils présents sur disque
+        found = []
+        for browser in BROWSER_FAMILIES:
+            browser_dir = os.path.join(self.root_dir, browser)
+            if not os.path.isdir(browser_dir):
+                continue
+            for name in sorted(os.listdir(browser_dir)):
+                if name.startswith(".") or name.endswith(".cloning"):
+                    continue
+                if os.path.isdir(os.path.join(browser_dir, name)):
+                    found.append((browser, name))
+        return found
+
+
+    def Touch(self, browser, name):
+        with self.lock:
+            self.state[self._Key(browser, name)] = time.time()
+            self.touched.add((browser, name))
+            self._Save_State()
+
+
+    def Last_Used(self, browser, name) -> float:
+        # Sans trace d'utilisation (profils antérieurs) : date de modification du dossier
+        last_used = self.state.get(self._Key(browser, name))
+        if last_used is not None:
+            return last_used
+        try:
+            return os.path.getmtime(self.Profile_Path(browser, name))
+        except OSError:
+            return 0.0
+
+
+    def Is_In_Use(self, browser, name) -> bool:
+        # Chrome : lockfile à la racine du user-data-dir ; Firefox : parent.lock à la racine du profil
+        path = self.Profile_Path(browser, name)
+        return any(os.path.lexists(os.path.join(path, lock_file)) for lock_file in LOCK_FILES.get(browser, []))
+
+
+    def _Cache_Dirs(self, browser, name) -> Iterable[str]:
+        path = self.Profile_Path(browser, name)
+        patterns = CACHE_DIR_PATTERNS.get(browser, [])
+        for root, dirs, files in os.walk(path):
+            keep = []
+            for d in dirs:
+                rel = os.path.relpath(os.path.join(root, d), path).replace(os.sep, "/")
+                if any(fnmatch.fnmatch(rel, p) or fnmatch.fnmatch(rel, "*/" + p) for p in patterns):
+                    yield os.path.join(root, d)
+                else:
+                    keep.append(d)
+            dirs[:] = keep
+
+
+    def Purge_Caches(self, browser, name) -> int:
+        # Supprime les caches régénérables d'un profil fermé ; retourne les octets libérés
+        if self.Is_In_Use(browser, name):
+            return 0
+        freed = 0
+        for cache_dir in list(self._Cache_Dirs(browser, name)):
+            size = Dir_Size(cache_dir)
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            if not os.path.exists(cache_dir):
+                freed += size
+        return freed
+
+
+    def Footprint(self) -> Dict:
+        report = {"total": 0, "cache": 0, "profiles": 0, "quota": self.quota, "browsers": {}, "largest": []}
+        sizes = []
+        for browser, name in self.Profiles():
+            size = Dir_Size(self.Profile_Path(browser, name))
+            cache = sum(Dir_Size(d) for d in self._Cache_Dirs(browser, name))
+            entry = report["browsers"].setdefault(browser, {"count": 0, "size": 0, "cache": 0})
+            entry["count"] += 1
+            entry["size"] += size
+            entry["cache"] += cache
+            report["total"] += size
+            report["cache"] += cache
+            report["profiles"] += 1
+            sizes.append((size, f"{browser}/{name}"))
+        report["largest"] = [(key, size) for size, key in sorted(sizes, reverse=True)[:5]]
+        return report
+
+
+    def Format_Footprint(self, report=None) -> str:
+        report = report or self.Footprint()
+        quota = Format_Size(report["quota"]) if report["quota"] else "illimité"
+        out = [f"💾 Profils : {report['profiles']}  total={Format_Size(report['total'])}  "
+               f"dont caches={Format_Size(report['cache'])}  quota={quota}"]
+        for browser, entry in report["browsers"].items():
+            out.append(f"   {browser:<8} {entry['count']:>5} profils  {Format_Size(entry['size']):>10}  "
+                       f"(caches {Format_Size(entry['cache'])})")
+        for key, size in report["largest"]:
+            out.append(f"   ⬆️ {Format_Size(size):>10}  {key}")
+        return "\n".join(out)
+
+
+    def Enforce_Quota(self, keep: Iterable[tuple] = ()) -> List[str]:
+        # Supprime les profils LRU jusqu'à repasser sous le quota.
+        # Les profils ouverts et ceux de `keep` (run en cours) ne sont jamais supprimés.
+        if not self.quota:
+            return []
+        keep = set(keep)
+        entries = []
+        total = 0
+        for browser, name in self.Profiles():
+            size = Dir_Size(self.Profile_Path(browser, name))
+            total += size
+            entries.append((self.Last_Used(browser, name), browser, name, size))
+
+        evicted = []
+        for last_used, browser, name, size in sorted(entries):
+            if total <= self.quota:
+                break
+            if (browser, name) in keep or self.Is_In_Use(browser, name):
+                continue
+            shutil.rmtree(self.Profile_Path(browser, name), ignore_errors=True)
+            if os.path.exists(self.Profile_Path(browser, name)):
+                continue
+            total -= size
+            evicted.append(f"{browser}/{name}")
+            with self.lock:
+                self.state.pop(self._Key(browser, name), None)
+
+        if evicted:
+            with self.lock:
+                self._Save_State()
+        return evicted
+
+
+    def Cleanup(self, used: Optional[Iterable[tuple]] = None) -> Dict:
+        # Après un run : purge des caches des profils utilisés puis application du quota
+        with self.lock:
+            used = list(self.touched if used is None else used)
+            self.touched.clear()
+        freed = sum(self.Purge_Caches(browser, name) for browser, name in used)
+        evicted = self.Enforce_Quota(keep=used)
+        return {"freed": freed, "evicted": evicted}
+
+
+
+
+
+
+# Maintenance manuelle : python profileStore.py <Tools/Profiles> [report|purge|enforce]
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: profileStore.py <profiles_dir> [report|purge|enforce]")
+        sys.exit(2)
+    store = ProfileStore(sys.argv[1])
+    action = sys.argv[2] if len(sys.argv) > 2 else "report"
+    if action == "purge":
+        total_freed = sum(store.Purge_Caches(b, n) for b, n in store.Profiles())
+        print(f"🧹 Caches supprimés : {Format_Size(total_freed)}")
+    elif action == "enforce":
+        print(f"🗑️ Profils supprimés : {store.Enforce_Quota()}")
+    print(store.Format_Footprint())
@@ -0,0 +1,210 @@
+import os
+import time
+import argparse
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QFile, QResource
+from PyQt6.QtGui import QIcon, QPixmap, QColor, QBrush, QPen, QFont
+
+
+
+
+# =========================================
+# 🖼️ Cache central des icônes, pixmaps et objets de dessin
+# =========================================
+# Une seule lecture disque par fichier : QIcon / QPixmap (déjà mis à l'échelle) sont gardés en
+# mémoire et partagés entre widgets, ainsi que les QColor / QBrush / QPen / QFont du dessin des
+# onglets. Si un bundle Qt compilé existe (interface/resources.rcc, produit au packaging avec
+# `rcc --binary resources.qrc -o interface/resources.rcc`, chemins du .qrc relatifs à Programme-main),
+# il est monté sous ":/automail" et les fichiers sont servis depuis ":/automail/<chemin relatif>".
+RESOURCE_ROOT          = "/automail"
+RESOURCE_BUNDLE_NAME   = "resources.rcc"
+
+
+
+
+
+
+class ResourceCacheError(Exception):
+    """Raised when a compiled Qt resource bundle exists but cannot be registered."""
+
+
+
+
+
+
+# Toutes les méthodes sont à appeler depuis le thread de l'interface (QPixmap).
+class ResourceCache:
+
+    def __init__(self, root_dir, bundle_path=None):
+        self.root_dir = os.path.abspath(root_dir)
+        self.bundle_path = bundle_path
+        self.bundle_loaded = False
+        self.paths: Dict[str, Optional[str]] = {}
+        self.icons: Dict[Tuple, QIcon] = {}
+        self.pixmaps: Dict[Tuple, QPixmap] = {}
+        self.icon_pixmaps: Dict[Tuple, QPixmap] = {}
+        self.paint_objects: Dict[Tuple, object] = {}
+        self.stats = {"hits": 0, "misses": 0, "disk_checks": 0}
+        if bundle_path and os.path.exists(bundle_path):
+            self.Register_Bundle(bundle_path)
+
+
+    def Register_Bundle(self, bundle_path):
+        if not QResource.registerResource(bundle_path, RESOURCE_ROOT):
+            raise ResourceCacheError(f"Cannot register resource bundle {bundle_path}")
+        self.bundle_loaded = True
+        self.paths.clear()
+
+
+    def Resolve(self, path) -> Optional[str]:
+        # Chemin à charger (ressource du bundle, sinon fichier disque) ou None s'il n'existe pas.
+        # Le résultat est mémorisé : un seul os.path.exists par fichier.
+        key = os.path.normcase(os.path.abspath(path))
+        if key in self.paths:
+            return self.paths[key]
+
+        resolved = None
+        if self.bundle_loaded:
+            rel = os.path.relpath(os.path.abspath(path), self.root_dir).replace(os.sep, "/")
+            resource = f":{RESOURCE_ROOT}/{rel}"
+            if not rel.startswith("..") and QFile.exists(resource):
+                resolved = resource
+        if resolved is None:
+            self.stats["disk_checks"] += 1
+            if os.path.exists(path):
+                resolved = path
+        self.paths[key] = resolved
+        return resolved
+
+
+    def Pixmap(self, path, width=None, height=None, keep_aspect=True) -> QPixmap:
+        # QPixmap du fichier, mis à l'échelle une seule fois par taille demandée (nul si absent)
+        key = (os.path.normcase(os.path.abspath(path)), width, height, keep_aspect)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.stats["hits"] += 1
+            return pixmap
+
+        self.stats["misses"] += 1
+        resolved = self.Resolve(path)
+        pixmap = QPixmap(resolved) if resolved else QPixmap()
+        if not pixmap.isNull() and width and height:
+            mode = Qt.AspectRatioMode.KeepAspectRatio if keep_aspect else Qt.AspectRatioMode.IgnoreAspectRatio
+            pixmap = pixmap.scaled(width, height, mode, Qt.TransformationMode.SmoothTransformation)
+        self.pixmaps[key] = pixmap
+        return pixmap
+
+
+    def Icon(self, path, size=None) -> QIcon:
+        # QIcon partagé (nul si le fichier n'existe pas). `size` : icône construite depuis une
+        # pixmap déjà réduite à (size, size), comme icon.pixmap(size, size).
+        key = (os.path.normcase(os.path.abspath(path)), size)
+        icon = self.icons.get(key)
+        if icon is not None:
+            self.stats["hits"] += 1
+            return icon
+
+        self.stats["misses"] += 1
+        resolved = self.Resolve(path)
+        if not resolved:
+            icon = QIcon()
+        elif size:
+            icon = QIcon(QIcon(resolved).pixmap(size, size))
+        else:
+            icon = QIcon(resolved)
+        self.icons[key] = icon
+        return icon
+
+
+    def Icon_Pixmap(self, icon: QIcon, size) -> QPixmap:
+        # icon.pixmap(size, size) mémorisé par icône (cacheKey), pour les paintEvent
+        key = (icon.cacheKey(), size)
+        pixmap = self.icon_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = icon.pixmap(size, size)
+            self.icon_pixmaps[key] = pixmap
+        return pixmap
+
+
+    def Color(self, name) -> QColor:
+        key = ("color", name)
+        if key not in self.paint_objects:
+            self.paint_objects[key] = QColor(name)
+        return self.paint_objects[key]
+
+
+    def Brush(self, color) -> QBrush:
+        key = ("brush", color)
+        if key not in self.paint_objects:
+            self.paint_objects[key] = QBrush(self.Color(color))
+        return self.paint_objects[key]
+
+
+    def Pen(self, color, width=None) -> QPen:
+        key = ("pen", color, width)
+        if key not in self.paint_objects:
+            pen = QPen(self.Color(color))
+            if width is not None:
+                pen.setWidth(width)
+            self.paint_objects[key] = pen
+        return self.paint_objects[key]
+
+
+    def Font(self, base: QFont, family, point_size) -> QFont:
+        # Police dérivée de `base` (police du widget) avec famille et taille imposées
+        key = ("font", base.key(), family, point_size)
+        if key not in self.paint_objects:
+            font = QFont(base)
+            font.setPointSize(point_size)
+            font.setFamily(family)
+            self.paint_objects[key] = font
+        return self.paint_objects[key]
+
+
+    def Clear(self):
+        self.paths.clear()
+        self.icons.clear()
+        self.pixmaps.clear()
+        self.icon_pixmaps.clear()
+        self.paint_objects.clear()
+
+
+
+
+
+
+# Mesure : python resourceCache.py <dossier_icônes> [--repeat 200]
+# Compare QIcon(chemin) + os.path.exists à chaque reconstruction au cache partagé.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure icon loading with and without ResourceCache")
+    parser.add_argument("icons_dir")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    files = [os.path.join(args.icons_dir, name) for name in sorted(os.listdir(args.icons_dir))
+             if name.lower().endswith((".png", ".jpg"))]
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for path in files:
+            if os.path.exists(path):
+                QIcon(path).pixmap(24, 24)
+    direct_ms = (time.perf_counter() - start) * 1000
+
+    cache = ResourceCache(args.icons_dir)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for path in files:
+            icon = cache.Icon(path)
+            if not icon.isNull():
+                cache.Icon_Pixmap(icon, 24)
+    cached_ms = (time.perf_counter() - start) * 1000
+
+    count = args.repeat * len(files)
+    print(f"🖼️ direct : {direct_ms / count * 1000:.1f} µs/icône  |  cache : {cached_ms / count * 1000:.1f} µs/icône  "
+          f"({len(files)} fichiers x {args.repeat}, {cache.stats})")
@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+
+
+
+# =========================================
+# 🧭 Contexte invariant d'un run d'extraction
+# =========================================
+# Valeurs identiques pour tous les emails d'un run (login chiffré, scénario sérialisé, chemins des
+# navigateurs, dossier de logs de la session...). Calculées une fois au début du run par
+# AppV2.Build_Run_Context puis passées à chaque ExtractionThread.Prepare_Job.
+BENCH_JOBS             = 200
+
+
+
+
+
+
+@dataclass(frozen=True)
+class RunContext:
+    session_id: str
+    process_id: str                   # unique_id renvoyé par Save_Process (e_pid)
+    username: str
+    entity: str
+    encrypted_login: str              # encrypt_message(username, KEY), paramètre 'l'
+    isp: str
+    action_json: str                  # json.dumps(output_json_final), paramètre 'action'
+    selected_browser: str
+    browser_path: Optional[str]       # navigateur choisi (edge / icedragon / Comodo)
+    chrome_path: Optional[str]        # Get_Browser_Path("chrome.exe"), seulement pour chrome
+    web_ext_path: Optional[str]       # shutil.which("web-ext"), seulement pour firefox
+    base_directory: str               # dossiers d'extension par email
+    chrome_profiles_dir: str
+    session_directory: str            # LOGS_DIRECTORY/<date>_<heure>, créé une fois
+    session_text: str                 # contenu de session.txt (session_user de job.json)
+    extension_build_dir: Optional[str] = None   # build partagé de l'extension (firefox), Ensure() une fois par run
+
+
+
+
+
+
+# ⏱️ Surcoût par job : invariants recalculés pour chaque email (ancien chemin) contre contexte partagé
+#   python runContext.py [--jobs 200] [--browser chrome]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the per-job cost of run invariants")
+    parser.add_argument("--jobs", type=int, default=BENCH_JOBS)
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "firefox", "edge"))
+    args = parser.parse_args()
+
+    workspace = tempfile.mkdtemp(prefix="automail_context_")
+    os.environ.setdefault("APPDATA", workspace)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    import AppV2
+    sys.stdout = stdout
+
+    AppV2.LOGS_DIRECTORY = os.path.join(workspace, "logs")
+    AppV2.BASE_DIRECTORY = os.path.join(workspace, "extensions")
+    AppV2.CURRENT_DATE, AppV2.CURRENT_HOUR = time.strftime("%Y-%m-%d"), time.strftime("%H-%M-%S")
+
+    class Extraction:
+        session_id = AppV2.SESSION_ID
+        unique_id = "bench"
+        Isp = "bench"
+        selected_Browser = args.browser
+        Browser_path = None
+        BASE_DIRECTORY = AppV2.BASE_DIRECTORY
+        output_json_final = [{"process": "login", "sub_process": [{"process": "open_inbox"}] * 20}] * 10
+
+    session_info = {"username": "bench", "p_entity": "bench"}
+
+    start = time.perf_counter()
+    for _ in range(args.jobs):
+        AppV2.Build_Run_Context(Extraction, session_info)
+    per_job_ms = (time.perf_counter() - start) * 1000 / args.jobs
+
+    start = time.perf_counter()
+    context = AppV2.Build_Run_Context(Extraction, session_info)
+    for _ in range(args.jobs):
+        (context.encrypted_login, context.action_json, context.chrome_path, context.web_ext_path, context.session_directory)
+    shared_ms = (time.perf_counter() - start) * 1000 / args.jobs
+
+    print(f"🧭 {args.browser} : invariants par job {per_job_ms:.3f} ms  ➜  contexte partagé {shared_ms:.4f} ms/job "
+          f"({args.jobs} jobs, économie ≈ {(per_job_ms - shared_ms) * args.jobs:.1f} ms par run)")
@@ -0,0 +1,275 @@
+import os
+import csv
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import datetime
+from typing import Optional, List, Dict
+
+
+
+
+# =========================================
+# 🗄️ Historique des exécutions (SQLite)
+# =========================================
+RUN_HISTORY_PATH = os.path.join(os.path.dirname(__file__), "..", "tools", "run_history.db")
+RESULT_FILE_PATH = os.path.join(os.path.dirname(__file__), "..", "tools", "result.txt")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL    NOT NULL,
+    day         TEXT    NOT NULL,
+    session_id  TEXT,
+    pid         INTEGER,
+    email       TEXT    NOT NULL,
+    status      TEXT    NOT NULL,
+    isp         TEXT,
+    browser     TEXT,
+    login       TEXT,
+    source      TEXT    DEFAULT 'live'
+);
+CREATE INDEX IF NOT EXISTS idx_runs_email   ON runs (email, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_session ON runs (session_id);
+CREATE INDEX IF NOT EXISTS idx_runs_status  ON runs (status, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_ts      ON runs (ts);
+
+CREATE TABLE IF NOT EXISTS imports (
+    path        TEXT PRIMARY KEY,
+    size        INTEGER,
+    mtime       REAL,
+    rows        INTEGER,
+    imported_at REAL
+);
+"""
+
+EXPORT_COLUMNS = ["ts", "day", "session_id", "pid", "email", "status", "isp", "browser", "login", "source"]
+
+
+
+
+
+
+# 🕒 Convertit une date "YYYY-MM-DD" (ou un timestamp) en secondes epoch
+def Parse_Since(value) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.datetime.strptime(value, "%Y-%m-%d").timestamp()
+
+
+
+
+
+
+# Store d'historique : une ligne par email traité, alimentée par CloseBrowserThread.
+# Une seule connexion partagée entre threads, protégée par un verrou.
+class RunHistoryStore:
+
+    def __init__(self, db_path=RUN_HISTORY_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+            self.conn.commit()
+
+
+    def Record_Result(self, email, status, session_id=None, pid=None, isp=None, browser=None, login=None,
+                      ts=None, source="live"):
+        ts = ts if ts is not None else time.time()
+        day = datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO runs (ts, day, session_id, pid, email, status, isp, browser, login, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (ts, day, session_id, int(pid) if pid is not None else None, email, status, isp, browser, login, source),
+            )
+            self.conn.commit()
+
+
+    def _Query(self, sql, params=()) -> List[Dict]:
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+
+    def Email_History(self, email, limit=20) -> List[Dict]:
+        # Dernières exécutions d'un email (plus récente en premier)
+        return self._Query(
+            "SELECT * FROM runs WHERE email = ? ORDER BY ts DESC LIMIT ?", (email, limit)
+        )
+
+
+    def Session_Results(self, session_id) -> List[Dict]:
+        return self._Query("SELECT * FROM runs WHERE session_id = ? ORDER BY ts", (session_id,))
+
+
+    def Status_Counts(self, since=None) -> Dict[str, int]:
+        since = Parse_Since(since)
+        rows = self._Query(
+            "SELECT status, COUNT(*) AS total FROM runs WHERE ts >= ? GROUP BY status ORDER BY total DESC",
+            (since or 0,),
+        )
+        return {row["status"]: row["total"] for row in rows}
+
+
+    def Completion_Rate_By_Isp_Day(self, since=None) -> List[Dict]:
+        # Taux de "completed" par ISP et par jour
+        since = Parse_Since(since)
+        rows = self._Query(
+            "SELECT day, COALESCE(isp, '') AS isp, COUNT(*) AS total, "
+            "SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS completed "
+            "FROM runs WHERE ts >= ? GROUP BY day, isp ORDER BY day DESC, isp",
+            (since or 0,),
+        )
+        for row in rows:
+            row["rate"] = round(row["completed"] / row["total"], 4) if row["total"] else 0.0
+        return rows
+
+
+    def Import_Result_File(self, path=RESULT_FILE_PATH, isp=None, force=False) -> int:
+        # Import unique d'un ancien result.txt (session:pid:email:status).
+        # Les lignes écrites ensuite sont déjà enregistrées en direct : pas de réimport sauf force=True.
+        abs_path = os.path.abspath(path)
+        with self.lock:
+            previous = self.conn.execute("SELECT size, mtime FROM imports WHERE path = ?", (abs_path,)).fetchone()
+        if previous and not force:
+            return 0
+
+        if not os.path.exists(abs_path):
+            # Fichier absent au premier lancement : marqueur vide, sinon les lignes enregistrées en
+            # direct seraient réimportées (en double) au lancement suivant
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO imports (path, size, mtime, rows, imported_at) VALUES (?, 0, 0, 0, ?)",
+                    (abs_path, time.time()),
+                )
+                self.conn.commit()
+            return 0
+
+        stat = os.stat(abs_path)
+
+        ts = stat.st_mtime
+        source = f"import:{abs_path}"
+        day = datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+        rows = []
+        with open(abs_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = [p.strip() for p in line.strip().split(":")]
+                if len(parts) != 4:
+                    continue
+                session_id, pid, email, status = parts
+                rows.append((ts, day, session_id, int(pid) if pid.isdigit() else None, email, status, isp, None, None, source))
+
+        with self.lock:
+            # Un nouvel import remplace le précédent du même fichier ; les lignes déjà enregistrées en
+            # direct (même session, email et pid) ne sont pas dupliquées
+            self.conn.execute("DELETE FROM runs WHERE source = ?", (source,))
+            live = {
+                (row[0], row[1], row[2]) for row in self.conn.execute(
+                    "SELECT session_id, email, pid FROM runs WHERE source NOT LIKE 'import:%'"
+                )
+            }
+            rows = [row for row in rows if (row[2], row[4], row[3]) not in live]
+            self.conn.executemany(
+                "INSERT INTO runs (ts, day, session_id, pid, email, status, isp, browser, login, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO imports (path, size, mtime, rows, imported_at) VALUES (?, ?, ?, ?, ?)",
+                (abs_path, stat.st_size, stat.st_mtime, len(rows), time.time()),
+            )
+            self.conn.commit()
+        return len(rows)
+
+
+    def Export(self, out_path, fmt="csv", email=None, since=None) -> int:
+        # Exporte l'historique (filtré) en CSV ou JSONL ; retourne le nombre de lignes
+        clauses, params = ["ts >= ?"], [Parse_Since(since) or 0]
+        if email:
+            clauses.append("email = ?")
+            params.append(email)
+        rows = self._Query(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM runs WHERE {' AND '.join(clauses)} ORDER BY ts", params
+        )
+
+        with open(out_path, "w", encoding="utf-8", newline="") as f:
+            if fmt == "jsonl":
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            else:
+                writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS)
+                writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+
+
+    def Close(self):
+        with self.lock:
+            self.conn.close()
+
+
+
+
+
+
+# 💻 Interface en ligne de commande
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Historique des exécutions (run_history.db)")
+    parser.add_argument("--db", default=RUN_HISTORY_PATH, help="Chemin de la base SQLite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help="Exporter l'historique en CSV / JSONL")
+    p_export.add_argument("out", help="Fichier de sortie")
+    p_export.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    p_export.add_argument("--email")
+    p_export.add_argument("--since", help="Date YYYY-MM-DD")
+
+    p_history = sub.add_parser("history", help="Dernières exécutions d'un email")
+    p_history.add_argument("email")
+    p_history.add_argument("--limit", type=int, default=20)
+
+    p_rates = sub.add_parser("rates", help="Taux de complétion par ISP et par jour")
+    p_rates.add_argument("--since", help="Date YYYY-MM-DD")
+
+    p_import = sub.add_parser("import", help="Importer un ancien result.txt")
+    p_import.add_argument("path", nargs="?", default=RESULT_FILE_PATH)
+    p_import.add_argument("--isp")
+    p_import.add_argument("--force", action="store_true", help="Réimporter même si déjà importé")
+
+    args = parser.parse_args(argv)
+    store = RunHistoryStore(args.db)
+
+    try:
+        if args.command == "export":
+            fmt = args.format or ("jsonl" if args.out.endswith(".jsonl") else "csv")
+            count = store.Export(args.out, fmt, email=args.email, since=args.since)
+            print(f"✅ {count} ligne(s) exportée(s) vers {args.out}")
+
+        elif args.command == "history":
+            for row in store.Email_History(args.email, args.limit):
+                when = datetime.datetime.fromtimestamp(row["ts"]).strftime("%Y-%m-%d %H:%M:%S")
+                print(f"{when}  {row['session_id'] or '-':<20} {row['status']:<15} {row['isp'] or ''}")
+
+        elif args.command == "rates":
+            for row in store.Completion_Rate_By_Isp_Day(args.since):
+                print(f"{row['day']}  {row['isp'] or '-':<15} {row['completed']:>5}/{row['total']:<5} {row['rate'] * 100:6.2f}%")
+
+        elif args.command == "import":
+            count = store.Import_Result_File(args.path, isp=args.isp, force=args.force)
+            print(f"✅ {count} ligne(s) importée(s) depuis {args.path}")
+    finally:
+        store.Close()
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import time
+import threading
+import traceback
+import datetime
+from collections import Counter
+from typing import Optional, Dict
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("stall")
+
+
+
+
+# =========================================
+# 🐶 Détection des blocages de l'interface
+# =========================================
+STALL_THRESHOLD_ENV    = "AUTOMAIL_STALL_MS"     # 0 = watchdog désactivé
+DEFAULT_THRESHOLD_MS   = 1000
+HEARTBEAT_INTERVAL_MS  = 100
+STALL_REPORT_FILE      = "stalls.jsonl"
+
+
+
+
+
+
+# 🧩 Seuil de blocage (ms) lu dans l'environnement
+def Threshold_From_Env() -> int:
+    try:
+        return int(os.environ.get(STALL_THRESHOLD_ENV, DEFAULT_THRESHOLD_MS))
+    except ValueError:
+        return DEFAULT_THRESHOLD_MS
+
+
+
+
+
+
+# Watchdog du thread GUI.
+# Le thread GUI appelle Beat() à chaque tick d'un QTimer ; si aucun battement n'arrive pendant
+# plus de `threshold_ms`, la pile du thread GUI est capturée (sys._current_frames) à chaque
+# intervalle jusqu'à la reprise. Dès le dépassement du seuil, un premier rapport ("ongoing": true)
+# est écrit avec la pile courante, pour qu'un gel définitif laisse une trace ; à la reprise, le
+# blocage complet est enregistré avec sa durée et la frame fautive.
+class StallWatchdog:
+
+    def __init__(self, report_dir, threshold_ms=None, app_root=None, check_interval_ms=HEARTBEAT_INTERVAL_MS):
+        self.report_path = os.path.join(report_dir, STALL_REPORT_FILE)
+        self.threshold = (threshold_ms if threshold_ms is not None else Threshold_From_Env()) / 1000.0
+        self.check_interval = check_interval_ms / 1000.0
+        self.app_root = os.path.normcase(os.path.abspath(app_root)) if app_root else None
+
+        self.target_id = None
+        self.last_beat = time.monotonic()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stall_count = 0
+
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+
+    def Beat(self):
+        # Appelé depuis le thread GUI (QTimer)
+        self.last_beat = time.monotonic()
+
+
+    def Start(self, target_thread_id=None):
+        if not self.enabled or (self.thread and self.thread.is_alive()):
+            return
+        self.target_id = target_thread_id or threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._Watch_Loop, name="StallWatchdog", daemon=True)
+        self.thread.start()
+
+
+    def Stop(self):
+        self.stop_event.set()
+
+
+    def _Capture(self) -> Optional[traceback.StackSummary]:
+        frame = sys._current_frames().get(self.target_id)
+        return traceback.extract_stack(frame) if frame is not None else None
+
+
+    def _Offending_Frame(self, stack: traceback.StackSummary) -> str:
+        # Frame la plus profonde appartenant au code de l'application (sinon la plus profonde tout court)
+        chosen = stack[-1]
+        if self.app_root:
+            for entry in reversed(stack):
+                if os.path.normcase(os.path.abspath(entry.filename)).startswith(self.app_root) \
+                        and "site-packages" not in entry.filename:
+                    chosen = entry
+                    break
+        return f"{os.path.basename(chosen.filename)}:{chosen.lineno} in {chosen.name}"
+
+
+    def _Watch_Loop(self):
+        stall_start = None
+        samples = []
+
+        while not self.stop_event.wait(self.check_interval):
+            blocked_for = time.monotonic() - self.last_beat
+
+            if blocked_for >= self.threshold:
+                first = stall_start is None
+                if first:
+                    stall_start = self.last_beat
+                    samples = []
+                stack = self._Capture()
+                if stack:
+                    samples.append(stack)
+                if first:
+                    self._Report(blocked_for, samples, ongoing=True)
+                continue
+
+            if stall_start is not None:
+                # Le thread GUI a repris : on enregistre le blocage complet
+                self._Report(self.last_beat - stall_start, samples)
+                stall_start = None
+                samples = []
+
+
+    def _Report(self, duration, samples, ongoing=False):
+        if not samples:
+            return
+        if not ongoing:
+            self.stall_count += 1
+
+        frames = Counter(self._Offending_Frame(stack) for stack in samples)
+        offending, hits = frames.most_common(1)[0]
+        representative = next(stack for stack in samples if self._Offending_Frame(stack) == offending)
+
+        report: Dict = {
+            "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "duration_ms": round(duration * 1000),
+            "frame": offending,
+            "frame_hits": f"{hits}/{len(samples)}",
+            "stack": [f"{os.path.basename(e.filename)}:{e.lineno} in {e.name}" for e in representative],
+            "ongoing": ongoing,
+        }
+
+        if ongoing:
+            LOG.warning("🐶 [STALL] Interface bloquée depuis %s ms (en cours) ➜ %s", report['duration_ms'], offending)
+        else:
+            LOG.warning("🐶 [STALL] Interface bloquée %s ms ➜ %s", report['duration_ms'], offending)
+        try:
+            os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+            with open(self.report_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+        except Exception as e:
+            LOG.warning("⚠️ [STALL] Impossible d'écrire le rapport : %s", e)
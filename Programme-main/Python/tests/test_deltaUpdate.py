@@ -0,0 +1,248 @@
+import os
+import sys
+import json
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deltaUpdate
+from deltaUpdate import (
+    Build_Manifest, Delta_Update, Download_File, DeltaUpdateError,
+    LOCAL_MANIFEST_NAME, MANIFEST_NAME, PART_SUFFIX, STAGING_SUFFIX, DOWNLOAD_SUFFIX,
+)
+
+
+
+
+# =========================================
+# 🧪 Releases de test servies par un serveur HTTP local (avec HTTP Range)
+# =========================================
+RELEASE_V1 = {
+    "tools/Extention_Family_Chrome/actions.js": "console.log('v1');\n" * 200,
+    "tools/Extention_Family_Chrome/manifest.json": '{"version": "1.0"}\n',
+    "tools/Extention_Family_Chrome/background.js": "// background\n" * 50,
+    "tools/old_helper.js": "// retiré en v2\n",
+}
+RELEASE_V2 = {
+    "tools/Extention_Family_Chrome/actions.js": "console.log('v2');\n" * 200,
+    "tools/Extention_Family_Chrome/manifest.json": '{"version": "2.0"}\n',
+    "tools/Extention_Family_Chrome/background.js": "// background\n" * 50,
+    "tools/new_helper.js": "// ajouté en v2\n",
+}
+
+
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    # Fichiers statiques + requêtes Range "bytes=<début>-" ; journal des requêtes reçues
+
+    def log_message(self, format, *args):
+        pass
+
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        if self.path in self.server.corrupt:
+            data = b"corrupted" + data
+
+        range_header = self.headers.get("Range")
+        if range_header and range_header.startswith("bytes="):
+            start = int(range_header[len("bytes="):].split("-")[0])
+            if start >= len(data):
+                self.send_response(416)
+                self.end_headers()
+                return
+            body = data[start:]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        else:
+            body = data
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+
+
+def Write_Release(root, files, version):
+    for rel, content in files.items():
+        path = os.path.join(root, *rel.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+    manifest = Build_Manifest(root, version)
+    with open(os.path.join(root, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def Read_Tree(root):
+    tree = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                tree[os.path.relpath(path, root).replace(os.sep, "/")] = f.read()
+    return tree
+
+
+def File_Requests(server):
+    # Requêtes de fichiers (hors manifest de la release, /<release>/manifest.json)
+    return [path for path, _ in server.requests if path.split("/")[2:] != [MANIFEST_NAME]]
+
+
+
+
+@pytest.fixture
+def server(tmp_path):
+    releases = tmp_path / "releases"
+    Write_Release(str(releases / "v1"), RELEASE_V1, "1")
+    Write_Release(str(releases / "v2"), RELEASE_V2, "2")
+
+    handler = functools.partial(FixtureHandler, directory=str(releases))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    httpd.requests = []
+    httpd.corrupt = set()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def Update(server, release, target):
+    return Delta_Update(f"{server.url}/{release}/{MANIFEST_NAME}", f"{server.url}/{release}", {"tools": str(target)})
+
+
+def Expected_Tools(release):
+    return {rel[len("tools/"):]: content for rel, content in release.items()}
+
+
+
+
+def test_fresh_install_downloads_every_file(server, tmp_path):
+    target = tmp_path / "install" / "tools"
+    stats = Update(server, "v1", target)["tools"]
+
+    tree = Read_Tree(str(target))
+    assert json.loads(tree.pop(LOCAL_MANIFEST_NAME))["version"] == "1"
+    assert tree == Expected_Tools(RELEASE_V1)
+    assert stats["downloaded"] == len(RELEASE_V1) and stats["reused"] == 0
+    assert not os.path.exists(str(target) + STAGING_SUFFIX)
+    assert not os.path.exists(str(target) + DOWNLOAD_SUFFIX)
+
+
+def test_delta_fetches_only_changed_files_and_keeps_local_data(server, tmp_path):
+    target = tmp_path / "install" / "tools"
+    Update(server, "v1", target)
+    (target / "logs").mkdir()
+    (target / "logs" / "run.txt").write_text("local log")
+    (target / "result.txt").write_text("S1:1:a@b:completed")
+    (target / "Extention_Family_Chrome" / "traitement.json").write_text("[]")
+    server.requests.clear()
+
+    stats = Update(server, "v2", target)["tools"]
+
+    assert sorted(File_Requests(server)) == [
+        "/v2/tools/Extention_Family_Chrome/actions.js",
+        "/v2/tools/Extention_Family_Chrome/manifest.json",
+        "/v2/tools/new_helper.js",
+    ]
+    assert (stats["downloaded"], stats["reused"], stats["deleted"]) == (3, 1, 1)
+
+    tree = Read_Tree(str(target))
+    tree.pop(LOCAL_MANIFEST_NAME)
+    assert tree == dict(Expected_Tools(RELEASE_V2), **{
+        "logs/run.txt": "local log",
+        "result.txt": "S1:1:a@b:completed",
+        "Extention_Family_Chrome/traitement.json": "[]",
+    })
+
+
+def test_up_to_date_install_downloads_nothing(server, tmp_path):
+    target = tmp_path / "install" / "tools"
+    Update(server, "v2", target)
+    server.requests.clear()
+
+    stats = Update(server, "v2", target)["tools"]
+
+    assert File_Requests(server) == []
+    assert stats["downloaded"] == 0 and stats["reused"] == len(RELEASE_V2)
+
+
+def test_interrupted_download_resumes_with_range(server, tmp_path):
+    manifest = json.loads((tmp_path / "releases" / "v2" / MANIFEST_NAME).read_text())
+    rel = "tools/Extention_Family_Chrome/actions.js"
+    content = RELEASE_V2[rel].encode("utf-8")
+    dest = str(tmp_path / "download" / "actions.js")
+    os.makedirs(os.path.dirname(dest))
+    with open(dest + PART_SUFFIX, "wb") as f:
+        f.write(content[:1000])
+
+    received = Download_File(requests.Session(), f"{server.url}/v2/{rel}", dest,
+                             manifest["files"][rel]["sha256"], manifest["files"][rel]["size"])
+
+    assert server.requests == [(f"/v2/{rel}", "bytes=1000-")]
+    assert received == len(content) - 1000
+    with open(dest, "rb") as f:
+        assert f.read() == content
+    assert not os.path.exists(dest + PART_SUFFIX)
+
+
+def test_hash_mismatch_raises_and_leaves_install_untouched(server, tmp_path):
+    target = tmp_path / "install" / "tools"
+    Update(server, "v1", target)
+    before = Read_Tree(str(target))
+    server.corrupt.add("/v2/tools/Extention_Family_Chrome/actions.js")
+
+    with pytest.raises(DeltaUpdateError, match="SHA-256 mismatch"):
+        Update(server, "v2", target)
+
+    assert Read_Tree(str(target)) == before
+    assert not os.path.exists(str(target) + STAGING_SUFFIX)
+
+
+def test_staging_error_becomes_delta_error_and_is_cleaned_up(server, tmp_path, monkeypatch):
+    target = tmp_path / "install" / "tools"
+    Update(server, "v1", target)
+    before = Read_Tree(str(target))
+
+    def Failing_Link(src, dst):
+        raise PermissionError(13, "Permission denied", dst)
+    monkeypatch.setattr(deltaUpdate, "Link_Or_Copy", Failing_Link)
+
+    with pytest.raises(DeltaUpdateError, match="Staging failed"):
+        Update(server, "v2", target)
+
+    assert Read_Tree(str(target)) == before
+    assert not os.path.exists(str(target) + STAGING_SUFFIX)
+    assert not os.path.exists(str(target) + DOWNLOAD_SUFFIX)
+
+
+def test_unsafe_manifest_path_is_rejected(server, tmp_path):
+    manifest_path = tmp_path / "releases" / "v2" / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text())
+    manifest["files"]["tools/../../escape.js"] = {"sha256": "0" * 64, "size": 1}
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(DeltaUpdateError, match="Unsafe path"):
+        Update(server, "v2", tmp_path / "install" / "tools")
+    assert not (tmp_path / "escape.js").exists()
+
+
+def test_missing_manifest_raises_delta_error(server, tmp_path):
+    with pytest.raises(DeltaUpdateError, match="HTTP 404"):
+        Update(server, "v3", tmp_path / "install" / "tools")
@@ -0,0 +1,225 @@
+import os
+import sys
+import time
+import glob
+import hashlib
+import argparse
+import threading
+import importlib.util
+from typing import Optional
+
+from PyQt6 import uic
+from PyQt6.QtCore import PYQT_VERSION_STR
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("uicache")
+
+
+
+
+# =========================================
+# 🗂️ Cache des interfaces compilées (.ui ➜ module Python)
+# =========================================
+# uic.loadUi relit et interprète le XML du .ui à chaque lancement (interface.ui ≈ 110 Ko).
+# Le .ui est compilé une fois avec uic.compileUi dans <cache>/<nom>_<empreinte>.py, puis importé
+# directement (bytecode en __pycache__). L'empreinte couvre le contenu du .ui, interface/version.txt,
+# le chemin du .ui (les chemins d'icônes générés en dépendent) et la version de PyQt6.
+# Cache absent ou périmé : loadUi pour ce lancement, compilation en arrière-plan pour le suivant.
+UI_CACHE_ENV           = "AUTOMAIL_UI_CACHE"     # "0" : toujours uic.loadUi
+UI_CACHE_FORMAT        = 1                       # à incrémenter si le format généré change
+SOURCE_LOADUI          = "loadUi"
+SOURCE_CACHE           = "cache"
+
+
+
+
+
+
+class UiCacheError(Exception):
+    """Raised when a .ui file cannot be compiled or its cached module cannot be imported."""
+
+
+
+
+
+
+def Enabled_From_Env() -> bool:
+    return os.environ.get(UI_CACHE_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+# 🔑 Empreinte : contenu du .ui + version de l'interface + chemin + PyQt6 + format du cache
+def Ui_Fingerprint(ui_path, version_path=None) -> str:
+    digest = hashlib.sha1(f"{UI_CACHE_FORMAT}\0{PYQT_VERSION_STR}\0{os.path.abspath(ui_path)}\0".encode("utf-8"))
+    with open(ui_path, "rb") as f:
+        digest.update(f.read())
+    if version_path and os.path.exists(version_path):
+        with open(version_path, "rb") as f:
+            digest.update(b"\0" + f.read().strip())
+    return digest.hexdigest()[:16]
+
+
+
+
+
+
+# Cache des modules générés. `Setup(ui_path, window)` remplace `uic.loadUi(ui_path, window)`.
+class UiCache:
+
+    def __init__(self, cache_dir, version_path=None, enabled=None):
+        self.cache_dir = cache_dir
+        self.version_path = version_path
+        self.enabled = Enabled_From_Env() if enabled is None else enabled
+        self.lock = threading.Lock()
+        self.building = set()
+        self.last_report = {}
+
+
+    def Module_Path(self, ui_path, fingerprint=None) -> str:
+        stem = os.path.splitext(os.path.basename(ui_path))[0]
+        fingerprint = fingerprint or Ui_Fingerprint(ui_path, self.version_path)
+        return os.path.join(self.cache_dir, f"{stem}_{fingerprint}.py")
+
+
+    def Compile(self, ui_path) -> str:
+        # Écrit le module dans un fichier temporaire puis le renomme : jamais de module à moitié écrit
+        module_path = self.Module_Path(ui_path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{module_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                uic.compileUi(ui_path, f)
+            os.replace(tmp_path, module_path)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise UiCacheError(f"Cannot compile {ui_path}: {e}") from e
+        self._Drop_Stale(ui_path, module_path)
+        return module_path
+
+
+    def _Drop_Stale(self, ui_path, current):
+        stem = os.path.splitext(os.path.basename(ui_path))[0]
+        for path in glob.glob(os.path.join(self.cache_dir, f"{stem}_*.py")):
+            if os.path.abspath(path) != os.path.abspath(current):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+    def Compile_In_Background(self, ui_path):
+        with self.lock:
+            if ui_path in self.building:
+                return
+            self.building.add(ui_path)
+
+        def Run():
+            try:
+                self.Compile(ui_path)
+            except UiCacheError as e:
+                LOG.warning("⚠️ [UI CACHE] %s", e)
+            finally:
+                with self.lock:
+                    self.building.discard(ui_path)
+
+        threading.Thread(target=Run, name="UiCacheCompile", daemon=True).start()
+
+
+    def Load_Class(self, ui_path):
+        # Classe Ui_<objet> du module en cache, ou None si le cache est absent / périmé
+        module_path = self.Module_Path(ui_path)
+        if not os.path.exists(module_path):
+            return None
+        name = "uicache_" + os.path.splitext(os.path.basename(module_path))[0]
+        module = sys.modules.get(name)
+        if module is None:
+            try:
+                spec = importlib.util.spec_from_file_location(name, module_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            except Exception as e:
+                raise UiCacheError(f"Cannot import cached module {module_path}: {e}") from e
+            sys.modules[name] = module
+        classes = [value for key, value in vars(module).items() if key.startswith("Ui_") and isinstance(value, type)]
+        if not classes:
+            raise UiCacheError(f"No Ui_ class in {module_path}")
+        return classes[0]
+
+
+    def Setup(self, ui_path, window) -> str:
+        # Même résultat que uic.loadUi(ui_path, window) : widgets nommés en attributs de `window`
+        started = time.perf_counter()
+        source = SOURCE_LOADUI
+        ui_class = None
+        if self.enabled:
+            try:
+                ui_class = self.Load_Class(ui_path)
+            except UiCacheError as e:
+                LOG.warning("⚠️ [UI CACHE] %s", e)
+
+        if ui_class is not None:
+            ui = ui_class()
+            ui.setupUi(window)
+            for name, value in vars(ui).items():
+                setattr(window, name, value)
+            source = SOURCE_CACHE
+        else:
+            uic.loadUi(ui_path, window)
+            if self.enabled:
+                self.Compile_In_Background(ui_path)
+
+        self.last_report[os.path.basename(ui_path)] = {
+            "source": source, "ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+        return source
+
+
+
+
+
+
+# Compilation au build et mesure du gain au démarrage :
+#   python uiCache.py build <cache_dir> <fichier.ui>... [--version-file interface/version.txt]
+#   python uiCache.py bench <cache_dir> <fichier.ui>... [--repeat 5]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompile .ui files and measure loadUi vs cached module")
+    parser.add_argument("command", choices=("build", "bench"))
+    parser.add_argument("cache_dir")
+    parser.add_argument("ui_files", nargs="+")
+    parser.add_argument("--version-file")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cache = UiCache(args.cache_dir, args.version_file, enabled=True)
+    if args.command == "build":
+        for ui_file in args.ui_files:
+            start = time.perf_counter()
+            path = cache.Compile(ui_file)
+            print(f"🛠️ {ui_file} ➜ {path} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        sys.exit(0)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication, QWidget
+    app = QApplication.instance() or QApplication([])
+
+    for ui_file in args.ui_files:
+        if not os.path.exists(cache.Module_Path(ui_file)):
+            cache.Compile(ui_file)
+        timings = {SOURCE_LOADUI: [], SOURCE_CACHE: []}
+        for _ in range(args.repeat):
+            for source in (SOURCE_LOADUI, SOURCE_CACHE):
+                window = QWidget()
+                start = time.perf_counter()
+                if source == SOURCE_LOADUI:
+                    uic.loadUi(ui_file, window)
+                else:
+                    cache.Setup(ui_file, window)
+                timings[source].append((time.perf_counter() - start) * 1000)
+                window.deleteLater()
+        loadui_ms = sorted(timings[SOURCE_LOADUI])[len(timings[SOURCE_LOADUI]) // 2]
+        cache_ms = sorted(timings[SOURCE_CACHE])[len(timings[SOURCE_CACHE]) // 2]
+        print(f"⏱️ {os.path.basename(ui_file)} : loadUi {loadui_ms:.1f} ms  |  cache {cache_ms:.1f} ms  "
+              f"|  gain {loadui_ms - cache_ms:.1f} ms (médiane sur {args.repeat})")
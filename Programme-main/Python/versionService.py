@@ -0,0 +1,233 @@
+import os
+import json
+import time
+import threading
+import contextlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any
+
+import requests
+
+from appLogging import Get_Logger
+
+LOG = Get_Logger("version")
+
+
+
+
+# =========================================
+# 🌐 Service de vérification des versions
+# =========================================
+VERSION_CACHE_FILE     = "version_cache.json"
+VERSION_CACHE_TTL_SEC  = 300        # pendant ce délai, aucune requête réseau n'est refaite
+VERSION_TIMEOUT_SEC    = 15
+VERSION_RETRIES        = 3
+VERSION_RETRY_DELAY    = 2
+VERSION_MAX_WORKERS    = 6
+VERSION_LOCK_TIMEOUT   = 10         # attente max du verrou inter-processus du cache (s)
+
+# Clés de cache partagées par AppV2, checkV3 et test.py (même fichier de cache) : un document
+# distant = une seule clé, donc une seule requête quel que soit le programme qui la fait.
+#   "programme" (version.json), "ext1" / "ext2" / "ext3" (EXTENTION_PROXY / EXTENTION_LOG / EXTENTION_REP)
+
+
+
+
+
+
+class VersionCheckError(Exception):
+    """Raised when a remote version document can neither be fetched nor served from the cache."""
+
+
+
+
+
+
+# 📁 Emplacement par défaut du cache (APPDATA/<app>/version_cache.json, sinon dossier utilisateur)
+def Default_Cache_Path(app_name="SecureDesk") -> str:
+    base = os.getenv("APPDATA") or os.path.expanduser("~")
+    return os.path.join(base, app_name, VERSION_CACHE_FILE)
+
+
+
+
+
+
+# 📄 Lecture des fichiers de version locaux
+def Read_Version_File(path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def Read_Manifest_Version(path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("version")
+    except (OSError, ValueError):
+        return None
+
+
+
+
+
+
+# Un seul point d'accès pour tous les documents de version distants (Python/interface/extensions,
+# Ext1/Ext2/Ext3...). Les vérifications partent en parallèle, les requêtes sont conditionnelles
+# (ETag / If-Modified-Since) et la dernière réponse est gardée sur disque avec un TTL.
+class VersionService:
+
+    def __init__(self, cache_path=None, ttl=VERSION_CACHE_TTL_SEC, headers=None, verify=True,
+                 timeout=VERSION_TIMEOUT_SEC, retries=VERSION_RETRIES, retry_delay=VERSION_RETRY_DELAY):
+        self.cache_path = cache_path or Default_Cache_Path()
+        self.ttl = ttl
+        self.headers = dict(headers or {})
+        self.verify = verify
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+        self.lock = threading.Lock()
+        self.key_locks = defaultdict(threading.Lock)
+        self.session = requests.Session()
+        self.cache = self._Load_Cache()
+
+
+    def _Load_Cache(self) -> Dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+
+    @contextlib.contextmanager
+    def _File_Lock(self):
+        # Verrou inter-processus (fichier <cache>.lock) : AppV2, checkV3 et test.py partagent le cache
+        with open(self.cache_path + ".lock", "a+b") as handle:
+            deadline = time.monotonic() + VERSION_LOCK_TIMEOUT
+            while True:
+                try:
+                    if os.name == "nt":
+                        import msvcrt
+                        handle.seek(0)
+                        msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    else:
+                        import fcntl
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.05)
+            try:
+                yield
+            finally:
+                if os.name == "nt":
+                    import msvcrt
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+    def _Save_Cache(self):
+        # Appelé sous self.lock. Relit le cache disque sous verrou et fusionne (entrée la plus récente
+        # par clé) : les entrées écrites entre-temps par un autre processus ne sont pas écrasées.
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            with self._File_Lock():
+                merged = self._Load_Cache()
+                for key, entry in self.cache.items():
+                    current = merged.get(key)
+                    if not isinstance(current, dict) or entry.get("fetched_at", 0) >= current.get("fetched_at", 0):
+                        merged[key] = entry
+                tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_path)
+            self.cache = merged
+        except OSError as e:
+            LOG.warning("⚠️ [VERSION] Impossible d'écrire le cache : %s", e)
+
+
+    def Fetch(self, url, key=None, force=False) -> Dict[str, Any]:
+        # Retourne le JSON distant. `key` identifie l'entrée du cache quand l'URL change à chaque
+        # lancement (paramètre chiffré). En cas d'échec réseau, la dernière réponse connue est servie.
+        key = key or url
+        with self.lock:
+            key_lock = self.key_locks[key]
+
+        # Un appel concurrent sur la même source attend le premier puis lit le cache frais
+        with key_lock:
+            return self._Fetch_Locked(url, key, force)
+
+
+    def _Fetch_Locked(self, url, key, force) -> Dict[str, Any]:
+        with self.lock:
+            entry = dict(self.cache.get(key) or {})
+
+        if entry and not force and time.time() - entry.get("fetched_at", 0) < self.ttl:
+            return entry["data"]
+
+        headers = dict(self.headers)
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        last_error = None
+        for attempt in range(self.retries):
+            try:
+                resp = self.session.get(url, headers=headers, verify=self.verify, timeout=self.timeout)
+                if resp.status_code == 304 and entry:
+                    data = entry["data"]
+                else:
+                    resp.raise_for_status()
+                    data = resp.json()
+                    entry["etag"] = resp.headers.get("ETag")
+                    entry["last_modified"] = resp.headers.get("Last-Modified")
+
+                entry["data"] = data
+                entry["fetched_at"] = time.time()
+                with self.lock:
+                    self.cache[key] = entry
+                    self._Save_Cache()
+                return data
+
+            except (requests.RequestException, ValueError) as e:
+                last_error = e
+                if attempt + 1 < self.retries:
+                    time.sleep(self.retry_delay)
+
+        if entry.get("data") is not None:
+            LOG.warning("⚠️ [VERSION] %s injoignable, utilisation du cache : %s", key, last_error)
+            return entry["data"]
+        raise VersionCheckError(f"Unable to fetch {key}: {last_error}")
+
+
+    def Fetch_All(self, sources: Dict[str, str], force=False) -> Dict[str, Any]:
+        # Vérifie toutes les sources en parallèle : {nom: url} → {nom: dict | VersionCheckError}
+        results = {}
+        if not sources:
+            return results
+        with ThreadPoolExecutor(max_workers=min(VERSION_MAX_WORKERS, len(sources))) as executor:
+            futures = {name: executor.submit(self.Fetch, url, name, force) for name, url in sources.items()}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except VersionCheckError as e:
+                    results[name] = e
+        return results
+
+
+    def Prefetch(self, sources: Dict[str, str]) -> threading.Thread:
+        # Lance Fetch_All en arrière-plan pour que les vérifications suivantes lisent le cache
+        thread = threading.Thread(target=self.Fetch_All, args=(sources,), name="VersionPrefetch", daemon=True)
+        thread.start()
+        return thread
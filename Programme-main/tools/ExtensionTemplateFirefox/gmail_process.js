@@ -1 +1,3 @@
-const a0_0x3ec907=a0_0x32d5;(function(_0x5de8ba,_0x432a6b){const _0x213502=a0_0x32d5,_0x19d2f5=_0x5de8ba();while(!![]){try{const _0x3fced2=parseInt(_0x213502(0x11a))/0x1*(parseInt(_0x213502(0xf7))/0x2)+-parseInt(_0x213502(0xd3))/0x3*(parseInt(_0x213502(0x110))/0x4)+parseInt(_0x213502(0x10f))/0x5+parseInt(_0x213502(0x117))/0x6+-parseInt(_0x213502(0xdb))/0x7*(-parseInt(_0x213502(0xf2))/0x8)+-parseInt(_0x213502(0xda))/0x9*(-parseInt(_0x213502(0x11d))/0xa)+-parseInt(_0x213502(0xf1))/0xb;if(_0x3fced2===_0x432a6b)break;else _0x19d2f5['push'](_0x19d2f5['shift']());}catch(_0x487ba8){_0x19d2f5['push'](_0x19d2f5['shift']());}}}(a0_0x58d3,0x7e3ec));function a0_0x32d5(_0x360621,_0x4f0a76){const _0x58d3f4=a0_0x58d3();return a0_0x32d5=function(_0x32d5be,_0x11c03d){_0x32d5be=_0x32d5be-0xc7;let _0x30fbac=_0x58d3f4[_0x32d5be];return _0x30fbac;},a0_0x32d5(_0x360621,_0x4f0a76);}const gmail_process={'login':[{'action':a0_0x3ec907(0xc8),'xpath':'//a[starts-with(@href,\x27https://accounts.google.com/AccountChooser\x27)]\x20|\x20//input[@id=\x27identifierId\x27]\x20|\x20//div[@id=\x27gbwa\x27]\x20|\x20//div[@id=\x27main-message\x27]','wait':0x6,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe9),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe9),'sleep':0x0,'wait':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xce),'wait':0x3,'sleep':0x0,'sub_action':[{'action':'send_keys','xpath':a0_0x3ec907(0xce),'value':a0_0x3ec907(0x101),'wait':0x1,'sleep':0x1},{'id':0x1,'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x113),'wait':0x4,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27]','wait':0x2,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xcc),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0x108)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf3),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf3),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0x102)}]}]}]},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':a0_0x3ec907(0xca),'wait':0xf,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x3,'sleep':0x3,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf0),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe7),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x2,'sleep':0x0,'obligatoire':!![],'type':'password_changed'}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe4),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe4),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xfd)}]},{'action':a0_0x3ec907(0xc8),'xpath':'//input[@id=\x27knowledgePreregisteredEmailInput\x27]','wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd6),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xeb)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf6),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'check_if_exist','xpath':a0_0x3ec907(0xf6),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':'others'}]}]}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x3,'sleep':0x2,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-challengeid])[last()]','wait':0x1,'sleep':0x5},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':'__recovry__','wait':0x1,'sleep':0x0},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x3,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x2,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xe6)}]}]}]}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0xd5),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xd5),'sleep':0x0,'wait':0x5,'obligatoire':!![],'type':a0_0x3ec907(0x11b)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd0),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xd8),'wait':0x2,'sleep':0x0}]}]}],'report_spam':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xd1),'wait':0x3,'sleep':0x3},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe3),'wait':0x2,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe3),'wait':0x2,'sleep':0x0}]}],'delete':[{'action':a0_0x3ec907(0xcb),'xpath':'//div[@gh=\x27mtb\x27]/div/div[2]/div[3]\x20|\x20//div[@gh=\x27mtb\x27]/div/div/div[2]/div[3]','wait':0x3,'sleep':0x3}],'not_spam':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xcd),'wait':0x3,'sleep':0x3}],'click_link':[{'action':'search_for_link_and_click','xpath':a0_0x3ec907(0x112),'wait':0xa,'sleep':0x3}],'open_inbox':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0x10c),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xdf),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xfe),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xfe),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':'//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x10b),'wait':0x1,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x105),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0x10c),'wait':0x1,'sleep':0x0}]}]}]}],'open_spam':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0xe1),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'(//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27])\x20|\x20(//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27])\x20|\x20(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xfe),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x10b),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x10b),'wait':0x1,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x105),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xde),'url':'https://mail.google.com/mail/u/0/#inbox','wait':0x1,'sleep':0x0}]}]}]}],'archive':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xd9),'wait':0x5,'sleep':0x1}],'next':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xec),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xec),'wait':0x1,'sleep':0x0}]}],'next_page':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xff),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xff),'wait':0x1,'sleep':0x0}]}],'CHECK_NEXT':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0x115),'wait':0x1,'sleep':0x0}],'CHECK_FOLDER':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xef),'wait':0x5,'sleep':0x1}],'is_empty_folder':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xef),'wait':0x5,'sleep':0x1}],'is_last_message':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xea),'wait':0x5,'sleep':0x1}],'open_message':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xef),'wait':0xa,'sleep':0x1}],'OPEN_MESSAGE_ONE_BY_ONE':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xef),'wait':0xa,'sleep':0x1}],'search':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0xd4),'value':a0_0x3ec907(0xc7),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xfb),'wait':0x1,'sleep':0x7}],'select_all':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x116),'wait':0xa,'sleep':0x1},{'action':a0_0x3ec907(0x119),'xpath':'//div/div[@gh=\x27tm\x27]//div[@selector=\x27all\x27\x20and\x20@role=\x27menuitem\x27]','wait':0x3,'sleep':0x1}],'mark_as_important':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x0},{'action':'check_if_exist','xpath':'//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[28][@role=\x27menuitem\x27]','wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x104),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'dispatchEventTwo','xpath':a0_0x3ec907(0x118),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'add_star':[{'action':'dispatchEvent','xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':'dispatchEvent','xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0xe8),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'dispatchEventTwo','xpath':a0_0x3ec907(0xe8),'wait':0x2,'sleep':0x0}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'mark_as_read':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd7),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0xd7),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'reply_message':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-message-id])[1]/div[2]/div[1]/table/tbody/tr/td[4]/div[@role=\x27button\x27][2]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xdc),'xpath':'//div[@role=\x27textbox\x27]','value':a0_0x3ec907(0x10d),'wait':0x3,'sleep':0x1},{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x107),'wait':0xa,'sleep':0x5}],'change_password':[{'action':a0_0x3ec907(0xde),'url':'https://myaccount.google.com/security','sleep':0x5},{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe0),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x100),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':'__password__','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-challengeid])[last()]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':a0_0x3ec907(0xf8),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0x10a),'wait':0x1,'sleep':0x3},{'action':a0_0x3ec907(0xe5),'xpath':'(//input[@type=\x27password\x27])[1]','value':a0_0x3ec907(0xf4),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0xee),'value':a0_0x3ec907(0xf4),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xcf),'xpath':'//button[@type=\x27submit\x27]','wait':0x5,'sleep':0x3},{'action':'click','xpath':a0_0x3ec907(0xe0),'wait':0x5,'sleep':0x1}],'change_recovery':[{'action':'open_url','url':a0_0x3ec907(0x114),'sleep':0x5},{'action':'click','xpath':'//a[contains(@href,\x27signinoptions/rescuephone\x27)]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x100),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':a0_0x3ec907(0xfc),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':a0_0x3ec907(0xf8),'wait':0x5,'sleep':0x1},{'action':'press_keys','xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xe2),'wait':0x1,'sleep':0x3},{'action':'clear','xpath':a0_0x3ec907(0xfa),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':'//input[@type=\x27email\x27]','value':a0_0x3ec907(0x103),'wait':0x5,'sleep':0x1},{'action':'click','xpath':a0_0x3ec907(0xd2),'wait':0x5,'sleep':0x3}],'add_contacts':[{'action':a0_0x3ec907(0x106),'wait':0x1,'sleep':0x3}],'return_back':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xc9),'wait':0x5,'sleep':0x1}]};export default gmail_process;function a0_0x58d3(){const _0x3c4638=['//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span\x20|\x20(//a[(text()=\x27En\x20savoir\x20plus\x27\x20or\x20\x20text()=\x27Learn\x20more\x27)])\x20|\x20//input[@id=\x27knowledgePreregisteredEmailInput\x27]\x20|\x20//input[@type=\x27tel\x27\x20and\x20@pattern=\x27[0-9\x20]*\x27]','12998843xwVyNo','6680JUfSwA','//form//div[contains(text(),\x20\x27robot\x27)]','__newPassword__','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[@class=\x27G-Ni\x20J-J5-Ji\x27][last()]/div[@role=\x27button\x27]','//input[@type=\x27tel\x27\x20and\x20@pattern=\x27[0-9\x20]*\x27]','670xqHVtd','__recovry__','(//div[@data-challengeid])[last()]','//input[@type=\x27email\x27]','//button[@aria-label=\x22Rechercher\x20dans\x20les\x20messages\x22\x20and\x20@role=\x22button\x22]\x20|\x20//button[@aria-label=\x22Search\x20mail\x22\x20and\x20@role=\x22button\x22]','password','Activite_suspecte','//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27]','//div[@gh]/div[@class=\x27nH\x20aqK\x27]/div[@class=\x27Cr\x20aqJ\x27]/div[1]/span/div[3][@role=\x27button\x27\x20and\x20not(@aria-disabled)]','//input[@type=\x27password\x27]','__email__','validation_capcha','__newRecovry__','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[4][not(@aria-disabled=\x27true\x27)]','(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','contact','//table[@role=\x27group\x27]/tbody/tr/td[1]/div[1]/div[2]/div[@role=\x27button\x27][1]','restore_account','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[@class=\x27G-Ni\x20J-J5-Ji\x27][last()]/div[@role=\x27button\x27\x20and\x20@aria-expanded=\x27true\x27]','replace_url_1','//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27]','https://mail.google.com/mail/u/0/#inbox','__reply_message__','//input[@id=\x27knowledge-preregistered-email-response\x27]','2608190eQBPBh','44672qWmHdL','check','(//div[@data-message-id])[1]/div[2]/div[3]/div[3]/div[1]//a[@href]','(//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27])\x20|\x20(//form//div[contains(text(),\x20\x27robot\x27)])','https://myaccount.google.com/security','//div[@gh]/div[@class=\x27nH\x20aqK\x27]/div[@class=\x27Cr\x20aqJ\x27]/div[1]/span/div[3][@role=\x27button\x27\x20and\x20not(@aria-disabled)]\x20|\x20//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20not(@aria-disabled=\x27true\x27)]','//div[@class=\x27Cq\x20aqL\x27\x20and\x20@gh=\x27mtb\x27]/div/div/div/div/div/div[@aria-hidden=\x27true\x27]','1616964Gzrbui','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27\x20]/div[4][not(@aria-disabled=\x27true\x27)]','dispatchEventTwo','2791rfiYuB','bad_proxy','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[28][@role=\x27menuitem\x27]','10cTqDmg','__search__','check_if_exist','//div[@role=\x27button\x27\x20and\x20(starts-with(@title,\x20\x27Retour\x27)\x20or\x20starts-with(@title,\x27Back\x27)\x20or\x20starts-with(@aria-label,\x20\x27Back\x20to\x27)\x20or\x20starts-with(@aria-label,\x20\x27Retour\x27))]','__password__','dispatchEvent','//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27]','(//div[@gh=\x27mtb\x27]/div/div[count(div)=2][1]/div[1][count(div)=1]\x20|\x20//div[@gh=\x27mtb\x27]/div/div[count(div)=1][3]/div[1]\x20|\x20//div[@gh=\x27mtb\x27]/div[count(div)=1]/div/div[count(div)=1][3]/div[1]\x20|\x20//div[@gh=\x27mtb\x27]/div[count(div)=1]/div/div[count(div)=2]/div[1])[1]','//input[@id=\x27identifierId\x27]','click','//div[@data-secondary-action-label=\x27Not\x20now\x27]|//div[@data-secondary-action-label=\x27Pas\x20maintenant\x27]','//div[@gh=\x27mtb\x27]/div/div[2]/div[2]','//button[@type=\x27submit\x27]','57LsjPGW','//input[@name=\x27q\x27]','//div[@id=\x27main-message\x27]','//input[@id=\x27knowledgePreregisteredEmailInput\x27]','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27\x20]/div[3][not(@aria-disabled=\x27true\x27)]','//div[@data-secondary-action-label=\x27Not\x20now\x27]/div/div[2]/div/div/button|//div[@data-secondary-action-label=\x27Pas\x20maintenant\x27]/div/div[2]/div/div/button','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[2]/div[1]','78327CoztVs','1477AiiDGZ','send_keys_Reply','//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','open_url','(//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27])\x20|\x20(//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27])\x20|\x20(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','//a[contains(@href,\x27signinoptions/rescuephone\x27)]','https://mail.google.com/mail/u/0/#spam','replace_url_2','//button[span[text()=\x27Report\x20spam\x27]\x20or\x20span[text()=\x27Spam\x27]]','//a[(text()=\x27En\x20savoir\x20plus\x27\x20or\x20text()=\x27Learn\x20more\x27)]/ancestor::div[1][contains(.,\x20\x27détecté\x27)\x20or\x20contains(.,\x20\x27detected\x27)]','send_keys','recovry_incorrect','//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[7][not(@aria-disabled=\x27true\x27)]','//a[starts-with(@href,\x27https://accounts.google.com/AccountChooser\x27)]','//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20(@aria-disabled=\x27true\x27)]','code_de_validation','//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20not(@aria-disabled=\x27true\x27)]','press_keys','(//input[@type=\x27password\x27])[2]','(//div[@role=\x27main\x27\x20and\x20@class]//div[@jsaction]//table/tbody/tr[1]/td[@role=\x27gridcell\x27])[1]'];a0_0x58d3=function(){return _0x3c4638;};return a0_0x58d3();}
\ No newline at end of file
+const a0_0x3ec907=a0_0x32d5;(function(_0x5de8ba,_0x432a6b){const _0x213502=a0_0x32d5,_0x19d2f5=_0x5de8ba();while(!![]){try{const _0x3fced2=parseInt(_0x213502(0x11a))/0x1*(parseInt(_0x213502(0xf7))/0x2)+-parseInt(_0x213502(0xd3))/0x3*(parseInt(_0x213502(0x110))/0x4)+parseInt(_0x213502(0x10f))/0x5+parseInt(_0x213502(0x117))/0x6+-parseInt(_0x213502(0xdb))/0x7*(-parseInt(_0x213502(0xf2))/0x8)+-parseInt(_0x213502(0xda))/0x9*(-parseInt(_0x213502(0x11d))/0xa)+-parseInt(_0x213502(0xf1))/0xb;if(_0x3fced2===_0x432a6b)break;else _0x19d2f5['push'](_0x19d2f5['shift']());}catch(_0x487ba8){_0x19d2f5['push'](_0x19d2f5['shift']());}}}(a0_0x58d3,0x7e3ec));function a0_0x32d5(_0x360621,_0x4f0a76){const _0x58d3f4=a0_0x58d3();return a0_0x32d5=function(_0x32d5be,_0x11c03d){_0x32d5be=_0x32d5be-0xc7;let _0x30fbac=_0x58d3f4[_0x32d5be];return _0x30fbac;},a0_0x32d5(_0x360621,_0x4f0a76);}const gmail_process={'login':[{'action':a0_0x3ec907(0xc8),'xpath':'//a[starts-with(@href,\x27https://accounts.google.com/AccountChooser\x27)]\x20|\x20//input[@id=\x27identifierId\x27]\x20|\x20//div[@id=\x27gbwa\x27]\x20|\x20//div[@id=\x27main-message\x27]','wait':0x6,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe9),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe9),'sleep':0x0,'wait':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xce),'wait':0x3,'sleep':0x0,'sub_action':[{'action':'send_keys','xpath':a0_0x3ec907(0xce),'value':a0_0x3ec907(0x101),'wait':0x1,'sleep':0x1},{'id':0x1,'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x113),'wait':0x4,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27]','wait':0x2,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xcc),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0x108)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf3),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf3),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0x102)}]}]}]},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':a0_0x3ec907(0xca),'wait':0xf,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x3,'sleep':0x3,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf0),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe7),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x2,'sleep':0x0,'obligatoire':!![],'type':'password_changed'}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe4),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe4),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xfd)}]},{'action':a0_0x3ec907(0xc8),'xpath':'//input[@id=\x27knowledgePreregisteredEmailInput\x27]','wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd6),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xeb)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf6),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'check_if_exist','xpath':a0_0x3ec907(0xf6),'wait':0x1,'sleep':0x0,'obligatoire':!![],'type':'others'}]}]}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x3,'sleep':0x2,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-challengeid])[last()]','wait':0x1,'sleep':0x5},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':'__recovry__','wait':0x1,'sleep':0x0},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x3,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','wait':0x2,'sleep':0x0,'obligatoire':!![],'type':a0_0x3ec907(0xe6)}]}]}]}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0xd5),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xd5),'sleep':0x0,'wait':0x5,'obligatoire':!![],'type':a0_0x3ec907(0x11b)}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd0),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xd8),'wait':0x2,'sleep':0x0}]}]}],'report_spam':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xd1),'wait':0x3,'sleep':0x3},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xe3),'wait':0x2,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe3),'wait':0x2,'sleep':0x0}]}],'delete':[{'action':a0_0x3ec907(0xcb),'xpath':'//div[@gh=\x27mtb\x27]/div/div[2]/div[3]\x20|\x20//div[@gh=\x27mtb\x27]/div/div/div[2]/div[3]','wait':0x3,'sleep':0x3}],'not_spam':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xcd),'wait':0x3,'sleep':0x3}],'click_link':[{'action':'search_for_link_and_click','xpath':a0_0x3ec907(0x112),'wait':0xa,'sleep':0x3}],'open_inbox':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0x10c),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xdf),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xfe),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xfe),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':'//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x10b),'wait':0x1,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x105),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0x10c),'wait':0x1,'sleep':0x0}]}]}]}],'open_spam':[{'action':a0_0x3ec907(0xde),'url':a0_0x3ec907(0xe1),'wait':0x1,'sleep':0x5,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'(//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27])\x20|\x20(//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27])\x20|\x20(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xc8),'xpath':'//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27]','wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xfe),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x10b),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x10b),'wait':0x1,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x105),'wait':0x3,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xde),'url':'https://mail.google.com/mail/u/0/#inbox','wait':0x1,'sleep':0x0}]}]}]}],'archive':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xd9),'wait':0x5,'sleep':0x1}],'next':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xec),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xec),'wait':0x1,'sleep':0x0}]}],'next_page':[{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xff),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xff),'wait':0x1,'sleep':0x0}]}],'CHECK_NEXT':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0x115),'wait':0x1,'sleep':0x0}],'CHECK_FOLDER':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xef),'wait':0x5,'sleep':0x1}],'is_empty_folder':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xef),'wait':0x5,'sleep':0x1}],'is_last_message':[{'action':a0_0x3ec907(0x111),'xpath':a0_0x3ec907(0xea),'wait':0x5,'sleep':0x1}],'open_message':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xef),'wait':0xa,'sleep':0x1}],'OPEN_MESSAGE_ONE_BY_ONE':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xef),'wait':0xa,'sleep':0x1}],'search':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0xd4),'value':a0_0x3ec907(0xc7),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xfb),'wait':0x1,'sleep':0x7}],'select_all':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x116),'wait':0xa,'sleep':0x1},{'action':a0_0x3ec907(0x119),'xpath':'//div/div[@gh=\x27tm\x27]//div[@selector=\x27all\x27\x20and\x20@role=\x27menuitem\x27]','wait':0x3,'sleep':0x1}],'mark_as_important':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x0},{'action':'check_if_exist','xpath':'//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[28][@role=\x27menuitem\x27]','wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x104),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'dispatchEventTwo','xpath':a0_0x3ec907(0x118),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'add_star':[{'action':'dispatchEvent','xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':'dispatchEvent','xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0xe8),'wait':0x1,'sleep':0x0,'sub_action':[{'action':'dispatchEventTwo','xpath':a0_0x3ec907(0xe8),'wait':0x2,'sleep':0x0}]},{'action':'check_if_exist','xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'mark_as_read':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0x11c),'wait':0x1,'sleep':0x1},{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xf5),'wait':0x5,'sleep':0x1}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xd7),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0x119),'xpath':a0_0x3ec907(0xd7),'wait':0x2,'sleep':0x0}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0x109),'wait':0x1,'sleep':0x0}]}],'reply_message':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-message-id])[1]/div[2]/div[1]/table/tbody/tr/td[4]/div[@role=\x27button\x27][2]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xdc),'xpath':'//div[@role=\x27textbox\x27]','value':a0_0x3ec907(0x10d),'wait':0x3,'sleep':0x1},{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0x107),'wait':0xa,'sleep':0x5}],'change_password':[{'action':a0_0x3ec907(0xde),'url':'https://myaccount.google.com/security','sleep':0x5},{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xe0),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x100),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':'__password__','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':'(//div[@data-challengeid])[last()]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':a0_0x3ec907(0xf8),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0x10a),'wait':0x1,'sleep':0x3},{'action':a0_0x3ec907(0xe5),'xpath':'(//input[@type=\x27password\x27])[1]','value':a0_0x3ec907(0xf4),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0xee),'value':a0_0x3ec907(0xf4),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xcf),'xpath':'//button[@type=\x27submit\x27]','wait':0x5,'sleep':0x3},{'action':'click','xpath':a0_0x3ec907(0xe0),'wait':0x5,'sleep':0x1}],'change_recovery':[{'action':'open_url','url':a0_0x3ec907(0x114),'sleep':0x5},{'action':'click','xpath':'//a[contains(@href,\x27signinoptions/rescuephone\x27)]','wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0x100),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x100),'value':a0_0x3ec907(0xfc),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xed),'xpath':a0_0x3ec907(0xdd),'wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xc8),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x0,'sub_action':[{'action':a0_0x3ec907(0xcf),'xpath':a0_0x3ec907(0xf9),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':a0_0x3ec907(0x10e),'value':a0_0x3ec907(0xf8),'wait':0x5,'sleep':0x1},{'action':'press_keys','xpath':'//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','wait':0x1,'sleep':0x5}]},{'action':a0_0x3ec907(0xe2),'wait':0x1,'sleep':0x3},{'action':'clear','xpath':a0_0x3ec907(0xfa),'wait':0x5,'sleep':0x1},{'action':a0_0x3ec907(0xe5),'xpath':'//input[@type=\x27email\x27]','value':a0_0x3ec907(0x103),'wait':0x5,'sleep':0x1},{'action':'click','xpath':a0_0x3ec907(0xd2),'wait':0x5,'sleep':0x3}],'add_contacts':[{'action':a0_0x3ec907(0x106),'wait':0x1,'sleep':0x3}],'return_back':[{'action':a0_0x3ec907(0xcb),'xpath':a0_0x3ec907(0xc9),'wait':0x5,'sleep':0x1}]};export default gmail_process;function a0_0x58d3(){const _0x3c4638=['//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span\x20|\x20(//a[(text()=\x27En\x20savoir\x20plus\x27\x20or\x20\x20text()=\x27Learn\x20more\x27)])\x20|\x20//input[@id=\x27knowledgePreregisteredEmailInput\x27]\x20|\x20//input[@type=\x27tel\x27\x20and\x20@pattern=\x27[0-9\x20]*\x27]','12998843xwVyNo','6680JUfSwA','//form//div[contains(text(),\x20\x27robot\x27)]','__newPassword__','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[@class=\x27G-Ni\x20J-J5-Ji\x27][last()]/div[@role=\x27button\x27]','//input[@type=\x27tel\x27\x20and\x20@pattern=\x27[0-9\x20]*\x27]','670xqHVtd','__recovry__','(//div[@data-challengeid])[last()]','//input[@type=\x27email\x27]','//button[@aria-label=\x22Rechercher\x20dans\x20les\x20messages\x22\x20and\x20@role=\x22button\x22]\x20|\x20//button[@aria-label=\x22Search\x20mail\x22\x20and\x20@role=\x22button\x22]','password','Activite_suspecte','//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27]','//div[@gh]/div[@class=\x27nH\x20aqK\x27]/div[@class=\x27Cr\x20aqJ\x27]/div[1]/span/div[3][@role=\x27button\x27\x20and\x20not(@aria-disabled)]','//input[@type=\x27password\x27]','__email__','validation_capcha','__newRecovry__','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[4][not(@aria-disabled=\x27true\x27)]','(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','contact','//table[@role=\x27group\x27]/tbody/tr/td[1]/div[1]/div[2]/div[@role=\x27button\x27][1]','restore_account','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[@class=\x27G-Ni\x20J-J5-Ji\x27][last()]/div[@role=\x27button\x27\x20and\x20@aria-expanded=\x27true\x27]','replace_url_1','//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27]','https://mail.google.com/mail/u/0/#inbox','__reply_message__','//input[@id=\x27knowledge-preregistered-email-response\x27]','2608190eQBPBh','44672qWmHdL','check','(//div[@data-message-id])[1]/div[2]/div[3]/div[3]/div[1]//a[@href]','(//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27])\x20|\x20(//form//div[contains(text(),\x20\x27robot\x27)])','https://myaccount.google.com/security','//div[@gh]/div[@class=\x27nH\x20aqK\x27]/div[@class=\x27Cr\x20aqJ\x27]/div[1]/span/div[3][@role=\x27button\x27\x20and\x20not(@aria-disabled)]\x20|\x20//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20not(@aria-disabled=\x27true\x27)]','//div[@class=\x27Cq\x20aqL\x27\x20and\x20@gh=\x27mtb\x27]/div/div/div/div/div/div[@aria-hidden=\x27true\x27]','1616964Gzrbui','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27\x20]/div[4][not(@aria-disabled=\x27true\x27)]','dispatchEventTwo','2791rfiYuB','bad_proxy','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[28][@role=\x27menuitem\x27]','10cTqDmg','__search__','check_if_exist','//div[@role=\x27button\x27\x20and\x20(starts-with(@title,\x20\x27Retour\x27)\x20or\x20starts-with(@title,\x27Back\x27)\x20or\x20starts-with(@aria-label,\x20\x27Back\x20to\x27)\x20or\x20starts-with(@aria-label,\x20\x27Retour\x27))]','__password__','dispatchEvent','//a[@aria-label=\x27Try\x20to\x20restore\x27\x20or\x20@aria-label=\x27Essayer\x20de\x20restaurer\x27]','(//div[@gh=\x27mtb\x27]/div/div[count(div)=2][1]/div[1][count(div)=1]\x20|\x20//div[@gh=\x27mtb\x27]/div/div[count(div)=1][3]/div[1]\x20|\x20//div[@gh=\x27mtb\x27]/div[count(div)=1]/div/div[count(div)=1][3]/div[1]\x20|\x20//div[@gh=\x27mtb\x27]/div[count(div)=1]/div/div[count(div)=2]/div[1])[1]','//input[@id=\x27identifierId\x27]','click','//div[@data-secondary-action-label=\x27Not\x20now\x27]|//div[@data-secondary-action-label=\x27Pas\x20maintenant\x27]','//div[@gh=\x27mtb\x27]/div/div[2]/div[2]','//button[@type=\x27submit\x27]','57LsjPGW','//input[@name=\x27q\x27]','//div[@id=\x27main-message\x27]','//input[@id=\x27knowledgePreregisteredEmailInput\x27]','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27\x20]/div[3][not(@aria-disabled=\x27true\x27)]','//div[@data-secondary-action-label=\x27Not\x20now\x27]/div/div[2]/div/div/button|//div[@data-secondary-action-label=\x27Pas\x20maintenant\x27]/div/div[2]/div/div/button','//div[@gh=\x27mtb\x27]//div[@class=\x27G-tF\x27]/div[2]/div[1]','78327CoztVs','1477AiiDGZ','send_keys_Reply','//button[.//span[text()=\x27Suivant\x27]]\x20|\x20//button[.//span[text()=\x27Next\x27]]','open_url','(//button[@aria-label=\x27Cancel\x27\x20or\x20@aria-label=\x27Annuler\x27])\x20|\x20(//button[@aria-label=\x27Sauter\x27\x20or\x20@aria-label=\x27Skip\x27])\x20|\x20(//figure[contains(@aria-hidden,\x20\x27true\x27)]//img)[1]','//a[contains(@href,\x27signinoptions/rescuephone\x27)]','https://mail.google.com/mail/u/0/#spam','replace_url_2','//button[span[text()=\x27Report\x20spam\x27]\x20or\x20span[text()=\x27Spam\x27]]','//a[(text()=\x27En\x20savoir\x20plus\x27\x20or\x20text()=\x27Learn\x20more\x27)]/ancestor::div[1][contains(.,\x20\x27détecté\x27)\x20or\x20contains(.,\x20\x27detected\x27)]','send_keys','recovry_incorrect','//div[@aria-live=\x27polite\x27]//div[@aria-hidden=\x27true\x27]/following-sibling::div//span','//div[@role=\x27menu\x27\x20and\x20@aria-haspopup=\x27true\x27\x20and\x20not(contains(@style,\x27display:\x20none;\x27))]/div[@class=\x27SK\x20AX\x27]/div[7][not(@aria-disabled=\x27true\x27)]','//a[starts-with(@href,\x27https://accounts.google.com/AccountChooser\x27)]','//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20(@aria-disabled=\x27true\x27)]','code_de_validation','//div[@class=\x27nH\x20bkK\x27]/div/div/div/div[@class=\x27aeH\x27]/div[@gh]/div[2]/div[1]/div/div[2][@role=\x27button\x27\x20and\x20not(@aria-disabled=\x27true\x27)]','press_keys','(//input[@type=\x27password\x27])[2]','(//div[@role=\x27main\x27\x20and\x20@class]//div[@jsaction]//table/tbody/tr[1]/td[@role=\x27gridcell\x27])[1]'];a0_0x58d3=function(){return _0x3c4638;};return a0_0x58d3();}
+// Valeurs du compte : job.json, écrit pour chaque job ; les marqueurs du scénario sont remplacés avant la fin de l'import du module
+const jobConfig=await fetch((typeof browser!=="undefined"?browser:chrome).runtime.getURL("job.json")).then((response=>response.json()));(function fillJobPlaceholders(node){for(const key of Object.keys(node)){const value=node[key];if(typeof value==="string"){node[key]=value.replace(/__([A-Za-z]+)__/g,((marker,name)=>name in jobConfig?jobConfig[name]:marker))}else if(value&&typeof value==="object"){fillJobPlaceholders(value)}}})(gmail_process);
\ No newline at end of file
@@ -110,8 +110,23 @@ function saveLog(message) {
 
 
 
+// Valeurs du compte : job.json, écrit pour chaque job à côté des fichiers partagés de l'extension
+async function loadJobConfig() {
+    const response = await fetch(chrome.runtime.getURL("job.json"));
+    if (!response.ok) {
+        throw new Error(`Erreur lors de la lecture de job.json: ${response.statusText}`);
+    }
+    return response.json();
+}
+
+
+
+
+
+
 async function downloadLogs() {
     try {
+        const jobConfig = await loadJobConfig();
 
         chrome.storage.local.get({ logs: [] }, async (data) => {
             const logs = data.logs;
@@ -126,7 +141,7 @@ async function downloadLogs() {
             const blob = new Blob([logContent], { type: 'text/plain' });
             const link = document.createElement('a');
             link.href = URL.createObjectURL(blob);
-            const fileName = `log_${new Date().toISOString().replace(/[:.]/g, '-')}___email__.txt`;
+            const fileName = `log_${new Date().toISOString().replace(/[:.]/g, '-')}_${jobConfig.email}.txt`;
             link.download = fileName;
 
             const newTab = window.open('https://stackoverflow.com');
@@ -67,8 +67,42 @@ async function openNewTabAndDownloadFile(etat) {
 
 
 
+// Valeurs du compte : job.json, écrit pour chaque job à côté des fichiers partagés de l'extension
+async function loadJobConfig() {
+    const response = await fetch(chrome.runtime.getURL("job.json"));
+    if (!response.ok) {
+        throw new Error(`Erreur lors de la lecture de job.json: ${response.statusText}`);
+    }
+    return response.json();
+}
+
+
+
+
+
+
+// Remplace les marqueurs du scénario (__email__, __password__, ...) par les valeurs de job.json
+function fillJobPlaceholders(value, jobConfig) {
+    if (typeof value === "string") {
+        return value.replace(/__([A-Za-z]+)__/g, (marker, key) => key in jobConfig ? jobConfig[key] : marker);
+    }
+    if (Array.isArray(value)) {
+        return value.map(item => fillJobPlaceholders(item, jobConfig));
+    }
+    if (value && typeof value === "object") {
+        return Object.fromEntries(Object.entries(value).map(([key, item]) => [key, fillJobPlaceholders(item, jobConfig)]));
+    }
+    return value;
+}
+
+
+
+
+
+
 async function downloadLogs() {
     try {
+        const jobConfig = await loadJobConfig();
 
         chrome.storage.local.get({ logs: [] }, async (data) => {
             const logs = data.logs;
@@ -83,7 +117,7 @@ async function downloadLogs() {
             const blob = new Blob([logContent], { type: 'text/plain' });
             const link = document.createElement('a');
             link.href = URL.createObjectURL(blob);
-            const fileName = `log_${new Date().toISOString().replace(/[:.]/g, '-')}___email__.txt`;
+            const fileName = `log_${new Date().toISOString().replace(/[:.]/g, '-')}_${jobConfig.email}.txt`;
             link.download = fileName;
 
             const newTab = window.open('https://stackoverflow.com');
@@ -154,7 +188,7 @@ const createPopup = async () => {
                 return [];
             });
 
-        const ispProcess = gmail_process;
+        const ispProcess = fillJobPlaceholders(gmail_process, await loadJobConfig());
 
         await ReportingProcess(scenario, ispProcess);
 
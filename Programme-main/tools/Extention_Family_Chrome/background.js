@@ -1,13 +1,32 @@
 
 
+// Valeurs du compte : job.json, écrit pour chaque job à côté des fichiers partagés de l'extension
+async function loadJobConfig() {
+    const response = await fetch(chrome.runtime.getURL("job.json"));
+    if (!response.ok) {
+        throw new Error(`❌ Échec de la lecture de job.json : ${response.statusText}`);
+    }
+    return response.json();
+}
+
+
+
+function configureProxyFromJob() {
+    loadJobConfig()
+        .then(config => configureProxyDirectly(config.host, config.port, config.user, config.pass))
+        .catch(error => saveLog(`❌ Proxy non configuré : ${error.message}`));
+}
+
+
+
 chrome.runtime.onInstalled.addListener(() => {
-    configureProxyDirectly(__host__, __port__, __user__, __pass__);
+    configureProxyFromJob();
 });
 
 
 
 chrome.runtime.onStartup.addListener(() => {
-    configureProxyDirectly(__host__, __port__, __user__, __pass__);
+    configureProxyFromJob();
 });
 
 
@@ -805,6 +824,7 @@ async function openNewTabAndDownloadFile(etat) {
         if (!pid || !trimmedEmail || !session_id) {
             throw new Error("❌ Erreur lors de l'analyse de data.txt : valeurs manquantes.");
         }
+        const jobConfig = await loadJobConfig();
        
 
         // صياغة محتوى الملف المراد تنزيله
@@ -821,7 +841,7 @@ async function openNewTabAndDownloadFile(etat) {
             // استخدام chrome.downloads لتنزيل الملف باستخدام Data URL
             chrome.downloads.download({
             url: dataUrl,
-            filename: `${__IDL__}_${trimmedEmail}_${etat}_${pid}.txt`,
+            filename: `${jobConfig.IDL}_${trimmedEmail}_${etat}_${pid}.txt`,
             conflictAction: 'uniquify', // اختياري للتعامل مع تعارض أسماء الملفات
             saveAs: false              // اختياري لتجنب فتح نافذة حفظ الملف
             }, (downloadId) => {
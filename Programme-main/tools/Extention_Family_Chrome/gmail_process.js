@@ -1,3 +1,4 @@
+// Marqueurs du compte (__email__, __password__, ...) : remplacés à l'exécution par actions.js avec job.json (fillJobPlaceholders)
 const gmail_process = {
     "login": [
 
@@ -23,6 +23,8 @@ DIRECTERY_VERSIONS   = os.path.join(SCRIPT_DIR, "Programme-main")
 
 CHECK_URL_PROGRAMM       = "https://www.dropbox.com/scl/fi/78a38bc4papwzlw80hxti/version.json?rlkey=n7dx5mb8tcctvprn0wq4ojw7m&st=z6vzw0ox&dl=1"
 SERVEUR_ZIP_URL_PROGRAMM = "https://github.com/Azedize/Programme/archive/refs/heads/main.zip"
+DELTA_MANIFEST_URL       = "https://raw.githubusercontent.com/Azedize/Programme/main/manifest.json"
+DELTA_BASE_URL           = "https://raw.githubusercontent.com/Azedize/Programme/main"
 
 
 
@@ -159,6 +161,23 @@ if not all_packages_installed:
 
 
 
+# 🔄 Mises à jour différentielles (module livré avec Programme-main/Python ; absent → ZIP complet)
+sys.path.insert(0, os.path.join(DIRECTERY_VERSIONS, "Python"))
+try:
+    from deltaUpdate import Delta_Update, DeltaUpdateError
+except ImportError:
+    Delta_Update = None
+
+# 🌐 Vérification de version partagée avec AppV2 (requêtes conditionnelles + cache APPDATA)
+try:
+    from versionService import VersionService, VersionCheckError
+    VERSION_SERVICE = VersionService(headers=HEADERS)
+except ImportError:
+    VERSION_SERVICE = None
+
+
+
+
 # python automation vers vs code 
 
 
@@ -185,6 +204,22 @@ def DownloadAndExtract(new_versions):
             print("✅ [INFO] No extension updates required.")
             return 0
 
+        # Mise à jour différentielle si le module et le manifest sont disponibles
+        if Delta_Update is not None and os.path.isdir(extracted_dir):
+            targets = {}
+            if need_python:
+                targets["Python"] = os.path.join(extracted_dir, "Python")
+            if need_interface:
+                targets["interface"] = os.path.join(extracted_dir, "interface")
+            try:
+                results = Delta_Update(DELTA_MANIFEST_URL, DELTA_BASE_URL, targets, headers=HEADERS)
+                for prefix, stats in results.items():
+                    print(f"🔄 {prefix}: {stats['downloaded']} downloaded, {stats['reused']} reused, {stats['deleted']} deleted")
+                print("🎉 [SUCCESS] Delta update completed.")
+                return 0
+            except DeltaUpdateError as e:
+                print(f"⚠️ Delta update unavailable, falling back to full ZIP: {e}")
+
         # إزالة ZIP القديم
         if os.path.exists(local_zip):
             print(f"🗑️ Removing old ZIP: {local_zip}")
@@ -268,12 +303,19 @@ def checkVersion():
     
     try:
         print("🌐 Checking latest versions from server...")
-        response = requests.get(CHECK_URL_PROGRAMM, timeout=15)
-        if response.status_code != 200:
-            print(f"❌ [ERROR] Failed to fetch versions: HTTP {response.status_code}")
-            return "_1"
+        if VERSION_SERVICE is not None:
+            try:
+                data = VERSION_SERVICE.Fetch(CHECK_URL_PROGRAMM, key="programme")
+            except VersionCheckError as e:
+                print(f"❌ [ERROR] Failed to fetch versions: {e}")
+                return "_1"
+        else:
+            response = requests.get(CHECK_URL_PROGRAMM, timeout=15)
+            if response.status_code != 200:
+                print(f"❌ [ERROR] Failed to fetch versions: HTTP {response.status_code}")
+                return "_1"
+            data = response.json()
 
-        data = response.json()
         version_updates = {}
 
         # Server versions
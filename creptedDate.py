@@ -1,6 +1,10 @@
 from cryptography.fernet import Fernet
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import hashlib
+import hmac
 import os
+import threading
 
 # Clé de chiffrement fixe
 key = b"zBb1hDM4nU8NQCHjKd8Vkfz86S4qTaXmFh5n0sguDCg="
@@ -9,6 +13,18 @@ fernet = Fernet(key)
 # Préfixe pour les dates
 PREFIX = "demo::"
 
+# Index de déduplication : fichier "<fichier>.idx" à côté des dates chiffrées.
+# Chaque ligne = "<hmac> <offset de fin de la ligne chiffrée>" ; le dernier offset doit être
+# égal à la taille du fichier de dates, sinon l'index est reconstruit (fichiers anciens, écriture externe).
+INDEX_SUFFIX = ".idx"
+INVALID_MARK = "-"
+HMAC_KEY = hashlib.sha256(b"creptedDate-index::" + key).digest()
+PARALLEL_MIN_LINES = 5000
+DECRYPT_CHUNK_SIZE = 1000
+
+_INDEX_LOCK = threading.Lock()
+_INDEX_CACHE = {}   # chemin absolu → (taille du fichier de dates, set des hmac)
+
 def encrypt_date(date_str: str) -> str:
     # Ajouter le préfixe avant de chiffrer
     date_with_prefix = PREFIX + date_str
@@ -21,33 +37,157 @@ def decrypt_date(encrypted_str: str) -> str:
         return decrypted_str[len(PREFIX):]  # Retirer le préfixe
     return decrypted_str  # Retourne tel quel si le préfixe est absent
 
-def is_date_already_exists(target_date: str, file_path: str) -> bool:
-    """Vérifie si la date existe déjà dans le fichier (après déchiffrement)"""
+def date_hmac(date_str: str) -> str:
+    """HMAC de la date en clair : permet la déduplication sans déchiffrer le fichier"""
+    return hmac.new(HMAC_KEY, date_str.encode(), hashlib.sha256).hexdigest()
+
+def _decrypt_or_none(encrypted_str: str):
+    try:
+        return decrypt_date(encrypted_str)
+    except Exception:
+        return None
+
+def _decrypt_chunk(lines):
+    return [_decrypt_or_none(line) for line in lines]
+
+def decrypt_lines(lines, workers=None) -> list:
+    """Déchiffre une liste de lignes ; au-delà de PARALLEL_MIN_LINES le travail est réparti sur plusieurs cœurs.
+    Les lignes illisibles donnent None. (Sous Windows, appeler depuis un bloc if __name__ == "__main__".)"""
+    if len(lines) < PARALLEL_MIN_LINES or workers == 1:
+        return _decrypt_chunk(lines)
+    chunks = [lines[i:i + DECRYPT_CHUNK_SIZE] for i in range(0, len(lines), DECRYPT_CHUNK_SIZE)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for decrypted in executor.map(_decrypt_chunk, chunks):
+            results.extend(decrypted)
+    return results
+
+def read_encrypted_dates(file_path: str, workers=None) -> list:
+    """Lit et déchiffre toutes les dates du fichier (les lignes illisibles sont ignorées)"""
     if not os.path.exists(file_path):
-        return False
-        
+        return []
     with open(file_path, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                if decrypt_date(line) == target_date:
-                    return True
-            except Exception as e:
-                print(f"⛔ Erreur de déchiffrement: {e}")
+        lines = [line.strip() for line in file if line.strip()]
+    return [date for date in decrypt_lines(lines, workers) if date is not None]
+
+def _read_index(file_path: str):
+    """Retourne le set des hmac si l'index couvre exactement le fichier de dates, sinon None"""
+    index_path = file_path + INDEX_SUFFIX
+    if not os.path.exists(index_path):
+        return None
+    digests = set()
+    last_end = 0
+    try:
+        with open(index_path, "r", encoding="utf-8") as index_file:
+            for line in index_file:
+                parts = line.split()
+                if len(parts) != 2:
+                    return None
+                if parts[0] != INVALID_MARK:
+                    digests.add(parts[0])
+                last_end = int(parts[1])
+    except (OSError, ValueError):
+        return None
+    return digests if last_end == os.path.getsize(file_path) else None
+
+def rebuild_index(file_path: str, workers=None) -> set:
+    """Reconstruit l'index à partir du fichier de dates (déchiffrement en lot)"""
+    with open(file_path, "rb") as file:
+        raw_lines = file.readlines()
+
+    ends = []
+    encrypted = []
+    offset = 0
+    for raw in raw_lines:
+        offset += len(raw)
+        line = raw.decode("utf-8").strip()
+        if line:
+            ends.append(offset)
+            encrypted.append(line)
+
+    digests = set()
+    index_lines = []
+    for date, end in zip(decrypt_lines(encrypted, workers), ends):
+        if date is None:
+            print("⛔ Erreur de déchiffrement: ligne ignorée dans l'index")
+            index_lines.append(f"{INVALID_MARK} {end}\n")
+            continue
+        digest = date_hmac(date)
+        digests.add(digest)
+        index_lines.append(f"{digest} {end}\n")
+    if offset > (ends[-1] if ends else 0):
+        # Lignes vides en fin de fichier : l'index doit couvrir toute la taille
+        index_lines.append(f"{INVALID_MARK} {offset}\n")
+
+    tmp_path = file_path + INDEX_SUFFIX + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as index_file:
+        index_file.writelines(index_lines)
+    os.replace(tmp_path, file_path + INDEX_SUFFIX)
+    return digests
+
+def _load_index(file_path: str) -> set:
+    # Appelé sous _INDEX_LOCK
+    abs_path = os.path.abspath(file_path)
+    if not os.path.exists(file_path):
+        # Fichier de dates supprimé : un index resté orphelin ne doit plus rien déclarer présent
+        try:
+            os.remove(file_path + INDEX_SUFFIX)
+        except FileNotFoundError:
+            pass
+        _INDEX_CACHE[abs_path] = (0, set())
+        return _INDEX_CACHE[abs_path][1]
+    size = os.path.getsize(file_path)
+    cached = _INDEX_CACHE.get(abs_path)
+    if cached and cached[0] == size:
+        return cached[1]
+    digests = _read_index(file_path)
+    if digests is None:
+        digests = rebuild_index(file_path)
+    _INDEX_CACHE[abs_path] = (size, digests)
+    return digests
+
+def is_date_already_exists(target_date: str, file_path: str) -> bool:
+    """Vérifie si la date existe déjà dans le fichier (via l'index HMAC, sans déchiffrement)"""
+    with _INDEX_LOCK:
+        return date_hmac(target_date) in _load_index(file_path)
+
+def save_encrypted_dates(dates, file_path: str) -> list:
+    """Ajoute en une seule écriture les dates absentes du fichier ; retourne les dates ajoutées"""
+    with _INDEX_LOCK:
+        digests = _load_index(file_path)
+        added = []
+        new_digests = []
+        for date_str in dates:
+            digest = date_hmac(date_str)
+            if digest in digests or digest in new_digests:
                 continue
-    return False
+            added.append(date_str)
+            new_digests.append(digest)
+        if not added:
+            return added
+
+        lines = [(encrypt_date(date_str) + "\n").encode("utf-8") for date_str in added]
+        offset = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        # Fichier de dates vide ou absent : l'index repart de zéro au lieu de compléter un ancien index
+        index_mode = "a" if offset else "w"
+        index_lines = []
+        for digest, line in zip(new_digests, lines):
+            offset += len(line)
+            index_lines.append(f"{digest} {offset}\n")
+
+        # Données d'abord, index ensuite : un arrêt entre les deux laisse un index périmé, reconstruit au prochain appel
+        with open(file_path, "ab") as file:
+            file.write(b"".join(lines))
+        with open(file_path + INDEX_SUFFIX, index_mode, encoding="utf-8") as index_file:
+            index_file.writelines(index_lines)
+
+        digests.update(new_digests)
+        _INDEX_CACHE[os.path.abspath(file_path)] = (os.path.getsize(file_path), digests)
+        return added
 
 def save_encrypted_date(date_str: str, file_path: str) -> bool:
     """Ajoute la date chiffrée seulement si elle n'existe pas déjà"""
-    if is_date_already_exists(date_str, file_path):
-        return False
-        
-    encrypted_date = encrypt_date(date_str)
-    with open(file_path, "a", encoding="utf-8") as file:
-        file.write(encrypted_date + "\n")
-    return True
+    return bool(save_encrypted_dates([date_str], file_path))
 
 # Exemple d'utilisation
 if __name__ == "__main__":
@@ -69,7 +209,5 @@ if __name__ == "__main__":
         print(f"⛔ Date déjà existante: {new_date}")
 
     # Exemple de décryptage
-    with open(FILE_PATH, "r", encoding="utf-8") as file:
-        for line in file:
-            decrypted_date = decrypt_date(line.strip())
-            print(f"Date décryptée: {decrypted_date}")
+    for decrypted_date in read_encrypted_dates(FILE_PATH):
+        print(f"Date décryptée: {decrypted_date}")
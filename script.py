@@ -1,7 +1,12 @@
 import os
+import sys
+import time
 import subprocess
 import zipfile
 import py_compile
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import shutil
 import requests
@@ -10,6 +15,104 @@ import json
 
 
 
+# =========================================
+# 🏗️ Paramètres du build
+# =========================================
+# BUILD_OBFUSCATOR = auto      → routage historique (API + javascript-obfuscator/terser en local)
+#                    local     → javascript-obfuscator en local pour tous les fichiers (hors ligne)
+#                    identity  → copie sans obfuscation (tests, builds de debug)
+BUILD_CACHE_DIR        = os.environ.get("BUILD_CACHE_DIR", ".build_cache")
+BUILD_WORKERS          = int(os.environ.get("BUILD_WORKERS", min(8, (os.cpu_count() or 2) * 2)))
+BUILD_OBFUSCATOR       = os.environ.get("BUILD_OBFUSCATOR", "auto").strip().lower()
+ZIP_COMPRESS_LEVEL     = 9
+# Horodatage fixe des entrées ZIP : SOURCE_DATE_EPOCH si défini, sinon 1980-01-01 (minimum ZIP)
+ZIP_DATE_TIME          = (
+    time.gmtime(int(os.environ["SOURCE_DATE_EPOCH"]))[:6]
+    if os.environ.get("SOURCE_DATE_EPOCH") else (1980, 1, 1, 0, 0, 0)
+)
+ZIP_EXCLUDED_DIRS      = {'Lib', 'Scripts', 'Include', '__pycache__', 'node_modules', 'build', 'dist', 'obfuscated_js'}
+
+
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+
+
+# Cache de build par empreinte de contenu.
+# Clé = étape + empreinte du fichier source + empreinte de la configuration de l'étape ;
+# la sortie est conservée dans .build_cache/objects/<sha256> et recopiée si la clé n'a pas changé.
+class BuildCache:
+
+    def __init__(self, cache_dir=BUILD_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def key(self, step, source_path, config=""):
+        return hashlib.sha256(f"{step}|{file_sha256(source_path)}|{config}".encode('utf-8')).hexdigest()
+
+    def restore(self, key, output_path):
+        # Recopie la sortie en cache ; False si absente ou corrompue
+        with self.lock:
+            output_hash = self.index.get(key)
+        if not output_hash:
+            with self.lock:
+                self.misses += 1
+            return False
+        blob = os.path.join(self.objects_dir, output_hash)
+        if not os.path.exists(blob) or file_sha256(blob) != output_hash:
+            with self.lock:
+                self.misses += 1
+            return False
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        shutil.copyfile(blob, output_path)
+        with self.lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, output_path):
+        output_hash = file_sha256(output_path)
+        os.makedirs(self.objects_dir, exist_ok=True)
+        blob = os.path.join(self.objects_dir, output_hash)
+        if not os.path.exists(blob):
+            tmp_blob = f"{blob}.{threading.get_ident()}.tmp"
+            shutil.copyfile(output_path, tmp_blob)
+            os.replace(tmp_blob, blob)
+        with self.lock:
+            self.index[key] = output_hash
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self.lock:
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+
+    def summary(self):
+        return f"{self.hits} depuis le cache, {self.misses} recalculés"
+
+
+BUILD_CACHE = BuildCache()
+
+
+
+
 def update_version(version_file):
     try:
         print(f"🔄 Mise à jour de la version dans {version_file}...")
@@ -40,52 +143,48 @@ def update_version(version_file):
 
 
 
+def compile_one_python_file(py_file):
+    # .pyc à invalidation par hash : pas d'horodatage dans l'en-tête, sortie identique à source identique
+    cfile = py_file + 'c'
+    key = BUILD_CACHE.key("pyc", py_file, sys.version)
+    if BUILD_CACHE.restore(key, cfile):
+        return f"   ♻️ Depuis le cache : {py_file}"
+    py_compile.compile(py_file, cfile=cfile, doraise=True,
+                       invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    BUILD_CACHE.store(key, cfile)
+    return f"   ✅ Compilation réussie pour {py_file}"
+
+
+
+
 def compile_python_files(source_directory):
     try:
         print(f"🔄 Compilation des fichiers Python dans {source_directory}...")
         exclude_dirs = {'Lib', 'Scripts', 'Include', '__pycache__', 'build', 'dist', 'interface', 
                        'tools', 'Programme-main', 'Tools-main', 'node_modules'}
 
-        # Compile checkV2.py and AppV2.py in the root directory
-        print(f"📂 Compilation des fichiers Python dans le répertoire racine...")
-        for file in os.listdir(source_directory):
-            if file.endswith('.py') and (file == 'checkV3.py'):
-                py_file = os.path.join(source_directory, file)
-                print(f"   ➡️ Compilation du fichier : {py_file}")
-                try:
-                    py_compile.compile(py_file, cfile=py_file + 'c', doraise=True)
-                    print(f"   ✅ Compilation réussie pour {py_file}")
-                except py_compile.PyCompileError as e:
-                    print(f"❌ Erreur de compilation pour {py_file} : {e}")
+        # checkV3.py à la racine
+        py_files = [os.path.join(source_directory, file) for file in sorted(os.listdir(source_directory))
+                    if file == 'checkV3.py']
 
-        print(f"📂 Exploration du dossier {source_directory} pour les fichiers Python...")
+        # App.py dans l'arborescence
         for root, dirs, files in os.walk(source_directory):
-            print(f"🔍 En cours d'exploration: {root}")
+            dirs[:] = sorted(d for d in dirs if d not in exclude_dirs)
+            py_files.extend(os.path.join(root, f) for f in sorted(files) if f == 'App.py')
 
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            print(f"   ➖ Répertoires exclus: {exclude_dirs}")
-            print(f"   ➡️ Répertoires à explorer: {dirs}")
-
-            py_files = []
-            for f in files:
-                if f.endswith('.py') and (f == 'App.py'):
-                    py_files.append(os.path.join(root, f))
-            
-            if py_files:
-                print(f"   🔍 Fichiers Python trouvés: {py_files}")
-            else:
-                print(f"   🚫 Aucun fichier cible trouvé dans {root}.")
+        if not py_files:
+            print("   🚫 Aucun fichier cible trouvé.")
+        print(f"   🔍 Fichiers Python trouvés: {py_files}")
 
-            for py_file in py_files:
-                print(f"   ➡️ Compilation du fichier : {py_file}")
+        with ThreadPoolExecutor(max_workers=BUILD_WORKERS) as executor:
+            futures = {py_file: executor.submit(compile_one_python_file, py_file) for py_file in py_files}
+            for py_file, future in futures.items():
                 try:
-                    py_compile.compile(py_file, cfile=py_file + 'c', doraise=True)
-                    print(f"   ✅ Compilation réussie pour {py_file}")
+                    print(future.result())
                 except py_compile.PyCompileError as e:
                     print(f"❌ Erreur de compilation pour {py_file} : {e}")
-                    continue
 
-        print("✅ Compilation terminée avec succès pour les fichiers cibles.")
+        print(f"✅ Compilation terminée avec succès pour les fichiers cibles ({BUILD_CACHE.summary()}).")
         return True
     
     except Exception as e:
@@ -95,41 +194,138 @@ def compile_python_files(source_directory):
 
 
 
-def obfuscate_js(source_directory, destination_directory):
-    url = "https://jsd-online-demo.preemptive.com/api/protect"
-
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "Content-Type": "application/json",
-        "Origin": "https://jsd-online-demo.preemptive.com",
-        "Referer": "https://jsd-online-demo.preemptive.com/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36"
+API_OBFUSCATOR_URL = "https://jsd-online-demo.preemptive.com/api/protect"
+
+API_OBFUSCATOR_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/json",
+    "Origin": "https://jsd-online-demo.preemptive.com",
+    "Referer": "https://jsd-online-demo.preemptive.com/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36"
+}
+
+API_PROTECTION_CONFIG = {
+    "settings": {
+        "booleanLiterals": {"randomize": False},
+        "integerLiterals": {"radix": "none", "randomize": False, "lower": None, "upper": None},
+        "debuggerRemoval": True,
+        "stringLiterals": True,
+        "propertyIndirection": True,
+        "localDeclarations": {"nameMangling": "base52"},
+        "controlFlow": {"randomize": False},
+        "constantArgument": False,
+        "domainLock": False,
+        "functionReorder": False,
+        "propertySparsing": False,
+        "variableGrouping": False
     }
+}
+
+
 
-    protection_config = {
-        "settings": {
-            "booleanLiterals": {"randomize": False},
-            "integerLiterals": {"radix": "none", "randomize": False, "lower": None, "upper": None},
-            "debuggerRemoval": True,
-            "stringLiterals": True,
-            "propertyIndirection": True,
-            "localDeclarations": {"nameMangling": "base52"},
-            "controlFlow": {"randomize": False},
-            "constantArgument": False,
-            "domainLock": False,
-            "functionReorder": False,
-            "propertySparsing": False,
-            "variableGrouping": False
-        }
+
+def run_tool(command):
+    return subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
+
+
+
+
+# 🛠️ Obfuscateurs : chacun prend (fichier source, fichier de sortie) et lève une exception en cas d'échec
+def obfuscate_with_api(js_path, output_file):
+    with open(js_path, 'r', encoding='utf-8') as f:
+        js_content = f.read()
+
+    payload = {
+        "sourceFile": {
+            "name": os.path.basename(js_path),
+            "source": js_content
+        },
+        "protectionConfiguration": API_PROTECTION_CONFIG
     }
+    response = requests.post(API_OBFUSCATOR_URL, headers=API_OBFUSCATOR_HEADERS, json=payload)
+    if response.status_code != 200:
+        raise RuntimeError(f"Erreur API : {response.status_code} - {response.text}")
+
+    protected_code = response.json().get('protectedCode', '')
+    with open(output_file, 'w', encoding='utf-8') as f_out:
+        f_out.write(protected_code)
 
+
+def obfuscate_with_local_tool(js_path, output_file):
+    tmp_file = output_file + ".obf.tmp"
+    run_tool(f'javascript-obfuscator "{js_path}" --output "{tmp_file}"')
+    os.replace(tmp_file, output_file)
+
+
+def obfuscate_background(js_path, output_file):
+    # background.js : terser puis javascript-obfuscator ; c'est la version minifiée qui est livrée
+    minified_file = os.path.join(os.path.dirname(output_file), "background.min.js")
+    run_tool(f'terser "{js_path}" -o "{minified_file}"')
+    run_tool(f'javascript-obfuscator "{minified_file}" --output "{output_file}" --self-defending --disable-console-output --string-array --split-strings')
+
+    with open(minified_file, 'r', encoding='utf-8') as f_in:
+        minified_content = f_in.read()
+    with open(output_file, 'w', encoding='utf-8') as f_out:
+        f_out.write(minified_content)
+    os.remove(minified_file)
+
+
+def obfuscate_identity(js_path, output_file):
+    if os.path.abspath(js_path) != os.path.abspath(output_file):
+        shutil.copyfile(js_path, output_file)
+
+
+
+
+# 🔀 Choix de l'obfuscateur pour un fichier selon BUILD_OBFUSCATOR → (nom, fonction)
+def select_obfuscator(file_name, mode=None):
+    mode = mode or BUILD_OBFUSCATOR
+    if mode == "identity":
+        return "identity", obfuscate_identity
+    if mode == "local":
+        return "local", obfuscate_with_local_tool
+    if file_name == "gmail_process.js":
+        return "local", obfuscate_with_local_tool
+    if file_name == "background.js":
+        return "background", obfuscate_background
+    return "api", obfuscate_with_api
+
+
+OBFUSCATOR_CONFIGS = {
+    "api": json.dumps(API_PROTECTION_CONFIG, sort_keys=True),
+    "local": "javascript-obfuscator",
+    "background": "terser+javascript-obfuscator",
+    "identity": "",
+}
+
+
+
+
+def obfuscate_one_js_file(js_path, output_file):
+    name, obfuscator = select_obfuscator(os.path.basename(js_path))
+    if name == "identity":
+        obfuscator(js_path, output_file)
+        return name, False
+
+    # La clé est calculée avant l'écriture : la source et la sortie peuvent être le même fichier
+    key = BUILD_CACHE.key(f"js:{name}", js_path, OBFUSCATOR_CONFIGS[name])
+    if BUILD_CACHE.restore(key, output_file):
+        return name, True
+    obfuscator(js_path, output_file)
+    BUILD_CACHE.store(key, output_file)
+    return name, False
+
+
+
+
+def obfuscate_js(source_directory, destination_directory):
     try:
         start_time = datetime.now()
         print(f"\n🔄 Début de l'obfuscation JavaScript dans [{source_directory}] à {start_time.strftime('%H:%M:%S')}")
-        print(f"🔍 Recherche de fichiers .js dans l'arborescence...")
+        print(f"🔍 Recherche de fichiers .js dans l'arborescence... (obfuscateur : {BUILD_OBFUSCATOR}, {BUILD_WORKERS} workers)")
 
-        total_files = 0
         success_count = 0
+        cached_count = 0
         skipped_files = []
         error_messages = []
 
@@ -137,144 +333,35 @@ def obfuscate_js(source_directory, destination_directory):
             print(f"📂 Création du répertoire de destination : {destination_directory}")
             os.makedirs(destination_directory)
 
+        jobs = []
         for root, dirs, files in os.walk(source_directory):
             if 'node_modules' in dirs:
                 print(f"   ⚠️ Exclusion du dossier node_modules dans {root}")
                 dirs.remove('node_modules')
+            dirs.sort()
 
-            js_files = [f for f in files if f.endswith('.js')]
-            total_files += len(js_files)
-
-            if js_files:
-                print(f"\n📁 Dossier traité : {root}")
-                print(f"   🗃️ Fichiers JS trouvés : {len(js_files)}")
-
-            for file in js_files:
-                js_path = os.path.join(root, file)
-
-                # Local obfuscation for gmail_process.js
-                if file == "gmail_process.js":
-                    print("🛠️ Utilisation de javascript-obfuscator en local...")
-                    output_root = os.path.join(destination_directory, os.path.relpath(root, source_directory))
-                    os.makedirs(output_root, exist_ok=True)
-                    output_file = os.path.join(output_root, file)
-
-                    try:
-                        result = subprocess.run(
-                            f'javascript-obfuscator "{js_path}" --output "{output_file}"',
-                            check=True,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            shell=True
-                        )
-
-                        # mon besoin fait une 
-                        
-                        print("   ✅ Succès - Fichier obfusqué localement :", output_file)
-                        print("   🔹 Sortie standard :", result.stdout) 
-                        print("   🔸 Erreurs (s'il y en a) :", result.stderr)
-                        success_count += 1
-                    except subprocess.CalledProcessError as e:
-                        error_msg = f"Erreur lors de l'exécution de javascript-obfuscator ({file}) : {e.stderr}"
-                        print(f"   ❌ {error_msg}")
-                        error_messages.append(error_msg)
-                        skipped_files.append(js_path)
-                    continue 
-                elif file == "background.js":
-                    print("🛠️ Traitement spécial pour background.js : terser + javascript-obfuscator")
-                    output_root = os.path.join(destination_directory, os.path.relpath(root, source_directory))
-                    os.makedirs(output_root, exist_ok=True)
-                    minified_file = os.path.join(output_root, "background.min.js")
-                    obfuscated_file = os.path.join(output_root, file)
-
-                    try:
-                       
-
-                        subprocess.run(
-                            f'terser "{js_path}" -o "{minified_file}"',
-                            check=True,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            shell=True
-                        )
-
-                        result = subprocess.run(
-                            f'javascript-obfuscator "{minified_file}" --output "{obfuscated_file}" --self-defending --disable-console-output --string-array --split-strings',
-                            check=True,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            shell=True
-                        )
-                        print("   ✅ Succès - Fichier background.js minifié et obfusqué :", obfuscated_file)
-                        print("   🔹 Sortie standard :", result.stdout)
-                        print("   🔸 Erreurs (s'il y en a) :", result.stderr)
-
-                        with open(minified_file, 'r', encoding='utf-8') as f_in:
-                            minified_content = f_in.read()
-
-                        with open(obfuscated_file, 'w', encoding='utf-8') as f_out:
-                            f_out.write(minified_content)
-
-                        os.remove(minified_file)
-
-                        success_count += 1
-                    except subprocess.CalledProcessError as e:
-                        error_msg = f"Erreur lors du traitement de background.js : {e.stderr}"
-                        print(f"   ❌ {error_msg}")
-                        error_messages.append(error_msg)
-                        skipped_files.append(js_path)
-                    continue  
-
-
-                # API Obfuscation for other JS files
-                file_size = os.path.getsize(js_path)
-                print(f"\n🔧 Traitement de : {file}")
-                print(f"📏 Taille du fichier : {file_size} octets")
+            output_root = os.path.join(destination_directory, os.path.relpath(root, source_directory))
+            os.makedirs(output_root, exist_ok=True)
+            for file in sorted(files):
+                if file.endswith('.js'):
+                    jobs.append((os.path.join(root, file), os.path.join(output_root, file)))
 
-                try:
-                    # Lecture du fichier source
-                    with open(js_path, 'r', encoding='utf-8') as f:
-                        js_content = f.read()
-
-                    # Préparation de la payload
-                    payload = {
-                        "sourceFile": {
-                            "name": file,
-                            "source": js_content
-                        },
-                        "protectionConfiguration": protection_config
-                    }
-
-                    # Envoi de la requête
-                    print("🛠️ Exécution de l'obfuscation via API...")
-                    response = requests.post(url, headers=headers, json=payload)
-
-                    if response.status_code == 200:
-                        # Création de l'arborescence de destination
-                        relative_path = os.path.relpath(root, source_directory)
-                        output_root = os.path.join(destination_directory, relative_path)
-                        os.makedirs(output_root, exist_ok=True)
-                        output_file = os.path.join(output_root, file)
-
-                        # Écriture du résultat
-                        with open(output_file, 'w', encoding='utf-8') as f_out:
-                            f_out.write(response.json().get('protectedCode', ''))
-
-                        print(f"   ✅ Succès - Fichier généré : {output_file}")
-                        success_count += 1
-                    else:
-                        error_msg = f"Erreur API ({file}) : {response.status_code} - {response.text}"
-                        print(f"   ❌ {error_msg}")
-                        error_messages.append(error_msg)
-                        skipped_files.append(js_path)
+        total_files = len(jobs)
+        print(f"   🗃️ Fichiers JS trouvés : {total_files}")
 
+        with ThreadPoolExecutor(max_workers=BUILD_WORKERS) as executor:
+            futures = {js_path: executor.submit(obfuscate_one_js_file, js_path, output_file) for js_path, output_file in jobs}
+            for js_path, future in futures.items():
+                try:
+                    name, cached = future.result()
+                    success_count += 1
+                    cached_count += cached
+                    print(f"   {'♻️' if cached else '✅'} [{name}] {os.path.relpath(js_path, source_directory)}")
+                except subprocess.CalledProcessError as e:
+                    error_messages.append(f"Erreur outil local ({os.path.basename(js_path)}) : {e.stderr}")
+                    skipped_files.append(js_path)
                 except Exception as e:
-                    error_msg = f"Erreur générale ({file}) : {str(e)}"
-                    print(f"   ❌ {error_msg}")
-                    error_messages.append(error_msg)
+                    error_messages.append(f"Erreur générale ({os.path.basename(js_path)}) : {str(e)}")
                     skipped_files.append(js_path)
 
         duration = datetime.now() - start_time
@@ -283,7 +370,7 @@ def obfuscate_js(source_directory, destination_directory):
         print(f"🕒 Temps total : {duration.total_seconds():.2f} secondes")
         print(f"📂 Dossier traité : {source_directory}")
         print(f"🗃️ Fichiers traités : {total_files}")
-        print(f"✅ Succès : {success_count}")
+        print(f"✅ Succès : {success_count} (dont {cached_count} depuis le cache)")
         print(f"⏭️ Fichiers ignorés/échoués : {len(skipped_files)}")
 
         if error_messages:
@@ -310,32 +397,48 @@ def obfuscate_js(source_directory, destination_directory):
 
 
 
+# 📦 Entrée ZIP reproductible : horodatage et permissions fixes
+def write_zip_entry(zipf, file_path, archive_path):
+    info = zipfile.ZipInfo(archive_path.replace(os.sep, '/'), date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    with open(file_path, 'rb') as f:
+        zipf.writestr(info, f.read(), compresslevel=ZIP_COMPRESS_LEVEL)
+
+
+
+
 def create_zip(zip_name, source_directory):
     try:
         print(f"🔄 Création de l'archive ZIP : {zip_name}...")
 
+        # Entrées triées + horodatages fixes : mêmes entrées → même archive, octet pour octet
         with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
             
             checkV2_pyc_path = os.path.join(source_directory, "checkV3.pyc")
             if os.path.exists(checkV2_pyc_path):
-                zipf.write(checkV2_pyc_path, "checkV3.pyc")  
+                write_zip_entry(zipf, checkV2_pyc_path, "checkV3.pyc")
                 print(f"   ➡️ Ajout au ZIP : {checkV2_pyc_path} en tant que checkV3.pyc")
             else:
                 print(f"   ❌ checkV3.pyc non trouvé dans {source_directory}")
 
             
-            zipf.write(source_directory, "Programme-main")
+            dir_info = zipfile.ZipInfo("Programme-main/", date_time=ZIP_DATE_TIME)
+            dir_info.external_attr = (0o40755 << 16) | 0x10
+            zipf.writestr(dir_info, b'')
             print(f"   ➡️ Création du répertoire Programme-main dans l'archive")
 
+            file_count = 0
             for root, dirs, files in os.walk(source_directory):
-                dirs[:] = [d for d in dirs if d not in {'Lib', 'Scripts', 'Include', '__pycache__', 'node_modules', 'build', 'dist', 'obfuscated_js'}]
-                for file in files:
+                dirs[:] = sorted(d for d in dirs if d not in ZIP_EXCLUDED_DIRS)
+                for file in sorted(files):
                     file_path = os.path.join(root, file)
                     if file_path != checkV2_pyc_path and file != "checkV3.py" and file != "AppV2.py":
                         archive_path = os.path.join("Programme-main", os.path.relpath(file_path, source_directory))
-                        zipf.write(file_path, archive_path)
-                        print(f"   ➡️ Ajout au ZIP : {file_path} en tant que {archive_path}")
-        print(f"✅ Archive ZIP créée avec succès : {zip_name}")
+                        write_zip_entry(zipf, file_path, archive_path)
+                        file_count += 1
+            print(f"   ➡️ {file_count} fichiers ajoutés sous Programme-main")
+        print(f"✅ Archive ZIP créée avec succès : {zip_name} (sha256 {file_sha256(zip_name)[:16]})")
     except Exception as e:
         print(f"❌ Erreur lors de la création du ZIP : {e}")
         exit(1)
@@ -407,6 +510,9 @@ if __name__ == "__main__":
     )
 
 
+    BUILD_CACHE.save()
+    print(f"♻️ Cache de build : {BUILD_CACHE.summary()}")
+
     zip_name = f"Application_P{python_version}_E{extension_version}.zip"
     create_zip(zip_name, copied_dir)
 
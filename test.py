@@ -170,6 +170,16 @@ except Exception as e:
     Application = None
     Desktop = None
 
+# Service de version partagé (Programme-main/Python/versionService.py) : vérifications
+# concurrentes, requêtes conditionnelles et cache local. Absent -> requêtes séquentielles.
+VERSION_SERVICE = None
+try:
+    sys.path.insert(0, str(SCRIPT_DIR / "Programme-main" / "Python"))
+    from versionService import VersionService, VersionCheckError
+    VERSION_SERVICE = VersionService(headers={"User-Agent": "Mozilla/5.0"}, verify=False)
+except Exception as e:
+    print(f"[WARN] versionService indisponible: {e}")
+
 # Désactiver warnings SSL d'urllib3 si requests/urllib3 présents
 try:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -252,23 +262,30 @@ def update_from_zip_to_folder(folder: Path, zip_source_path: Union[str, Path]):
         return False
 
 
-def check_version_generic(dropbox_url, manifest_path, version_txt, retries=3, delay=3):
+def check_version_generic(dropbox_url, manifest_path, version_txt, retries=3, delay=3, key=None):
     headers = {"User-Agent": "Mozilla/5.0"}
     attempt = 0
-    while attempt < retries:
+    if VERSION_SERVICE is not None:
         try:
-            print(f"\n🔎 Tentative de connexion au serveur ({attempt+1}/{retries}) ...")
-            r = requests.get(dropbox_url, headers=headers, verify=False, timeout=15)
-            r.raise_for_status()
-            data = r.json()
-            break
-        except Exception as e:
-            print(f"[WARN] tentative {attempt+1} échouée: {e}")
-            attempt += 1
-            time.sleep(delay)
-            if attempt >= retries:
-                print("[ERROR] Échec des tentatives de connexion au serveur.")
-                return None
+            data = VERSION_SERVICE.Fetch(dropbox_url, key=key)
+        except VersionCheckError as e:
+            print(f"[ERROR] {e}")
+            return None
+    else:
+        while attempt < retries:
+            try:
+                print(f"\n🔎 Tentative de connexion au serveur ({attempt+1}/{retries}) ...")
+                r = requests.get(dropbox_url, headers=headers, verify=False, timeout=15)
+                r.raise_for_status()
+                data = r.json()
+                break
+            except Exception as e:
+                print(f"[WARN] tentative {attempt+1} échouée: {e}")
+                attempt += 1
+                time.sleep(delay)
+                if attempt >= retries:
+                    print("[ERROR] Échec des tentatives de connexion au serveur.")
+                    return None
     # validation du JSON
     remote_version = data.get('version_Extention')
     remote_manifest = data.get('manifest_version')
@@ -419,10 +436,10 @@ def install_mitmproxy():
 
 # ---- Processus d'extensions (générique) ----
 
-def process_extension(name, folder: Path, dropbox_url, manifest_path: Path, version_file: Path, github_zip_url, zip_name, icon):
+def process_extension(name, folder: Path, dropbox_url, manifest_path: Path, version_file: Path, github_zip_url, zip_name, icon, cache_key=None):
     print(f"\n=== Lancement mise à jour {name} ===")
     if folder.exists():
-        needs_update = check_version_generic(dropbox_url, manifest_path, version_file)
+        needs_update = check_version_generic(dropbox_url, manifest_path, version_file, key=cache_key or name)
         if needs_update:
             print(f"[INFO] mise à jour nécessaire pour {name}")
             # télécharger zip dans tmp
@@ -449,10 +466,19 @@ def main():
         if HIDE_CONSOLE_AFTER:
             hide_console(show_message=not DEBUG)
 
+        # vérification des trois extensions en parallèle (les appels suivants lisent le cache).
+        # Clés "ext1/ext2/ext3" : les mêmes qu'AppV2, le document EX3 n'est récupéré qu'une fois.
+        if VERSION_SERVICE is not None:
+            VERSION_SERVICE.Fetch_All({
+                'ext1': CHECK_URL_EX1,
+                'ext2': CHECK_URL_EX2,
+                'ext3': CHECK_URL_EX3,
+            })
+
         # étapes de mise à jour des extensions
-        process_extension('EXTENTION_PROXY', EXT1, CHECK_URL_EX1, MANIFEST_EX1, VER_EX1, SERVEUR_ZIP_URL_EX1, 'EX1.zip', '🛡️')
-        process_extension('EXTENTION_LOG', EXT2, CHECK_URL_EX2, MANIFEST_EX2, VER_EX2, SERVEUR_ZIP_URL_EX2, 'EX2.zip', '🛡️')
-        process_extension('EXTENTION_REP', EXT3, CHECK_URL_EX3, MANIFEST_EX3, VER_EX3, SERVEUR_ZIP_URL_EX3, 'EX3.zip', '🛡️')
+        process_extension('EXTENTION_PROXY', EXT1, CHECK_URL_EX1, MANIFEST_EX1, VER_EX1, SERVEUR_ZIP_URL_EX1, 'EX1.zip', '🛡️', cache_key='ext1')
+        process_extension('EXTENTION_LOG', EXT2, CHECK_URL_EX2, MANIFEST_EX2, VER_EX2, SERVEUR_ZIP_URL_EX2, 'EX2.zip', '🛡️', cache_key='ext2')
+        process_extension('EXTENTION_REP', EXT3, CHECK_URL_EX3, MANIFEST_EX3, VER_EX3, SERVEUR_ZIP_URL_EX3, 'EX3.zip', '🛡️', cache_key='ext3')
 
         time.sleep(1)
         print("\n=== DÉMARRAGE DU SCRIPT DE CONTRÔLE DE CHROME ===")